@@ -121,6 +121,9 @@ class PerformanceRegressionTest(ClusterTester):  # pylint: disable=too-many-publ
             for single_result in results:
                 self.display_single_result(single_result)
                 test_xml += self.get_test_xml(single_result, test_name=test_name)
+            if self.hdr_histograms:
+                self.log.info("Cluster-wide latency percentiles from HDR histograms of all loaders (ms): %s",
+                              self.hdr_histograms.get_percentiles())
 
             with open(os.path.join(self.logdir, 'jenkins_perf_PerfPublisher.xml'), 'w', encoding="utf-8") as pref_file:
                 content = """<report name="%s report" categ="none">%s</report>""" % (test_name, test_xml)
@@ -13,7 +13,10 @@
 #
 # Copyright (c) 2021 ScyllaDB
 
-# pylint: disable=too-many-lines
+# pylint: disable=too-many-lines,import-outside-toplevel
+# Heavy modules (cloud SDKs, k8s, docker, pytest, etc.) are imported inside the commands which use them
+# to keep `sct.py --help' and light commands fast.  Check `unit_tests/test_sct_import_time.py' before adding
+# any new module level import here.
 import os
 import re
 import sys
@@ -28,65 +31,18 @@ import pprint
 from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from functools import partial
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
 from uuid import UUID
 
-import pytest
 import click
 import click_completion
 from prettytable import PrettyTable
 
-from sdcm.localhost import LocalHost
-from sdcm.remote import LOCALRUNNER
-from sdcm.results_analyze import PerformanceResultsAnalyzer, BaseResultsAnalyzer
-from sdcm.sct_config import SCTConfiguration
-from sdcm.sct_provision.common.layout import SCTProvisionLayout, create_sct_configuration
-from sdcm.sct_provision.instances_provider import provision_sct_resources
-from sdcm.sct_runner import AwsSctRunner, GceSctRunner, AzureSctRunner, get_sct_runner, clean_sct_runners
-from sdcm.utils.azure_utils import AzureService
-from sdcm.utils.azure_region import AzureRegion, region_name_to_location
-from sdcm.utils.cloud_monitor import cloud_report, cloud_qa_report
-from sdcm.utils.cloud_monitor.cloud_monitor import cloud_non_qa_report
-from sdcm.utils.common import (
-    all_aws_regions,
-    aws_tags_to_dict,
-    clean_cloud_resources,
-    clean_resources_according_post_behavior,
-    format_timestamp,
-    gce_meta_to_dict,
-    get_all_gce_regions,
-    get_branched_ami,
-    get_branched_gce_images,
-    get_builder_by_test_id,
-    get_s3_scylla_repos_mapping,
-    get_scylla_ami_versions,
-    get_scylla_gce_images_versions,
-    get_testrun_dir,
-    list_clusters_eks,
-    list_clusters_gke,
-    list_elastic_ips_aws,
-    list_instances_aws,
-    list_instances_gce,
-    list_logs_by_test_id,
-    list_resources_docker,
-    search_test_id_in_latest,
-    list_parallel_timelines_report_urls
-)
 from sdcm.utils.net import get_sct_runner_ip
-from sdcm.utils.jepsen import JepsenResults
-from sdcm.utils.docker_utils import docker_hub_login
-from sdcm.monitorstack import (restore_monitoring_stack, get_monitoring_stack_services,
-                               kill_running_monitoring_stack_services)
 from sdcm.utils.log import setup_stdout_logger
-from sdcm.utils.aws_region import AwsRegion
-from sdcm.utils.get_username import get_username
-from sdcm.send_email import get_running_instances_for_email_report, read_email_data_from_file, build_reporter, \
-    send_perf_email
-from sdcm.parallel_timeline_report.generate_pt_report import ParallelTimelinesReportGenerator
-from sdcm.utils.aws_utils import AwsArchType
-from utils.build_system.create_test_release_jobs import JenkinsPipelines  # pylint: disable=no-name-in-module,import-error
-from utils.get_supported_scylla_base_versions import UpgradeBaseVersion  # pylint: disable=no-name-in-module,import-error
-from utils.mocks.aws_mock import AwsMock  # pylint: disable=no-name-in-module
+
+if TYPE_CHECKING:
+    from sdcm.utils.aws_utils import AwsArchType
 
 
 SUPPORTED_CLOUDS = ("aws", "gce", "azure",)
@@ -101,16 +57,83 @@ click_completion.init()
 
 
 def get_test_config():
-    from sdcm.cluster import TestConfig  # pylint: disable=import-outside-toplevel; avoid import for `--help' option
+    from sdcm.test_config import TestConfig
 
     return TestConfig()
 
 
+def available_backends() -> Sequence[str]:
+    from sdcm.sct_config import SCTConfiguration
+
+    return SCTConfiguration.available_backends
+
+
+def aws_arch_types() -> Sequence[str]:
+    from sdcm.utils.aws_utils import AwsArchType
+
+    return AwsArchType.__args__
+
+
+class LazyChoice(click.Choice):
+    """Same as `click.Choice', but the list of choices is built on first use (e.g., to show help for the command.)"""
+
+    def __init__(self, get_choices: Callable[[], Sequence[str]], case_sensitive: bool = True):  # pylint: disable=super-init-not-called
+        self._get_choices = get_choices
+        self._choices = None
+        self.case_sensitive = case_sensitive
+
+    @property
+    def choices(self) -> Sequence[str]:
+        if self._choices is None:
+            self._choices = self._get_choices()
+        return self._choices
+
+
+class SctOption(click.Option):
+    """Option which takes its type and help (if not provided) from SCT configuration option `sct_name'.
+
+    The configuration option is looked up only when the command is invoked or its help is shown.
+    """
+
+    def __init__(self, *args, sct_name: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sct_name = sct_name
+
+    def _apply_sct_option(self) -> None:
+        if self.sct_name is None:
+            return
+        from sdcm.sct_config import SCTConfiguration
+
+        sct_opt = SCTConfiguration.get_config_option(self.sct_name)
+        self.type = click.types.convert_type(sct_opt['type'])
+        if self.help is None:
+            self.help = sct_opt['help']
+        self.sct_name = None
+
+    def get_help_record(self, ctx):
+        self._apply_sct_option()
+        return super().get_help_record(ctx)
+
+    def type_cast_value(self, ctx, value):
+        self._apply_sct_option()
+        return super().type_cast_value(ctx, value)
+
+
+class LazyHelpCommand(click.Command):
+    """Command with a help text which is built only when it's shown.  Provide `short_help' for the commands list."""
+
+    def __init__(self, *args, help_factory: Callable[[], str], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.help_factory = help_factory
+
+    def format_help_text(self, ctx, formatter):
+        if self.help is None:
+            self.help = self.help_factory()
+        super().format_help_text(ctx, formatter)
+
+
 def sct_option(name, sct_name, **kwargs):
-    sct_opt = SCTConfiguration.get_config_option(sct_name)
-    multimple_use = kwargs.pop('multiple', False)
-    sct_opt.update(kwargs)
-    return click.option(name, type=sct_opt['type'], help=sct_opt['help'], multiple=multimple_use)
+    return click.option(name, cls=SctOption, sct_name=sct_name, **kwargs)
 
 
 def install_callback(ctx, _, value):
@@ -156,10 +179,17 @@ class CloudRegion(click.ParamType):
     def convert(self, value, param, ctx):
         cloud_provider = self.cloud_provider or ctx.params["cloud_provider"]
         if cloud_provider == "aws":
+            from sdcm.utils.common import all_aws_regions
+
             regions = all_aws_regions()
         elif cloud_provider == "gce":
+            from sdcm.utils.common import get_all_gce_regions
+
             regions = get_all_gce_regions()
         elif cloud_provider == "azure":
+            from sdcm.utils.azure_utils import AzureService
+            from sdcm.utils.azure_region import region_name_to_location
+
             regions = AzureService().all_regions
             value = region_name_to_location(value)
         else:
@@ -192,15 +222,22 @@ class SctLoader(unittest.TestLoader):
               expose_value=False,
               help="Install paths for extra python packages to install, scylla-cluster-plugins for example")
 def cli():
+    from sdcm.remote import LOCALRUNNER
+    from sdcm.utils.docker_utils import docker_hub_login
+
     LOGGER.info("install-bash-completion current path: %s", os.getcwd())
     docker_hub_login(remoter=LOCALRUNNER)
 
 
 @cli.command('provision-resources', help="Provision resources for the test")
-@click.option('-b', '--backend', type=click.Choice(SCTConfiguration.available_backends), help="Backend to use")
+@click.option('-b', '--backend', type=LazyChoice(available_backends), help="Backend to use")
 @click.option('-t', '--test-name', type=str, help="Test name")
 @click.option('-c', '--config', multiple=True, type=click.Path(exists=True), help="Test config .yaml to use, can have multiple of those")
 def provision_resources(backend, test_name: str, config: str):
+    from sdcm.localhost import LocalHost
+    from sdcm.sct_provision.common.layout import SCTProvisionLayout, create_sct_configuration
+    from sdcm.sct_provision.instances_provider import provision_sct_resources
+
     if config:
         os.environ['SCT_CONFIG_FILES'] = str(list(config))
     if backend:
@@ -240,7 +277,7 @@ def provision_resources(backend, test_name: str, config: str):
 @sct_option('--test-id', 'test_id', help='test id to filter by. Could be used multiple times', multiple=True)
 @click.option('--logdir', type=str, help='directory with test run')
 @click.option('--dry-run', is_flag=True, default=False, help='dry run')
-@click.option('-b', '--backend', type=click.Choice(SCTConfiguration.available_backends), help="Backend to use")
+@click.option('-b', '--backend', type=LazyChoice(available_backends), help="Backend to use")
 @click.pass_context
 def clean_resources(ctx, post_behavior, user, test_id, logdir, dry_run, backend):  # pylint: disable=too-many-arguments,too-many-branches
     """Clean cloud resources.
@@ -265,6 +302,14 @@ def clean_resources(ctx, post_behavior, user, test_id, logdir, dry_run, backend)
 
     Also you can add --dry-run option to see what should be cleaned.
     """
+    from sdcm.sct_config import SCTConfiguration
+    from sdcm.utils.common import (
+        clean_cloud_resources,
+        clean_resources_according_post_behavior,
+        search_test_id_in_latest,
+    )
+    from sdcm.utils.resources_inventory import ResourcesInventory
+
     add_file_logger()
 
     user_param = {"RunByUser": user} if user else {}
@@ -301,13 +346,16 @@ def clean_resources(ctx, post_behavior, user, test_id, logdir, dry_run, backend)
         click.echo(f"Use {logdir} as a logdir")
         clean_func = partial(clean_resources_according_post_behavior, config=SCTConfiguration(), logdir=logdir)
     else:
-        clean_func = clean_cloud_resources
+        # List all clouds concurrently only once for all Test IDs (or once with tag filters if there is only one.)
+        params = list(params)
+        snapshot = ResourcesInventory(tags_dict=params[0] if len(params) == 1 else None, verbose=True).collect()
+        clean_func = partial(clean_cloud_resources, snapshot=snapshot)
 
     if dry_run:
         click.echo("Make a dry-run")
 
     try:
-        from sdcm.argus_test_run import ArgusTestRun  # pylint: disable=import-outside-toplevel
+        from sdcm.argus_test_run import ArgusTestRun
         # Will return MagicMock if there are more than 1 test_id
         argus_run = ArgusTestRun.get(UUID(test_id[0])) if len(test_id) == 1 else ArgusTestRun.get()
         LOGGER.info("Loaded Argus Run: %s", argus_run.id)
@@ -326,9 +374,12 @@ def clean_resources(ctx, post_behavior, user, test_id, logdir, dry_run, backend)
 @click.option('--get-all-running', is_flag=True, default=False, help='All running resources')
 @sct_option('--test-id', 'test_id', help='test id to filter by')
 @click.option('--verbose', is_flag=True, default=False, help='if enable, will log progress')
+@click.option('--snapshot-max-age', type=int, default=0,
+              help='reuse resources snapshot saved by previous run if it is not older than this (in seconds)')
 @click.pass_context
-def list_resources(ctx, user, test_id, get_all, get_all_running, verbose):
-    # pylint: disable=too-many-locals,too-many-arguments,too-many-branches,too-many-statements
+def list_resources(ctx, user, test_id, get_all, get_all_running, verbose, snapshot_max_age):
+    # pylint: disable=too-many-arguments
+    from sdcm.utils.resources_inventory import ResourcesInventory, ResourcesSnapshot
 
     add_file_logger()
 
@@ -341,150 +392,71 @@ def list_resources(ctx, user, test_id, get_all, get_all_running, verbose):
     if all([not get_all, not get_all_running, not user, not test_id]):
         click.echo(list_resources.get_help(ctx))
 
-    if get_all_running:
-        table_header = ["Name", "Region-AZ", "PublicIP", "TestId", "RunByUser", "LaunchTime"]
-    else:
-        table_header = ["Name", "Region-AZ", "State", "TestId", "RunByUser", "LaunchTime"]
-
-    click.secho("Checking AWS EC2...", fg='green')
-    aws_instances = list_instances_aws(tags_dict=params, running=get_all_running, verbose=verbose)
-
-    if aws_instances:
-        aws_table = PrettyTable(table_header)
-        aws_table.align = "l"
-        aws_table.sortby = 'LaunchTime'
-        for instance in aws_instances:
-            tags = aws_tags_to_dict(instance.get('Tags'))
-            name = tags.get("Name", "N/A")
-            test_id = tags.get("TestId", "N/A")
-            run_by_user = tags.get("RunByUser", "N/A")
-            aws_table.add_row([
-                name,
-                instance['Placement']['AvailabilityZone'],
-                instance.get('PublicIpAddress', 'N/A') if get_all_running else instance['State']['Name'],
-                test_id,
-                run_by_user,
-                instance['LaunchTime'].ctime()])
-        click.echo(aws_table.get_string(title="Instances used on AWS"))
-    else:
-        click.secho("Nothing found for selected filters in AWS!", fg="yellow")
-
-    click.secho("Checking AWS Elastic IPs...", fg='green')
-    elastic_ips_aws = list_elastic_ips_aws(tags_dict=params, verbose=verbose)
-    if elastic_ips_aws:
-        aws_table = PrettyTable(["AllocationId", "PublicIP", "TestId", "RunByUser", "InstanceId (attached to)"])
-        aws_table.align = "l"
-        aws_table.sortby = 'AllocationId'
-        for eip in elastic_ips_aws:
-            tags = aws_tags_to_dict(eip.get('Tags'))
-            test_id = tags.get("TestId", "N/A")
-            run_by_user = tags.get("RunByUser", "N/A")
-            aws_table.add_row([
-                eip['AllocationId'],
-                eip['PublicIp'],
-                test_id,
-                run_by_user,
-                eip.get('InstanceId', 'N/A')])
-        click.echo(aws_table.get_string(title="EIPs used on AWS"))
-    else:
-        click.secho("No elastic ips found for selected filters in AWS!", fg="yellow")
-
-    click.secho("Checking GKE...", fg='green')
-    gke_clusters = list_clusters_gke(tags_dict=params, verbose=verbose)
-    if gke_clusters:
-        gke_table = PrettyTable(["Name", "Region-AZ", "TestId", "RunByUser", "CreateTime"])
-        gke_table.align = "l"
-        gke_table.sortby = 'CreateTime'
-        for cluster in gke_clusters:
-            tags = gce_meta_to_dict(cluster.extra['metadata'])
-            gke_table.add_row([cluster.name,
-                               cluster.zone,
-                               tags.get('TestId', 'N/A') if tags else "N/A",
-                               tags.get('RunByUser', 'N/A') if tags else "N/A",
-                               cluster.cluster_info['createTime'],
-                               ])
-        click.echo(gke_table.get_string(title="GKE clusters"))
-    else:
-        click.secho("Nothing found for selected filters in GKE!", fg="yellow")
-
-    click.secho("Checking GCE...", fg='green')
-    gce_instances = list_instances_gce(tags_dict=params, running=get_all_running, verbose=verbose)
-    if gce_instances:
-        gce_table = PrettyTable(table_header)
-        gce_table.align = "l"
-        gce_table.sortby = 'LaunchTime'
-        for instance in gce_instances:
-            tags = gce_meta_to_dict(instance.extra['metadata'])
-            public_ips = ", ".join(instance.public_ips) if None not in instance.public_ips else "N/A"
-            gce_table.add_row([instance.name,
-                               instance.extra["zone"].name,
-                               public_ips if get_all_running else instance.state,
-                               tags.get('TestId', 'N/A') if tags else "N/A",
-                               tags.get('RunByUser', 'N/A') if tags else "N/A",
-                               instance.extra['creationTimestamp'],
-                               ])
-        click.echo(gce_table.get_string(title="Resources used on GCE"))
-    else:
-        click.secho("Nothing found for selected filters in GCE!", fg="yellow")
-
-    click.secho("Checking EKS...", fg='green')
-    eks_clusters = list_clusters_eks(tags_dict=params, verbose=verbose)
-    if eks_clusters:
-        eks_table = PrettyTable(["Name", "TestId", "Region", "RunByUser", "CreateTime"])
-        eks_table.align = "l"
-        eks_table.sortby = 'CreateTime'
-        for cluster in eks_clusters:
-            tags = gce_meta_to_dict(cluster.extra['metadata'])
-            eks_table.add_row([cluster.name,
-                               tags.get('TestId', 'N/A') if tags else "N/A",
-                               cluster.region_name,
-                               tags.get('RunByUser', 'N/A') if tags else "N/A",
-                               cluster.create_time,
-                               ])
-        click.echo(eks_table.get_string(title="EKS clusters"))
-    else:
-        click.secho("Nothing found for selected filters in EKS!", fg="yellow")
-
-    click.secho("Checking Docker...", fg="green")
-    docker_resources = \
-        list_resources_docker(tags_dict=params, running=get_all_running, group_as_builder=True, verbose=verbose)
-
-    if any(docker_resources.values()):
-        if docker_resources.get("containers"):
-            docker_table = PrettyTable(["Name", "Builder", "Public IP" if get_all_running else "Status",
-                                        "TestId", "RunByUser", "Created"])
-            docker_table.align = "l"
-            docker_table.sortby = "Created"
-            for builder_name, docker_containers in docker_resources["containers"].items():
-                for container in docker_containers:
-                    container.reload()
-                    docker_table.add_row([
-                        container.name,
-                        builder_name,
-                        container.attrs["NetworkSettings"]["IPAddress"] if get_all_running else container.status,
-                        container.labels.get("TestId", "N/A"),
-                        container.labels.get("RunByUser", "N/A"),
-                        container.attrs.get("Created", "N/A"),
-                    ])
-            click.echo(docker_table.get_string(title="Containers used on Docker"))
-        if docker_resources.get("images"):
-            docker_table = PrettyTable(["Name", "Builder", "TestId", "RunByUser", "Created"])
-            docker_table.align = "l"
-            docker_table.sortby = "Created"
-            for builder_name, docker_images in docker_resources["images"].items():
-                for image in docker_images:
-                    image.reload()
-                    for tag in image.tags:
-                        docker_table.add_row([
-                            tag,
-                            builder_name,
-                            image.labels.get("TestId", "N/A"),
-                            image.labels.get("RunByUser", "N/A"),
-                            image.attrs.get("Created", "N/A"),
-                        ])
-            click.echo(docker_table.get_string(title="Images used on Docker"))
+    snapshot = ResourcesSnapshot.load(max_age=snapshot_max_age) if snapshot_max_age else None
+    if snapshot:
+        click.secho(f"Use resources snapshot taken {snapshot.age:.0f} seconds ago", fg="green")
     else:
-        click.secho("Nothing found for selected filters in Docker!", fg="yellow")
+        click.secho("Checking AWS EC2, AWS Elastic IPs, EKS, GCE, GKE and Docker...", fg="green")
+        if snapshot_max_age:
+            # Collect resources without filters to be able to reuse the snapshot with any filters next time.
+            snapshot = ResourcesInventory(verbose=verbose).collect()
+            snapshot.save()
+        else:
+            snapshot = ResourcesInventory(tags_dict=params, verbose=verbose).collect()
+    for provider in snapshot.errors:
+        click.secho(f"Failed to list resources of `{provider}', results can be incomplete!", fg="red")
+
+    def show(provider, kind, title, header, row, sortby):
+        if items := snapshot.filter(tags_dict=params, provider=provider, kind=kind, running=get_all_running):
+            table = PrettyTable(header)
+            table.align = "l"
+            table.sortby = sortby
+            for item in items:
+                table.add_row(row(item))
+            click.echo(table.get_string(title=title))
+        else:
+            click.secho(f"Nothing found for selected filters in {title}!", fg="yellow")
+
+    state_header = "PublicIP" if get_all_running else "State"
+
+    def state(item):
+        return item.public_ip if get_all_running else item.state
+
+    show("aws", "instance", "Instances used on AWS",
+         ["Name", "Region-AZ", state_header, "TestId", "RunByUser", "LaunchTime"],
+         lambda item: [item.name, item.extra.get("availability_zone", item.region), state(item),
+                       item.tags.get("TestId", "N/A"), item.tags.get("RunByUser", "N/A"), item.created],
+         sortby="LaunchTime")
+    show("aws", "elastic_ip", "EIPs used on AWS",
+         ["AllocationId", "PublicIP", "TestId", "RunByUser", "InstanceId (attached to)"],
+         lambda item: [item.id, item.public_ip, item.tags.get("TestId", "N/A"), item.tags.get("RunByUser", "N/A"),
+                       item.extra.get("instance_id", "N/A")],
+         sortby="AllocationId")
+    show("gke", "cluster", "GKE clusters",
+         ["Name", "Region-AZ", "TestId", "RunByUser", "CreateTime"],
+         lambda item: [item.name, item.region, item.tags.get("TestId", "N/A"), item.tags.get("RunByUser", "N/A"),
+                       item.created],
+         sortby="CreateTime")
+    show("gce", "instance", "Resources used on GCE",
+         ["Name", "Region-AZ", state_header, "TestId", "RunByUser", "LaunchTime"],
+         lambda item: [item.name, item.region, state(item), item.tags.get("TestId", "N/A"),
+                       item.tags.get("RunByUser", "N/A"), item.created],
+         sortby="LaunchTime")
+    show("eks", "cluster", "EKS clusters",
+         ["Name", "TestId", "Region", "RunByUser", "CreateTime"],
+         lambda item: [item.name, item.tags.get("TestId", "N/A"), item.region, item.tags.get("RunByUser", "N/A"),
+                       item.created],
+         sortby="CreateTime")
+    show("docker", "container", "Containers used on Docker",
+         ["Name", "Builder", "Public IP" if get_all_running else "Status", "TestId", "RunByUser", "Created"],
+         lambda item: [item.name, item.region, state(item), item.tags.get("TestId", "N/A"),
+                       item.tags.get("RunByUser", "N/A"), item.created],
+         sortby="Created")
+    show("docker", "image", "Images used on Docker",
+         ["Name", "Builder", "TestId", "RunByUser", "Created"],
+         lambda item: [item.name, item.region, item.tags.get("TestId", "N/A"), item.tags.get("RunByUser", "N/A"),
+                       item.created],
+         sortby="Created")
 
 
 @cli.command('list-ami-versions', help='list Amazon Scylla formal AMI versions')
@@ -493,10 +465,12 @@ def list_resources(ctx, user, test_id, get_all, get_all_running, verbose):
               default='eu-west-1',
               help="a region to look for AMIs (default: eu-west-1)")
 @click.option('-a', '--arch',
-              type=click.Choice(AwsArchType.__args__),
+              type=LazyChoice(aws_arch_types),
               default='x86_64',
               help="architecture of the AMI (default: x86_64)")
-def list_ami_versions(region: str, arch: AwsArchType):
+def list_ami_versions(region: str, arch: "AwsArchType"):
+    from sdcm.utils.common import get_scylla_ami_versions
+
     add_file_logger()
 
     tbl = PrettyTable(field_names=["Name", "ImageId", "CreationDate"], align="l")
@@ -512,11 +486,13 @@ def list_ami_versions(region: str, arch: AwsArchType):
               default='eu-west-1',
               help="a region to look for AMIs (default: eu-west-1)")
 @click.option('-a', '--arch',
-              type=click.Choice(AwsArchType.__args__),
+              type=LazyChoice(aws_arch_types),
               default='x86_64',
               help="architecture of the AMI (default: x86_64)")
 @click.argument('version', type=str, default='branch-3.1:all')
-def list_ami_branch(region: str, arch: AwsArchType, version: str):
+def list_ami_branch(region: str, arch: "AwsArchType", version: str):
+    from sdcm.utils.common import get_branched_ami
+
     add_file_logger()
 
     def get_tags(ami):
@@ -539,6 +515,8 @@ def list_ami_branch(region: str, arch: AwsArchType, version: str):
 
 @cli.command("list-gce-images-versions", help="list Scylla formal GCE images versions")
 def list_gce_images_versions():
+    from sdcm.utils.common import get_scylla_gce_images_versions
+
     add_file_logger()
 
     tbl = PrettyTable(field_names=["Name", "ImageId", "CreationDate"], align="l")
@@ -551,6 +529,8 @@ def list_gce_images_versions():
     \n\n[VERSION] is a branch version to look for, ex. 'branch-2019.1:latest', 'branch-3.1:all'""")
 @click.argument("version", type=str, default="branch-3.1:all")
 def list_gce_images_branch(version):
+    from sdcm.utils.common import get_branched_gce_images
+
     add_file_logger()
 
     if ":" not in version:
@@ -575,6 +555,8 @@ def list_gce_images_branch(version):
                                                          'jessie', 'stretch', 'buster', 'bullseye']),  # Debian
               default=None, help='deb style versions')
 def list_repos(dist_type, dist_version):
+    from sdcm.utils.common import get_s3_scylla_repos_mapping
+
     add_file_logger()
 
     if not dist_type == 'centos' and dist_version is None:
@@ -606,6 +588,8 @@ def get_scylla_base_versions(scylla_version, scylla_repo, linux_distro, only_pri
     get the base versions according to the scylla repo and distro type, then we don't need to hardcode
     the base version for each branch.
     """
+    from utils.get_supported_scylla_base_versions import UpgradeBaseVersion  # pylint: disable=no-name-in-module,import-error
+
     add_file_logger()
 
     version_detector = UpgradeBaseVersion(scylla_repo, linux_distro, scylla_version)
@@ -635,8 +619,10 @@ def get_scylla_base_versions(scylla_version, scylla_repo, linux_distro, only_pri
 
 @cli.command('output-conf', help="Output test configuration readed from the file")
 @click.argument('config_files', type=str, default='')
-@click.option('-b', '--backend', type=click.Choice(SCTConfiguration.available_backends))
+@click.option('-b', '--backend', type=LazyChoice(available_backends))
 def output_conf(config_files, backend):
+    from sdcm.sct_config import SCTConfiguration
+
     add_file_logger()
 
     if backend:
@@ -649,6 +635,8 @@ def output_conf(config_files, backend):
 
 
 def _run_yaml_test(backend, full_path, env):
+    from sdcm.sct_config import SCTConfiguration
+
     output = []
     error = False
     output.append(f'---- linting: {full_path} -----')
@@ -671,7 +659,7 @@ def _run_yaml_test(backend, full_path, env):
 
 
 @cli.command(help="Test yaml in test-cases directory")
-@click.option('-b', '--backend', type=click.Choice(SCTConfiguration.available_backends), default='aws')
+@click.option('-b', '--backend', type=LazyChoice(available_backends), default='aws')
 @click.option('-i', '--include', type=str, default='')
 @click.option('-e', '--exclude', type=str, default='')
 def lint_yamls(backend, exclude: str, include: str):  # pylint: disable=too-many-locals,too-many-branches
@@ -723,8 +711,10 @@ def lint_yamls(backend, exclude: str, include: str):  # pylint: disable=too-many
 
 @cli.command(help="Check test configuration file")
 @click.argument('config_file', type=str, default='')
-@click.option('-b', '--backend', type=click.Choice(SCTConfiguration.available_backends), default='aws')
+@click.option('-b', '--backend', type=LazyChoice(available_backends), default='aws')
 def conf(config_file, backend):
+    from sdcm.sct_config import SCTConfiguration
+
     add_file_logger()
 
     if backend:
@@ -747,6 +737,8 @@ def conf(config_file, backend):
 @cli.command('conf-docs', help="Show all available configuration in yaml/markdown format")
 @click.option('-o', '--output-format', type=click.Choice(["yaml", "markdown"]), default="yaml", help="type of the output")
 def conf_docs(output_format):
+    from sdcm.sct_config import SCTConfiguration
+
     add_file_logger()
 
     os.environ['SCT_CLUSTER_BACKEND'] = "aws"  # just to pass SCTConfiguration() verification.
@@ -764,6 +756,10 @@ def conf_docs(output_format):
 @click.option("-e", "--emails", required=True, type=str, help="Comma separated list of emails. Example a@b.com,c@d.com")
 @click.option("-l", "--logdir", required=True, type=str, help="Dir configured to store SCT logs")
 def perf_regression_report(es_id, emails, logdir):
+    from sdcm.results_analyze import PerformanceResultsAnalyzer
+    from sdcm.send_email import read_email_data_from_file, send_perf_email
+    from sdcm.utils.common import format_timestamp, list_logs_by_test_id
+
     add_file_logger()
     emails = emails.split(',')
     if not emails:
@@ -792,6 +788,8 @@ def investigate():
 @click.argument('test_id')
 @click.option('-o', '--output-format', type=click.Choice(["table", "markdown"]), default="table", help="type of the output")
 def show_log(test_id, output_format):
+    from sdcm.utils.common import list_logs_by_test_id
+
     add_file_logger()
 
     files = list_logs_by_test_id(test_id)
@@ -813,6 +811,9 @@ def show_log(test_id, output_format):
 @click.option("--date-time", type=str, required=False, help='Datetime of monitor-set archive is collected')
 @click.option("--kill", type=bool, required=False, help='Kill and remove containers')
 def show_monitor(test_id, date_time, kill):
+    from sdcm.monitorstack import (restore_monitoring_stack, get_monitoring_stack_services,
+                                   kill_running_monitoring_stack_services)
+
     add_file_logger()
 
     click.echo('Search monitoring stack archive files for test id {} and restoring...'.format(test_id))
@@ -840,6 +841,8 @@ def show_monitor(test_id, date_time, kill):
 @investigate.command('show-jepsen-results', help="Run a server with Jepsen results")
 @click.argument('test_id')
 def show_jepsen_results(test_id):
+    from sdcm.utils.jepsen import JepsenResults
+
     add_file_logger()
 
     click.secho(message=f"\nSearch Jepsen results archive files for test id {test_id} and restoring...\n", fg="green")
@@ -858,6 +861,8 @@ def show_jepsen_results(test_id):
 @investigate.command('search-builder', help='Search builder where test run with test-id located')
 @click.argument('test-id')
 def search_builder(test_id):
+    from sdcm.utils.common import get_builder_by_test_id
+
     logging.getLogger("paramiko").setLevel(logging.CRITICAL)
     add_file_logger()
 
@@ -877,6 +882,8 @@ def search_builder(test_id):
 @click.option("--last-n", type=int, required=False, help="return last n lines from events.log file")
 @click.option("--save-to", type=str, required=False, help="Download events.log file and save to provided dir")
 def show_events(test_id: str, follow: bool = False, last_n: int = None, save_to: str = None):
+    from sdcm.utils.common import get_builder_by_test_id
+
     logging.getLogger("paramiko").setLevel(logging.CRITICAL)
     add_file_logger()
     builders = get_builder_by_test_id(test_id)
@@ -911,6 +918,8 @@ cli.add_command(investigate)
 @click.option("-t", "--test", required=False, default="",
               help="Run specific test file from unit-tests directory")
 def unit_tests(test):
+    import pytest
+
     sys.exit(pytest.main(['-v', '-p', 'no:warnings', 'unit_tests/{}'.format(test)]))
 
 
@@ -947,7 +956,7 @@ class OutputLogger():
 
 @cli.command('run-test', help="Run SCT test using unittest")
 @click.argument('argv')
-@click.option('-b', '--backend', type=click.Choice(SCTConfiguration.available_backends), help="Backend to use")
+@click.option('-b', '--backend', type=LazyChoice(available_backends), help="Backend to use")
 @click.option('-c', '--config', multiple=True, type=click.Path(exists=True), help="Test config .yaml to use, can have multiple of those")
 @click.option('-l', '--logdir', help="Directory to use for logs")
 def run_test(argv, backend, config, logdir):
@@ -969,10 +978,12 @@ def run_test(argv, backend, config, logdir):
 
 @cli.command('run-pytest', help="Run tests using pytest")
 @click.argument('target')
-@click.option('-b', '--backend', type=click.Choice(SCTConfiguration.available_backends), help="Backend to use")
+@click.option('-b', '--backend', type=LazyChoice(available_backends), help="Backend to use")
 @click.option('-c', '--config', multiple=True, type=click.Path(exists=True), help="Test config .yaml to use, can have multiple of those")
 @click.option('-l', '--logdir', help="Directory to use for logs")
 def run_pytest(target, backend, config, logdir):
+    import pytest
+
     if config:
         os.environ['SCT_CONFIG_FILES'] = str(list(config))
     if backend:
@@ -998,6 +1009,9 @@ def run_pytest(target, backend, config, logdir):
 @click.option("-u", "--user", required=False, type=str, default="",
               help="User or instance owner. Applicable for last-7-days-* reports")
 def cloud_usage_report(emails, report_type, user):
+    from sdcm.utils.cloud_monitor import cloud_report, cloud_qa_report
+    from sdcm.utils.cloud_monitor.cloud_monitor import cloud_non_qa_report
+
     add_file_logger()
 
     email_list = emails.split(",")
@@ -1016,9 +1030,11 @@ def cloud_usage_report(emails, report_type, user):
 @click.option('--config-file', type=str, help='config test file path')
 def collect_logs(test_id=None, logdir=None, backend=None, config_file=None):
     # pylint: disable=too-many-nested-blocks,too-many-branches
+    from sdcm.logcollector import Collector
+    from sdcm.sct_config import SCTConfiguration
+
     add_file_logger()
 
-    from sdcm.logcollector import Collector  # pylint: disable=import-outside-toplevel
     logging.getLogger("paramiko").setLevel(logging.CRITICAL)
     if backend is None:
         if os.environ.get('SCT_CLUSTER_BACKEND', None) is None:
@@ -1057,7 +1073,7 @@ def collect_logs(test_id=None, logdir=None, backend=None, config_file=None):
 
 def store_logs_in_argus(test_id: UUID, logs: dict[str, list[list[str] | str]]):
     try:
-        from sdcm.argus_test_run import ArgusTestRun  # pylint: disable=import-outside-toplevel
+        from sdcm.argus_test_run import ArgusTestRun
         test_run = ArgusTestRun.get(test_id=test_id)
         for _, s3_links in logs.items():
             for link in s3_links:
@@ -1070,6 +1086,8 @@ def store_logs_in_argus(test_id: UUID, logs: dict[str, list[list[str] | str]]):
 
 
 def get_test_results_for_failed_test(test_status, start_time):
+    from sdcm.utils.common import format_timestamp
+
     return {
         "job_url": os.environ.get("BUILD_URL"),
         "subject": f"{test_status}: {os.environ.get('JOB_NAME')}: {start_time}",
@@ -1094,6 +1112,17 @@ def get_test_results_for_failed_test(test_status, start_time):
 @click.option('--logdir', help='Directory where to find testrun folder')
 def send_email(test_id=None, test_status=None, start_time=None, started_by=None, runner_ip=None,
                email_recipients=None, logdir=None):
+    from sdcm.results_analyze import BaseResultsAnalyzer
+    from sdcm.send_email import get_running_instances_for_email_report, read_email_data_from_file, build_reporter, \
+        send_perf_email
+    from sdcm.utils.common import (
+        format_timestamp,
+        get_testrun_dir,
+        list_logs_by_test_id,
+        list_parallel_timelines_report_urls,
+    )
+    from sdcm.utils.get_username import get_username
+
     if started_by is None:
         started_by = get_username()
     add_file_logger()
@@ -1188,6 +1217,8 @@ def send_email(test_id=None, test_status=None, start_time=None, started_by=None,
 @click.option('--sct_branch', default='master', type=str)
 @click.option('--sct_repo', default='git@github.com:scylladb/scylla-cluster-tests.git', type=str)
 def create_operator_test_release_jobs(branch, username, password, sct_branch, sct_repo):
+    from utils.build_system.create_test_release_jobs import JenkinsPipelines  # pylint: disable=no-name-in-module,import-error
+
     add_file_logger()
 
     base_job_dir = "scylla-operator"
@@ -1221,6 +1252,8 @@ def create_operator_test_release_jobs(branch, username, password, sct_branch, sc
 @click.option('--sct_branch', default='master', type=str)
 @click.option('--sct_repo', default='git@github.com:scylladb/scylla-cluster-tests.git', type=str)
 def create_test_release_jobs(branch, username, password, sct_branch, sct_repo):
+    from utils.build_system.create_test_release_jobs import JenkinsPipelines  # pylint: disable=no-name-in-module,import-error
+
     add_file_logger()
 
     base_job_dir = f'{branch}'
@@ -1276,6 +1309,8 @@ def create_test_release_jobs(branch, username, password, sct_branch, sct_repo):
 @click.option('--sct_branch', default='master', type=str)
 @click.option('--sct_repo', default='git@github.com:scylladb/scylla-cluster-tests.git', type=str)
 def create_test_release_jobs_enterprise(branch, username, password, sct_branch, sct_repo):
+    from utils.build_system.create_test_release_jobs import JenkinsPipelines  # pylint: disable=no-name-in-module,import-error
+
     add_file_logger()
 
     base_job_dir = f'{branch}'
@@ -1302,6 +1337,9 @@ def create_test_release_jobs_enterprise(branch, username, password, sct_branch,
 @cloud_provider_option
 @click.option("-r", "--region", required=True, type=CloudRegion(), help="Cloud region")
 def prepare_region(cloud_provider, region):
+    from sdcm.utils.aws_region import AwsRegion
+    from sdcm.utils.azure_region import AzureRegion
+
     add_file_logger()
     if cloud_provider == "aws":
         region = AwsRegion(region_name=region)
@@ -1312,16 +1350,26 @@ def prepare_region(cloud_provider, region):
     region.configure()
 
 
+def create_runner_image_help() -> str:
+    from sdcm.sct_runner import AwsSctRunner, GceSctRunner, AzureSctRunner
+
+    return f"Create an SCT runner image in the selected cloud region." \
+           f" If the requested region is not a source region" \
+           f" (aws: {AwsSctRunner.SOURCE_IMAGE_REGION}, gce: {GceSctRunner.SOURCE_IMAGE_REGION}," \
+           f" azure: {AzureSctRunner.SOURCE_IMAGE_REGION}) the image will be first created in the" \
+           f" source region and then copied to the chosen one."
+
+
 @cli.command("create-runner-image",
-             help=f"Create an SCT runner image in the selected cloud region."
-                  f" If the requested region is not a source region"
-                  f" (aws: {AwsSctRunner.SOURCE_IMAGE_REGION}, gce: {GceSctRunner.SOURCE_IMAGE_REGION},"
-                  f" azure: {AzureSctRunner.SOURCE_IMAGE_REGION}) the image will be first created in the"
-                  f" source region and then copied to the chosen one.")
+             cls=LazyHelpCommand,
+             help_factory=create_runner_image_help,
+             short_help="Create an SCT runner image in the selected cloud region.")
 @cloud_provider_option
 @click.option("-r", "--region", required=True, type=CloudRegion(), help="Cloud region")
 @click.option("-z", "--availability-zone", default="", type=str, help="Name of availability zone, ex. 'a'")
 def create_runner_image(cloud_provider, region, availability_zone):
+    from sdcm.sct_runner import get_sct_runner
+
     if cloud_provider == "aws" and availability_zone != "":
         assert len(availability_zone) == 1, f"Invalid AZ: {availability_zone}, availability-zone is one-letter a-z."
     add_file_logger()
@@ -1343,6 +1391,8 @@ def create_runner_image(cloud_provider, region, availability_zone):
               help="Test ID of the test that the runner is created for restore monitor")
 def create_runner_instance(cloud_provider, region, availability_zone, instance_type, root_disk_size_gb,
                            test_id, duration, restore_monitor=False, restored_test_id=""):
+    from sdcm.sct_runner import get_sct_runner
+
     if cloud_provider == "aws":
         assert len(availability_zone) == 1, f"Invalid AZ: {availability_zone}, availability-zone is one-letter a-z."
     add_file_logger()
@@ -1377,6 +1427,8 @@ def create_runner_instance(cloud_provider, region, availability_zone, instance_t
 @click.option("-ip", "--runner-ip", required=False, type=str, default="")
 @click.option('--dry-run', is_flag=True, default=False, help='dry run')
 def clean_runner_instances(test_status, runner_ip, dry_run):
+    from sdcm.sct_runner import clean_sct_runners
+
     add_file_logger()
     clean_sct_runners(test_status=test_status, test_runner_ip=runner_ip, dry_run=dry_run)
 
@@ -1392,6 +1444,8 @@ def clean_runner_instances(test_status, runner_ip, dry_run):
 @click.option("-f", "--force", is_flag=True, default=False, help="don't check aws_mock_ip")
 @click.option("-t", "--test-id", required=False, help="SCT Test ID")
 def run_aws_mock(mock_region: list[str], force: bool = False, test_id: str | None = None) -> None:
+    from utils.mocks.aws_mock import AwsMock  # pylint: disable=no-name-in-module
+
     add_file_logger()
     if test_id is None:
         test_id = str(uuid.uuid4())
@@ -1411,6 +1465,8 @@ def run_aws_mock(mock_region: list[str], force: bool = False, test_id: str | Non
 @click.option('--verbose', is_flag=True, default=False, help="if enable, will log progress")
 @click.option("--dry-run", is_flag=True, default=False, help="dry run")
 def clean_aws_mocks(test_id: str | None, all_mocks: bool, verbose: bool, dry_run: bool) -> None:
+    from utils.mocks.aws_mock import AwsMock  # pylint: disable=no-name-in-module
+
     add_file_logger()
     AwsMock.clean(test_id=test_id, all_mocks=all_mocks, verbose=verbose, dry_run=dry_run)
 
@@ -1420,6 +1476,9 @@ def clean_aws_mocks(test_id: str | None, all_mocks: bool, verbose: bool, dry_run
 @click.option("-d", "--logdir", envvar='HOME', type=click.Path(exists=True),
               help="Directory with sct-results folder")
 def generate_parallel_timelines_report(logdir: str | None, test_id: str | None) -> None:
+    from sdcm.parallel_timeline_report.generate_pt_report import ParallelTimelinesReportGenerator
+    from sdcm.utils.common import get_testrun_dir
+
     add_file_logger()
 
     event_log_file = "raw_events.log"
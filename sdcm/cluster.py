@@ -29,11 +29,12 @@ import uuid
 import itertools
 import json
 import ipaddress
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait as wait_for_futures
 from pathlib import Path
-from typing import List, Optional, Dict, Union, Set, Iterable, ContextManager
+from typing import List, Optional, Dict, Union, Set, Iterable, ContextManager, Callable
 from datetime import datetime
 from textwrap import dedent
-from functools import cached_property, wraps
+from functools import cached_property, partial, wraps
 from collections import defaultdict
 from collections.abc import Iterator
 from dataclasses import dataclass
@@ -67,7 +68,10 @@ from sdcm.provision.scylla_yaml.cluster_builder import ScyllaYamlClusterAttrBuil
 from sdcm.provision.scylla_yaml.scylla_yaml import ScyllaYaml
 from sdcm.provision.helpers.certificate import install_client_certificate, install_encryption_at_rest_files
 from sdcm.remote import RemoteCmdRunnerBase, LOCALRUNNER, NETWORK_EXCEPTIONS, shell_script_cmd
-from sdcm.remote.remote_file import remote_file, yaml_file_to_dict, dict_to_yaml_file
+from sdcm.remote.libssh2_client import Client as LibSSH2Client
+from sdcm.remote.libssh2_client.exceptions import FailedToRunCommand
+from sdcm.remote.libssh2_client.multiplexer import MultiplexedExecutor, MultiplexedCommandResult, OutputCallback
+from sdcm.remote.remote_file import yaml_file_to_dict, dict_to_yaml_file, RemoteFilesTransaction
 from sdcm import wait, mgmt
 from sdcm.sct_config import SCTConfiguration
 from sdcm.sct_events.continuous_event import ContinuousEventsRegistry
@@ -85,6 +89,7 @@ from sdcm.utils.common import (
     download_dir_from_cloud,
     generate_random_string,
     prepare_and_start_saslauthd_service,
+    ParallelObject,
 )
 from sdcm.utils.ci_tools import get_test_name
 from sdcm.utils.distro import Distro
@@ -95,6 +100,11 @@ from sdcm.utils.health_checker import check_nodes_status, check_node_status_in_g
     check_schema_version, check_nulls_in_peers, check_schema_agreement_in_gossip_and_peers, \
     CHECK_NODE_HEALTH_RETRIES, CHECK_NODE_HEALTH_RETRY_DELAY
 from sdcm.utils.decorators import NoValue, retrying, log_run_info, optional_cached_property
+from sdcm.utils.package_mirror import PackageMirror
+from sdcm.utils.disk_usage import DiskUsageSampler, DiskUsageError
+from sdcm.utils.debuginfo_cache import DebuginfoCache, DebuginfoCacheError, find_debuginfo_file
+from sdcm.utils.setup_steps import SetupStep, SetupStepsRunner, PACKAGE_MANAGER, SCYLLA_CONFIG
+from sdcm.utils.ring_watcher import RingStateWatcher, RingStateWatcherError, RingStateTimeout, RING_CONNECT_RETRY_DELAY
 from sdcm.utils.remotewebbrowser import WebDriverContainerMixin
 from sdcm.test_config import TestConfig
 from sdcm.utils.version_utils import SCYLLA_VERSION_RE, get_gemini_version, get_systemd_version, assume_version
@@ -113,6 +123,7 @@ from sdcm.utils.ldap import LDAP_SSH_TUNNEL_LOCAL_PORT, LDAP_BASE_OBJECT, LDAP_P
     LDAP_PORT, DEFAULT_PWD_SUFFIX
 from sdcm.utils.remote_logger import get_system_logging_thread
 from sdcm.utils.scylla_args import ScyllaArgParser
+from sdcm.utils.sstable.sstable_inventory import SstableInventory
 from sdcm.utils.file import File
 from sdcm.utils import cdc
 from sdcm.coredump import CoredumpExportSystemdThread
@@ -259,6 +270,7 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
 
         self.termination_event = threading.Event()
         self.lock = threading.Lock()
+        self._remote_config_transactions: Dict[int, RemoteFilesTransaction] = {}
 
         self._running_nemesis = None
 
@@ -567,6 +579,10 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
         self.log.info("Detected Linux distribution: %s", _distro.name)
         return _distro
 
+    @cached_property
+    def sstable_inventory(self) -> SstableInventory:
+        return SstableInventory(node=self)
+
     @cached_property
     def is_nonroot_install(self):
         return self.parent_cluster.params.get("unified_package") \
@@ -886,6 +902,19 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
         with self.remote_scylla_yaml() as scylla_yaml:
             return scylla_yaml.broadcast_rpc_address if scylla_yaml.broadcast_rpc_address else self.ip_address
 
+    @property
+    def broadcast_address(self):
+        """Address of the node in the ring, i.e., in `nodetool status' and `system.peers'."""
+        if self.is_kubernetes():
+            return self.ip_address
+        return self._scylla_yaml_broadcast_address or self.ip_address
+
+    @cached_property
+    def _scylla_yaml_broadcast_address(self) -> Optional[str]:
+        """Cached `broadcast_address' from scylla.yaml, it's forgotten when scylla.yaml is changed."""
+        with self.remote_scylla_yaml() as scylla_yaml:
+            return scylla_yaml.broadcast_address
+
     @property
     def ip_address(self):
         if self.test_config.IP_SSH_CONNECTIONS == "ipv6":
@@ -996,7 +1025,9 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
                 ).publish_or_dump()
 
     def start_coredump_thread(self):
-        self._coredump_thread = CoredumpExportSystemdThread(self, self._maximum_number_of_cores_to_publish)
+        self._coredump_thread = CoredumpExportSystemdThread(
+            self, self._maximum_number_of_cores_to_publish,
+            streaming_upload=self.parent_cluster.params.get("coredump_streaming_upload"))
         self._coredump_thread.start()
 
     def start_db_log_reader_thread(self):
@@ -1479,7 +1510,7 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
         self._decoding_backtraces_thread.start()
 
     def decode_backtrace(self):
-        scylla_debug_file = None
+        scylla_debug_files = {}
         while True:
             event = None
             obj = None
@@ -1488,8 +1519,10 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
                 if obj is None:
                     break
                 event = obj["event"]
-                if not scylla_debug_file:
-                    scylla_debug_file = self.copy_scylla_debug_info(obj["node"], obj["debug_file"])
+                build_id = obj.get("build_id")
+                if (scylla_debug_file := scylla_debug_files.get(build_id)) is None:
+                    scylla_debug_file = scylla_debug_files[build_id] = \
+                        self.copy_scylla_debug_info(obj["node"], obj["debug_file"], build_id)
                 output = self.decode_raw_backtrace(scylla_debug_file, " ".join(event.raw_backtrace.split('\n')))
                 event.backtrace = output.stdout
             except queue.Empty:
@@ -1503,23 +1536,44 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
 
             if self.termination_event.is_set() and self.test_config.DECODING_QUEUE.empty():
                 break
+        if self.parent_cluster and (db_cluster := self.parent_cluster.targets.get('db_cluster')):
+            db_cluster.debuginfo_cache.report()
 
-    def copy_scylla_debug_info(self, node_name: str, debug_file: str):
+    def copy_scylla_debug_info(self, node_name: str, debug_file: Optional[str], build_id: Optional[str] = None):
         """Copy scylla debug file from db-node to monitor-node
 
-        Copy via builder
+        Copy via builder.  If build id is known, the file is taken from the debuginfo cache of the DB cluster,
+        so it's downloaded from DB nodes once per build id.
         :param node_name: db node name
         :type node_name: str
-        :param scylla_debug_file: path to scylla_debug_file on db-node
-        :type scylla_debug_file: str
+        :param debug_file: path to scylla_debug_file on db-node (None if debuginfo is not installed on it)
+        :type debug_file: str
+        :param build_id: build id of Scylla on db-node
+        :type build_id: str
         :returns: path on monitor node
         :rtype: {str}
         """
 
-        db_nodes = self.parent_cluster.targets['db_cluster'].nodes
-        db_node = next(iter([n for n in db_nodes if n.name == node_name]), None)
+        db_cluster = self.parent_cluster.targets['db_cluster']
+        db_node = next(iter([n for n in db_cluster.nodes if n.name == node_name]), None)
         assert db_node, f"Node named: {node_name} wasn't found"
 
+        if build_id:
+            try:
+                return db_cluster.debuginfo_cache.deliver(build_id, self.remoter, node=db_node, debug_file=debug_file)
+            except DebuginfoCacheError as exc:
+                self.log.warning("%s, install it on %s", exc, db_node)
+                db_node.install_scylla_debuginfo_package()
+                return db_cluster.debuginfo_cache.deliver(
+                    build_id, self.remoter, node=db_node,
+                    debug_file=find_debuginfo_file(db_node.remoter, build_id=build_id))
+
+        if debug_file is None:
+            self.log.warning("Scylla debug information is not found on %s, install it", db_node)
+            db_node.install_scylla_debuginfo_package()
+            if (debug_file := find_debuginfo_file(db_node.remoter)) is None:
+                raise DebuginfoCacheError(f"Scylla debug information is not found on {db_node}")
+
         base_scylla_debug_file = os.path.basename(debug_file)
         transit_scylla_debug_file = os.path.join(db_node.parent_cluster.logdir,
                                                  base_scylla_debug_file)
@@ -1569,21 +1623,42 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
         cmd = cmd.format(datacenters[self.dc_idx], dc_suffix)
         self.remoter.run(cmd)
 
+    @contextlib.contextmanager
+    def remote_config_transaction(self, prefetch: Iterable[str] = ()) -> ContextManager[RemoteFilesTransaction]:
+        """Collect all edits of remote config files made in the current thread and apply them at once on exit.
+
+        `remote_scylla_yaml()', `remote_manager_agent_yaml()', etc. used inside of the transaction don't touch
+        the node but edit files in the transaction.  Files listed in `prefetch' are read by one remote command.
+        Nested transactions are merged into the outer one.
+        """
+        thread_id = threading.get_ident()
+        if (transaction := self._remote_config_transactions.get(thread_id)) is not None:
+            transaction.fetch(*prefetch)
+            yield transaction
+            return
+        transaction = RemoteFilesTransaction(remoter=self.remoter)
+        transaction.fetch(*prefetch)
+        self._remote_config_transactions[thread_id] = transaction
+        try:
+            yield transaction
+        finally:
+            del self._remote_config_transactions[thread_id]
+        transaction.commit()
+
+    @contextlib.contextmanager
     def _remote_yaml(self, path):
         self.log.debug("Update %s YAML file", path)
-        return remote_file(remoter=self.remoter,
-                           remote_path=path,
-                           serializer=dict_to_yaml_file,
-                           deserializer=yaml_file_to_dict,
-                           sudo=True)
+        with self.remote_config_transaction() as transaction, \
+                transaction.edit(path=path, serializer=dict_to_yaml_file, deserializer=yaml_file_to_dict) as data:
+            yield data
 
+    @contextlib.contextmanager
     def _remote_properties(self, path):
         self.log.debug("Update %s properties configuration file", path)
-        return remote_file(remoter=self.remoter,
-                           remote_path=path,
-                           serializer=properties.serialize,
-                           deserializer=properties.deserialize,
-                           sudo=True)
+        with self.remote_config_transaction() as transaction, \
+                transaction.edit(path=path, serializer=properties.serialize,
+                                 deserializer=properties.deserialize) as data:
+            yield data
 
     def remote_cassandra_rackdc_properties(self):
         return self._remote_properties(path=self.add_install_prefix(abs_path=SCYLLA_PROPERTIES_PATH))
@@ -1598,6 +1673,7 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
             if not diff:
                 LOGGER.debug("%s: scylla.yaml hasn't been changed", self)
                 return
+            self.__dict__.pop("_scylla_yaml_broadcast_address", None)
             scylla_yaml.clear()
             scylla_yaml.update(
                 new_scylla_yaml.dict(
@@ -1675,13 +1751,16 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
                      debug_install=False,
                      **_
                      ):
-        with self.remote_scylla_yaml() as scylla_yml:
-            scylla_yml.update(
-                self.parent_cluster.proposed_scylla_yaml,
-                self.proposed_scylla_yaml
-            )
+        # scylla.yaml and sysconfig are read by one remote command and updated by another one.
+        with self.remote_config_transaction(prefetch=(self.add_install_prefix(abs_path=SCYLLA_YAML_PATH),
+                                                      self.scylla_server_sysconfig_path)):
+            with self.remote_scylla_yaml() as scylla_yml:
+                scylla_yml.update(
+                    self.parent_cluster.proposed_scylla_yaml,
+                    self.proposed_scylla_yaml
+                )
 
-        self.process_scylla_args(append_scylla_args)
+            self.process_scylla_args(append_scylla_args)
 
         if debug_install:
             if self.distro.is_rhel_like:
@@ -1728,9 +1807,12 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
 
         if append_scylla_args:
             self.log.debug("Append following args to scylla: `%s'", append_scylla_args)
-            self.remoter.sudo(
-                f"sed -i '/{append_scylla_args}/! s/SCYLLA_ARGS=\"/&{append_scylla_args} /' "
-                f"{self.scylla_server_sysconfig_path}")
+            with self.remote_config_transaction() as transaction, \
+                    transaction.edit(path=self.scylla_server_sysconfig_path, serializer="".join,
+                                     deserializer=lambda fobj: fobj.read().splitlines(keepends=True)) as sysconfig:
+                for idx, line in enumerate(sysconfig):
+                    if append_scylla_args not in line:
+                        sysconfig[idx] = line.replace('SCYLLA_ARGS="', f'SCYLLA_ARGS="{append_scylla_args} ', 1)
 
     def config_client_encrypt(self):
         install_client_certificate(self.remoter)
@@ -1804,6 +1886,16 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
 
         self.remoter.sudo(f'{pkg_cmd} install -y {package_name}')
 
+    def install_packages_from_mirror(self, repo_url: str, packages: str) -> bool:
+        """Install packages using the package mirror of the cluster if it's enabled by `use_package_mirror'.
+
+        Return False if the mirror wasn't used and the packages should be installed in a regular way.
+        """
+        if not self.parent_cluster.params.get("use_package_mirror") \
+                or (package_mirror := getattr(self.parent_cluster, "package_mirror", None)) is None:
+            return False
+        return package_mirror.install(node=self, repo_url=repo_url, packages=packages)
+
     def is_apt_lock_free(self) -> bool:
         result = self.remoter.sudo("lsof /var/lib/dpkg/lock", ignore_status=True)
         return result.exit_status == 1
@@ -1960,7 +2052,8 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
             self.download_scylla_repo(scylla_repo)
             # hack cause of broken caused by EPEL
             self.remoter.run('sudo yum install -y python36-PyYAML', ignore_status=True)
-            self.remoter.run('sudo yum install -y {}'.format(self.scylla_pkg()))
+            if not self.install_packages_from_mirror(repo_url=scylla_repo, packages=self.scylla_pkg()):
+                self.remoter.run('sudo yum install -y {}'.format(self.scylla_pkg()))
             self.remoter.run('sudo yum install -y scylla-gdb', ignore_status=True)
         elif self.distro.is_sles15:
             self.remoter.sudo('zypper install -y rsync tcpdump screen')
@@ -2040,9 +2133,10 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
             self.remoter.run('sudo apt-get install -y rsync tcpdump screen')
             self.download_scylla_repo(scylla_repo)
             self.remoter.run('sudo apt-get update')
-            self.remoter.run(
-                'sudo apt-get install -y '
-                ' {} '.format(self.scylla_pkg()))
+            if not self.install_packages_from_mirror(repo_url=scylla_repo, packages=self.scylla_pkg()):
+                self.remoter.run(
+                    'sudo apt-get install -y '
+                    ' {} '.format(self.scylla_pkg()))
 
         # THIS IS A WORKAROUND FOR ISSUE https://github.com/scylladb/scylla/issues/10442
         # the issue is related to JDK version, and the fix was added to later patches of multiple base versions,
@@ -2119,6 +2213,14 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
             f"curl -sSf get.scylladb.com/server | sudo bash -s -- --scylla-version {version} {product_type}")
 
     def install_scylla_debuginfo(self) -> None:
+        """Install Scylla debuginfo unless other node of the cluster with the same build id has it already."""
+        debuginfo_cache = getattr(self.parent_cluster, "debuginfo_cache", None)
+        if debuginfo_cache is not None and (build_id := self.get_scylla_build_id()):
+            debuginfo_cache.install(node=self, build_id=build_id, install_func=self.install_scylla_debuginfo_package)
+        else:
+            self.install_scylla_debuginfo_package()
+
+    def install_scylla_debuginfo_package(self) -> None:
         if self.distro.is_rhel_like:
             cmd = fr"yum install -y {self.scylla_pkg()}-debuginfo-{self.scylla_version}\*"
         elif self.distro.is_sles:
@@ -3148,8 +3250,61 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
             loader.remoter.send_files(src=src, dst=dst, verbose=verbose)
 
     def run(self, cmd, verbose=False):
-        for loader in self.nodes:
-            loader.remoter.run(cmd=cmd, verbose=verbose)
+        if not all(isinstance(node.remoter, RemoteCmdRunnerBase) and node.remoter.libssh2_client_supported
+                   for node in self.nodes):
+            for loader in self.nodes:
+                loader.remoter.run(cmd=cmd, verbose=verbose)
+            return
+        for node, result in self.run_multiplexed(cmd=cmd).items():
+            if isinstance(result.exception, FailedToRunCommand):
+                # The command wasn't started because of a connection failure, the remoter retries it.
+                node.remoter.run(cmd=cmd, verbose=verbose)
+                continue
+            if verbose:
+                node.remoter._print_command_results(  # pylint: disable=protected-access
+                    result.result, verbose=verbose, ignore_status=False)
+            if result.exception is not None:
+                raise result.exception
+
+    @cached_property
+    def _multiplexed_clients_map(self) -> threading.local:
+        return threading.local()
+
+    @cached_property
+    def _multiplexed_clients_of_all_threads(self) -> List[Dict[str, LibSSH2Client]]:
+        return []
+
+    @property
+    def _multiplexed_clients(self) -> Dict[str, LibSSH2Client]:
+        """libssh2 clients aren't thread safe, so bind them to the current thread, same as remoters do."""
+        if (clients := getattr(self._multiplexed_clients_map, "clients", None)) is None:
+            self._multiplexed_clients_map.clients = clients = {}
+            self._multiplexed_clients_of_all_threads.append(clients)
+        return clients
+
+    def close_multiplexed_clients(self) -> None:
+        """Disconnect clients of `run_multiplexed()' created by all threads."""
+        while self._multiplexed_clients_of_all_threads:
+            MultiplexedExecutor().shutdown(self._multiplexed_clients_of_all_threads.pop())
+
+    def run_multiplexed(self, cmd: str, nodes: Optional[List[BaseNode]] = None, timeout: Optional[float] = None,
+                        ignore_status: bool = False, on_output: Optional[OutputCallback] = None,
+                        ) -> Dict[BaseNode, MultiplexedCommandResult]:
+        """Run a command on many nodes at once from the current thread, without a thread per node.
+
+        `on_output' is called for every line of output as soon as it arrives: on_output(node, stream_name, line).
+        Connections are dedicated to this method and are reused by next calls, they are closed by `destroy()'.
+        Remoters of the nodes should support libssh2 clients (see `libssh2_client_supported'.)
+        """
+        nodes = self.nodes if nodes is None else nodes
+        clients = {}
+        for node in nodes:
+            hostname = node.remoter.hostname
+            if (client := self._multiplexed_clients.get(hostname)) is None:
+                self._multiplexed_clients[hostname] = client = node.remoter.create_libssh2_client()
+            clients[node] = client
+        return MultiplexedExecutor().run(command=cmd, clients=clients, timeout=timeout,
+                                         ignore_status=ignore_status, on_output=on_output)
 
     def run_func_parallel(self, func, node_list=None):
         if node_list is None:
@@ -3213,6 +3368,7 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
         return errors
 
     def destroy(self):
+        self.close_multiplexed_clients()
         self.log.info('Destroy nodes')
         for node in self.nodes:
             node.destroy()
@@ -3509,6 +3665,75 @@ class NodeSetupTimeout(Exception):
     pass
 
 
+def setup_nodes_in_two_phases(cl_inst: "BaseScyllaCluster", node_list: List[BaseNode],  # pylint: disable=too-many-locals
+                              timeout: Optional[float] = None, **setup_kwargs) -> Dict[str, Dict[str, float]]:
+    """
+    Phase 1: run `node_prepare()' for all nodes concurrently (up to `cluster_init_parallelism' nodes at a time.)
+    Phase 2: run `node_startup()' one node at a time, next node is started only after all started nodes are UN.
+
+    Return durations of both phases for each node.  Raise exception if setup failed or timeout (min) expired.
+    """
+    if not node_list:
+        return {}
+    timings = {node.name: {} for node in node_list}
+    deadline = time.perf_counter() + timeout * 60 if timeout else None
+
+    def time_left() -> Optional[float]:
+        if deadline is None:
+            return None
+        if (left := deadline - time.perf_counter()) <= 0:
+            msg = 'TIMEOUT [%d min]: Waiting for node(-s) setup expired!' % timeout
+            cl_inst.log.error(msg)
+            raise NodeSetupTimeout(msg)
+        return left
+
+    def prepare(node: BaseNode) -> None:
+        started = time.perf_counter()
+        cl_inst.node_prepare(node, **setup_kwargs)
+        timings[node.name]["prepare"] = time.perf_counter() - started
+        cl_inst.log.info("Node %s is prepared in %d s", node, timings[node.name]["prepare"])
+
+    parallelism = cl_inst.params.get("cluster_init_parallelism") or len(node_list)
+    cl_inst.log.info("Prepare %d node(s), up to %d in parallel", len(node_list), parallelism)
+    executor = ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="NodePrepareThread")
+    try:
+        futures = {executor.submit(prepare, node): node for node in node_list}
+        done, not_done = wait_for_futures(futures, timeout=time_left(), return_when=FIRST_EXCEPTION)
+        for future in done:
+            if exc := future.exception():
+                raise NodeSetupFailed(node=futures[future], error_msg=str(exc),
+                                      traceback_str="".join(traceback.format_exception(type(exc), exc,
+                                                                                       exc.__traceback__)))
+        if not_done:
+            time_left()  # raise NodeSetupTimeout
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    started_nodes = []
+    for node in node_list:
+        started = time.perf_counter()
+        try:
+            cl_inst.node_startup(node, **setup_kwargs)
+            started_nodes.append(node)
+            # Gate the next node on the ring state instead of a fixed delay.  The ring is always seen by the first
+            # started node, so the ring state watcher connects once and it's reused for all next nodes.
+            cl_inst.wait_for_nodes_up_and_normal(nodes=started_nodes, verification_node=started_nodes[0],
+                                                 timeout=time_left() or 0)
+            node.argus_resource_set_shards()
+            ArgusTestRun.get().save()
+        except NodeSetupTimeout:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            raise NodeSetupFailed(node=node, error_msg=str(exc), traceback_str=traceback.format_exc()) from exc
+        timings[node.name]["startup"] = time.perf_counter() - started
+        cl_inst.log.info("(%d/%d) nodes ready, node %s started in %d s",
+                         len(started_nodes), len(node_list), node, timings[node.name]["startup"])
+    cl_inst.log.info("Nodes setup timings (prepare/startup, s): %s",
+                     ", ".join(f"{name}={phases['prepare']:.0f}/{phases['startup']:.0f}"
+                               for name, phases in timings.items()))
+    return timings
+
+
 def wait_for_init_wrap(method):  # pylint: disable=too-many-statements
     """
     Wraps wait_for_init class method.
@@ -3565,25 +3790,33 @@ def wait_for_init_wrap(method):  # pylint: disable=too-many-statements
             cl_inst.update_db_binary(node_list, start_service=False)
             cl_inst.update_db_packages(node_list, start_service=False)
 
-        for node in node_list:
-            if isinstance(cl_inst, BaseScyllaCluster) \
-                    and not getattr(cl_inst, 'params', {}).get('use_legacy_cluster_init'):
-                init_nodes.append(node)
-                start_time = time.perf_counter()
-                node_setup(node)
-                verify_node_setup(start_time)
-            else:
-                setup_thread = threading.Thread(target=node_setup, name='NodeSetupThread',
-                                                args=(node,), daemon=True)
-                setup_thread.start()
-                if isinstance(cl_inst, BaseScyllaCluster):
-                    cl_inst.log.info("Wait 120 seconds before next node setup")
-                    time.sleep(120)
+        if isinstance(cl_inst, BaseScyllaCluster) and cl_inst.two_phase_node_setup_supported \
+                and not getattr(cl_inst, 'params', {}).get('use_legacy_cluster_init'):
+            for node_name, node_timings in setup_nodes_in_two_phases(cl_inst, node_list, timeout=timeout,
+                                                                     **setup_kwargs).items():
+                cl_inst.node_setup_timings.setdefault(node_name, {}).update(node_timings)
+            results.extend(node_list)
+        else:
+            for node in node_list:
+                if isinstance(cl_inst, BaseScyllaCluster) \
+                        and not getattr(cl_inst, 'params', {}).get('use_legacy_cluster_init'):
+                    init_nodes.append(node)
+                    start_time = time.perf_counter()
+                    node_setup(node)
+                    verify_node_setup(start_time)
+                else:
+                    setup_thread = threading.Thread(target=node_setup, name='NodeSetupThread',
+                                                    args=(node,), daemon=True)
+                    setup_thread.start()
+                    if isinstance(cl_inst, BaseScyllaCluster):
+                        cl_inst.log.info("Wait 120 seconds before next node setup")
+                        time.sleep(120)
 
         while len(results) != len(node_list):
             verify_node_setup(start_time)
 
         if isinstance(cl_inst, BaseScyllaCluster):
+            cl_inst.package_mirror.stop()  # don't keep the HTTP server running on a DB node during the test
             cl_inst.wait_for_nodes_up_and_normal(nodes=node_list, verification_node=node_list[0])
 
         time_elapsed = time.perf_counter() - start_time
@@ -3611,6 +3844,14 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
         self.nemesis_count = 0
         self.test_config = TestConfig()
         self._node_cycle = None
+        self.node_setup_timings = {}
+        self.package_mirror = PackageMirror()
+        self.debuginfo_cache = DebuginfoCache()
+        self._ring_state_watcher = None
+        self._ring_state_watcher_node = None
+        self._ring_state_watcher_failed_at = None
+        self._ring_state_watcher_lock = threading.Lock()
+        self.disk_usage_sampler = DiskUsageSampler()
         super().__init__(*args, **kwargs)
 
     def get_node_ips_param(self, public_ip=True):
@@ -3861,11 +4102,25 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
         time_elapsed = time.time() - start_time
         self.log.debug('Update DB packages duration -> %s s', int(time_elapsed))
 
+    def update_nodes_config(self, update_func: Callable, nodes: Optional[List[BaseNode]] = None,
+                            timeout: int = 300) -> None:
+        """Run `update_func(node)' for all nodes in parallel, config edits on each node are made in one transaction.
+
+        See `BaseNode.remote_config_transaction()' for details.
+        """
+        def update_node_config(node):
+            with node.remote_config_transaction():
+                update_func(node)
+
+        ParallelObject(objects=nodes or self.nodes, timeout=timeout).run(update_node_config, ignore_exceptions=False)
+
     def update_seed_provider(self):
-        for node in self.nodes:
+        def update_seed_provider(node):
             with node.remote_scylla_yaml() as scylla_yml:
                 scylla_yml.seed_provider = node.proposed_scylla_yaml.seed_provider
 
+        self.update_nodes_config(update_seed_provider)
+
     def update_db_binary(self, node_list=None, start_service=True):
         if node_list is None:
             node_list = self.nodes
@@ -4005,7 +4260,7 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
         for node in nodes:
             found_node_status = False
             for dc_status in status.values():
-                ip_status = dc_status.get(node.ip_address)
+                ip_status = dc_status.get(node.broadcast_address)
                 if ip_status:
                     found_node_status = True
                     up_statuses.append(ip_status["state"] == "UN")
@@ -4040,7 +4295,61 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
                 break
         return node_status
 
+    def get_ring_state_watcher(self, node=None) -> Optional[RingStateWatcher]:
+        """Ring state watcher if it's enabled by `use_ring_state_watcher' and can connect to the cluster.
+
+        The ring is seen by `node' (the first node of the cluster by default.)  After a failure to connect, next
+        attempt is made not earlier than in RING_CONNECT_RETRY_DELAY seconds.
+        """
+        if not self.params.get("use_ring_state_watcher"):
+            return None
+        with self._ring_state_watcher_lock:
+            if (node := node or next(iter(self.nodes), None)) is None:
+                return None
+            if self._ring_state_watcher is not None \
+                    and (not self._ring_state_watcher.is_running or self._ring_state_watcher_node is not node):
+                self.close_ring_state_watcher()
+            if self._ring_state_watcher is None:
+                if self._ring_state_watcher_failed_at is not None \
+                        and time.monotonic() - self._ring_state_watcher_failed_at < RING_CONNECT_RETRY_DELAY:
+                    return None
+                watcher = RingStateWatcher(
+                    connect=partial(self.cql_connection_exclusive, node=node, connect_timeout=10, verbose=False))
+                try:
+                    self._ring_state_watcher = watcher.start()
+                    self._ring_state_watcher_node = node
+                    self._ring_state_watcher_failed_at = None
+                except Exception as exc:  # pylint: disable=broad-except
+                    self.log.debug("Failed to start ring state watcher: %s", exc)
+                    self._ring_state_watcher_failed_at = time.monotonic()
+                    watcher.close()
+            return self._ring_state_watcher
+
+    def close_ring_state_watcher(self):
+        if self._ring_state_watcher is not None:
+            self._ring_state_watcher.close()
+            self._ring_state_watcher = None
+            self._ring_state_watcher_node = None
+
+    def destroy(self):
+        self.close_ring_state_watcher()
+        self.package_mirror.stop()
+        super().destroy()
+
     def wait_for_nodes_up_and_normal(self, nodes=None, verification_node=None, iterations=60, sleep_time=3, timeout=0):  # pylint: disable=too-many-arguments
+        if watcher := self.get_ring_state_watcher(node=verification_node):
+            try:
+                watcher.await_state([node.broadcast_address for node in nodes or self.nodes], state="UN",
+                                    timeout=timeout or iterations * sleep_time)
+                return
+            except RingStateTimeout as exc:
+                # Double check using nodetool: it raises ClusterNodesNotReady if the watcher is right.
+                self.log.warning("Ring state watcher: %s", exc)
+                self.check_nodes_up_and_normal(nodes=nodes, verification_node=verification_node)
+                return
+            except RingStateWatcherError as exc:
+                self.log.warning("Ring state watcher failed, poll `nodetool status' instead: %s", exc)
+
         @retrying(n=iterations, sleep_time=sleep_time, allowed_exceptions=NETWORK_EXCEPTIONS + (ClusterNodesNotReady,),
                   message="Waiting for nodes to join the cluster", timeout=timeout)
         def _wait_for_nodes_up_and_normal():
@@ -4068,6 +4377,11 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
 
         self.log.debug("Waiting for threshold: %s" % (threshold))
         node = self.nodes[0]
+        if key == "Space used (total)":
+            try:
+                return self.disk_space_reached_threshold(node=node, threshold=threshold, keyspaces=keyspaces)
+            except DiskUsageError as exc:
+                self.log.warning("%s, use nodetool cfstats instead", exc)
         node_space = 0
         # Calculate space on the disk of all test keyspaces on the one node.
         # It's decided to check the threshold on one node only
@@ -4084,6 +4398,21 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
             self.log.debug("Done waiting on cfstats: %s" % node_space)
         return reached_threshold
 
+    def disk_space_reached_threshold(self, node, threshold, keyspaces):
+        """Same as `cfstat_reached_threshold()' for `Space used (total)', but uses Scylla REST API."""
+        sampler = self.disk_usage_sampler
+        node_space = sampler.space_used(node=node, keyspaces=keyspaces)
+        eta = sampler.time_to_threshold(node=node, threshold=threshold, keyspaces=keyspaces)
+        growth_rate = sampler.growth_rate(node=node, keyspaces=keyspaces)
+        self.log.debug("Current space used on the node %s by %s keyspaces: %s (growth rate: %s B/s, "
+                       "time to reach threshold: %s s)", node.name, keyspaces, node_space,
+                       "N/A" if growth_rate is None else f"{growth_rate:.0f}",
+                       "N/A" if eta is None else f"{eta:.0f}")
+        if node_space >= threshold:
+            self.log.debug("Done waiting on space used: %s", node_space)
+            return True
+        return False
+
     def wait_total_space_used_per_node(self, size=None, keyspace='keyspace1'):
         if size is None:
             size = int(self.params.get('space_node_threshold'))
@@ -4149,7 +4478,7 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
             self.log.warning("Error recording nemesis termination information in Argus")
             self.log.debug(exc_info=True)
 
-    def scylla_configure_non_root_installation(self, node, devname, verbose, timeout):
+    def scylla_configure_non_root_installation(self, node, devname):
         node.stop_scylla_server(verify_down=False)
         node.remoter.run(f'{INSTALL_DIR}/sbin/scylla_setup --nic {devname} --no-raid-setup --no-io-setup',
                          verbose=True, ignore_status=True)
@@ -4170,10 +4499,6 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
         node.remoter.run(
             f"sed -ie 's/^rpc_address: .*/rpc_address: {node.ip_address}/g' {INSTALL_DIR}/etc/scylla/scylla.yaml")
 
-        node.start_scylla_server(verify_up=False, verify_up_timeout=timeout)
-        node.wait_db_up(verbose=verbose, timeout=timeout)
-        node.wait_jmx_up(verbose=verbose, timeout=200)
-
     def copy_preconfigured_iotune_files(self, node):
         self.log.info("This AMI need to be tweaked for io.conf and properties")
         for conf in ['io.conf', 'io_properties.yaml']:
@@ -4182,73 +4507,168 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
                                     dst='/tmp/')
             node.remoter.run('sudo mv /tmp/{0} /etc/scylla.d/{0}'.format(conf))
 
-    def node_setup(self, node: BaseNode, verbose: bool = False, timeout: int = 3600):  # pylint: disable=too-many-branches,too-many-statements
-        node.wait_ssh_up(verbose=verbose, timeout=timeout)
-        if node.distro.is_centos8 or node.distro.is_rhel8 or node.distro.is_oel8 or node.distro.is_rocky8:
-            node.remoter.sudo('systemctl stop iptables', ignore_status=True)
-            node.remoter.sudo('systemctl disable iptables', ignore_status=True)
-            node.remoter.sudo('systemctl stop firewalld', ignore_status=True)
-            node.remoter.sudo('systemctl disable firewalld', ignore_status=True)
-        node.update_repo_cache()
+    def node_setup(self, node: BaseNode, verbose: bool = False, timeout: int = 3600):
+        self.node_prepare(node, verbose=verbose, timeout=timeout)
+        self.node_startup(node, verbose=verbose, timeout=timeout)
 
-        install_scylla = True
+    @property
+    def two_phase_node_setup_supported(self) -> bool:
+        """Whether the setup can be split into concurrent `node_prepare()' and serialized `node_startup()'."""
+        return type(self).node_setup is BaseScyllaCluster.node_setup and self.node_setup_requires_scylla_restart
 
-        if self.params.get("use_preinstalled_scylla") and node.is_scylla_installed(raise_if_not_installed=True):
-            install_scylla = False
+    def node_prepare_steps(self, node: BaseNode) -> List[SetupStep]:  # pylint: disable=too-many-locals
+        """Steps of `node_prepare()'.
 
-        if not self.test_config.REUSE_CLUSTER:
-            node.disable_daily_triggered_services()
-            nic_devname = node.get_nic_devices()[0]
-            if install_scylla:
-                self._scylla_install(node)
-            else:
-                self.log.info("Waiting for preinstalled Scylla")
-                self._wait_for_preinstalled_scylla(node)
-                self.log.info("Done waiting for preinstalled Scylla")
-                if self.params.get('workaround_kernel_bug_for_iotune'):
-                    self.copy_preconfigured_iotune_files(node)
-            if node.is_nonroot_install:
-                self.scylla_configure_non_root_installation(node=node, devname=nic_devname,
-                                                            verbose=verbose, timeout=timeout)
-                return
+        Steps are listed in the order they run in, steps which don't require each other can run concurrently.
+        """
+        steps = []
 
-            if self.test_config.BACKTRACE_DECODING:
-                node.install_scylla_debuginfo()
+        def step(name, func, requires=None, **kwargs):
+            # By default a step requires the previous one.
+            if requires is None:
+                requires = (steps[-1].name, ) if steps else ()
+            steps.append(SetupStep(name=name, func=func, requires=tuple(requires), **kwargs))
 
-            if self.test_config.MULTI_REGION:
-                node.datacenter_setup(self.datacenter)  # pylint: disable=no-member
-            node.config_setup(append_scylla_args=self.get_scylla_args())
+        def disable_firewall():
+            node.remoter.sudo('systemctl stop iptables', ignore_status=True)
+            node.remoter.sudo('systemctl disable iptables', ignore_status=True)
+            node.remoter.sudo('systemctl stop firewalld', ignore_status=True)
+            node.remoter.sudo('systemctl disable firewalld', ignore_status=True)
 
-            self._scylla_post_install(node, install_scylla, nic_devname)
+        def wait_for_preinstalled_scylla():
+            self.log.info("Waiting for preinstalled Scylla")
+            self._wait_for_preinstalled_scylla(node)
+            self.log.info("Done waiting for preinstalled Scylla")
+            if self.params.get('workaround_kernel_bug_for_iotune'):
+                self.copy_preconfigured_iotune_files(node)
+
+        def stop_scylla_and_clean_data():
+            node.stop_scylla_server(verify_down=False)
+            node.clean_scylla_data()
+            node.remoter.sudo(cmd="rm -f /etc/scylla/ami_disabled", ignore_status=True)
+            if self.is_additional_data_volume_used():
+                result = node.remoter.sudo(cmd="scylla_io_setup")
+                if result.ok:
+                    self.log.info("Scylla_io_setup result: %s", result.stdout)
+
+        if node.distro.is_centos8 or node.distro.is_rhel8 or node.distro.is_oel8 or node.distro.is_rocky8:
+            step("disable_firewall", disable_firewall, requires=(), checkpoint=False)
+        step("update_repo_cache", node.update_repo_cache, requires=(), resources=(PACKAGE_MANAGER, ), checkpoint=False)
+        if self.test_config.REUSE_CLUSTER:
+            step("reuse_cluster_setup", partial(self._reuse_cluster_setup, node), checkpoint=False)
+        step("disable_daily_triggered_services", node.disable_daily_triggered_services, requires=(),
+             resources=(PACKAGE_MANAGER, ))
+
+        install_scylla = not (self.params.get("use_preinstalled_scylla")
+                              and node.is_scylla_installed(raise_if_not_installed=True))
+        nic_devname = node.get_nic_devices()[0]
+        if install_scylla:
+            step("install_scylla", partial(self._scylla_install, node),
+                 requires=("update_repo_cache", "disable_daily_triggered_services", ),
+                 resources=(PACKAGE_MANAGER, ),
+                 inputs={key: self.params.get(key) for key in ("install_mode", "scylla_version", "scylla_repo",
+                                                               "unified_package", "nonroot_offline_install")})
+        else:
+            step("wait_for_preinstalled_scylla", wait_for_preinstalled_scylla,
+                 requires=("disable_daily_triggered_services", ),
+                 inputs={"workaround_kernel_bug_for_iotune": self.params.get('workaround_kernel_bug_for_iotune')})
+        installed = steps[-1].name
+
+        if node.is_nonroot_install:
+            step("configure_nonroot_installation",
+                 partial(self.scylla_configure_non_root_installation, node=node, devname=nic_devname))
+            return steps
+
+        if self.test_config.BACKTRACE_DECODING:
+            step("install_scylla_debuginfo", node.install_scylla_debuginfo, requires=(installed, ),
+                 resources=(PACKAGE_MANAGER, ))
+        if self.test_config.MULTI_REGION:
+            step("datacenter_setup", partial(node.datacenter_setup, self.datacenter),  # pylint: disable=no-member
+                 requires=(installed, ), inputs={"datacenter": self.datacenter})  # pylint: disable=no-member
+        scylla_args = self.get_scylla_args()
+        proposed_scylla_yaml = ScyllaYaml()
+        proposed_scylla_yaml.update(self.proposed_scylla_yaml, node.proposed_scylla_yaml)
+        step("config_setup", partial(node.config_setup, append_scylla_args=scylla_args), requires=(installed, ),
+             resources=(SCYLLA_CONFIG, ),
+             inputs={"append_scylla_args": scylla_args,
+                     "proposed_scylla_yaml": proposed_scylla_yaml.dict(exclude_defaults=True)})
+        step("scylla_post_install", partial(self._scylla_post_install, node, install_scylla, nic_devname),
+             requires=[s.name for s in steps if s.name in ("datacenter_setup", "config_setup")],
+             resources=(PACKAGE_MANAGER, ))
+        if self.params.get('prepare_saslauthd'):
+            step("prepare_saslauthd", partial(prepare_and_start_saslauthd_service, node),
+                 requires=("config_setup", "scylla_post_install", ), resources=(PACKAGE_MANAGER, SCYLLA_CONFIG, ))
+        # Never wipe data of a reused cluster, even if some step runs for the first time (e.g., debuginfo install.)
+        if self.node_setup_requires_scylla_restart and not self.test_config.REUSE_CLUSTER:
+            step("stop_scylla_and_clean_data", stop_scylla_and_clean_data,
+                 requires=[s.name for s in steps])
+        return steps
+
+    def node_startup_steps(self, node: BaseNode) -> List[SetupStep]:
+        """Steps of `node_startup()' for a node prepared by `node_prepare()'."""
+        steps = []
+        if self.node_setup_requires_scylla_restart:
+            steps.append(SetupStep(name="start_scylla", func=partial(node.start_scylla_server, verify_up=False),
+                                   probe=node.db_up))
+
+        # code to increase java heap memory to scylla-jmx (because of #7609)
+        if jmx_memory := self.params.get("jmx_heap_memory"):
+            def increase_jmx_heap():
+                node.increase_jmx_heap_memory(jmx_memory)
+                node.restart_scylla_jmx()
+            steps.append(SetupStep(name="increase_jmx_heap", func=increase_jmx_heap,
+                                   requires=tuple(s.name for s in steps), inputs={"jmx_heap_memory": jmx_memory}))
 
-            # prepare and start saslauthd service
-            if self.params.get('prepare_saslauthd'):
-                prepare_and_start_saslauthd_service(node)
+        if self.params.get('use_mgmt'):
+            steps.append(SetupStep(name="install_scylla_manager", func=partial(self.install_scylla_manager, node),
+                                   requires=tuple(s.name for s in steps),
+                                   inputs={"scylla_mgmt_pkg": self.params.get("scylla_mgmt_pkg")}))
+        return steps
 
-            if self.node_setup_requires_scylla_restart:
-                node.stop_scylla_server(verify_down=False)
-                node.clean_scylla_data()
-                node.remoter.sudo(cmd="rm -f /etc/scylla/ami_disabled", ignore_status=True)
+    def _run_node_setup_steps(self, node: BaseNode, steps: List[SetupStep]) -> Optional[SetupStepsRunner]:
+        """Run `steps' skipping ones finished according to the checkpoint on the node and store their durations.
 
-                if self.is_additional_data_volume_used():
-                    result = node.remoter.sudo(cmd="scylla_io_setup")
-                    if result.ok:
-                        self.log.info("Scylla_io_setup result: %s", result.stdout)
+        A reused cluster without the checkpoint was set up before steps were introduced: run only steps which
+        are not checkpointed (as it was done for reused clusters before) and return None.
+        """
+        runner = SetupStepsRunner(node=node, steps=steps, check_inputs=not self.test_config.REUSE_CLUSTER)
+        if self.test_config.REUSE_CLUSTER and not runner.checkpoint:
+            self.log.info("%s: there is no setup steps checkpoint on the reused node, run only steps without it", node)
+            for step in steps:
+                if not step.checkpoint:
+                    step.func()
+            return None
+        durations = runner.run()
+        timings = self.node_setup_timings.setdefault(node.name, {})
+        timings.update({f"step:{name}": duration for name, duration in durations.items()})
+        self.log.info("%s: setup steps done (%s), skipped: %s", node,
+                      ", ".join(f"{name}={duration:.0f}s" for name, duration in durations.items()) or "none",
+                      ", ".join(runner.skipped) or "none")
+        return runner
+
+    def node_prepare(self, node: BaseNode, verbose: bool = False, timeout: int = 3600):
+        """Node-local part of the setup: install and configure Scylla, but leave it stopped.
+
+        It doesn't interact with other nodes of the cluster and can run for many nodes concurrently.  Steps
+        finished by a previous run (see `node_prepare_steps()') are skipped.
+        """
+        node.wait_ssh_up(verbose=verbose, timeout=timeout)
+        self._run_node_setup_steps(node, self.node_prepare_steps(node))
 
-                node.start_scylla_server(verify_up=False)
+    def node_startup(self, node: BaseNode, verbose: bool = False, timeout: int = 3600):
+        """Start Scylla prepared by `node_prepare()' and wait for the node to join the cluster.
 
-            # code to increase java heap memory to scylla-jmx (because of #7609)
-            if jmx_memory := self.params.get("jmx_heap_memory"):
-                node.increase_jmx_heap_memory(jmx_memory)
-                node.restart_scylla_jmx()
+        Nodes should join the cluster one at a time, so run it for the next node only after this one is UN.
+        """
+        if node.is_nonroot_install and not self.test_config.REUSE_CLUSTER:
+            node.start_scylla_server(verify_up=False, verify_up_timeout=timeout)
+            node.wait_db_up(verbose=verbose, timeout=timeout)
+            node.wait_jmx_up(verbose=verbose, timeout=200)
+            return
 
+        if self._run_node_setup_steps(node, self.node_startup_steps(node)) is not None:
             self.log.debug('io.conf right after reboot: %s', node.remoter.sudo('cat /etc/scylla.d/io.conf').stdout)
 
-            if self.params.get('use_mgmt'):
-                self.install_scylla_manager(node)
-        else:
-            self._reuse_cluster_setup(node)
-
         node.wait_db_up(verbose=verbose, timeout=timeout)
         nodes_status = node.get_nodes_status()
         check_nodes_status(nodes_status=nodes_status, current_node=node)
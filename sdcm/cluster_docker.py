@@ -15,19 +15,29 @@
 # pylint: disable=invalid-overridden-method; pylint doesn't know that cached_property is property
 import os
 import re
+import json
+import hashlib
 import logging
+import threading
 from typing import Optional, Union, Dict
 from functools import cached_property
 
 from sdcm import cluster
 from sdcm.remote import LOCALRUNNER
-from sdcm.utils.docker_utils import get_docker_bridge_gateway, Container, ContainerManager, DockerException
+from sdcm.utils.common import ParallelObject
+from sdcm.utils.decorators import NoValue, optional_cached_property
+from sdcm.utils.docker_utils import get_docker_bridge_gateway, Container, ContainerManager, DockerException, \
+    ImageNotFound
 from sdcm.utils.health_checker import check_nodes_status
 from sdcm.utils.net import get_my_public_ip
 
 DEFAULT_SCYLLA_DB_IMAGE = "scylladb/scylla-nightly"
 DEFAULT_SCYLLA_DB_IMAGE_TAG = "latest"
 AIO_MAX_NR_RECOMMENDED_VALUE = 1048576
+NODE_SNAPSHOT_REPOSITORY = "scylla-sct-snapshot"
+NODE_SNAPSHOTS_TO_KEEP = 5
+NODES_LAUNCH_PARALLELISM = 10
+NODE_CONTAINER_INIT_TIMEOUT = 300  # seconds
 
 LOGGER = logging.getLogger(__name__)
 
@@ -205,8 +215,8 @@ class DockerCluster(cluster.BaseCluster):  # pylint: disable=abstract-method
         return os.path.join(os.path.dirname(__file__), '../docker/scylla-sct',
                             self.params.get("scylla_linux_distro").split('-')[0])
 
-    def _create_node(self, node_index, container=None):
-        node = DockerNode(parent_cluster=self,
+    def _init_node(self, node_index: int, container: Optional[Container] = None) -> DockerNode:
+        return DockerNode(parent_cluster=self,
                           container=container,
                           ssh_login_info=dict(hostname=None,
                                               user=self.node_container_user,
@@ -215,14 +225,23 @@ class DockerCluster(cluster.BaseCluster):  # pylint: disable=abstract-method
                           node_prefix=self.node_prefix,
                           node_index=node_index)
 
+    def _update_node_container_image_tag(self) -> None:
+        """Hook to choose an image for new node containers (`node_container_image_tag') before they are created."""
+
+    def _init_node_container(self, node: DockerNode) -> None:
+        ContainerManager.ssh_copy_id(node, "node", self.node_container_user, self.node_container_key_file)
+        node.init()
+
+    def _create_node(self, node_index, container=None):
+        node = self._init_node(node_index, container)
+
         if container is None:
+            self._update_node_container_image_tag()
             ContainerManager.build_container_image(node, "node")
 
         ContainerManager.run_container(node, "node", seed_ip=self.nodes[0].public_ip_address if node_index else None)
         ContainerManager.wait_for_status(node, "node", status="running")
-        ContainerManager.ssh_copy_id(node, "node", self.node_container_user, self.node_container_key_file)
-
-        node.init()
+        self._init_node_container(node)
 
         return node
 
@@ -240,6 +259,27 @@ class DockerCluster(cluster.BaseCluster):  # pylint: disable=abstract-method
             new_nodes.append(node)
         return new_nodes
 
+    def _launch_nodes(self, count, enable_auto_bootstrap=False):
+        """Create containers of new nodes concurrently and wait for them using Docker events.
+
+        The first node of the cluster is created before others because its address is used as a seed.
+        """
+        new_nodes = [] if self.nodes or not count else self._create_nodes(1, enable_auto_bootstrap)
+        nodes = [self._init_node(node_index) for node_index in self._get_new_node_indexes(count - len(new_nodes))]
+        if not nodes:
+            return new_nodes
+        self._update_node_container_image_tag()
+        ContainerManager.build_container_image(nodes[0], "node")
+        ContainerManager.run_containers(nodes, "node",
+                                        max_workers=NODES_LAUNCH_PARALLELISM,
+                                        seed_ip=self.nodes[0].public_ip_address)
+        for node in nodes:
+            node.enable_auto_bootstrap = enable_auto_bootstrap
+            self.nodes.append(node)
+        ParallelObject(nodes, timeout=NODE_CONTAINER_INIT_TIMEOUT, num_workers=NODES_LAUNCH_PARALLELISM).run(
+            self._init_node_container)
+        return new_nodes + nodes
+
     def _get_nodes(self):
         containers = ContainerManager.get_containers_by_prefix(self.node_prefix)
         for node_index, container in sorted((int(c.labels["NodeIndex"]), c) for c in containers):
@@ -249,7 +289,7 @@ class DockerCluster(cluster.BaseCluster):  # pylint: disable=abstract-method
         return self.nodes
 
     def add_nodes(self, count, ec2_user_data="", dc_idx=0, rack=0, enable_auto_bootstrap=False):
-        return self._get_nodes() if self.test_config.REUSE_CLUSTER else self._create_nodes(count, enable_auto_bootstrap)
+        return self._get_nodes() if self.test_config.REUSE_CLUSTER else self._launch_nodes(count, enable_auto_bootstrap)
 
 
 class ScyllaDockerCluster(cluster.BaseScyllaCluster, DockerCluster):  # pylint: disable=abstract-method
@@ -262,6 +302,7 @@ class ScyllaDockerCluster(cluster.BaseScyllaCluster, DockerCluster):  # pylint:
                  params: dict = None) -> None:
         cluster_prefix = cluster.prepend_user_prefix(user_prefix, 'db-cluster')
         node_prefix = cluster.prepend_user_prefix(user_prefix, 'db-node')
+        self._node_snapshot_lock = threading.Lock()
         super().__init__(docker_image=docker_image,
                          docker_image_tag=docker_image_tag,
                          node_key_file=node_key_file,
@@ -271,20 +312,125 @@ class ScyllaDockerCluster(cluster.BaseScyllaCluster, DockerCluster):  # pylint:
                          n_nodes=n_nodes,
                          params=params)
 
+    def node_snapshot_image_tag(self) -> Optional[str]:
+        """Tag of an image of a configured node which can be reused for nodes with the same configuration.
+
+        Key of the snapshot is a hash of the source image ID, files used to build the node image, Scylla args and
+        cluster-wide part of scylla.yaml (except the cluster name.)  Node-specific fields are patched by `node_setup'.
+        Return None if snapshots are disabled or the source image is not available.
+        """
+        if not self.params.get("use_docker_node_snapshots") or \
+                self.params.get("db_nodes_shards_selection") == "random":
+            return None
+        if (source_image_id := self._source_image_id) is None:
+            return None
+        cluster_scylla_yaml = self.proposed_scylla_yaml.dict(exclude_unset=True, exclude_none=True)
+        cluster_scylla_yaml.pop("cluster_name", None)
+        key = json.dumps(dict(source_image_id=source_image_id,
+                              context_files=self._node_container_context_files,
+                              scylla_args=self.get_scylla_args(),
+                              append_scylla_yaml=self.params.get("append_scylla_yaml"),
+                              backtrace_decoding=self.test_config.BACKTRACE_DECODING,
+                              scylla_yaml=cluster_scylla_yaml), sort_keys=True, default=str)
+        return f"{NODE_SNAPSHOT_REPOSITORY}:{hashlib.sha1(key.encode()).hexdigest()[:16]}"
+
+    @optional_cached_property
+    def _source_image_id(self) -> Optional[str]:
+        """ID of the source image pulled once per cluster, so a snapshot of an outdated image is never used."""
+        docker_client = ContainerManager.default_docker_client
+        try:
+            return docker_client.images.pull(*self.source_image.split(":", maxsplit=1)).id
+        except DockerException as exc:
+            LOGGER.warning("Unable to pull `%s', use a local image: %s", self.source_image, exc)
+        try:
+            return docker_client.images.get(self.source_image).id
+        except ImageNotFound:
+            raise NoValue from None
+
+    @cached_property
+    def _node_container_context_files(self) -> Dict[str, str]:
+        context_files = {}
+        for dirpath, _, filenames in os.walk(self.node_container_context_path):
+            for filename in filenames:
+                with open(os.path.join(dirpath, filename), "rb") as context_file:
+                    context_files[filename] = hashlib.sha1(context_file.read()).hexdigest()
+        return context_files
+
+    @staticmethod
+    def _is_image_exists(image_tag: str) -> bool:
+        try:
+            ContainerManager.default_docker_client.images.get(image_tag)
+        except ImageNotFound:
+            return False
+        return True
+
+    def _update_node_container_image_tag(self) -> None:
+        if snapshot_image_tag := self.node_snapshot_image_tag():
+            if self._is_image_exists(snapshot_image_tag):
+                LOGGER.info("Use node snapshot `%s' for %s", snapshot_image_tag, self.name)
+                self.node_container_image_tag = snapshot_image_tag
+            else:
+                LOGGER.debug("There is no node snapshot `%s' yet", snapshot_image_tag)
+
+    @staticmethod
+    def is_node_from_snapshot(node: DockerNode) -> bool:
+        image = ContainerManager.get_container(node, "node").image
+        return any(tag.startswith(f"{NODE_SNAPSHOT_REPOSITORY}:") for tag in image.tags)
+
+    def save_node_snapshot(self, node: DockerNode) -> None:
+        """Commit the configured node (with stopped Scylla and empty data dir) as a snapshot if there is no one."""
+        if node.replacement_node_ip or not (snapshot_image_tag := self.node_snapshot_image_tag()):
+            return
+        with self._node_snapshot_lock:
+            if self._is_image_exists(snapshot_image_tag):
+                return
+            try:
+                # Don't keep seeds of this node as a command of the snapshot.
+                node_image_cmd = ContainerManager.default_docker_client.images.get(
+                    self.node_container_image_tag).attrs["Config"]["Cmd"]
+                ContainerManager.commit_container(node, "node", snapshot_image_tag,
+                                                  Labels={"SourceImage": self.source_image, },
+                                                  Cmd=node_image_cmd)
+            except DockerException as exc:
+                node.log.warning("Unable to save node snapshot `%s': %s", snapshot_image_tag, exc)
+                return
+            self.remove_old_node_snapshots(keep=NODE_SNAPSHOTS_TO_KEEP)
+
+    @staticmethod
+    def remove_old_node_snapshots(keep: int) -> None:
+        """Remove all node snapshots except `keep' newest ones.  Snapshots used by containers are skipped."""
+        docker_client = ContainerManager.default_docker_client
+        snapshots = sorted(docker_client.images.list(name=NODE_SNAPSHOT_REPOSITORY),
+                           key=lambda image: image.attrs["Created"], reverse=True)
+        for image in snapshots[keep:]:
+            LOGGER.info("Remove old node snapshot %s", image.tags)
+            try:
+                docker_client.images.remove(image.id)
+            except DockerException as exc:
+                LOGGER.debug("Unable to remove node snapshot %s: %s", image.tags, exc)
+
     def node_setup(self, node, verbose=False, timeout=3600):
         node.wait_ssh_up(verbose=verbose)
 
-        node.is_scylla_installed(raise_if_not_installed=True)
+        if from_snapshot := self.is_node_from_snapshot(node):
+            # Scylla args, debuginfo and cluster-wide part of scylla.yaml are in the snapshot already.
+            node.log.info("Node created from a snapshot, patch node-specific configuration only")
+            self.check_aio_max_nr(node)
+            node.config_setup()
+        else:
+            node.is_scylla_installed(raise_if_not_installed=True)
 
-        self.check_aio_max_nr(node)
+            self.check_aio_max_nr(node)
 
-        if self.test_config.BACKTRACE_DECODING:
-            node.install_scylla_debuginfo()
+            if self.test_config.BACKTRACE_DECODING:
+                node.install_scylla_debuginfo()
 
-        node.config_setup(append_scylla_args=self.get_scylla_args())
+            node.config_setup(append_scylla_args=self.get_scylla_args())
 
         node.stop_scylla_server(verify_down=False)
         node.remoter.sudo('rm -Rf /var/lib/scylla/data/*')  # Clear data folder to drop wrong cluster name data.
+        if not from_snapshot:
+            self.save_node_snapshot(node)
         node.start_scylla_server(verify_up=False)
 
         node.wait_db_up(verbose=verbose, timeout=timeout)
@@ -67,12 +67,15 @@ from sdcm.utils.k8s import (
     convert_memory_value_from_k8s_to_units,
     get_helm_pool_affinity_values,
     get_pool_affinity_modifiers,
+    get_kubectl_call_priority,
     get_preferred_pod_anti_affinity_values,
+    ApiCallPriority,
     ApiCallRateLimiter,
     JSON_PATCH_TYPE,
     KubernetesOps,
     KUBECTL_TIMEOUT,
     HelmValues,
+    KubernetesInformer,
     TokenUpdateThread,
 )
 from sdcm.utils.decorators import log_run_info, retrying
@@ -301,6 +304,8 @@ class KubernetesCluster(metaclass=abc.ABCMeta):  # pylint: disable=too-many-publ
             ('scylla-operator.scylladb.com/node-config-job-type', 'Containers'),
         ]
         self._scylla_cluster_events_threads = {}
+        self._informers: Dict[tuple, KubernetesInformer] = {}
+        self._informers_lock = Lock()
 
     # NOTE: Following class attr(s) are defined for consumers of this class
     #       such as 'sdcm.utils.remote_logger.ScyllaOperatorLogger'.
@@ -346,7 +351,7 @@ class KubernetesCluster(metaclass=abc.ABCMeta):  # pylint: disable=too-many-publ
     def kubectl(self, *command, namespace=None, timeout=KUBECTL_TIMEOUT, remoter=None, ignore_status=False,
                 verbose=True):
         if self.api_call_rate_limiter:
-            self.api_call_rate_limiter.wait()
+            self.api_call_rate_limiter.wait(priority=get_kubectl_call_priority(*command))
         return KubernetesOps.kubectl(self, *command, namespace=namespace, timeout=timeout, remoter=remoter,
                                      ignore_status=ignore_status, verbose=verbose)
 
@@ -380,7 +385,7 @@ class KubernetesCluster(metaclass=abc.ABCMeta):  # pylint: disable=too-many-publ
     def kubectl_multi_cmd(self, *command, namespace=None, timeout=KUBECTL_TIMEOUT, remoter=None, ignore_status=False,
                           verbose=True):
         if self.api_call_rate_limiter:
-            self.api_call_rate_limiter.wait()
+            self.api_call_rate_limiter.wait(priority=get_kubectl_call_priority(*command))
         return KubernetesOps.kubectl_multi_cmd(self, *command, namespace=namespace, timeout=timeout, remoter=remoter,
                                                ignore_status=ignore_status, verbose=verbose)
 
@@ -393,13 +398,13 @@ class KubernetesCluster(metaclass=abc.ABCMeta):  # pylint: disable=too-many-publ
     @property
     def helm_install(self):
         if self.api_call_rate_limiter:
-            self.api_call_rate_limiter.wait()
+            self.api_call_rate_limiter.wait(priority=ApiCallPriority.MUTATION)
         return partial(self.test_config.tester_obj().localhost.helm_install, self)
 
     @property
     def helm_upgrade(self):
         if self.api_call_rate_limiter:
-            self.api_call_rate_limiter.wait()
+            self.api_call_rate_limiter.wait(priority=ApiCallPriority.MUTATION)
         return partial(self.test_config.tester_obj().localhost.helm_upgrade, self)
 
     @cached_property
@@ -1263,10 +1268,14 @@ class KubernetesCluster(metaclass=abc.ABCMeta):  # pylint: disable=too-many-publ
                             ('/etc/scylla.d/', logfile / 'etc-scylla-d'),
                             ('/etc/scylla/', logfile / 'etc-scylla'),
                         )
-                        for src_path, dst_path in scylla_container_files_to_copy:
-                            self.kubectl(
-                                f"cp {res}:{src_path} {dst_path} -c {container_name}",
-                                namespace=namespace, ignore_status=True)
+                        remoter = KubernetesCmdRunner(
+                            kluster=self, pod=res, container=container_name, namespace=namespace)
+                        try:
+                            remoter.receive_files_batch(
+                                {src_path: str(dst_path) for src_path, dst_path in scylla_container_files_to_copy},
+                                compress=True, ignore_status=True)
+                        except Exception as exc:  # pylint: disable=broad-except
+                            LOGGER.warning("K8S-LOGS: failed to copy files from '%s' pod: %s", res, exc)
 
     @log_run_info
     def stop_k8s_task_threads(self, timeout=10):
@@ -1283,6 +1292,30 @@ class KubernetesCluster(metaclass=abc.ABCMeta):  # pylint: disable=too-many-publ
             self._scylla_operator_scheduling_thread.stop(timeout)
         for thread in self._scylla_cluster_events_threads.values():
             thread.stop(timeout)
+        with self._informers_lock:
+            for informer in self._informers.values():
+                informer.stop(timeout)
+            self._informers = {}
+
+    def get_informer(self, kind: str, namespace: Optional[str] = None) -> Optional[KubernetesInformer]:
+        """Return informer for objects of `kind' ("pod", "service" or "node") in `namespace', start it if needed.
+
+        Return None if informers are disabled by `k8s_use_informer_cache' option.
+        """
+        if not self.params.get("k8s_use_informer_cache"):
+            return None
+        with self._informers_lock:
+            if (informer := self._informers.get((kind, namespace))) is None:
+                informer = KubernetesInformer(self.k8s_core_v1_api, kind=kind, namespace=namespace)
+                informer.start()
+                self._informers[(kind, namespace)] = informer
+        return informer
+
+    def get_cached_object(self, kind: str, name: str, fallback: Callable[[], Any], namespace: Optional[str] = None):
+        """Get object from the informer cache or by calling `fallback' if there is no fresh cache."""
+        if (informer := self.get_informer(kind, namespace)) is None:
+            return fallback()
+        return informer.get(name, fallback)
 
     @property
     def minio_pod(self) -> Resource:
@@ -1606,6 +1639,10 @@ class BasePodContainer(cluster.BaseNode):  # pylint: disable=too-many-public-met
 
     @property
     def _pod(self):
+        return self.parent_cluster.k8s_cluster.get_cached_object(
+            "pod", self.name, fallback=self._read_pod, namespace=self.parent_cluster.namespace)
+
+    def _read_pod(self):
         pods = KubernetesOps.list_pods(self.parent_cluster, namespace=self.parent_cluster.namespace,
                                        field_selector=f"metadata.name={self.name}")
         return pods[0] if pods else None
@@ -1618,16 +1655,20 @@ class BasePodContainer(cluster.BaseNode):  # pylint: disable=too-many-public-met
 
     @property
     def _node(self):
-        return KubernetesOps.get_node(self.parent_cluster, self.node_name)
+        node_name = self.node_name
+        return self.parent_cluster.k8s_cluster.get_cached_object(
+            "node", node_name, fallback=lambda: KubernetesOps.get_node(self.parent_cluster, node_name))
 
     @property
     def _cluster_ip_service(self):
-        services = KubernetesOps.list_services(self.parent_cluster, namespace=self.parent_cluster.namespace,
-                                               field_selector=f"metadata.name={self.name}")
-        return services[0] if services else None
+        return self._svc
 
     @property
     def _svc(self):
+        return self.parent_cluster.k8s_cluster.get_cached_object(
+            "service", self.name, fallback=self._read_svc, namespace=self.parent_cluster.namespace)
+
+    def _read_svc(self):
         services = KubernetesOps.list_services(self.parent_cluster, namespace=self.parent_cluster.namespace,
                                                field_selector=f"metadata.name={self.name}")
         return services[0] if services else None
@@ -1751,7 +1792,8 @@ class BasePodContainer(cluster.BaseNode):  # pylint: disable=too-many-public-met
 
     def start_coredump_thread(self):
         self._coredump_thread = CoredumpExportFileThread(
-            self, self._maximum_number_of_cores_to_publish, ['/var/lib/scylla/coredumps'])
+            self, self._maximum_number_of_cores_to_publish, ['/var/lib/scylla/coredumps'],
+            streaming_upload=self.parent_cluster.params.get("coredump_streaming_upload"))
         self._coredump_thread.start()
 
     @cached_property
@@ -31,6 +31,7 @@ from sdcm.cluster_gce import MonitorSetGCE
 
 
 GKE_API_CALL_RATE_LIMIT = 5  # ops/s
+GKE_API_CALL_BURST = 10  # ops
 GKE_API_CALL_QUEUE_SIZE = 1000  # ops
 GKE_URLLIB_RETRY = 5  # How many times api request is retried before reporting failure
 GKE_URLLIB_BACKOFF_FACTOR = 0.1
@@ -189,6 +190,7 @@ class GkeCluster(KubernetesCluster):
         self.gke_cluster_created = False
         self.api_call_rate_limiter = ApiCallRateLimiter(
             rate_limit=GKE_API_CALL_RATE_LIMIT,
+            burst=GKE_API_CALL_BURST,
             queue_size=GKE_API_CALL_QUEUE_SIZE,
             urllib_retry=GKE_URLLIB_RETRY,
             urllib_backoff_factor=GKE_URLLIB_BACKOFF_FACTOR,
@@ -22,7 +22,7 @@ from threading import Thread, Event
 from dataclasses import dataclass
 
 from sdcm.log import SDCMAdapter
-from sdcm.remote import NETWORK_EXCEPTIONS
+from sdcm.remote import NETWORK_EXCEPTIONS, shell_script_cmd
 from sdcm.utils.decorators import timeout
 from sdcm.sct_events.system import CoreDumpEvent
 from sdcm.sct_events.decorators import raise_event_on_failure
@@ -86,11 +86,16 @@ class CoredumpThreadBase(Thread):  # pylint: disable=too-many-instance-attribute
     lookup_period = 30
     upload_retry_limit = 3
     max_coredump_thread_exceptions = 10
+    compressed_extensions = ('.lz4', '.zst', '.zip', '.gz', '.gzip', )
+    decompress_commands = {'.lz4': 'lz4 -d', '.zst': 'zstd -d', '.zip': 'unzip', '.gz': 'gunzip', '.gzip': 'gunzip'}
+    streaming_upload_part_size = 1024 ** 3  # size of a core's chunk uploaded as one part, should be a multiple of 1MiB
+    streaming_upload_progress_dir = '/var/tmp'
 
-    def __init__(self, node: 'BaseNode', max_core_upload_limit: int):
+    def __init__(self, node: 'BaseNode', max_core_upload_limit: int, streaming_upload: bool = False):
         self.node = node
         self.log = SDCMAdapter(node.log, extra={"prefix": self.__class__.__name__})
         self.max_core_upload_limit = max_core_upload_limit
+        self.streaming_upload = streaming_upload
         self.found: List[CoreDumpInfo] = []
         self.in_progress: List[CoreDumpInfo] = []
         self.completed: List[CoreDumpInfo] = []
@@ -200,16 +205,69 @@ class CoredumpThreadBase(Thread):  # pylint: disable=too-many-instance-attribute
 
     # @retrying(n=10, sleep_time=20, allowed_exceptions=NETWORK_EXCEPTIONS, message="Retrying on uploading coredump")
     def _upload_coredump(self, core_info: CoreDumpInfo):
+        if self.streaming_upload:
+            self._upload_coredump_streaming(core_info)
+            return
         coredump = core_info.corefile
         coredump = self._pack_coredump(coredump)
-        coredump_id = os.path.basename(coredump)[:-3]
-        upload_url = f'upload.scylladb.com/{coredump_id}/{os.path.basename(coredump)}'
+        file_name = os.path.basename(coredump)
+        coredump_id = os.path.splitext(file_name)[0]
+        upload_url = f'upload.scylladb.com/{coredump_id}/{file_name}'
         self.log.info('Uploading coredump %s to %s', coredump, upload_url)
         self.node.remoter.run("sudo curl --request PUT --fail --show-error --upload-file "
                               "'%s' 'https://%s'" % (coredump, upload_url))
         download_url = 'https://storage.cloud.google.com/%s' % upload_url
         self.log.info("You can download it by %s (available for ScyllaDB employee)", download_url)
-        download_instructions = 'gsutil cp gs://%s .\ngunzip %s' % (upload_url, coredump)
+        download_instructions = f'gsutil cp gs://{upload_url} .'
+        if decompress_cmd := self.decompress_commands.get(os.path.splitext(file_name)[1]):
+            download_instructions += f'\n{decompress_cmd} {file_name}'
+        core_info.download_url, core_info.download_instructions = download_url, download_instructions
+
+    def _upload_coredump_streaming(self, core_info: CoreDumpInfo):
+        """Compress and upload a core in parts without writing anything big to the node's disk.
+
+        Each part is a chunk of the core compressed by pigz on the fly (concatenation of gzip members is
+        a valid gzip file) and piped directly to curl.  Names of uploaded parts are appended to a small progress
+        file on the node, so a retry after a failure continues from the first part which wasn't uploaded.
+        """
+        coredump = core_info.corefile
+        compress = not coredump.endswith(self.compressed_extensions)
+        if compress and not self._is_pigz_installed:
+            self._install_pigz()
+        file_name = os.path.basename(coredump) + ('.gz' if compress else '')
+        coredump_id = os.path.splitext(file_name)[0]
+        upload_url = f'upload.scylladb.com/{coredump_id}/{file_name}'
+        progress_file = os.path.join(self.streaming_upload_progress_dir, f"{file_name}.upload-progress")
+
+        core_size = int(self.node.remoter.run(f'sudo stat -c %s {coredump}', verbose=False).stdout.strip())
+        parts_num = max(1, -(-core_size // self.streaming_upload_part_size))
+        uploaded_parts = set(
+            self.node.remoter.run(f'cat {progress_file}', verbose=False, ignore_status=True).stdout.split())
+        if uploaded_parts:
+            self.log.info('Resuming upload of coredump %s: %s of %s parts are uploaded already',
+                          coredump, len(uploaded_parts), parts_num)
+        self.log.info('Uploading coredump %s to %s in %s part(s)', coredump, upload_url, parts_num)
+
+        for part in range(parts_num):
+            part_name = f"{file_name}.part{part:04d}"
+            if part_name in uploaded_parts:
+                continue
+            compressor = " | pigz --fast --stdout" if compress else ""
+            self.node.remoter.run(shell_script_cmd(f"""\
+                set -o pipefail
+                sudo dd if={coredump} bs=1M iflag=skip_bytes,count_bytes status=none \\
+                    skip={part * self.streaming_upload_part_size} count={self.streaming_upload_part_size}{compressor} \\
+                    | curl --request PUT --fail --show-error --upload-file - 'https://{upload_url}.part{part:04d}'
+                echo {part_name} >> {progress_file}
+            """), verbose=False)
+            self.log.debug('Uploaded part %s of %s of coredump %s', part + 1, parts_num, coredump)
+        self.node.remoter.run(f'rm -f {progress_file}', verbose=False, ignore_status=True)
+
+        download_url = f'https://storage.cloud.google.com/upload.scylladb.com/{coredump_id}/'
+        self.log.info("You can download it by %s (available for ScyllaDB employee)", download_url)
+        download_instructions = f"gsutil cp 'gs://{upload_url}.part*' .\ncat {file_name}.part* > {file_name}"
+        if decompress_cmd := self.decompress_commands.get(os.path.splitext(file_name)[1]):
+            download_instructions += f"\n{decompress_cmd} {file_name}"
         core_info.download_url, core_info.download_instructions = download_url, download_instructions
 
     def upload_coredump(self, core_info: CoreDumpInfo):
@@ -247,10 +305,8 @@ class CoredumpThreadBase(Thread):  # pylint: disable=too-many-instance-attribute
             raise RuntimeError("Distro is not supported")
 
     def _pack_coredump(self, coredump: str) -> str:
-        extensions = ['.lz4', '.zip', '.gz', '.gzip']
-        for extension in extensions:
-            if coredump.endswith(extension):
-                return coredump
+        if coredump.endswith(self.compressed_extensions):
+            return coredump
         if not self._is_pigz_installed:
             self._install_pigz()
         try:  # pylint: disable=unreachable
@@ -416,9 +472,10 @@ class CoredumpExportFileThread(CoredumpThreadBase):
     """
     checkup_time_core_to_complete = 1
 
-    def __init__(self, node: 'BaseNode', max_core_upload_limit: int, coredump_directories: List[str]):
+    def __init__(self, node: 'BaseNode', max_core_upload_limit: int, coredump_directories: List[str],
+                 streaming_upload: bool = False):
         self.coredumps_directories = coredump_directories
-        super().__init__(node=node, max_core_upload_limit=max_core_upload_limit)
+        super().__init__(node=node, max_core_upload_limit=max_core_upload_limit, streaming_upload=streaming_upload)
 
     @property
     def _is_file_installed(self):
@@ -26,6 +26,7 @@ from sdcm.sct_events.base import LogEvent
 from sdcm.sct_events.database import get_pattern_to_event_to_func_mapping, BACKTRACE_RE
 from sdcm.sct_events.decorators import raise_event_on_failure
 from sdcm.utils.common import make_threads_be_daemonic_by_default
+from sdcm.utils.debuginfo_cache import find_debuginfo_file
 
 LOGGER = logging.getLogger(__name__)
 
@@ -172,11 +173,13 @@ class DbLogReader(Process):
 
         for backtrace in backtraces:
             if self._decoding_queue and backtrace["event"].raw_backtrace:
-                scylla_debug_info = self.get_scylla_debuginfo_file()
-                LOGGER.debug("Debug info file %s", scylla_debug_info)
+                build_id = self.get_scylla_build_id()
+                scylla_debug_info = self.get_scylla_debuginfo_file(build_id=build_id)
+                LOGGER.debug("Debug info file %s, build id %s", scylla_debug_info, build_id)
                 self._decoding_queue.put({
                     "node": self._node_name,
                     "debug_file": scylla_debug_info,
+                    "build_id": build_id,
                     "event": backtrace["event"],
                 })
             else:
@@ -222,32 +225,15 @@ class DbLogReader(Process):
                 return build_id_result.stdout.strip()
         return None
 
-    def get_scylla_debuginfo_file(self):
+    def get_scylla_debuginfo_file(self, build_id: str | None = None) -> str | None:
         """
         Lookup the scylla debug information, in various places it can be.
 
-        :return the path to the scylla debug information
+        :return the path to the scylla debug information or None if debuginfo is not installed on the node
+            (it's taken from other node with the same build id in such case)
         :rtype str
         """
-        # first try default location
-        scylla_debug_info = '/usr/lib/debug/bin/scylla.debug'
-        results = self._remoter.run('[[ -f {} ]]'.format(scylla_debug_info), ignore_status=True)
-        if results.ok:
-            return scylla_debug_info
-
-        # then try the relocatable location
-        results = self._remoter.run('ls /usr/lib/debug/opt/scylladb/libexec/scylla*.debug', ignore_status=True)
-        if results.stdout.strip():
-            return results.stdout.strip()
-
-        # then look it up base on the build id
-        if build_id := self.get_scylla_build_id():
-            scylla_debug_info = "/usr/lib/debug/.build-id/{0}/{1}.debug".format(build_id[:2], build_id[2:])
-            results = self._remoter.run('[[ -f {} ]]'.format(scylla_debug_info), ignore_status=True)
-            if results.ok:
-                return scylla_debug_info
-
-        raise Exception("Couldn't find scylla debug information")
+        return find_debuginfo_file(self._remoter, build_id=build_id)
 
     def stop(self):
         self._terminate_event.set()
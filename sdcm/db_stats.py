@@ -34,6 +34,7 @@ from sdcm.test_config import TestConfig
 from sdcm.utils.common import normalize_ipv6_url
 from sdcm.utils.git import get_git_commit_id
 from sdcm.utils.decorators import retrying
+from sdcm.utils.hdrhistogram import HdrHistogramStore
 from sdcm.sct_events.system import ElasticsearchEvent
 from sdcm.utils.ci_tools import get_job_name, get_job_url
 
@@ -567,6 +568,7 @@ class TestStatsMixin(Stats):
             self._test_index = self.__class__.__name__.lower()
         self._test_id = self._create_test_id(doc_id_with_timestamp)
         self._stats = self._init_stats()
+        self.__dict__.pop("hdr_histograms", None)  # new test stats start with empty histograms
         self._stats['setup_details'] = self.get_setup_details()
         self._stats['versions'] = self.get_scylla_versions()
         self._stats['test_details'] = self.get_test_details()
@@ -647,11 +649,18 @@ class TestStatsMixin(Stats):
         self._stats['results'].update(prometheus_stats)
         return prometheus_stats
 
-    def update_stress_results(self, results, calculate_stats=True):
+    @cached_property
+    def hdr_histograms(self) -> HdrHistogramStore:
+        """HDR latency histograms of all loaders for stress results stored in the current test stats."""
+        return HdrHistogramStore()
+
+    def update_stress_results(self, results, calculate_stats=True, hdr_log_files=()):
         if 'stats' not in self._stats['results']:
             self._stats['results']['stats'] = results
         else:
             self._stats['results']['stats'].extend(results)
+        for hdr_log_file in hdr_log_files:
+            self.hdr_histograms.load_log(hdr_log_file)
         if calculate_stats:
             self.calculate_stats_average()
             self.calculate_stats_total()
@@ -685,6 +694,11 @@ class TestStatsMixin(Stats):
             total = self._calc_stat_total(stat=stat)
             if total:
                 average_stats[stat] = round(total / len(self._stats['results']['stats']), 1)
+        if self.hdr_histograms:
+            # Percentiles of different loaders can't be averaged, use exact ones from merged histograms instead.
+            average_stats['latency mean'] = round(self.hdr_histograms.get_mean(), 1)
+            average_stats['latency 99th percentile'] = round(
+                self.hdr_histograms.get_percentiles(percentiles=(99, ))[99], 1)
         self._stats['results']['stats_average'] = average_stats
 
     def calculate_stats_total(self):
@@ -22,6 +22,7 @@ import time
 from sdcm.sct_events import Severity
 from sdcm.utils.common import FileFollowerThread
 from sdcm.sct_events.loaders import GeminiStressEvent, GeminiStressLogEvent
+from sdcm.sct_events.log_events_coalescer import LogEventsCoalescer, DEFAULT_COALESCING_INTERVAL
 
 
 LOGGER = logging.getLogger(__name__)
@@ -35,26 +36,29 @@ class NotGeminiErrorResult:  # pylint: disable=too-few-public-methods
 
 
 class GeminiEventsPublisher(FileFollowerThread):
-    def __init__(self, node, gemini_log_filename, verbose=False, event_id=None):
+    def __init__(self, node, gemini_log_filename, verbose=False, event_id=None,  # pylint: disable=too-many-arguments
+                 coalescing_interval=DEFAULT_COALESCING_INTERVAL):
         super().__init__()
         self.gemini_log_filename = gemini_log_filename
         self.node = str(node)
         self.verbose = verbose
         self.event_id = event_id
+        self.events_coalescer = LogEventsCoalescer(flush_interval=coalescing_interval)
 
     def run(self):
-        while not self.stopped():
-            if not os.path.isfile(self.gemini_log_filename):
-                time.sleep(0.5)
-                continue
-            for line_number, line in enumerate(self.follow_file(self.gemini_log_filename), start=1):
-                gemini_event = GeminiStressLogEvent.GeminiEvent(verbose=self.verbose)
-                gemini_event.add_info(node=self.node, line=line, line_number=line_number)
-                gemini_event.event_id = self.event_id
-                gemini_event.publish(warn_not_ready=False)
+        with self.events_coalescer:
+            while not self.stopped():
+                if not os.path.isfile(self.gemini_log_filename):
+                    time.sleep(0.5)
+                    continue
+                for line_number, line in enumerate(self.follow_file(self.gemini_log_filename), start=1):
+                    gemini_event = GeminiStressLogEvent.GeminiEvent(verbose=self.verbose)
+                    gemini_event.add_info(node=self.node, line=line, line_number=line_number)
+                    gemini_event.event_id = self.event_id
+                    self.events_coalescer.publish(gemini_event)
 
-                if self.stopped():
-                    break
+                    if self.stopped():
+                        break
 
 
 class GeminiStressThread:  # pylint: disable=too-many-instance-attributes
@@ -113,7 +117,9 @@ class GeminiStressThread:  # pylint: disable=too-many-instance-attributes
                                      'gemini-l%s-%s.log' %
                                      (loader_idx, uuid.uuid4()))
         gemini_cmd = self._generate_gemini_command()
-        with GeminiEventsPublisher(node=node, gemini_log_filename=log_file_name) as publisher, \
+        with GeminiEventsPublisher(
+                node=node, gemini_log_filename=log_file_name,
+                coalescing_interval=self.params.get("loader_events_coalescing_interval")) as publisher, \
                 GeminiStressEvent(node=node, cmd=gemini_cmd, log_file_name=log_file_name) as gemini_stress_event:
             try:
                 publisher.event_id = gemini_stress_event.event_id
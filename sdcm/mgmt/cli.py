@@ -23,12 +23,14 @@ from contextlib import contextmanager
 from distutils.version import LooseVersion
 
 import requests
+import tenacity
 from invoke.exceptions import Failure as InvokeFailure
 from sdcm.remote.libssh2_client.exceptions import Failure as Libssh2Failure
 
 from sdcm import wait
 from sdcm.mgmt.common import \
     TaskStatus, ScyllaManagerError, HostStatus, HostSsl, HostRestStatus, duration_to_timedelta, DEFAULT_TASK_TIMEOUT
+from sdcm.mgmt.state_client import ManagerStateClient, ManagerStateClientError, ManagerTaskState
 from sdcm.utils.distro import Distro
 
 
@@ -369,8 +371,29 @@ class ManagerTask:
         progress = self.progress  # pylint: disable=unused-variable
         return self.status in list_status
 
+    @property
+    def state_client(self) -> ManagerStateClient:
+        return ManagerStateClient.get(manager_node=self.manager_node)
+
     def wait_for_status(self, list_status, check_task_progress=True, timeout=3600, step=120):
         text = "Waiting until task: {} reaches status of: {}".format(self.id, list_status)
+        started = time.perf_counter()
+        try:
+            state = self.state_client.get_poller(cluster_id=self.cluster_id).wait_for_status(
+                task_id=self.id, statuses=list_status, timeout=timeout)
+        except ManagerStateClientError as exc:
+            LOGGER.warning("Failed to get task status using Scylla Manager API, use sctool instead: %s", exc)
+            timeout = max(timeout - (time.perf_counter() - started), 1)
+        else:
+            if state is None:
+                err = f"Wait for: {text}: timeout - {timeout} seconds - expired"
+                LOGGER.error(err)
+                raise tenacity.RetryError(err)
+            LOGGER.debug("Task %s reached %s status", self.id, state.status)
+            if check_task_progress and state.status not in [TaskStatus.NEW, TaskStatus.STARTING]:
+                # Check that the progress command works for the reached status and log the progress.
+                LOGGER.debug("Task %s progress: %s", self.id, self.progress)
+            return True
         is_status_reached = wait.wait_for(func=self.is_status_in_list, step=step, throw_exc=True,
                                           text=text, list_status=list_status, check_task_progress=check_task_progress,
                                           timeout=timeout)
@@ -721,6 +744,10 @@ class ManagerCluster(ScyllaManagerBase):
                 task_list.append(task_class(task_id=row[0], cluster_id=self.id, manager_node=self.manager_node))
         return task_list
 
+    def get_tasks_state(self) -> dict[str, ManagerTaskState]:
+        """State of all tasks of the cluster, by one Scylla Manager API request."""
+        return ManagerStateClient.get(manager_node=self.manager_node).tasks(cluster_id=self.id)
+
     @property
     def repair_task_list(self):
         return self._get_task_list_filtered('repair/', RepairTask)
@@ -0,0 +1,236 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""State of Scylla Manager tasks using Scylla Manager REST API instead of parsing `sctool' tables.
+
+The API listens on localhost of the manager node by default, so requests are sent by `curl' on the node.
+Status of all tasks of a cluster is fetched by one request and shared by all waiters of the cluster using
+`ManagerTasksPoller'.
+"""
+
+import re
+import json
+import time
+import logging
+import datetime
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from sdcm.mgmt.common import TaskStatus, ScyllaManagerError
+
+LOGGER = logging.getLogger(__name__)
+
+MANAGER_API_URL = "http://127.0.0.1:5080/api/v1"
+POLL_INTERVAL = 5
+MAX_POLL_ERRORS = 3
+FRACTION_RE = re.compile(r"\.(\d+)")
+
+
+class ManagerStateClientError(ScyllaManagerError):
+    pass
+
+
+def parse_time(value: Optional[str]) -> Optional[datetime.datetime]:
+    """Parse RFC 3339 time returned by Scylla Manager (with nanoseconds), None for zero or missing time."""
+    if not value or value.startswith("0001-01-01"):
+        return None
+    # Python can't parse more than 6 digits of fraction.
+    value = FRACTION_RE.sub(lambda match: f".{match.group(1)[:6].ljust(6, '0')}", value.replace("Z", "+00:00"))
+    return datetime.datetime.fromisoformat(value)
+
+
+@dataclass
+class ManagerTaskState:  # pylint: disable=too-many-instance-attributes
+    task_id: str  # in `sctool' format: `repair/<uuid>'
+    name: str
+    enabled: bool
+    status: str
+    cause: str = ""
+    retry: int = 0
+    success_count: int = 0
+    error_count: int = 0
+    start_time: Optional[datetime.datetime] = None
+    end_time: Optional[datetime.datetime] = None
+    next_activation: Optional[datetime.datetime] = None
+    suspended: bool = False
+
+    @classmethod
+    def from_api(cls, data: dict) -> "ManagerTaskState":
+        status = TaskStatus.from_str(data.get("status") or TaskStatus.NEW)
+        # Same as `ERROR (4/4)' shown by sctool when all retries of a task run failed.
+        if status == TaskStatus.ERROR and data.get("error_count", 0) >= data.get("retry", 0) + 1 \
+                and not parse_time(data.get("next_activation")):
+            status = TaskStatus.ERROR_FINAL
+        return cls(task_id=f"{data['type']}/{data['id']}",
+                   name=data.get("name", ""),
+                   enabled=data.get("enabled", True),
+                   status=status,
+                   cause=data.get("cause", ""),
+                   retry=data.get("retry", 0),
+                   success_count=data.get("success_count", 0),
+                   error_count=data.get("error_count", 0),
+                   start_time=parse_time(data.get("start_time")),
+                   end_time=parse_time(data.get("end_time")),
+                   next_activation=parse_time(data.get("next_activation")),
+                   suspended=data.get("suspended", False))
+
+
+@dataclass
+class ManagerTaskRun:
+    run_id: str
+    status: str
+    cause: str = ""
+    start_time: Optional[datetime.datetime] = None
+    end_time: Optional[datetime.datetime] = None
+
+    @classmethod
+    def from_api(cls, data: dict) -> "ManagerTaskRun":
+        return cls(run_id=data["id"],
+                   status=TaskStatus.from_str(data.get("status") or TaskStatus.NEW),
+                   cause=data.get("cause", ""),
+                   start_time=parse_time(data.get("start_time")),
+                   end_time=parse_time(data.get("end_time")))
+
+    @property
+    def duration(self) -> datetime.timedelta:
+        if not self.start_time:
+            return datetime.timedelta(0)
+        return (self.end_time or datetime.datetime.now(tz=datetime.timezone.utc)) - self.start_time
+
+
+class ManagerTasksPoller:
+    """Poll status of all tasks of a cluster while there are waiters and wake them up on changes."""
+
+    def __init__(self, client: "ManagerStateClient", cluster_id: str, interval: float = POLL_INTERVAL):
+        self.client = client
+        self.cluster_id = cluster_id
+        self.interval = interval
+        self.tasks: Dict[str, ManagerTaskState] = {}
+        self.polls = 0
+        self.errors = 0
+        self.last_error: Optional[Exception] = None
+        self._waiters = 0
+        self._thread = None
+        self._condition = threading.Condition()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._waiters:
+                    self._thread = None
+                    return
+            try:
+                tasks, error = self.client.tasks(cluster_id=self.cluster_id), None
+            except ScyllaManagerError as exc:
+                tasks, error = None, exc
+            with self._condition:
+                if error is None:
+                    for task_id, state in tasks.items():
+                        if (old_state := self.tasks.get(task_id)) is None or old_state.status != state.status:
+                            LOGGER.debug("Task %s status: %s -> %s", task_id,
+                                         old_state.status if old_state else None, state.status)
+                    self.tasks = tasks
+                    self.errors = 0
+                else:
+                    LOGGER.debug("Failed to get status of tasks of cluster %s: %s", self.cluster_id, error)
+                    self.errors += 1
+                self.last_error = error
+                self.polls += 1
+                self._condition.notify_all()
+            time.sleep(self.interval)
+
+    def wait_for_status(self, task_id: str, statuses: Iterable[str], timeout: float) -> Optional[ManagerTaskState]:
+        """Wait until the task reaches one of `statuses', return its state or None if `timeout' expired.
+
+        Only states fetched after the call are taken into account.  Raise `ManagerStateClientError' if the API
+        failed `MAX_POLL_ERRORS' times in a row.
+        """
+        statuses = set(statuses)
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            self._waiters += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"ManagerTasksPoller-{self.cluster_id}",
+                                                daemon=True)
+                self._thread.start()
+            try:
+                polls = self.polls
+                while (time_left := deadline - time.monotonic()) > 0:
+                    self._condition.wait(timeout=time_left)
+                    if self.polls == polls:
+                        continue
+                    polls = self.polls
+                    if self.errors >= MAX_POLL_ERRORS:
+                        raise ManagerStateClientError(f"Scylla Manager API failed {self.errors} times in a row, "
+                                                      f"last error: {self.last_error}")
+                    if (state := self.tasks.get(task_id)) is not None and state.status in statuses:
+                        return state
+                return None
+            finally:
+                self._waiters -= 1
+
+
+class ManagerStateClient:
+    """Scylla Manager REST API client for the state of tasks, one per manager node."""
+
+    _clients: Dict[str, "ManagerStateClient"] = {}
+    _clients_lock = threading.Lock()
+
+    def __init__(self, manager_node, api_url: str = MANAGER_API_URL):
+        self.manager_node = manager_node
+        self.api_url = api_url
+        self._pollers: Dict[str, ManagerTasksPoller] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls, manager_node) -> "ManagerStateClient":
+        with cls._clients_lock:
+            if (client := cls._clients.get(manager_node.name)) is None or client.manager_node is not manager_node:
+                client = cls._clients[manager_node.name] = cls(manager_node=manager_node)
+            return client
+
+    def get_poller(self, cluster_id: str) -> ManagerTasksPoller:
+        with self._lock:
+            if (poller := self._pollers.get(cluster_id)) is None:
+                poller = self._pollers[cluster_id] = ManagerTasksPoller(client=self, cluster_id=cluster_id)
+            return poller
+
+    def request(self, path: str):
+        url = f"{self.api_url}/{path}"
+        result = self.manager_node.remoter.run(f"curl -sS --fail '{url}'", ignore_status=True, verbose=False,
+                                               timeout=60)
+        if not result.ok:
+            raise ManagerStateClientError(f"Scylla Manager API request `{url}' failed: {result.stderr.strip()}")
+        try:
+            return json.loads(result.stdout)
+        except ValueError as exc:
+            raise ManagerStateClientError(f"Scylla Manager API request `{url}' returned non-JSON response: "
+                                          f"{result.stdout[:200]}") from exc
+
+    def tasks(self, cluster_id: str) -> Dict[str, ManagerTaskState]:
+        """State of all tasks of the cluster (including disabled ones) keyed by task ID in `sctool' format."""
+        states = [ManagerTaskState.from_api(task) for task in self.request(f"cluster/{cluster_id}/tasks?all=true")]
+        return {state.task_id: state for state in states}
+
+    def task_history(self, cluster_id: str, task_id: str, limit: int = 10) -> List[ManagerTaskRun]:
+        """Last `limit' runs of the task, newest first."""
+        runs = self.request(f"cluster/{cluster_id}/task/{task_id}/history?limit={limit}")
+        return [ManagerTaskRun.from_api(run) for run in runs or []]
+
+    def task_progress(self, cluster_id: str, task_id: str, run_id: str = "latest") -> dict:
+        return self.request(f"cluster/{cluster_id}/task/{task_id}/{run_id}/progress")
+
+
+__all__ = ("ManagerStateClient", "ManagerTasksPoller", "ManagerTaskState", "ManagerTaskRun",
+           "ManagerStateClientError", )
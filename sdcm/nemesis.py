@@ -21,7 +21,6 @@ import datetime
 import inspect
 import json
 import logging
-import os
 import random
 import re
 import time
@@ -725,44 +724,19 @@ class Nemesis:  # pylint: disable=too-many-instance-attributes,too-many-public-m
 
     @retrying(n=10, allowed_exceptions=(NoKeyspaceFound, NoFilesFoundToDestroy))
     def _choose_file_for_destroy(self, ks_cfs):
-        file_for_destroy = ''
-
         ks_cf_for_destroy = random.choice(ks_cfs)  # expected value as: 'keyspace1.standard1'
 
-        ks_cf_for_destroy = ks_cf_for_destroy.replace('.', '/')
-        files = self.target_node.remoter.sudo("find /var/lib/scylla/data/%s-* -maxdepth 1 -type f"
-                                              % ks_cf_for_destroy, verbose=False)
-        if files.stderr:
-            raise NoFilesFoundToDestroy(
-                'Failed to get data files for destroy in {}. Error: {}'.format(ks_cf_for_destroy,
-                                                                               files.stderr))
-
-        for one_file in files.stdout.split():
-            if not one_file or '/' not in one_file:
-                continue
-            file_name = os.path.basename(one_file)
-            # The file name like: /var/lib/scylla/data/scylla_bench/test-f60e4f30c98f11e98d46000000000002/mc-220-big-Data.db
-            # For corruption we need to remove all files that their names are started from "mc-220-" (MC format)
-            # Old format: "system-truncated-ka-" (system-truncated-ka-7-Data.db)
-            # Search for "<digit>-" substring
-
-            try:
-                file_name_template = re.search(r"(.*-\d+)-", file_name).group(1)
-            except Exception as error:  # pylint: disable=broad-except
-                self.log.debug('File name "{file_name}" is not as expected for Scylla data files. '
-                               'Search files for "{ks_cf_for_destroy}" table'.format(file_name=file_name,
-                                                                                     ks_cf_for_destroy=ks_cf_for_destroy))
-                self.log.debug('Error: {}'.format(error))
-                continue
-
-            file_for_destroy = one_file.replace(file_name, file_name_template + '-*')
-            self.log.debug('Selected files for destroy: {}'.format(file_for_destroy))
-            if file_for_destroy:
-                break
-
-        if not file_for_destroy:
+        # The inventory rescans only table directories changed since the previous call
+        sstable_inventory = self.target_node.sstable_inventory
+        sstable_inventory.refresh()
+        sstable = sstable_inventory.choose_random_sstable(tables=[ks_cf_for_destroy])
+        if not sstable:
             raise NoFilesFoundToDestroy('Data file for destroy is not found in {}'.format(ks_cf_for_destroy))
 
+        # For corruption we need to remove all files that their names are started from "mc-220-" (MC format)
+        # Old format: "system-truncated-ka-" (system-truncated-ka-7-Data.db)
+        file_for_destroy = sstable.files_pattern
+        self.log.debug('Selected files for destroy: {}'.format(file_for_destroy))
         return file_for_destroy
 
     def _destroy_data_and_restart_scylla(self):
@@ -12,7 +12,6 @@
 # Copyright (c) 2021 ScyllaDB
 
 
-import json
 import logging
 import re
 import sys
@@ -23,6 +22,8 @@ from typing import List
 from enum import Enum
 from jinja2 import Environment, FileSystemLoader
 
+from sdcm.sct_events.events_store import RawEventsStore
+
 
 LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +42,9 @@ class EventGroup(Enum):
     STRESS_EVENTS = ["CassandraStressEvent", "CassandraStressLogEvent"]
 
 
+REPORTED_EVENTS = [event for group in EventGroup for event in group.value]
+
+
 # pylint: disable=too-many-instance-attributes
 @dataclass
 class Event:
@@ -166,19 +170,21 @@ class ParallelTimelinesReportGenerator:
             LOGGER.critical("File \"%s\" not found!", self.events_file)
             sys.exit(1)
         LOGGER.info("Starting to read file \"%s\"...", self.events_file)
-        with self.events_file.open(encoding="utf-8") as file:
-            for line in file:
-                event = Event(event_dict=json.loads(line))
-                if event.end_timestamp and event.end_timestamp > self.max_end_timestamp:
-                    self.max_end_timestamp = event.end_timestamp
-                if not self.cluster_name and event.cluster_name:
-                    self.cluster_name = event.cluster_name
-                # Getting test_id from the line like this "test_id=fe9c9218-367f-47ba-b59f-0d06c0e81c30"
-                if not self.test_id and event.base == "InfoEvent" and "TEST_START" in event.message:
-                    self.test_id = event.message.split("=")[-1]
-                self.events.append(event)
-            LOGGER.info("File \"%s\" has been read successfully. %d rows have been processed.",
-                        self.events_file, len(self.events))
+        events_store = RawEventsStore(raw_events_log=self.events_file)
+        events_store.refresh()
+        self.max_end_timestamp = Event._convert_to_milliseconds(  # pylint: disable=protected-access
+            timestamp=events_store.max_timestamp) or 0
+        # Load only events shown in the report, all others are skipped using the index without parsing.
+        for event_dict in events_store.iter_events(event_type=REPORTED_EVENTS, refresh=False):
+            event = Event(event_dict=event_dict)
+            if not self.cluster_name and event.cluster_name:
+                self.cluster_name = event.cluster_name
+            # Getting test_id from the line like this "test_id=fe9c9218-367f-47ba-b59f-0d06c0e81c30"
+            if not self.test_id and event.base == "InfoEvent" and "TEST_START" in event.message:
+                self.test_id = event.message.split("=")[-1]
+            self.events.append(event)
+        LOGGER.info("File \"%s\" has been read successfully. %d of %d rows have been processed.",
+                    self.events_file, len(self.events), events_store.count)
 
     def prepare_scylla_nodes_event_data(self) -> None:
         scylla_nodes_events = self._process_raw_data(events_to_process=EventGroup.NODES_RELATED_EVENTS.value)
@@ -248,6 +248,9 @@ class LogWriteWatcher(StreamWatcher):  # pylint: disable=too-few-public-methods
     def submit_line(self, line: str):
         self.file_object.write(line)
 
+    def submit_chunk(self, data: str):
+        self.file_object.write(data)
+
 
 class FailuresWatcher(Responder):
     def __init__(self, sentinel, callback=None, raise_exception=True):
@@ -11,9 +11,15 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+import os
+import time
+import shlex
+import base64
 import inspect
+import tarfile
+import tempfile
 import threading
-from typing import Optional, Callable, Iterator, List
+from typing import Optional, Callable, Iterator, List, Dict, BinaryIO, Tuple
 
 import kubernetes as k8s
 from invoke import Runner, Context, Config
@@ -27,6 +33,9 @@ from sdcm.utils.decorators import retrying
 from .base import RetryableNetworkException
 from .remote_base import RemoteCmdRunnerBase, StreamWatcher
 
+TAR_TRANSFER_CHUNK_SIZE = 1024 * 1024  # bytes
+TAR_TRANSFER_SHELL = "/bin/bash"
+
 
 class KubernetesRunner(Runner):
     read_timeout = 0.1
@@ -102,6 +111,38 @@ class KubernetesRunner(Runner):
         self.stop()
 
 
+class Base64StreamDecoder:
+    """Decode base64 text which comes in chunks of arbitrary size and write the result to a file object."""
+
+    def __init__(self, fileobj: BinaryIO):
+        self._fileobj = fileobj
+        self._remainder = ""
+
+    def write(self, data: str) -> None:
+        data = self._remainder + "".join(data.split())
+        cut = len(data) - len(data) % 4
+        self._remainder = data[cut:]
+        if cut:
+            self._fileobj.write(base64.b64decode(data[:cut]))
+
+    def close(self) -> None:
+        if self._remainder:
+            raise ValueError(f"Incomplete base64 data at the end of the stream: {self._remainder!r}")
+
+
+def _map_tar_member(name: str, files: Dict[str, str]) -> Optional[str]:
+    """Return local path for an archive member using {remote path: local path} mapping."""
+    if ".." in name.split("/"):
+        return None
+    for src, dst in files.items():
+        src = src.strip("/")
+        if name == src:
+            return dst
+        if name.startswith(src + "/"):
+            return os.path.join(dst, name[len(src) + 1:])
+    return None
+
+
 class KubernetesCmdRunner(RemoteCmdRunnerBase):
     exception_retryable = (ConnectionError, MaxRetryError, ThreadException)
     default_run_retry = 8
@@ -168,6 +209,106 @@ class KubernetesCmdRunner(RemoteCmdRunnerBase):
                                 container=self.container, timeout=300)
         return True
 
+    def _exec_stream(self, command: str):
+        k8s_core_v1_api = KubernetesOps.core_v1_api(self.kluster.get_api_client())
+        try:
+            return k8s.stream.stream(
+                k8s_core_v1_api.connect_get_namespaced_pod_exec,
+                name=self.pod,
+                container=self.container,
+                namespace=self.namespace,
+                command=[TAR_TRANSFER_SHELL, "-c", command],
+                stderr=True,
+                stdin=True,
+                stdout=True,
+                tty=False,
+                capture_all=False,
+                _preload_content=False)
+        except k8s.client.rest.ApiException as exc:
+            raise RetryableNetworkException(str(exc), original=exc) from None
+
+    def _wait_exec_stream(self, process, command: str, timeout: float,
+                          on_stdout: Optional[Callable[[str], None]] = None) -> Tuple[int, str]:
+        """Read output of the command till it ends and return its exit status and stderr."""
+        end_time = time.perf_counter() + timeout
+        stderr = []
+        while True:
+            is_open = process.is_open()
+            if is_open and time.perf_counter() > end_time:
+                process.close()
+                raise TimeoutError(f"{self}: `{command}' didn't finish in {timeout} seconds")
+            process.update(timeout=1)
+            if (stdout_data := process.read_stdout(timeout=0)) and on_stdout:
+                on_stdout(stdout_data)
+            if stderr_data := process.read_stderr(timeout=0):
+                stderr.append(stderr_data)
+            if not is_open:
+                break
+        return process.returncode, "".join(stderr)
+
+    def send_files_batch(self, files: Dict[str, str], compress: bool = False, timeout: float = 300) -> bool:
+        """Send many local files and directories to the pod by one tar stream over one exec websocket.
+
+        `files' is a mapping of local paths to remote paths, remote parent directories are created if needed.
+        """
+        with tempfile.TemporaryFile() as archive:
+            with tarfile.open(fileobj=archive, mode="w:gz" if compress else "w") as tar:
+                for src, dst in files.items():
+                    tar.add(src, arcname=dst.strip("/"))
+            size = archive.tell()
+            archive.seek(0)
+            # NOTE: there is no way to close stdin of exec websocket, so read exact number of bytes.
+            command = f"head -c {size} | tar -x{'z' if compress else ''}mf - -C /"
+            self.log.debug("Send %s files (%s bytes) to %s", len(files), size, self)
+            process = self._exec_stream(command)
+            try:
+                while chunk := archive.read(TAR_TRANSFER_CHUNK_SIZE):
+                    process.write_stdin(chunk)
+                returncode, stderr = self._wait_exec_stream(process, command, timeout)
+            finally:
+                process.close()
+        if returncode:
+            raise RuntimeError(f"{self}: failed to send files (exit status {returncode}): {stderr}")
+        return True
+
+    def receive_files_batch(self, files: Dict[str, str], compress: bool = False, timeout: float = 300,
+                            ignore_status: bool = False) -> bool:
+        """Receive many files and directories from the pod by one tar stream over one exec websocket.
+
+        `files' is a mapping of remote paths to local paths.  Output of the exec websocket is text only,
+        so the archive is base64 encoded on the pod side.  If `ignore_status' is set then files which
+        were archived are extracted even if some of them are missing.
+        """
+        paths = " ".join(shlex.quote(src.strip("/")) for src in files)
+        command = f"set -o pipefail; tar -c{'z' if compress else ''}f - -C / {paths} | base64"
+        with tempfile.TemporaryFile() as archive:
+            decoder = Base64StreamDecoder(archive)
+            process = self._exec_stream(command)
+            try:
+                returncode, stderr = self._wait_exec_stream(process, command, timeout, on_stdout=decoder.write)
+            finally:
+                process.close()
+            decoder.close()
+            if returncode and not ignore_status:
+                raise RuntimeError(f"{self}: failed to receive files (exit status {returncode}): {stderr}")
+            self.log.debug("Received %s bytes from %s", archive.tell(), self)
+            archive.seek(0)
+            if not archive.read(1):
+                return False
+            archive.seek(0)
+            with tarfile.open(fileobj=archive, mode="r:gz" if compress else "r:") as tar:
+                for member in tar:
+                    if not (member.isfile() or member.isdir()):
+                        self.log.warning("Skip archive member which is not a regular file or directory: %s",
+                                         member.name)
+                        continue
+                    if (target := _map_tar_member(member.name, files)) is None:
+                        self.log.warning("Skip unexpected archive member: %s", member.name)
+                        continue
+                    member.name = os.path.relpath(os.path.abspath(target), "/")
+                    tar.extract(member, path="/")
+        return not returncode
+
     def _run_on_retryable_exception(self, exc: Exception, new_session: bool) -> bool:
         self.log.error(exc)
         if isinstance(exc, self.exception_retryable):
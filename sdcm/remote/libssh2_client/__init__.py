@@ -16,6 +16,7 @@ from time import perf_counter, sleep
 from os.path import normpath, expanduser, exists
 from sys import float_info
 from io import StringIO
+from codecs import getincrementaldecoder
 from warnings import warn
 from socket import socket, AF_INET, AF_INET6, SOCK_STREAM, gaierror, gethostbyname, error as sock_error
 from threading import Thread, Lock, Event, BoundedSemaphore
@@ -34,7 +35,7 @@ from .session import Session
 from .timings import Timings, NullableTiming
 
 
-__all__ = ['Session', 'Timings', 'Client', 'Channel', 'FailedToRunCommand']
+__all__ = ['Session', 'Timings', 'Client', 'Channel', 'FailedToRunCommand', 'ChunkBuffer']
 
 
 LINESEP = b'\n'
@@ -45,11 +46,44 @@ class __DEFAULT__:  # pylint: disable=invalid-name, too-few-public-methods
 
 
 class StreamWatcher(ABC):  # pylint: disable=too-few-public-methods
+    """Line-oriented watcher.
+
+    Watchers which don't need lines can implement `submit_chunk(self, data: str)' in addition (or instead), then
+    in buffered mode they get output as it is read from the socket and no line splitting is done for them.
+    """
     @abstractmethod
     def submit_line(self, line: str):
         pass
 
 
+class ChunkBuffer:
+    """Buffer for raw output chunks between `SSHReaderThread' and the consumer.
+
+    Reader appends chunks as they are and consumer takes all of them at once, so there is one lock round trip per
+    batch instead of per line, and neither splitting nor copying of data is done on the reader side.
+    Chunks returned by `channel.read()' are immutable bytes, so keeping them in a list is cheaper than copying them
+    into a bytearray ring.
+    """
+
+    def __init__(self, data_ready: Event):
+        self._chunks: List[bytes] = []
+        self._lock = Lock()
+        self._data_ready = data_ready
+
+    def put(self, chunk: bytes):
+        with self._lock:
+            self._chunks.append(chunk)
+        self._data_ready.set()
+
+    def get_all(self) -> List[bytes]:
+        with self._lock:
+            chunks, self._chunks = self._chunks, []
+        return chunks
+
+    def qsize(self) -> int:
+        return len(self._chunks)
+
+
 class SSHReaderThread(Thread):  # pylint: disable=too-many-instance-attributes
     """
     Thread that reads data from ssh session socket and forwards it to Queue.
@@ -57,11 +91,21 @@ class SSHReaderThread(Thread):  # pylint: disable=too-many-instance-attributes
       we have to have Queue as a buffer with 'endless' memory, and fast reader that reads data from the socket
       and forward it to the Queue.
       As part of this process it splits data into lines, because watchers expect it is organized in this way.
+    In buffered mode it doesn't split anything and forwards raw chunks to `ChunkBuffer' instead,
+      lines are built by `Client._process_output_buffered' only when some watcher needs them.
     """
 
-    def __init__(self, session: Session, channel: Channel, timeout: NullableTiming, timeout_read_data: NullableTiming):
-        self.stdout = Queue()
-        self.stderr = Queue()
+    def __init__(self, session: Session, channel: Channel, timeout: NullableTiming,  # pylint: disable=too-many-arguments
+                 timeout_read_data: NullableTiming, buffered: bool = False):
+        self.buffered = buffered
+        # Set whenever new data is available in buffered mode or when the reader is done.
+        self.data_ready = Event()
+        if buffered:
+            self.stdout = ChunkBuffer(self.data_ready)
+            self.stderr = ChunkBuffer(self.data_ready)
+        else:
+            self.stdout = Queue()
+            self.stderr = Queue()
         self.timeout_reached = False
         self._session = session
         self._channel = channel
@@ -73,11 +117,41 @@ class SSHReaderThread(Thread):  # pylint: disable=too-many-instance-attributes
         super().__init__(daemon=True)
 
     def run(self):
+        read_output = self._read_output_buffered if self.buffered else self._read_output
         try:
-            self._read_output(self._session, self._channel, self._timeout,
-                              self._timeout_read_data, self.stdout, self.stderr)
+            read_output(self._session, self._channel, self._timeout,
+                        self._timeout_read_data, self.stdout, self.stderr)
         except Exception as exc:  # pylint: disable=broad-except
             self.raised = exc
+        finally:
+            self.data_ready.set()
+
+    def _read_output_buffered(  # pylint: disable=too-many-arguments
+            self, session: Session, channel: Channel, timeout: NullableTiming, timeout_read_data: NullableTiming,
+            stdout_stream: ChunkBuffer, stderr_stream: ChunkBuffer):
+        """Same as `_read_output', but forwards raw chunks without splitting them into lines."""
+        if timeout is None:
+            end_time = float_info.max
+        else:
+            end_time = perf_counter() + timeout
+        eof_result = stdout_size = stderr_size = 1
+        while eof_result == LIBSSH2_ERROR_EAGAIN or stdout_size == LIBSSH2_ERROR_EAGAIN or \
+                stdout_size > 0 or stderr_size == LIBSSH2_ERROR_EAGAIN or stderr_size > 0:  # pylint: disable=consider-using-in
+            if not self._can_run.is_set():
+                break
+            if perf_counter() > end_time:
+                self.timeout_reached = True
+                break
+            with session.lock:
+                if stdout_size == LIBSSH2_ERROR_EAGAIN and stderr_size == LIBSSH2_ERROR_EAGAIN:  # pylint: disable=consider-using-in
+                    session.simple_select(timeout=timeout_read_data)
+                stdout_size, stdout_chunk = channel.read()
+                stderr_size, stderr_chunk = channel.read_stderr()
+                eof_result = channel.eof()
+            if stdout_chunk:
+                stdout_stream.put(stdout_chunk)
+            if stderr_chunk:
+                stderr_stream.put(stderr_chunk)
 
     def _read_output(  # pylint: disable=too-many-arguments,too-many-branches
             self, session: Session, channel: Channel, timeout: NullableTiming, timeout_read_data: NullableTiming,
@@ -281,6 +355,8 @@ class Client:  # pylint: disable=too-many-instance-attributes
     forward_ssh_agent: bool = False
     proxy_host: str = None
     keepalive_seconds: int = 60
+    # Read output of commands with watchers in raw chunks (see `ChunkBuffer') instead of line by line.
+    buffered_output: bool = True
     timings: Timings = Timings()
     flood_preventing: FloodPreventingFacility = DEFAULT_FLOOD_PREVENTING
 
@@ -461,6 +537,60 @@ class Client:  # pylint: disable=too-many-instance-attributes
                         pass
         return True
 
+    @staticmethod
+    def _process_output_buffered(  # pylint: disable=too-many-arguments,too-many-locals
+            watchers: List[StreamWatcher], encoding: str, stdout_stream: StringIO, stderr_stream: StringIO,
+            reader: SSHReaderThread, timeout: NullableTiming, timeout_read_data_chunk: NullableTiming):
+        """Same as `_process_output', but `reader' is in buffered mode: take all available chunks at once and
+        split them into lines only if there are line-oriented watchers.
+        """
+        chunk_watchers = [watcher for watcher in watchers if hasattr(watcher, "submit_chunk")]
+        line_watchers = [watcher for watcher in watchers if not hasattr(watcher, "submit_chunk")]
+        streams = [[reader.stdout, stdout_stream, getincrementaldecoder(encoding)(), ''],
+                   [reader.stderr, stderr_stream, getincrementaldecoder(encoding)(), '']]
+
+        def forward(stream_state, chunks, final=False):
+            _, output_stream, decoder, remainder = stream_state
+            if output_stream is None:
+                return
+            data = decoder.decode(b''.join(chunks), final)
+            output_stream.write(data)
+            try:
+                for watcher in chunk_watchers:
+                    watcher.submit_chunk(data)
+                if line_watchers:
+                    lines = (remainder + data).split('\n')
+                    stream_state[3] = lines.pop()
+                    if final and stream_state[3]:
+                        lines.append(stream_state[3])
+                    for line in lines:
+                        line += '\n'
+                        for watcher in line_watchers:
+                            watcher.submit_line(line)
+            except Exception:  # pylint: disable=broad-except
+                pass
+
+        reader.start()
+        if timeout:
+            end_time = perf_counter() + timeout
+        else:
+            end_time = float_info.max
+        while True:
+            if perf_counter() > end_time:
+                reader.stop()
+                return False
+            reader_is_done = not reader.is_alive()
+            reader.data_ready.wait(timeout_read_data_chunk)
+            reader.data_ready.clear()
+            for stream_state in streams:
+                if chunks := stream_state[0].get_all():
+                    forward(stream_state, chunks)
+            if reader_is_done:
+                break
+        for stream_state in streams:
+            forward(stream_state, [], final=True)
+        return True
+
     @staticmethod
     def _process_output_no_watchers(  # pylint: disable=too-many-arguments
             session: Session, channel: Channel, encoding: str, stdout_stream: StringIO,
@@ -596,12 +726,14 @@ class Client:  # pylint: disable=too-many-instance-attributes
             return self._complete_run(
                 channel, FailedToRunCommand(result, exc), timeout_reached, timeout, result, warn, stdout, stderr)
         if watchers:
-            reader = SSHReaderThread(self.session, channel, timeout, self.timings.interactive_read_data_chunk_timeout)
+            reader = SSHReaderThread(self.session, channel, timeout, self.timings.interactive_read_data_chunk_timeout,
+                                     buffered=self.buffered_output)
+            process_output = self._process_output_buffered if self.buffered_output else self._process_output
             try:
 
                 self.execute(command, channel=channel, use_pty=False)
-                self._process_output(watchers, encoding, stdout, stderr, reader, timeout,
-                                     self.timings.interactive_read_data_chunk_timeout)
+                process_output(watchers, encoding, stdout, stderr, reader, timeout,
+                               self.timings.interactive_read_data_chunk_timeout)
             except Exception as exc:  # pylint: disable=broad-except
                 exception = FailedToReadCommandOutput(result, exc)
             if reader.is_alive():
@@ -0,0 +1,283 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+from __future__ import annotations
+
+import logging
+import selectors
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from io import StringIO
+from sys import float_info
+from time import perf_counter
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional
+
+from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN  # pylint: disable=no-name-in-module
+from ssh2.session import LIBSSH2_SESSION_BLOCK_INBOUND, LIBSSH2_SESSION_BLOCK_OUTBOUND  # pylint: disable=no-name-in-module
+
+from . import Client, StreamWatcher, LINESEP
+from .exceptions import CommandTimedOut, FailedToReadCommandOutput, FailedToRunCommand, UnexpectedExit
+from .result import Result
+
+__all__ = ['MultiplexedExecutor', 'MultiplexedCommandResult', 'OutputCallback']
+
+LOGGER = logging.getLogger(__name__)
+
+# Called for each line of output as soon as it is received: (key, stream name, line with trailing newline).
+OutputCallback = Callable[[Hashable, str, str], None]
+
+
+@dataclass
+class MultiplexedCommandResult:
+    """Outcome of a command on one endpoint.  `exception' is set if the command failed, timed out or exited
+    with non-zero status (unless `ignore_status' was requested), same exceptions as `Client.run()' raises."""
+    result: Result
+    exception: Optional[Exception] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None and self.result.ok
+
+    @property
+    def failed(self) -> bool:
+        return not self.ok
+
+
+class _Stage(Enum):
+    OPEN_CHANNEL = 1
+    EXECUTE = 2
+    READ_OUTPUT = 3
+    CLOSE_CHANNEL = 4
+    WAIT_CLOSED = 5
+    DONE = 6
+
+
+class _CommandTask:  # pylint: disable=too-many-instance-attributes
+    """Non-blocking state machine which runs a command in a new channel of an already connected session.
+
+    Each `step()' advances it as far as possible and returns False when libssh2 needs the socket
+    to become readable/writable (LIBSSH2_ERROR_EAGAIN) or True when the command is completed.
+    """
+
+    def __init__(self, key: Hashable, client: Client, command: str, encoding: str,  # pylint: disable=too-many-arguments
+                 timeout: Optional[float], on_output: Optional[OutputCallback], watchers: List[StreamWatcher]):
+        self.key = key
+        self.client = client
+        self.command = command
+        self.encoding = encoding
+        self.timeout = timeout
+        self.on_output = on_output
+        self.watchers = watchers
+        self.stage = _Stage.OPEN_CHANNEL
+        self.channel = None
+        self.events = 0
+        self.started = perf_counter()
+        self.deadline = self.started + timeout if timeout else float_info.max
+        self.streams = {"stdout": StringIO(), "stderr": StringIO()}
+        self.remainders = {"stdout": b"", "stderr": b""}
+        self.result = Result(command=command, encoding=encoding, hide=('stderr', 'stdout'), shell='/bin/bash',
+                             exited=None, stdout='', stderr='')
+
+    @property
+    def fileno(self) -> int:
+        return self.client.sock.fileno()
+
+    @property
+    def wait_events(self) -> int:
+        """Selector events the session waits for, read if libssh2 doesn't tell."""
+        directions = self.client.session.block_directions()
+        events = 0
+        if directions & LIBSSH2_SESSION_BLOCK_INBOUND:
+            events |= selectors.EVENT_READ
+        if directions & LIBSSH2_SESSION_BLOCK_OUTBOUND:
+            events |= selectors.EVENT_WRITE
+        return events or selectors.EVENT_READ
+
+    def _feed(self, stream: str, chunk: bytes) -> None:
+        lines = (self.remainders[stream] + chunk).split(LINESEP)
+        self.remainders[stream] = lines.pop()
+        for line in lines:
+            self._submit_line(stream, line)
+
+    def _submit_line(self, stream: str, line: bytes) -> None:
+        data = line.decode(self.encoding) + '\n'
+        self.streams[stream].write(data)
+        for watcher in self.watchers:
+            watcher.submit_line(data)
+        if self.on_output is not None:
+            self.on_output(self.key, stream, data)
+
+    def step(self) -> bool:  # pylint: disable=too-many-return-statements,too-many-branches
+        session = self.client.session
+        with session.lock:
+            if self.stage is _Stage.OPEN_CHANNEL:
+                channel = session.open_session()
+                if channel == LIBSSH2_ERROR_EAGAIN:
+                    return False
+                self.channel = channel
+                self.stage = _Stage.EXECUTE
+            if self.stage is _Stage.EXECUTE:
+                if self.channel.execute(self.command) == LIBSSH2_ERROR_EAGAIN:
+                    return False
+                self.stage = _Stage.READ_OUTPUT
+            if self.stage is _Stage.READ_OUTPUT:
+                while True:
+                    stdout_size, stdout_chunk = self.channel.read()
+                    stderr_size, stderr_chunk = self.channel.read_stderr()
+                    for size in (stdout_size, stderr_size):
+                        if size < 0 and size != LIBSSH2_ERROR_EAGAIN:
+                            raise OSError(f"failed to read output from the channel, libssh2 error code {size}")
+                    if stdout_size > 0:
+                        self._feed("stdout", stdout_chunk)
+                    if stderr_size > 0:
+                        self._feed("stderr", stderr_chunk)
+                    if stdout_size > 0 or stderr_size > 0:
+                        continue
+                    if self.channel.eof():
+                        break
+                    return False
+                self.stage = _Stage.CLOSE_CHANNEL
+            if self.stage is _Stage.CLOSE_CHANNEL:
+                if self.channel.close() == LIBSSH2_ERROR_EAGAIN:
+                    return False
+                self.stage = _Stage.WAIT_CLOSED
+            if self.stage is _Stage.WAIT_CLOSED:
+                if self.channel.wait_closed() == LIBSSH2_ERROR_EAGAIN:
+                    return False
+                self.result.exited = self.channel.get_exit_status()
+                self.stage = _Stage.DONE
+        return True
+
+    def complete(self, warn: bool, exception: Optional[Exception] = None) -> MultiplexedCommandResult:
+        for stream, remainder in self.remainders.items():
+            if remainder:
+                self._submit_line(stream, remainder)
+        self.result.stdout = self.streams["stdout"].getvalue()
+        self.result.stderr = self.streams["stderr"].getvalue()
+        if self.channel is not None and self.client.session is not None:
+            self.client.session.drop_channel(self.channel)
+        if exception is None and not warn and self.result.exited != 0:
+            exception = UnexpectedExit(self.result)
+        return MultiplexedCommandResult(result=self.result, exception=exception,
+                                        duration=perf_counter() - self.started)
+
+
+class MultiplexedExecutor:
+    """Run a command on many endpoints from a single thread.
+
+    All sessions are non-blocking, so instead of a thread (or two) per endpoint, one `selectors' loop waits for
+    any socket to become ready and advances the command on it.  Output is split into lines and passed to
+    `on_output' callback and to watchers as soon as it arrives.
+
+    Only connection establishment is blocking in libssh2, so endpoints which are not connected yet are connected
+    by a small bounded thread pool before the loop starts.  Connected clients are kept by the caller and reused.
+
+    Usage::
+
+        executor = MultiplexedExecutor()
+        results = executor.run("uptime", clients={node: Client(host=node.ip_address, user="scyllaadm") ...})
+        for node, res in results.items():
+            print(node, res.ok, res.result.stdout)
+    """
+
+    connect_concurrency: int = 16
+    poll_interval: float = 1.0
+
+    def __init__(self, connect_concurrency: int = None, poll_interval: float = None):
+        if connect_concurrency is not None:
+            self.connect_concurrency = connect_concurrency
+        if poll_interval is not None:
+            self.poll_interval = poll_interval
+
+    def _connect(self, clients: Mapping[Hashable, Client]) -> Dict[Hashable, Exception]:
+        to_connect = {key: client for key, client in clients.items() if client.session is None}
+        if not to_connect:
+            return {}
+        errors = {}
+        with ThreadPoolExecutor(max_workers=min(self.connect_concurrency, len(to_connect)),
+                                thread_name_prefix=self.__class__.__name__) as pool:
+            futures = {key: pool.submit(client.connect) for key, client in to_connect.items()}
+            for key, future in futures.items():
+                if (exc := future.exception()) is not None:
+                    errors[key] = exc
+        return errors
+
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+    def run(self, command: str, clients: Mapping[Hashable, Client], timeout: Optional[float] = None,
+            ignore_status: bool = False, encoding: str = 'utf-8', on_output: Optional[OutputCallback] = None,
+            watchers: Optional[List[StreamWatcher]] = None) -> Dict[Hashable, MultiplexedCommandResult]:
+        """Run `command' on all clients and wait till it completes everywhere.
+
+        Never raises for a particular endpoint, check `ok' and `exception' of the result instead.
+        Returns results in the same order as `clients'.
+        """
+        watchers = watchers or []
+        results: Dict[Hashable, Optional[MultiplexedCommandResult]] = dict.fromkeys(clients)
+
+        for key, exc in self._connect(clients).items():
+            result = Result(command=command, encoding=encoding, stdout='', stderr='')
+            results[key] = MultiplexedCommandResult(result=result, exception=FailedToRunCommand(result, exc))
+        tasks = [_CommandTask(key=key, client=client, command=command, encoding=encoding, timeout=timeout,
+                              on_output=on_output, watchers=watchers)
+                 for key, client in clients.items() if results[key] is None]
+
+        def finish(task: _CommandTask, exception: Optional[Exception] = None) -> None:
+            if task.events:
+                selector.unregister(task.fileno)
+                task.events = 0
+            results[task.key] = task.complete(warn=ignore_status, exception=exception)
+            if exception is not None:
+                # The session can be in any state after a failure, so make the caller reconnect next time.
+                task.client.disconnect()
+            waiting.pop(task.key, None)
+
+        waiting: Dict[Hashable, _CommandTask] = {}
+        with selectors.DefaultSelector() as selector:
+            ready = tasks
+            while ready or waiting:
+                for task in ready:
+                    try:
+                        if task.step():
+                            finish(task)
+                            continue
+                        events = task.wait_events
+                        if not task.events:
+                            selector.register(task.fileno, events, task)
+                        elif task.events != events:
+                            selector.modify(task.fileno, events, task)
+                        task.events = events
+                        waiting[task.key] = task
+                    except Exception as exc:  # pylint: disable=broad-except
+                        finish(task, FailedToReadCommandOutput(task.result, exc))
+
+                now = perf_counter()
+                for task in [task for task in waiting.values() if task.deadline <= now]:
+                    finish(task, CommandTimedOut(task.result, task.timeout))
+                if not waiting:
+                    break
+
+                select_timeout = max(0.0, min(min(task.deadline for task in waiting.values()) - now,
+                                              self.poll_interval))
+                selected = selector.select(timeout=select_timeout)
+                # libssh2 may buffer data it has already read from the socket, so poll everything once in a while.
+                ready = [key.data for key, _ in selected] if selected else list(waiting.values())
+        return results
+
+    def shutdown(self, clients: Mapping[Any, Client]) -> None:
+        for client in clients.values():
+            try:
+                client.disconnect()
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.debug("Failed to disconnect from %s: %s", client.host, exc)
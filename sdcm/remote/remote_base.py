@@ -27,6 +27,7 @@ from invoke.runners import Result
 from sdcm.utils.decorators import retrying
 
 from .base import RetryableNetworkException, CommandRunner
+from .libssh2_client import Client as LibSSH2Client, Timings
 from .local_cmd_runner import LocalCmdRunner
 
 
@@ -118,6 +119,24 @@ class RemoteCmdRunnerBase(CommandRunner):  # pylint: disable=too-many-instance-a
     def _create_connection(self):
         pass
 
+    @property
+    def libssh2_client_supported(self) -> bool:
+        """Whether a client created by `create_libssh2_client()' can reach the endpoint.
+
+        libssh2 client doesn't use `extra_ssh_options' (e.g., a jump host), only TTY allocation ones can be ignored.
+        """
+        return set(self.extra_ssh_options.split()) <= {"-t", "-tt"}
+
+    def create_libssh2_client(self) -> LibSSH2Client:
+        """Create a libssh2 client for the same endpoint, regardless of SSH transport used by the remoter."""
+        return LibSSH2Client(
+            host=self.hostname,
+            user=self.user,
+            port=self.port,
+            pkey=os.path.expanduser(self.key_file),
+            timings=Timings(keepalive_timeout=0, connect_timeout=self.connect_timeout)
+        )
+
     def _bind_generation_to_connection(self, connection: object):
         setattr(connection, '_context_generation', self._context_generation)
 
@@ -12,10 +12,16 @@
 # Copyright (c) 2020 ScyllaDB
 
 import os
+import base64
+import difflib
+import hashlib
 import logging
 import tempfile
 import contextlib
 from io import StringIO
+from uuid import uuid4
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
 
 import yaml
 
@@ -86,3 +92,123 @@ def yaml_file_to_dict(fobj):
 
 def dict_to_yaml_file(data):
     return yaml.safe_dump(data) if data else ""
+
+
+class RemoteFilesTransactionError(Exception):
+    pass
+
+
+@dataclass
+class RemoteFileState:
+    path: str
+    checksum: Optional[str]  # None if the file doesn't exist
+    content: str = ""
+    new_content: Optional[str] = None
+
+    @property
+    def changed(self) -> bool:
+        return self.new_content is not None and (self.checksum is None or self.new_content != self.content)
+
+
+def sha256(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def checksum_cmd(path: str) -> str:
+    return f'$(sha256sum < "{path}" | cut -d" " -f1)'
+
+
+class RemoteFilesTransaction:
+    """Edit several remote files in memory and write all changes at once.
+
+    Files are read by one remote command (see `fetch()') and all changed files are written by another one
+    (see `commit()'): new content is uploaded to temporary files next to the original ones, checksums of
+    uploaded files and of original files (to detect concurrent changes) are verified, ownership and permissions
+    are copied from the original files, and only then all files are replaced by `mv'.
+
+    Paths are expected to have no spaces and quotes.
+    """
+
+    def __init__(self, remoter, sudo: bool = True):
+        self.remoter = remoter
+        self.sudo = sudo
+        self.files: Dict[str, RemoteFileState] = {}
+        self.transaction_id = uuid4().hex[:8]
+
+    def __enter__(self) -> "RemoteFilesTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+
+    def _run_script(self, script: str):
+        cmd = f"bash -ec '{script}'"
+        if self.sudo:
+            return self.remoter.sudo(cmd, verbose=False)
+        return self.remoter.run(cmd, verbose=False)
+
+    def fetch(self, *paths: str) -> None:
+        """Read content and checksums of all `paths' (which were not read yet) by one remote command."""
+        if not (paths := [path for path in dict.fromkeys(paths) if path not in self.files]):
+            return
+        quoted_paths = " ".join(f'"{path}"' for path in paths)
+        result = self._run_script(
+            f'for f in {quoted_paths}; do '
+            f'if [ -f "$f" ]; then echo "$f {checksum_cmd("$f")} $(base64 -w0 < "$f")"; else echo "$f - -"; fi; '
+            f'done')
+        for line in result.stdout.splitlines():
+            path, checksum, data = (line.split(" ", 2) + [""])[:3]
+            if path not in paths:
+                continue
+            if checksum == "-":
+                self.files[path] = RemoteFileState(path=path, checksum=None)
+            else:
+                self.files[path] = RemoteFileState(path=path, checksum=checksum,
+                                                   content=base64.b64decode(data).decode("utf-8"))
+        if missed := [path for path in paths if path not in self.files]:
+            raise RemoteFilesTransactionError(f"Failed to read {missed} from {self.remoter.hostname}")
+
+    @contextlib.contextmanager
+    def edit(self, path: str, serializer: Callable = StringIO.getvalue, deserializer: Callable = read_to_stringio,
+             create: bool = False):
+        """Yield deserialized content of the file, serialized data is written to the file on commit."""
+        self.fetch(path)
+        state = self.files[path]
+        if state.checksum is None and not create:
+            raise RemoteFilesTransactionError(f"`{path}' doesn't exist on {self.remoter.hostname}")
+        content = state.content if state.new_content is None else state.new_content
+        data = deserializer(StringIO(content))
+        unchanged = serializer(deserializer(StringIO(content)))
+
+        yield data
+
+        if (new_content := serializer(data)) != unchanged:
+            state.new_content = new_content
+
+    def commit(self) -> None:
+        if not (changed := [state for state in self.files.values() if state.changed]):
+            LOGGER.debug("%s: no changes in %s", self.remoter.hostname, list(self.files))
+            return
+        tmp_files = {state.path: f"{state.path}.sct-{self.transaction_id}" for state in changed}
+        script = [f"trap \"rm -f {' '.join(tmp_files.values())}\" EXIT"]
+        for state in changed:
+            path, tmp_file = state.path, tmp_files[state.path]
+            LOGGER.debug("%s: update `%s':\n%s", self.remoter.hostname, path, "".join(difflib.unified_diff(
+                state.content.splitlines(keepends=True), state.new_content.splitlines(keepends=True),
+                fromfile=f"{path} (old)", tofile=f"{path} (new)")))
+            script.append(f'echo {base64.b64encode(state.new_content.encode("utf-8")).decode()} '
+                          f'| base64 -d > "{tmp_file}"')
+            script.append(f'[ "{checksum_cmd(tmp_file)}" = {sha256(state.new_content)} ] '
+                          f'|| {{ echo "Checksum mismatch of uploaded {path}" >&2; exit 3; }}')
+            if state.checksum is None:
+                script.append(f'[ ! -e "{path}" ] || {{ echo "{path} has been created concurrently" >&2; exit 4; }}')
+            else:
+                script.append(f'[ "{checksum_cmd(path)}" = {state.checksum} ] '
+                              f'|| {{ echo "{path} has been changed concurrently" >&2; exit 4; }}')
+                script.append(f'chown --reference="{path}" "{tmp_file}"')
+                script.append(f'chmod --reference="{path}" "{tmp_file}"')
+        script.extend(f'mv -f "{tmp_file}" "{path}"' for path, tmp_file in tmp_files.items())
+        self._run_script("\n".join(script))
+        for state in changed:
+            state.content, state.checksum, state.new_content = state.new_content, sha256(state.new_content), None
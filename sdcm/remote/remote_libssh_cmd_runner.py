@@ -11,11 +11,10 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
-import os
 import time
 import socket
 
-from .libssh2_client import Client as LibSSH2Client, Timings
+from .libssh2_client import Client as LibSSH2Client
 from .libssh2_client.exceptions import AuthenticationException, UnknownHostException, ConnectError, \
     FailedToReadCommandOutput, CommandTimedOut, FailedToRunCommand, OpenChannelTimeout, SocketRecvError, \
     UnexpectedExit, Failure
@@ -40,13 +39,7 @@ class RemoteLibSSH2CmdRunner(RemoteCmdRunnerBase, ssh_transport='libssh2'):  # p
     )
 
     def _create_connection(self) -> LibSSH2Client:
-        return LibSSH2Client(
-            host=self.hostname,
-            user=self.user,
-            port=self.port,
-            pkey=os.path.expanduser(self.key_file),
-            timings=Timings(keepalive_timeout=0, connect_timeout=self.connect_timeout)
-        )
+        return self.create_libssh2_client()
 
     def is_up(self, timeout: float = 30) -> bool:
         end_time = time.perf_counter() + timeout
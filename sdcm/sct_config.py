@@ -18,10 +18,13 @@ Handling Scylla-cluster-test configuration loading
 # pylint: disable=too-many-lines
 import os
 import ast
+import copy
+import hashlib
 import logging
 import getpass
 import pathlib
-from typing import List, Union, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Union, Set, Tuple
 
 from distutils.util import strtobool
 
@@ -31,6 +34,7 @@ from sdcm import sct_abs_path
 from sdcm.provision.azure.utils import get_scylla_images
 from sdcm.utils import alternator
 from sdcm.utils.aws_utils import get_arch_from_instance_type
+from sdcm.utils.lookup_cache import LookupCache
 from sdcm.utils.common import (
     MAX_SPOT_DURATION_TIME,
     ami_built_by_scylla,
@@ -50,6 +54,23 @@ from sdcm.utils.version_utils import (
 from sdcm.sct_events.base import add_severity_limit_rules, print_critical_events
 
 
+IMAGE_LOOKUP_CACHE = LookupCache(name="image-lookups", ttl=3600)
+
+_PARSED_CONFIG_FILES: Dict[Tuple[str, str], dict] = {}
+
+
+def load_config_files(paths: List[str]) -> dict:
+    """Same as `anyconfig.load(paths)', but each file is parsed only once per its content."""
+    config = {}
+    for path in paths:
+        with open(path, "rb") as config_file:
+            key = (path, hashlib.sha256(config_file.read()).hexdigest())
+        if (parsed := _PARSED_CONFIG_FILES.get(key)) is None:
+            parsed = _PARSED_CONFIG_FILES[key] = anyconfig.load(path)
+        anyconfig.merge(config, copy.deepcopy(parsed))
+    return config
+
+
 def str_or_list(value: Union[str, List[str], List[List[str]]]) -> List[str]:  # pylint: disable=unsubscriptable-object
     """Convert an environment variable into a Python's list."""
 
@@ -814,6 +835,9 @@ class SCTConfiguration(dict):
              help=""),
         dict(name="k8s_minio_storage_size", env="SCT_K8S_MINIO_STORAGE_SIZE", type=str,
              help=""),
+        dict(name="k8s_use_informer_cache", env="SCT_K8S_USE_INFORMER_CACHE", type=boolean,
+             help="""Keep pods, services and nodes state in a local cache updated by K8S watch streams
+                     instead of calling K8S API on each access"""),
 
         # docker config options
         dict(name="mgmt_docker_image", env="SCT_MGMT_DOCKER_IMAGE", type=str,
@@ -822,6 +846,11 @@ class SCTConfiguration(dict):
         dict(name="docker_image", env="SCT_DOCKER_IMAGE", type=str,
              help="Scylla docker image repo, i.e. 'scylladb/scylla', if omitted is calculated from scylla_version"),
 
+        dict(name="use_docker_node_snapshots", env="SCT_USE_DOCKER_NODE_SNAPSHOTS", type=boolean,
+             help="""Docker backend: commit the first configured DB node to a local image and create DB nodes of
+                     next clusters with the same image, Scylla args and scylla.yaml from it (only node-specific
+                     configuration is patched)"""),
+
         # baremetal config options
 
         dict(name="db_nodes_private_ip", env="SCT_DB_NODES_PRIVATE_IP", type=str_or_list,
@@ -1203,8 +1232,34 @@ class SCTConfiguration(dict):
              type=boolean,
              help="""retrieving data from multiple streams in one poll"""),
 
+        dict(name="coredump_streaming_upload", env="SCT_COREDUMP_STREAMING_UPLOAD",
+             type=boolean,
+             help="""Compress coredumps on the fly and upload them in parts, without writing a compressed copy
+                     to the node's disk. Interrupted uploads are resumed from the last uploaded part"""),
+
+        dict(name="loader_events_coalescing_interval", env="SCT_LOADER_EVENTS_COALESCING_INTERVAL",
+             type=float,
+             help="""Interval in seconds to aggregate identical events from loader logs
+                     (cassandra-stress, scylla-bench, gemini) into one event with a count.
+                     First occurrence is always published immediately. Set to 0 to publish every line"""),
+
+        dict(name="collect_hdr_latency", env="SCT_COLLECT_HDR_LATENCY",
+             type=boolean,
+             help="""Write HdrHistogram latency logs by cassandra-stress and scylla-bench, collect them from loaders
+                     and use exact cluster-wide latency percentiles in performance results"""),
+
         dict(name="use_legacy_cluster_init", env="SCT_USE_LEGACY_CLUSTER_INIT", type=bool,
              help="""Use legacy cluster initialization with autobootsrap disabled and parallel node setup"""),
+        dict(name="use_package_mirror", env="SCT_USE_PACKAGE_MIRROR", type=boolean,
+             help="""Download Scylla packages once per cluster on the first DB node and install them on other nodes
+                     from it (served over HTTP on port 8089) instead of downloading them from repos on each node"""),
+        dict(name="cluster_init_parallelism", env="SCT_CLUSTER_INIT_PARALLELISM", type=int,
+             help="""Max number of DB nodes prepared (Scylla installed and configured) in parallel during cluster
+                     init.  Nodes are still started one by one.  0 means all nodes at once"""),
+        dict(name="use_ring_state_watcher", env="SCT_USE_RING_STATE_WATCHER", type=boolean,
+             help="""Wait for DB nodes to be UN using a long-lived CQL session which listens to driver topology
+                     and status change pushes and reads `system.cluster_status', instead of polling
+                     `nodetool status'"""),
         dict(name="availability_zone", env="SCT_AVAILABILITY_ZONE",
              type=str,
              help="Availability zone to use. Same for multi-region scenario."),
@@ -1412,11 +1467,11 @@ class SCTConfiguration(dict):
             backend_config_files += self.defaults_config_files[str(backend)]
 
         # 1) load the default backend config files
-        files = anyconfig.load(list(backend_config_files))
+        files = load_config_files(backend_config_files)
         anyconfig.merge(self, files)
 
         # 2) load the config files
-        files = anyconfig.load(list(config_files))
+        files = load_config_files(config_files)
         anyconfig.merge(self, files)
 
         regions_data = self.get('regions_data') or {}
@@ -1476,40 +1531,22 @@ class SCTConfiguration(dict):
                 aws_arch = get_arch_from_instance_type(self.get('instance_type_db'))
                 # ami.name format examples: ScyllaDB 4.4.0 or ScyllaDB Enterprise 2019.1.1
                 scylla_version_substr = f" {scylla_version}"
-                ami_list = []
-                for region in region_names:
-                    if ':' in scylla_version:
-                        ami = get_branched_ami(scylla_version=scylla_version, region_name=region, arch=aws_arch)[0]
-                    else:
-                        for ami in get_scylla_ami_versions(region_name=region, arch=aws_arch):
-                            if scylla_version_substr in ami.name:
-                                break
-                        else:
-                            raise ValueError(f"AMIs for {scylla_version=} not found in {region}")
-                    self.log.debug("Found AMI %s for scylla_version='%s' in %s", ami.image_id, scylla_version, region)
-                    ami_list.append(ami)
-                self['ami_id_db_scylla'] = " ".join(ami.image_id for ami in ami_list)
+                self['ami_id_db_scylla'] = " ".join(self._find_amis(
+                    version_param="scylla_version", version=scylla_version, region_names=region_names, arch=aws_arch,
+                    name_matches=lambda name: scylla_version_substr in name))
             elif not self.get("gce_image_db") and self.get("cluster_backend") == "gce":
-                if ":" in scylla_version:
-                    gce_image = get_branched_gce_images(scylla_version=scylla_version)[0]
-                else:
-                    # gce_image.name format examples: scylla-4-3-6 or scylla-enterprise-2021-1-2
-                    scylla_version_substr = f"scylla-{scylla_version.replace('.', '-')}"
-                    for gce_image in get_scylla_gce_images_versions():
-                        if gce_image.name.replace("-enterprise", "").startswith(scylla_version_substr):
-                            break
-                    else:
-                        raise ValueError(f"GCE images for {scylla_version=} not found")
-                self.log.debug("Found GCE image %s for scylla_version='%s'", gce_image.name, scylla_version)
-                self["gce_image_db"] = gce_image.extra["selfLink"]
+                self["gce_image_db"] = self._lookup_image(
+                    f"gce/{scylla_version}", lambda: self._find_gce_image(scylla_version), scylla_version)
             elif not self.get("azure_image_db") and self.get("cluster_backend") == "azure":
-                scylla_azure_images = []
-                for region in self.get('azure_region_name'):
+                def find_azure_image(region):
                     azure_image = get_scylla_images(scylla_version, region)[0]
                     self.log.debug("Found AMI %s for scylla_version='%s' in %s",
                                    azure_image.name, scylla_version, region)
-                    scylla_azure_images.append(azure_image)
-                self["azure_image_db"] = " ".join(image.id for image in scylla_azure_images)
+                    return azure_image.id
+                self["azure_image_db"] = " ".join(self._map_regions(
+                    lambda region: self._lookup_image(
+                        f"azure/{scylla_version}/{region}", lambda: find_azure_image(region), scylla_version),
+                    self.get('azure_region_name')))
             elif not self.get('scylla_repo'):
                 self['scylla_repo'] = find_scylla_repo(scylla_version, dist_type, dist_version)
             else:
@@ -1538,21 +1575,9 @@ class SCTConfiguration(dict):
             suffix = f" {oracle_scylla_version}"  # ami.name format example: ScyllaDB 4.4.0
             if not self.get('ami_id_db_oracle') and self.get('cluster_backend') == 'aws':
                 aws_arch = get_arch_from_instance_type(self.get('instance_type_db'))
-                ami_list = []
-                for region in region_names:
-                    if ':' in oracle_scylla_version:
-                        ami = get_branched_ami(
-                            scylla_version=oracle_scylla_version, region_name=region, arch=aws_arch)[0]
-                    else:
-                        for ami in get_scylla_ami_versions(region_name=region, arch=aws_arch):
-                            if ami.name.endswith(suffix):
-                                break
-                        else:
-                            raise ValueError(f"AMIs for {oracle_scylla_version=} not found in {region}")
-                    self.log.debug("Found AMI %s for oracle_scylla_version='%s' in %s",
-                                   ami.image_id, oracle_scylla_version, region)
-                    ami_list.append(ami)
-                self["ami_id_db_oracle"] = " ".join(ami.image_id for ami in ami_list)
+                self["ami_id_db_oracle"] = " ".join(self._find_amis(
+                    version_param="oracle_scylla_version", version=oracle_scylla_version, region_names=region_names,
+                    arch=aws_arch, name_matches=lambda name: name.endswith(suffix)))
             else:
                 raise ValueError("'oracle_scylla_version' and 'ami_id_db_oracle' can't used together")
 
@@ -1604,6 +1629,54 @@ class SCTConfiguration(dict):
     def log_config(self):
         self.log.info(self.dump_config())
 
+    @staticmethod
+    def _map_regions(func: Callable[[str], str], region_names: List[str]) -> List[str]:
+        """Call `func' for all regions concurrently, results are in the same order as `region_names'."""
+        if len(region_names) < 2:
+            return [func(region) for region in region_names]
+        with ThreadPoolExecutor(max_workers=len(region_names), thread_name_prefix="sct-config") as pool:
+            return list(pool.map(func, region_names))
+
+    @staticmethod
+    def _lookup_image(key: str, func: Callable[[], str], version: str) -> str:
+        """Use lookup cache for images of release versions and specific builds, but not for `:latest' and `:all'."""
+        if version.endswith((":latest", ":all")):
+            return func()
+        return IMAGE_LOOKUP_CACHE.get_or_set(key, func)
+
+    def _find_amis(self, version_param: str, version: str, region_names: List[str], arch: str,  # pylint: disable=too-many-arguments
+                   name_matches: Callable[[str], bool]) -> List[str]:
+        def find_ami(region: str) -> str:
+            if ':' in version:
+                ami = get_branched_ami(scylla_version=version, region_name=region, arch=arch)[0]
+            else:
+                for ami in get_scylla_ami_versions(region_name=region, arch=arch):
+                    if name_matches(ami.name):
+                        break
+                else:
+                    raise ValueError(f"AMIs for {version_param}={version!r} not found in {region}")
+            self.log.debug("Found AMI %s for %s='%s' in %s", ami.image_id, version_param, version, region)
+            return ami.image_id
+
+        return self._map_regions(
+            lambda region: self._lookup_image(
+                f"ami/{version_param}/{version}/{region}/{arch}", lambda: find_ami(region), version),
+            region_names)
+
+    def _find_gce_image(self, scylla_version: str) -> str:
+        if ":" in scylla_version:
+            gce_image = get_branched_gce_images(scylla_version=scylla_version)[0]
+        else:
+            # gce_image.name format examples: scylla-4-3-6 or scylla-enterprise-2021-1-2
+            scylla_version_substr = f"scylla-{scylla_version.replace('.', '-')}"
+            for gce_image in get_scylla_gce_images_versions():
+                if gce_image.name.replace("-enterprise", "").startswith(scylla_version_substr):
+                    break
+            else:
+                raise ValueError(f"GCE images for {scylla_version=} not found")
+        self.log.debug("Found GCE image %s for scylla_version='%s'", gce_image.name, scylla_version)
+        return gce_image.extra["selfLink"]
+
     @property
     def region_names(self) -> List[str]:
         region_names = self.environment.get('region_name')
@@ -1633,7 +1706,7 @@ class SCTConfiguration(dict):
         if backend and include_backend:
             default_config_files += self.defaults_config_files[str(backend)]
 
-        return anyconfig.load(list(default_config_files)).get(key, None)
+        return load_config_files(default_config_files).get(key, None)
 
     def _load_environment_variables(self):
         environment_vars = {}
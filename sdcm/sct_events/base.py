@@ -354,6 +354,9 @@ class LogEventProtocol(SctEventProtocol, Protocol[T_log_event]):
     line_number: int
     backtrace: Optional[str]
     raw_backtrace: Optional[str]
+    coalesced_count: int
+    first_timestamp: Optional[float]
+    last_timestamp: Optional[float]
 
     def add_info(self: T_log_event, node, line: str, line_number: int) -> T_log_event:
         ...
@@ -363,6 +366,11 @@ class LogEventProtocol(SctEventProtocol, Protocol[T_log_event]):
 
 
 class LogEvent(Generic[T_log_event], InformationalEvent, abstract=True):
+    # Set by LogEventsCoalescer for an event which represents a few identical log lines.
+    coalesced_count: int = 1
+    first_timestamp: Optional[float] = None
+    last_timestamp: Optional[float] = None
+
     def __init__(self, regex: str, severity=Severity.ERROR):
         super().__init__(severity=severity)
 
@@ -414,6 +422,21 @@ class LogEvent(Generic[T_log_event], InformationalEvent, abstract=True):
     def clone(self: T_log_event) -> T_log_event:
         return pickle.loads(pickle.dumps(self))
 
+    @property
+    def formatted_first_timestamp(self) -> str:
+        return self._formatted_timestamp(self.first_timestamp)
+
+    @property
+    def formatted_last_timestamp(self) -> str:
+        return self._formatted_timestamp(self.last_timestamp)
+
+    @property
+    def coalesced_msgfmt(self) -> str:
+        if self.coalesced_count > 1:
+            return " coalesced_count={0.coalesced_count}" \
+                   " first_timestamp={0.formatted_first_timestamp} last_timestamp={0.formatted_last_timestamp}"
+        return ""
+
     @property
     def msgfmt(self):
         fmt = super().msgfmt + ":"
@@ -425,6 +448,7 @@ class LogEvent(Generic[T_log_event], InformationalEvent, abstract=True):
             fmt += " line_number={0.line_number}"
         if self.node is not None:
             fmt += " node={0.node}"
+        fmt += self.coalesced_msgfmt
         if self.line is not None:
             fmt += "\n{0.line}"
         if self.backtrace:
@@ -0,0 +1,174 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""Deduplicated digest of events: similar events are counted instead of being listed one by one.
+
+Events are similar if they have same type, severity, node and message after numbers, IDs, addresses, etc. are masked.
+"""
+
+import os
+import re
+import copy
+import json
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from sdcm.sct_events import Severity
+
+LOGGER = logging.getLogger(__name__)
+
+DIGEST_VERSION = 1
+MAX_DIGEST_GROUPS = 5000
+MAX_EXEMPLAR_LENGTH = 2000  # characters; exemplars like backtraces are cut to keep the digest small
+OVERFLOW_FINGERPRINT = "*"
+
+MESSAGE_MASKS = (
+    (re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.IGNORECASE), "<uuid>"),
+    (re.compile(r"\b0x[0-9a-f]+\b", re.IGNORECASE), "<hex>"),
+    (re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"), "<ip>"),
+    (re.compile(r"\b[0-9a-f]{16,}\b", re.IGNORECASE), "<hex>"),
+    (re.compile(r"\d+(?:\.\d+)?"), "<n>"),
+)
+
+
+def normalize_message(message: str) -> str:
+    for regex, mask in MESSAGE_MASKS:
+        message = regex.sub(mask, message)
+    return message
+
+
+def message_fingerprint(message: str) -> str:
+    return hashlib.sha1(normalize_message(message).encode("utf-8", errors="replace")).hexdigest()[:16]
+
+
+def cut_exemplar(exemplar: str) -> str:
+    if len(exemplar) <= MAX_EXEMPLAR_LENGTH:
+        return exemplar
+    return f"{exemplar[:MAX_EXEMPLAR_LENGTH]}... [{len(exemplar) - MAX_EXEMPLAR_LENGTH} more characters]"
+
+
+def format_timestamp(timestamp: Optional[float]) -> str:
+    if timestamp is None:
+        return "<UnknownTimestamp>"
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+@dataclass
+class DigestEntry:  # pylint: disable=too-many-instance-attributes
+    event_type: str
+    severity: str
+    node: Optional[str]
+    fingerprint: str
+    exemplar: str
+    last_exemplar: Optional[str] = None
+    count: int = 0
+    first_timestamp: Optional[float] = None
+    last_timestamp: Optional[float] = None
+
+    def __str__(self) -> str:
+        if self.count == 1:
+            return self.exemplar
+        text = self.exemplar
+        if self.last_exemplar and self.last_exemplar != self.exemplar:
+            text += f"\n...\n{self.last_exemplar}"
+        similar = "other events" if self.fingerprint == OVERFLOW_FINGERPRINT else "similar events"
+        return f"{text}\n[{self.count} {similar} on {self.node or 'no node'}: " \
+               f"first at {format_timestamp(self.first_timestamp)}, last at {format_timestamp(self.last_timestamp)}]"
+
+
+class EventsDigest:
+    """Counters, first/last timestamps and exemplars of events grouped by (type, severity, node, fingerprint.)
+
+    Number of groups is limited by `max_groups': when it's reached, new messages are folded into one group
+    per (type, severity, node.)
+    """
+
+    def __init__(self, max_groups: int = MAX_DIGEST_GROUPS):
+        self.max_groups = max_groups
+        self.entries: Dict[str, DigestEntry] = {}
+
+    def add(self,  # pylint: disable=too-many-arguments
+            event_type: str, severity: str, node: Optional[str], message: str, exemplar: Optional[str] = None,
+            timestamp: Optional[float] = None) -> bool:
+        """Count an event and return True if it started a new group."""
+        fingerprint = message_fingerprint(message)
+        key = "|".join((event_type, severity, str(node), fingerprint))
+        is_new = key not in self.entries
+        if is_new and len(self.entries) >= self.max_groups:
+            fingerprint = OVERFLOW_FINGERPRINT
+            key = "|".join((event_type, severity, str(node), fingerprint))
+            is_new = key not in self.entries
+        if is_new:
+            entry = self.entries[key] = DigestEntry(event_type=event_type, severity=severity, node=node,
+                                                    fingerprint=fingerprint,
+                                                    exemplar=cut_exemplar(exemplar or message),
+                                                    first_timestamp=timestamp)
+        else:
+            entry = self.entries[key]
+            entry.last_exemplar = cut_exemplar(exemplar or message)
+        entry.count += 1
+        if timestamp is not None:
+            entry.last_timestamp = timestamp
+        return is_new
+
+    def get_events_by_category(self, limit: Optional[int] = None) -> Dict[str, List[str]]:
+        """Same format as `EventsFileLogger.get_events_by_category()' but one item for each group of similar events.
+
+        First `limit' groups are returned for CRITICAL severity and last `limit' groups for other severities.
+        """
+        output = {}
+        for severity in (Severity.CRITICAL, Severity.ERROR, Severity.WARNING, Severity.NORMAL, Severity.DEBUG, ):
+            if severity is Severity.CRITICAL:
+                entries = sorted((entry for entry in self.entries.values() if entry.severity == severity.name),
+                                 key=lambda entry: entry.first_timestamp or 0)[:limit]
+            else:
+                entries = sorted((entry for entry in self.entries.values() if entry.severity == severity.name),
+                                 key=lambda entry: entry.last_timestamp or 0)
+                entries = entries[max(len(entries) - limit, 0):] if limit is not None else entries
+            output[severity.name] = [str(entry) for entry in entries]
+        return output
+
+    def snapshot(self) -> List[DigestEntry]:
+        """Copy of all entries which can be saved by `save_snapshot()' while the digest is being updated."""
+        return [copy.copy(entry) for entry in self.entries.values()]
+
+    @staticmethod
+    def save_snapshot(entries: List[DigestEntry], path: Path) -> None:
+        path = Path(path)
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False,
+                                         encoding="utf-8") as tmp_file:
+            json.dump({"version": DIGEST_VERSION, "entries": [asdict(entry) for entry in entries]},
+                      tmp_file, separators=(",", ":"))
+        os.replace(tmp_file.name, path)
+
+    def save(self, path: Path) -> None:
+        self.save_snapshot(self.snapshot(), path)
+
+    @classmethod
+    def load(cls, path: Path) -> "EventsDigest":
+        digest = cls()
+        with Path(path).open(encoding="utf-8") as digest_file:
+            snapshot = json.load(digest_file)
+        if snapshot.get("version") == DIGEST_VERSION:
+            for entry in snapshot["entries"]:
+                entry = DigestEntry(**entry)
+                digest.entries["|".join((entry.event_type, entry.severity, str(entry.node), entry.fingerprint))] = entry
+        return digest
+
+
+__all__ = ("EventsDigest", "DigestEntry", "normalize_message", "message_fingerprint", )
@@ -0,0 +1,251 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""Streaming access to raw_events.log (one JSON event per line) with a sidecar offset index.
+
+The index keeps byte offsets of events by severity, type, node and time bucket and it's updated incrementally:
+only lines appended since the last refresh are parsed, so reports can fetch slices of multi-GB logs cheaply.
+The index file is append-only too: a header line followed by one JSON record per refresh with offsets it added.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from itertools import islice
+from collections import deque
+from typing import Iterable, Iterator, Optional, Union
+
+from sdcm.sct_events import Severity
+
+LOGGER = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 2
+DEFAULT_BUCKET_SIZE = 60  # seconds
+READ_CHUNK_SIZE = 1024 * 1024
+HEAD_SIZE = 4096  # bytes of the log used to detect that the file was replaced
+
+IndexKeys = Union[None, str, Severity, Iterable[Union[str, Severity]]]
+
+
+class RawEventsStore:
+    """Query events from raw_events.log by severity, event type, node and time range without reading it all.
+
+    Event type can be a base (e.g., `DatabaseLogEvent') or a base with type (e.g., `DatabaseLogEvent.BACKTRACE'.)
+    Each filter accepts one value or an iterable of values: values of one filter are ORed, filters are ANDed.
+    """
+
+    FIELDS = ("severity", "type", "node", "bucket", )
+
+    def __init__(self, raw_events_log: Union[str, Path], bucket_size: int = DEFAULT_BUCKET_SIZE,
+                 index_path: Optional[Union[str, Path]] = None):
+        self.raw_events_log = Path(raw_events_log)
+        self.index_path = Path(index_path) if index_path else self.raw_events_log.with_name(
+            self.raw_events_log.name + INDEX_SUFFIX)
+        self.bucket_size = bucket_size
+        self._reset()
+        self._load_index()
+
+    def _reset(self) -> None:
+        self.offset = 0  # end of the last indexed line
+        self.count = 0
+        self.max_timestamp = None
+        self._head = (0, None)  # size and hash of the log head
+        self._index = {field: {} for field in self.FIELDS}
+        self._new_entries = {field: {} for field in self.FIELDS}  # added since the index was saved last time
+        self._rewrite_index = True
+
+    def _apply_index_record(self, record: dict) -> None:
+        self.offset, self.count, self.max_timestamp = record["offset"], record["count"], record["max_timestamp"]
+        self._head = tuple(record["head"])
+        for field, entries in record["index"].items():
+            for key, offsets in entries.items():
+                self._index[field].setdefault(int(key) if field == "bucket" else key, []).extend(offsets)
+
+    def _load_index(self) -> None:
+        try:
+            with self.index_path.open(encoding="utf-8") as index_file:
+                header = json.loads(index_file.readline())
+                if header.get("version") != INDEX_VERSION or header.get("bucket_size") != self.bucket_size:
+                    return
+                self._rewrite_index = False
+                for line in index_file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:  # partially written record, the rest of the log will be indexed again
+                        self._rewrite_index = True
+                        break
+                    self._apply_index_record(record)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._reset()
+
+    def _save_index(self) -> None:
+        """Append a record with entries added since the last save, or write the whole index after a reset."""
+        record = {"offset": self.offset, "count": self.count, "max_timestamp": self.max_timestamp,
+                  "head": self._head, "index": self._index if self._rewrite_index else self._new_entries}
+        try:
+            if self._rewrite_index:
+                header = {"version": INDEX_VERSION, "bucket_size": self.bucket_size}
+                with tempfile.NamedTemporaryFile("w", dir=self.index_path.parent, suffix=".tmp", delete=False,
+                                                 encoding="utf-8") as tmp_file:
+                    tmp_file.write(f"{json.dumps(header)}\n{json.dumps(record)}\n")
+                os.replace(tmp_file.name, self.index_path)
+                self._rewrite_index = False
+            else:
+                with self.index_path.open("a", encoding="utf-8") as index_file:
+                    index_file.write(f"{json.dumps(record)}\n")
+        except OSError as exc:  # e.g., read-only logs directory, just keep the index in memory
+            LOGGER.debug("Failed to save events index to %s: %s", self.index_path, exc)
+            self._rewrite_index = True
+        self._new_entries = {field: {} for field in self.FIELDS}
+
+    def _file_head(self, size: int) -> Optional[str]:
+        with self.raw_events_log.open("rb") as log_file:
+            return hashlib.sha1(log_file.read(size)).hexdigest() if size else None
+
+    def _add(self, offset: int, event: dict) -> None:
+        keys = {"severity": [event.get("severity")], "type": [event.get("base")], "node": [event.get("node")]}
+        if event.get("type"):
+            keys["type"].append(f"{event.get('base')}.{event['type']}")
+        if (timestamp := event.get("event_timestamp")) is not None:
+            keys["bucket"] = [int(timestamp // self.bucket_size)]
+        for field, values in keys.items():
+            for value in values:
+                if value is not None:
+                    self._index[field].setdefault(value, []).append(offset)
+                    self._new_entries[field].setdefault(value, []).append(offset)
+        if event.get("period_type") in ("begin", "end", ):
+            timestamp = event.get("end_timestamp") or timestamp
+        if timestamp and (self.max_timestamp is None or timestamp > self.max_timestamp):
+            self.max_timestamp = timestamp
+        self.count += 1
+
+    def refresh(self) -> int:
+        """Index events appended to the log since the last call and return the number of them.
+
+        Partially written last line is left for the next refresh.  If the log was truncated or replaced,
+        the index is rebuilt from scratch.
+        """
+        try:
+            size = self.raw_events_log.stat().st_size
+            if size < self.offset or self._head[1] != self._file_head(self._head[0]):
+                LOGGER.debug("%s was truncated or replaced, rebuild the index", self.raw_events_log)
+                self._reset()
+            if size == self.offset:
+                return 0
+            added, start_offset = 0, self.offset
+            with self.raw_events_log.open("rb") as log_file:
+                log_file.seek(self.offset)
+                pending = b""
+                while chunk := log_file.read(READ_CHUNK_SIZE):
+                    *lines, pending = (pending + chunk).split(b"\n")
+                    for line in lines:
+                        offset, self.offset = self.offset, self.offset + len(line) + 1
+                        if not line.strip():
+                            continue
+                        try:
+                            self._add(offset=offset, event=json.loads(line))
+                        except ValueError:
+                            LOGGER.warning("%s: skip malformed line at offset %s", self.raw_events_log, offset)
+                            continue
+                        added += 1
+        except OSError as exc:
+            LOGGER.error("Failed to index %s: %s", self.raw_events_log, exc)
+            return 0
+        if self._head[0] < HEAD_SIZE and self._head[0] < self.offset:
+            head_size = min(HEAD_SIZE, self.offset)
+            self._head = (head_size, self._file_head(head_size))
+        if self.offset != start_offset or self._rewrite_index:
+            self._save_index()
+        return added
+
+    @staticmethod
+    def _keys(values: IndexKeys) -> Optional[list[str]]:
+        if values is None:
+            return None
+        if isinstance(values, (str, Severity, )):
+            values = [values]
+        return [value.name if isinstance(value, Severity) else value for value in values]
+
+    def offsets(self,  # pylint: disable=too-many-arguments
+                severity: IndexKeys = None,
+                event_type: IndexKeys = None,
+                node: IndexKeys = None,
+                start: Optional[float] = None,
+                end: Optional[float] = None) -> Optional[list[int]]:
+        """Return sorted offsets of events which match the filters or None if there are no filters at all.
+
+        Time range is matched by buckets here, so some offsets can point to events slightly out of the range.
+        """
+        candidates = None
+        for field, values in (("severity", severity), ("type", event_type), ("node", node), ):
+            if (keys := self._keys(values)) is None:
+                continue
+            offsets = set()
+            for key in keys:
+                offsets.update(self._index[field].get(key, ()))
+            candidates = offsets if candidates is None else candidates & offsets
+        if start is not None or end is not None:
+            first = None if start is None else int(start // self.bucket_size)
+            last = None if end is None else int(end // self.bucket_size)
+            offsets = set()
+            for bucket, bucket_offsets in self._index["bucket"].items():
+                if (first is None or bucket >= first) and (last is None or bucket <= last):
+                    offsets.update(bucket_offsets)
+            candidates = offsets if candidates is None else candidates & offsets
+        return None if candidates is None else sorted(candidates)
+
+    def _read(self, offsets: Optional[list[int]]) -> Iterator[dict]:
+        with self.raw_events_log.open("rb") as log_file:
+            if offsets is None:
+                while log_file.tell() < self.offset and (line := log_file.readline()):
+                    if line.strip():
+                        yield json.loads(line)
+                return
+            for offset in offsets:
+                log_file.seek(offset)
+                yield json.loads(log_file.readline())
+
+    def iter_events(self,  # pylint: disable=too-many-arguments
+                    severity: IndexKeys = None,
+                    event_type: IndexKeys = None,
+                    node: IndexKeys = None,
+                    start: Optional[float] = None,
+                    end: Optional[float] = None,
+                    limit: Optional[int] = None,
+                    last: bool = False,
+                    refresh: bool = True) -> Iterator[dict]:
+        """Yield matched events (as dicts) in the order of the log: first `limit' events or last ones if `last'."""
+        if refresh:
+            self.refresh()
+        offsets = self.offsets(severity=severity, event_type=event_type, node=node, start=start, end=end)
+        time_range = start is not None or end is not None
+        if offsets is not None and limit is not None and not time_range:
+            offsets = offsets[-limit:] if last else offsets[:limit]
+        events = self._read(offsets)
+        if time_range:
+            events = (event for event in events
+                      if (start is None or (event.get("event_timestamp") or 0) >= start)
+                      and (end is None or (event.get("event_timestamp") or 0) <= end))
+        if limit is None:
+            yield from events
+        elif last:
+            yield from deque(events, maxlen=limit)
+        else:
+            yield from islice(events, limit)
+
+
+__all__ = ("RawEventsStore", )
@@ -14,6 +14,7 @@
 import re
 import json
 import logging
+import threading
 import collections
 import multiprocessing
 from typing import Tuple, Optional, Callable, Any, Dict, List, cast
@@ -25,6 +26,7 @@ from collections import deque as tail
 from sdcm.sct_events import Severity
 from sdcm.sct_events.base import SctEvent
 from sdcm.sct_events.system import TestResultEvent
+from sdcm.sct_events.events_digest import EventsDigest
 from sdcm.sct_events.events_device import get_events_main_device
 from sdcm.sct_events.events_processes import \
     EVENTS_FILE_LOGGER_ID, EventsProcessesRegistry, BaseEventsProcess, \
@@ -38,6 +40,9 @@ ERROR_LOG: str = "error.log"
 WARNING_LOG: str = "warning.log"
 NORMAL_LOG: str = "normal.log"
 DEBUG_LOG: str = "debug.log"
+DIGEST_LOG: str = "events_digest.json"
+
+DIGEST_SAVE_INTERVAL = 1  # seconds; the digest is saved also on stop
 
 LINE_START_RE = re.compile(r"^\d{4}-\d{2}-\d{2} ")  # date in YYYY-MM-DD format
 
@@ -72,6 +77,13 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
         self.events_summary = collections.defaultdict(int)
         self.events_summary_log = base_dir / SUMMARY_LOG
 
+        self.events_digest = EventsDigest()
+        self.events_digest_log = base_dir / DIGEST_LOG
+        self._events_digest_lock = threading.Lock()
+        self._events_digest_save_lock = threading.Lock()  # keeps an older snapshot from overwriting a newer one
+        self._events_digest_changed = False
+        self._events_readers = {}
+
         super().__init__(_registry=_registry)
 
     def run(self) -> None:
@@ -80,11 +92,21 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
         for log_file in chain((self.events_log, self.events_summary_log, ), self.events_logs_by_severity.values(), ):
             log_file.touch()
 
+        # The digest is saved periodically, not in the event writing path.
+        threading.Thread(target=self._save_events_digest_periodically, name="EventsDigestSaver", daemon=True).start()
+
         for event_tuple in self.inbound_events():
             with verbose_suppress("EventsFileLogger failed to process %s", event_tuple):
                 _, event = event_tuple  # try to unpack event from EventsDevice
                 self.write_event(event=event)
 
+        self.save_events_digest()
+
+    def _save_events_digest_periodically(self) -> None:
+        while not self.stop_event.wait(DIGEST_SAVE_INTERVAL):
+            if self._events_digest_changed:
+                self.save_events_digest()
+
     def write_event(self, event: SctEvent) -> None:
         if event.source_timestamp:
             message = f"{event.formatted_event_timestamp} <{event.formatted_source_timestamp}>: {str(event).strip()}"
@@ -111,38 +133,104 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
                     with log_file.open("ab+", buffering=0) as fobj:
                         fobj.write(message_bin)
 
+            # Update deduplicated digest of events.
+            with verbose_suppress("%s: failed to update %s", self, self.events_digest_log):
+                node = getattr(event, "node", None)
+                with self._events_digest_lock:
+                    self.events_digest.add(
+                        event_type=f"{event.base}.{event.type}" if event.type else event.base,
+                        severity=Severity(event.severity).name,
+                        node=str(node) if node else None,
+                        message=str(event),
+                        exemplar=message,
+                        timestamp=event.event_timestamp,
+                    )
+                    self._events_digest_changed = True
+
         # Update summary.log file (statistics.)
         self.events_summary[Severity(event.severity).name] += 1
         with verbose_suppress("%s: failed to update %s", self, self.events_summary_log):
             with self.events_summary_log.open("wb", buffering=0) as fobj:
                 fobj.write(json.dumps(dict(self.events_summary), indent=4).encode("utf-8"))
 
+    def save_events_digest(self) -> None:
+        with verbose_suppress("%s: failed to save %s", self, self.events_digest_log), self._events_digest_save_lock:
+            with self._events_digest_lock:
+                self._events_digest_changed = False
+                snapshot = self.events_digest.snapshot()
+            EventsDigest.save_snapshot(snapshot, self.events_digest_log)
+
+    def get_events_digest(self) -> EventsDigest:
+        with verbose_suppress("%s: failed to read %s", self, self.events_digest_log):
+            if self.events_digest_log.exists():
+                return EventsDigest.load(self.events_digest_log)
+        return EventsDigest()
+
     def get_events_by_category(self, limit: Optional[int] = None) -> Dict[str, List[str]]:
         output = {}
         for severity, log_file in self.events_logs_by_severity.items():
             # Get first `limit' events with CRITICAL severity and last `limit' for other severities.
-            events_bucket = (head if severity is Severity.CRITICAL else tail)(maxlen=limit)
-            event = []
+            if (reader := self._events_readers.get((severity, limit))) is None:
+                reader = self._events_readers[(severity, limit)] = \
+                    EventsLogReader(log_file=log_file, from_head=severity is Severity.CRITICAL, limit=limit)
             try:
-                with log_file.open() as fobj:
-                    for line in fobj:
-                        if line := line.strip():
-                            if LINE_START_RE.match(line):
-                                if event:
-                                    events_bucket.append("\n".join(event))
-                                event.clear()
-                            event.append(line)
-                if event:
-                    events_bucket.append("\n".join(event))
+                events = reader.read()
             except Exception as exc:  # pylint: disable=broad-except
                 error_msg = f"{self}: failed to read {log_file}: {exc}"
                 LOGGER.error(error_msg)
-                if not events_bucket:
-                    events_bucket.append(error_msg)
-            output[severity.name] = list(events_bucket)
+                events = reader.events or [error_msg]
+            output[severity.name] = events
         return output
 
 
+class EventsLogReader:
+    """Keep first or last `limit' multiline events of a log file and read only lines appended since the last call."""
+
+    def __init__(self, log_file: Path, from_head: bool = False, limit: Optional[int] = None):
+        self.log_file = log_file
+        self.from_head = from_head
+        self.limit = limit
+        self._reset()
+
+    def _reset(self) -> None:
+        self._offset = 0
+        self._bucket = (head if self.from_head else tail)(maxlen=self.limit)
+        self._event = []  # lines of the last event, it can be continued by next lines
+
+    @property
+    def events(self) -> List[str]:
+        events = list(self._bucket)
+        if self._event and (self.limit is None or not self.from_head or len(events) < self.limit):
+            events.append("\n".join(self._event))
+        if self.limit is not None:
+            events = events[max(len(events) - self.limit, 0):]
+        return events
+
+    def read(self) -> List[str]:
+        if self.from_head and self.limit is not None and len(self._bucket) >= self.limit:
+            return self.events  # got enough events already, nothing to read
+        size = self.log_file.stat().st_size
+        if size < self._offset:  # the file was truncated
+            self._reset()
+        if size > self._offset:
+            with self.log_file.open("rb") as fobj:
+                fobj.seek(self._offset)
+                for line in fobj:
+                    if not line.endswith(b"\n"):  # the last line could be not completely written yet
+                        break
+                    self._offset += len(line)
+                    self._add_line(line.decode("utf-8", errors="replace").strip())
+        return self.events
+
+    def _add_line(self, line: str) -> None:
+        if line:
+            if LINE_START_RE.match(line):
+                if self._event:
+                    self._bucket.append("\n".join(self._event))
+                self._event = []
+            self._event.append(line)
+
+
 start_events_logger = partial(start_events_process, EVENTS_FILE_LOGGER_ID, EventsFileLogger)
 get_events_logger = cast(Callable[..., EventsFileLogger], partial(get_events_process, EVENTS_FILE_LOGGER_ID))
 
@@ -152,6 +240,12 @@ def get_events_grouped_by_category(limit: Optional[int] = None,
     return get_events_logger(_registry=_registry).get_events_by_category(limit=limit)
 
 
+def get_events_digest_grouped_by_category(limit: Optional[int] = None,
+                                          _registry: Optional[EventsProcessesRegistry] = None) -> Dict[str, List[str]]:
+    """Like `get_events_grouped_by_category()' but similar events are listed once, with a counter."""
+    return get_events_logger(_registry=_registry).get_events_digest().get_events_by_category(limit=limit)
+
+
 def get_logger_event_summary(_registry: Optional[EventsProcessesRegistry] = None) -> dict:
     events_summary_log = get_events_logger(_registry=_registry).events_summary_log
     with verbose_suppress("Failed to read %s", events_summary_log):
@@ -160,5 +254,6 @@ def get_logger_event_summary(_registry: Optional[EventsProcessesRegistry] = None
     return {}
 
 
-__all__ = ("EventsFileLogger",
-           "start_events_logger", "get_events_logger", "get_events_grouped_by_category", "get_logger_event_summary", )
+__all__ = ("EventsFileLogger", "EventsLogReader",
+           "start_events_logger", "get_events_logger", "get_events_grouped_by_category",
+           "get_events_digest_grouped_by_category", "get_logger_event_summary", )
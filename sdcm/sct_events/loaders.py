@@ -264,6 +264,7 @@ class GeminiStressLogEvent(LogEvent[T_log_event], abstract=True):  # pylint: dis
         if self.type:
             fmt += " type={0.type}"
         fmt += " line_number={0.line_number} node={0.node}"
+        fmt += self.coalesced_msgfmt
 
         if self.line:
             fmt += "\nline={0.line}"
@@ -0,0 +1,126 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=protected-access
+
+from __future__ import annotations
+
+import re
+import time
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from sdcm.sct_events.base import LogEventProtocol
+
+DEFAULT_COALESCING_INTERVAL = 10.0  # seconds
+
+LOGGER = logging.getLogger(__name__)
+
+# Timestamps, counters, keys, latencies and addresses differ between lines of the same error.
+NORMALIZE_MESSAGE_RE = re.compile(r"\b(?:0x)?[0-9a-fA-F]*\d[0-9a-fA-F]*\b")
+
+
+def normalize_message(line: Optional[str]) -> str:
+    return NORMALIZE_MESSAGE_RE.sub("#", line.strip()) if line else ""
+
+
+class _CoalescedEvents:  # pylint: disable=too-few-public-methods
+    __slots__ = ("event", "count", "first_timestamp", "last_timestamp", )
+
+    def __init__(self):
+        self.event: Optional[LogEventProtocol] = None  # a copy of the first repeated event, published on flush
+        self.count = 0
+        self.first_timestamp: Optional[float] = None
+        self.last_timestamp: Optional[float] = None
+
+
+class LogEventsCoalescer:
+    """Aggregate identical log events within a time window.
+
+    The first occurrence of (node, event type, severity, normalized message) is published immediately, so
+    critical events still stop the test without delay.  Repeats within the window are only counted and published
+    on flush as one event with `coalesced_count' (number of repeats), `first_timestamp' and `last_timestamp'
+    (of the first and the last repeat) attributes set.
+
+    Flush happens every `flush_interval' seconds from a background thread while used as a context manager
+    and on exit from it.  Set `flush_interval' to 0 to publish every event as is.
+    """
+
+    def __init__(self, flush_interval: Optional[float] = DEFAULT_COALESCING_INTERVAL):
+        self.flush_interval = DEFAULT_COALESCING_INTERVAL if flush_interval is None else flush_interval
+        self._pending: Dict[Tuple[str, str, str, str], _CoalescedEvents] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    def __enter__(self):
+        if self.flush_interval > 0:
+            self._stop_event.clear()
+            self._flusher = threading.Thread(target=self._flush_periodically, name=self.__class__.__name__,
+                                             daemon=True)
+            self._flusher.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stop_event.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=self.flush_interval)
+            self._flusher = None
+        self.flush()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Failed to flush coalesced events")
+
+    def publish(self, event: LogEventProtocol) -> None:
+        if not event._ready_to_publish:
+            return
+        if self.flush_interval <= 0:
+            event.publish()
+            return
+
+        key = (event.node, event.__class__.__name__, event.severity.name, normalize_message(event.line))
+        with self._lock:
+            coalesced = self._pending.get(key)
+            if coalesced is None:
+                self._pending[key] = _CoalescedEvents()
+            else:
+                if coalesced.event is None:
+                    coalesced.event = event.clone()  # source events may be reused by publishers, so keep a copy.
+                    coalesced.first_timestamp = event.timestamp
+                else:
+                    coalesced.event.line_number = event.line_number
+                coalesced.count += 1
+                coalesced.last_timestamp = event.timestamp
+                event._ready_to_publish = False
+                return
+        event.publish()
+
+    def flush(self) -> None:
+        """Publish counted repeats and start a new window for all keys."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for coalesced in pending.values():
+            if not coalesced.count:
+                continue
+            event = coalesced.event
+            event.coalesced_count = coalesced.count
+            event.first_timestamp = coalesced.first_timestamp
+            event.last_timestamp = coalesced.last_timestamp
+            event.event_timestamp = time.time()
+            event.ready_to_publish()
+            event.publish()
@@ -23,8 +23,9 @@ from sdcm.loader import ScyllaBenchStressExporter
 from sdcm.prometheus import nemesis_metrics_obj
 from sdcm.sct_events import Severity
 from sdcm.sct_events.loaders import ScyllaBenchEvent, SCYLLA_BENCH_ERROR_EVENTS_PATTERNS
+from sdcm.sct_events.log_events_coalescer import LogEventsCoalescer, DEFAULT_COALESCING_INTERVAL
 from sdcm.utils.common import FileFollowerThread, generate_random_string, convert_metric_to_ms
-from sdcm.stress_thread import format_stress_cmd_error
+from sdcm.stress_thread import collect_hdr_log, format_stress_cmd_error
 from sdcm.wait import wait_for
 
 
@@ -46,30 +47,33 @@ class ScyllaBenchWorkloads(Enum):
 
 
 class ScyllaBenchStressEventsPublisher(FileFollowerThread):
-    def __init__(self, node, sb_log_filename, event_id=None):
+    def __init__(self, node, sb_log_filename, event_id=None, coalescing_interval=DEFAULT_COALESCING_INTERVAL):
         super().__init__()
         self.sb_log_filename = sb_log_filename
         self.node = str(node)
         self.event_id = event_id
+        self.events_coalescer = LogEventsCoalescer(flush_interval=coalescing_interval)
 
     def run(self):
-        while not self.stopped():
-            exists = os.path.isfile(self.sb_log_filename)
-            if not exists:
-                time.sleep(0.5)
-                continue
+        with self.events_coalescer:
+            while not self.stopped():
+                exists = os.path.isfile(self.sb_log_filename)
+                if not exists:
+                    time.sleep(0.5)
+                    continue
 
-            for line_number, line in enumerate(self.follow_file(self.sb_log_filename)):
-                if self.stopped():
-                    break
+                for line_number, line in enumerate(self.follow_file(self.sb_log_filename)):
+                    if self.stopped():
+                        break
 
-                for pattern, event in SCYLLA_BENCH_ERROR_EVENTS_PATTERNS:
-                    if self.event_id:
-                        # Connect the event to the stress load
-                        event.event_id = self.event_id
+                    for pattern, event in SCYLLA_BENCH_ERROR_EVENTS_PATTERNS:
+                        if self.event_id:
+                            # Connect the event to the stress load
+                            event.event_id = self.event_id
 
-                    if pattern.search(line):
-                        event.add_info(node=self.node, line=line, line_number=line_number).publish()
+                        if pattern.search(line):
+                            self.events_coalescer.publish(
+                                event.add_info(node=self.node, line=line, line_number=line_number))
 
 
 class ScyllaBenchThread:  # pylint: disable=too-many-instance-attributes
@@ -122,6 +126,7 @@ class ScyllaBenchThread:  # pylint: disable=too-many-instance-attributes
         self.results_futures = []
         self.shell_marker = generate_random_string(20)
         self.max_workers = 0
+        self.hdr_log_files = []  # local copies of HdrHistogram latency logs of all scylla-bench processes
         # Find stress mode:
         #    "scylla-bench -workload=sequential -mode=write -replication-factor=3 -partition-count=100"
         #    "scylla-bench -workload=uniform -mode=read -replication-factor=3 -partition-count=100"
@@ -174,6 +179,10 @@ class ScyllaBenchThread:  # pylint: disable=too-many-instance-attributes
         os.makedirs(node.logdir, exist_ok=True)
 
         log_file_name = os.path.join(node.logdir, f'scylla-bench-l{loader_idx}-{uuid.uuid4()}.log')
+        remote_hdr_log_file = None
+        if self.loader_set.params.get("collect_hdr_latency") and "-hdr-latency-file" not in stress_cmd:
+            remote_hdr_log_file = f"/tmp/{os.path.basename(log_file_name)[:-4]}.hdr"
+            stress_cmd = f"{stress_cmd.strip()} -hdr-latency-file {remote_hdr_log_file}"
         # Select first seed node to send the scylla-bench cmds
         ips = node_list[0].cql_ip_address
 
@@ -182,7 +191,9 @@ class ScyllaBenchThread:  # pylint: disable=too-many-instance-attributes
                                        stress_operation=self.sb_mode,
                                        stress_log_filename=log_file_name,
                                        loader_idx=loader_idx), \
-                ScyllaBenchStressEventsPublisher(node=node, sb_log_filename=log_file_name) as publisher, \
+                ScyllaBenchStressEventsPublisher(
+                    node=node, sb_log_filename=log_file_name,
+                    coalescing_interval=self.loader_set.params.get("loader_events_coalescing_interval")) as publisher, \
                 ScyllaBenchEvent(node=node, stress_cmd=stress_cmd,
                                  log_file_name=log_file_name) as scylla_bench_event:
             publisher.event_id = scylla_bench_event.event_id
@@ -203,6 +214,11 @@ class ScyllaBenchThread:  # pylint: disable=too-many-instance-attributes
 
                 scylla_bench_event.add_error([errors_str])
 
+        if remote_hdr_log_file:
+            local_hdr_log_file = f"{log_file_name[:-4]}.hdr"
+            if collect_hdr_log(node, remote_hdr_log_file, local_hdr_log_file):
+                self.hdr_log_files.append(local_hdr_log_file)
+
         return node, result
 
     def run(self):
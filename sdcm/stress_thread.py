@@ -25,6 +25,7 @@ from sdcm.loader import CassandraStressExporter
 from sdcm.cluster import BaseLoaderSet
 from sdcm.prometheus import nemesis_metrics_obj
 from sdcm.sct_events import Severity
+from sdcm.sct_events.log_events_coalescer import LogEventsCoalescer, DEFAULT_COALESCING_INTERVAL
 from sdcm.utils.common import FileFollowerThread, generate_random_string, get_profile_content
 from sdcm.sct_events.loaders import CassandraStressEvent, CS_ERROR_EVENTS_PATTERNS, CS_NORMAL_EVENTS_PATTERNS
 
@@ -40,32 +41,45 @@ def format_stress_cmd_error(exc: Exception) -> str:
     return f"Stress command execution failed with: {exc}"
 
 
+def collect_hdr_log(node: Any, remote_hdr_log_file: str, local_hdr_log_file: str) -> bool:
+    """Download HdrHistogram latency log written by a stress tool from a loader."""
+    try:
+        return node.remoter.receive_files(src=remote_hdr_log_file, dst=local_hdr_log_file)
+    except Exception as exc:  # pylint: disable=broad-except
+        LOGGER.warning("Failed to collect HdrHistogram log %s from %s: %s", remote_hdr_log_file, node, exc)
+        return False
+
+
 class CassandraStressEventsPublisher(FileFollowerThread):
-    def __init__(self, node: Any, cs_log_filename: str, event_id: str = None):
+    def __init__(self, node: Any, cs_log_filename: str, event_id: str = None,
+                 coalescing_interval: float = DEFAULT_COALESCING_INTERVAL):
         super().__init__()
 
         self.node = str(node)
         self.cs_log_filename = cs_log_filename
         self.event_id = event_id
+        self.events_coalescer = LogEventsCoalescer(flush_interval=coalescing_interval)
 
     def run(self) -> None:
-        while not self.stopped():
-            if not os.path.isfile(self.cs_log_filename):
-                time.sleep(0.5)
-                continue
+        with self.events_coalescer:
+            while not self.stopped():
+                if not os.path.isfile(self.cs_log_filename):
+                    time.sleep(0.5)
+                    continue
 
-            for line_number, line in enumerate(self.follow_file(self.cs_log_filename)):
-                if self.stopped():
-                    break
+                for line_number, line in enumerate(self.follow_file(self.cs_log_filename)):
+                    if self.stopped():
+                        break
 
-                for pattern, event in chain(CS_NORMAL_EVENTS_PATTERNS, CS_ERROR_EVENTS_PATTERNS):
-                    if self.event_id:
-                        # Connect the event to the stress load
-                        event.event_id = self.event_id
+                    for pattern, event in chain(CS_NORMAL_EVENTS_PATTERNS, CS_ERROR_EVENTS_PATTERNS):
+                        if self.event_id:
+                            # Connect the event to the stress load
+                            event.event_id = self.event_id
 
-                    if pattern.search(line):
-                        event.add_info(node=self.node, line=line, line_number=line_number).publish()
-                        break  # Stop iterating patterns to avoid creating two events for one line of the log
+                        if pattern.search(line):
+                            self.events_coalescer.publish(
+                                event.add_info(node=self.node, line=line, line_number=line_number))
+                            break  # Stop iterating patterns to avoid creating two events for one line of the log
 
 
 class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
@@ -90,6 +104,7 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
         self.shell_marker = generate_random_string(20)
         #  This marker is used to mark shell commands, in order to be able to kill them later
         self.max_workers = 0
+        self.hdr_log_files = []  # local copies of HdrHistogram latency logs of all c-s processes
 
     def create_stress_cmd(self, node, loader_idx, keyspace_idx):
         stress_cmd = self.stress_cmd
@@ -143,6 +158,15 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
             return stress_cmd
         return stress_cmd.replace(current_error_option, 'errors ' + ' '.join(new_error_suboptions))
 
+    @staticmethod
+    def _add_hdr_log_option(stress_cmd: str, hdr_log_file: str) -> tuple[str, str]:
+        """Make c-s write HdrHistogram interval log, return updated command and the remote path of the log."""
+        if match := re.search(r"hdrfile=(\S+)", stress_cmd):
+            return stress_cmd, match.group(1)
+        if " -log " in stress_cmd:
+            return stress_cmd.replace(" -log ", f" -log hdrfile={hdr_log_file} ", 1), hdr_log_file
+        return f"{stress_cmd} -log hdrfile={hdr_log_file}", hdr_log_file
+
     def _get_available_suboptions(self, node, option):
         try:
             result = node.remoter.run(
@@ -171,6 +195,11 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
         log_file_name = \
             os.path.join(node.logdir, f'cassandra-stress-l{loader_idx}-c{cpu_idx}-k{keyspace_idx}-{uuid.uuid4()}.log')
 
+        remote_hdr_log_file = None
+        if self.loader_set.params.get("collect_hdr_latency"):
+            stress_cmd, remote_hdr_log_file = self._add_hdr_log_option(
+                stress_cmd=stress_cmd, hdr_log_file=f"/tmp/{os.path.basename(log_file_name)[:-4]}.hdr")
+
         LOGGER.debug('cassandra-stress local log: %s', log_file_name)
 
         # This tag will be output in the header of c-stress result,
@@ -193,7 +222,9 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
                                      stress_operation=stress_cmd_opt,
                                      stress_log_filename=log_file_name,
                                      loader_idx=loader_idx, cpu_idx=cpu_idx), \
-                CassandraStressEventsPublisher(node=node, cs_log_filename=log_file_name) as publisher, \
+                CassandraStressEventsPublisher(
+                    node=node, cs_log_filename=log_file_name,
+                    coalescing_interval=self.loader_set.params.get("loader_events_coalescing_interval")) as publisher, \
                 CassandraStressEvent(node=node, stress_cmd=self.stress_cmd,
                                      log_file_name=log_file_name) as cs_stress_event:
             publisher.event_id = cs_stress_event.event_id
@@ -203,6 +234,11 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
                 cs_stress_event.severity = Severity.CRITICAL if self.stop_test_on_failure else Severity.ERROR
                 cs_stress_event.add_error(errors=[format_stress_cmd_error(exc)])
 
+        if remote_hdr_log_file:
+            local_hdr_log_file = f"{log_file_name[:-4]}.hdr"
+            if collect_hdr_log(node, remote_hdr_log_file, local_hdr_log_file):
+                self.hdr_log_files.append(local_hdr_log_file)
+
         return node, result, cs_stress_event
 
     def run(self):
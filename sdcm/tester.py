@@ -74,7 +74,8 @@ from sdcm.sct_config import init_and_verify_sct_config
 from sdcm.sct_events import Severity
 from sdcm.sct_events.setup import start_events_device, stop_events_device
 from sdcm.sct_events.system import InfoEvent, TestFrameworkEvent, TestResultEvent, TestTimeoutEvent
-from sdcm.sct_events.file_logger import get_events_grouped_by_category, get_logger_event_summary
+from sdcm.sct_events.file_logger import get_events_grouped_by_category, get_events_digest_grouped_by_category, \
+    get_logger_event_summary
 from sdcm.sct_events.events_analyzer import stop_events_analyzer
 from sdcm.sct_events.grafana import start_posting_grafana_annotations
 from sdcm.stress_thread import CassandraStressThread
@@ -97,7 +98,7 @@ from sdcm.remote import RemoteCmdRunnerBase
 from sdcm.utils.gce_utils import get_gce_services
 from sdcm.utils.auth_context import temp_authenticator
 from sdcm.keystore import KeyStore
-from sdcm.utils.latency import calculate_latency
+from sdcm.utils.latency import calculate_latency, update_latency_from_hdr
 
 CLUSTER_CLOUD_IMPORT_ERROR = ""
 try:
@@ -1807,7 +1808,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
         else:
             results, errors = cs_thread_pool.verify_results()
         if results and self.create_stats:
-            self.update_stress_results(results)
+            self.update_stress_results(results, hdr_log_files=getattr(cs_thread_pool, "hdr_log_files", ()))
         if not results:
             self.log.warning('There is no stress results, probably stress thread has failed.')
         # Sometimes, we might have an epic error messages list
@@ -1822,13 +1823,13 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
     def get_stress_results(self, queue, store_results=True) -> list[dict | None]:
         results = queue.get_results()
         if store_results and self.create_stats:
-            self.update_stress_results(results)
+            self.update_stress_results(results, hdr_log_files=getattr(queue, "hdr_log_files", ()))
         return results
 
     def get_stress_results_bench(self, queue):
         results = queue.get_stress_results_bench()
         if self.create_stats:
-            self.update_stress_results(results)
+            self.update_stress_results(results, hdr_log_files=getattr(queue, "hdr_log_files", ()))
         return results
 
     def verify_cdclog_reader_results(self, cdcreadstessors_queue, update_es=False):
@@ -2797,6 +2798,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
         self.log.debug('latency_results were loaded from file %s and its result is %s',
                        self.latency_results_file, latency_results)
         if latency_results and self.create_stats:
+            latency_results = update_latency_from_hdr(latency_results, self.hdr_histograms)
             latency_results = calculate_latency(latency_results)
             with open(self.latency_results_file, 'w', encoding="utf-8") as file:
                 json.dump(latency_results, file)
@@ -2810,7 +2812,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
         results_analyzer = PerformanceResultsAnalyzer(es_index=self._test_index,
                                                       es_doc_type=self._es_doc_type,
                                                       email_recipients=self.params.get('email_recipients'),
-                                                      events=get_events_grouped_by_category(
+                                                      events=get_events_digest_grouped_by_category(
                                                           _registry=self.events_processes_registry,
                                                           limit=self.params.get('events_limit_in_email'))
                                                       )
@@ -2826,7 +2828,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
         results_analyzer = PerformanceResultsAnalyzer(es_index=self._test_index,
                                                       es_doc_type=self._es_doc_type,
                                                       email_recipients=self.params.get('email_recipients'),
-                                                      events=get_events_grouped_by_category(
+                                                      events=get_events_digest_grouped_by_category(
                                                           _registry=self.events_processes_registry,
                                                           limit=self.params.get('events_limit_in_email'))
                                                       )
@@ -2844,7 +2846,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
         results_analyzer = PerformanceResultsAnalyzer(es_index=self._test_index,
                                                       es_doc_type=self._es_doc_type,
                                                       email_recipients=self.params.get('email_recipients'),
-                                                      events=get_events_grouped_by_category(
+                                                      events=get_events_digest_grouped_by_category(
                                                           _registry=self.events_processes_registry,
                                                           limit=self.params.get('events_limit_in_email'))
                                                       )
@@ -3235,7 +3237,8 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
                 "job_url": os.environ.get("BUILD_URL"),
                 "end_time": format_timestamp(time.time()),
                 "events_summary": self.get_event_summary(),
-                "last_events": get_events_grouped_by_category(limit=100, _registry=self.events_processes_registry),
+                "last_events": get_events_digest_grouped_by_category(limit=100,
+                                                                     _registry=self.events_processes_registry),
                 "nodes": [],
                 "number_of_db_nodes": self.params.get('n_db_nodes'),
                 "region_name": region_name,
@@ -37,7 +37,7 @@ import uuid
 import zipfile
 import io
 import tempfile
-from typing import Iterable, List, Callable, Optional, Dict, Union, Literal, Any
+from typing import TYPE_CHECKING, Iterable, List, Callable, Optional, Dict, Union, Literal, Any
 from urllib.parse import urlparse
 from unittest.mock import Mock
 from textwrap import dedent
@@ -76,6 +76,9 @@ from sdcm.utils.gce_utils import GcloudContainerMixin
 from sdcm.remote import LocalCmdRunner
 from sdcm.remote import RemoteCmdRunnerBase
 
+if TYPE_CHECKING:
+    from sdcm.utils.resources_inventory import ResourcesSnapshot
+
 LOGGER = logging.getLogger('utils')
 DEFAULT_AWS_REGION = "eu-west-1"
 DOCKER_CGROUP_RE = re.compile("/docker/([0-9a-f]+)")
@@ -495,24 +498,25 @@ class ParallelObjectException(Exception):
         return ex_str
 
 
-def clean_cloud_resources(tags_dict, dry_run=False):
+def clean_cloud_resources(tags_dict, dry_run=False, snapshot: Optional["ResourcesSnapshot"] = None):
     """
     Remove all instances with specific tags from both AWS/GCE
 
     :param tags_dict: a dict of the tag to select the instances,e.x. {"TestId": "9bc6879f-b1ef-47e1-99ab-020810aedbcc"}
+    :param snapshot: resources collected by `ResourcesInventory' in advance, to avoid listing of all clouds again
     :return: None
     """
     if "TestId" not in tags_dict and "RunByUser" not in tags_dict:
         LOGGER.error("Can't clean cloud resources, TestId or RunByUser is missing")
         return False
-    clean_instances_aws(tags_dict, dry_run=dry_run)
-    clean_elastic_ips_aws(tags_dict, dry_run=dry_run)
-    clean_clusters_gke(tags_dict, dry_run=dry_run)
+    clean_instances_aws(tags_dict, dry_run=dry_run, snapshot=snapshot)
+    clean_elastic_ips_aws(tags_dict, dry_run=dry_run, snapshot=snapshot)
+    clean_clusters_gke(tags_dict, dry_run=dry_run, snapshot=snapshot)
     clean_orphaned_gke_disks(dry_run=dry_run)
-    clean_clusters_eks(tags_dict, dry_run=dry_run)
-    clean_instances_gce(tags_dict, dry_run=dry_run)
+    clean_clusters_eks(tags_dict, dry_run=dry_run, snapshot=snapshot)
+    clean_instances_gce(tags_dict, dry_run=dry_run, snapshot=snapshot)
     clean_instances_azure(tags_dict, dry_run=dry_run)
-    clean_resources_docker(tags_dict, dry_run=dry_run)
+    clean_resources_docker(tags_dict, dry_run=dry_run, snapshot=snapshot)
     return True
 
 
@@ -613,7 +617,8 @@ def list_resources_docker(tags_dict: Optional[dict] = None,
     return dict(containers=containers, images=images)
 
 
-def clean_resources_docker(tags_dict: dict, builder_name: Optional[str] = None, dry_run: bool = False) -> None:
+def clean_resources_docker(tags_dict: dict, builder_name: Optional[str] = None, dry_run: bool = False,
+                           snapshot: Optional["ResourcesSnapshot"] = None) -> None:
     assert tags_dict, "tags_dict not provided (can't clean all instances)"
 
     def delete_container(container):
@@ -629,7 +634,12 @@ def clean_resources_docker(tags_dict: dict, builder_name: Optional[str] = None,
             image.client.images.remove(image=image.id, force=True)
             LOGGER.debug("Done.")
 
-    resources_to_clean = list_resources_docker(tags_dict=tags_dict, builder_name=builder_name, group_as_builder=False)
+    if snapshot is not None and builder_name is None and snapshot.covers("docker"):
+        resources_to_clean = {"containers": snapshot.get_raw("docker", "container", tags_dict=tags_dict),
+                              "images": snapshot.get_raw("docker", "image", tags_dict=tags_dict)}
+    else:
+        resources_to_clean = list_resources_docker(tags_dict=tags_dict, builder_name=builder_name,
+                                                   group_as_builder=False)
     containers = resources_to_clean.get("containers", [])
     images = resources_to_clean.get("images", [])
 
@@ -681,9 +691,9 @@ def list_instances_aws(tags_dict=None, region_name=None, running=False, group_as
         custom_filter = []
         if tags_dict:
             custom_filter = [{'Name': 'tag:{}'.format(key), 'Values': [value]} for key, value in tags_dict.items()]
-        response = client.describe_instances(Filters=custom_filter)
-        instances[region] = [instance for reservation in response['Reservations'] for instance in reservation[
-            'Instances']]
+        paginator = client.get_paginator('describe_instances')
+        instances[region] = [instance for page in paginator.paginate(Filters=custom_filter)
+                             for reservation in page['Reservations'] for instance in reservation['Instances']]
 
         if verbose:
             LOGGER.info("%s: done [%s/%s]", region, len(list(instances.keys())), len(aws_regions))
@@ -708,11 +718,14 @@ def list_instances_aws(tags_dict=None, region_name=None, running=False, group_as
     return instances
 
 
-def clean_instances_aws(tags_dict, dry_run=False):
+def clean_instances_aws(tags_dict, dry_run=False, snapshot: Optional["ResourcesSnapshot"] = None):
     """Remove all instances with specific tags in AWS."""
     # pylint: disable=too-many-locals
     assert tags_dict, "tags_dict not provided (can't clean all instances)"
-    aws_instances = list_instances_aws(tags_dict=tags_dict, group_as_region=True)
+    if snapshot is not None and snapshot.covers("aws"):
+        aws_instances = snapshot.get_raw("aws", "instance", tags_dict=tags_dict, group_by_region=True)
+    else:
+        aws_instances = list_instances_aws(tags_dict=tags_dict, group_as_region=True)
     from sdcm.argus_test_run import ArgusTestRun  # pylint: disable=import-outside-toplevel
     argus_run = ArgusTestRun.get()
 
@@ -780,15 +793,19 @@ def list_elastic_ips_aws(tags_dict=None, region_name=None, group_as_region=False
     return elastic_ips
 
 
-def clean_elastic_ips_aws(tags_dict, dry_run=False):
+def clean_elastic_ips_aws(tags_dict, dry_run=False, snapshot: Optional["ResourcesSnapshot"] = None):
     """
     Remove all elastic ips with specific tags AWS
 
     :param tags_dict: a dict of the tag to select the instances, e.x. {"TestId": "9bc6879f-b1ef-47e1-99ab-020810aedbcc"}
+    :param snapshot: resources collected by `ResourcesInventory' in advance
     :return: None
     """
     assert tags_dict, "tags_dict not provided (can't clean all instances)"
-    aws_instances = list_elastic_ips_aws(tags_dict=tags_dict, group_as_region=True)
+    if snapshot is not None and snapshot.covers("aws"):
+        aws_instances = snapshot.get_raw("aws", "elastic_ip", tags_dict=tags_dict, group_by_region=True)
+    else:
+        aws_instances = list_elastic_ips_aws(tags_dict=tags_dict, group_as_region=True)
 
     for region, eip_list in aws_instances.items():
         if not eip_list:
@@ -1021,15 +1038,19 @@ def filter_k8s_clusters_by_tags(tags_dict: dict,
                               instances=clusters)
 
 
-def clean_instances_gce(tags_dict, dry_run=False):
+def clean_instances_gce(tags_dict, dry_run=False, snapshot: Optional["ResourcesSnapshot"] = None):
     """
     Remove all instances with specific tags GCE
 
     :param tags_dict: a dict of the tag to select the instances, e.x. {"TestId": "9bc6879f-b1ef-47e1-99ab-020810aedbcc"}
+    :param snapshot: resources collected by `ResourcesInventory' in advance
     :return: None
     """
     assert tags_dict, "tags_dict not provided (can't clean all instances)"
-    gce_instances_to_clean = list_instances_gce(tags_dict=tags_dict)
+    if snapshot is not None and snapshot.covers("gce"):
+        gce_instances_to_clean = snapshot.get_raw("gce", "instance", tags_dict=tags_dict)
+    else:
+        gce_instances_to_clean = list_instances_gce(tags_dict=tags_dict)
 
     if not gce_instances_to_clean:
         LOGGER.info("There are no instances to remove in GCE")
@@ -1079,9 +1100,12 @@ def clean_instances_azure(tags_dict, dry_run=False):
                     instance.terminate(wait=False)
 
 
-def clean_clusters_gke(tags_dict: dict, dry_run: bool = False) -> None:
+def clean_clusters_gke(tags_dict: dict, dry_run: bool = False, snapshot: Optional["ResourcesSnapshot"] = None) -> None:
     assert tags_dict, "tags_dict not provided (can't clean all clusters)"
-    gke_clusters_to_clean = list_clusters_gke(tags_dict=tags_dict)
+    if snapshot is not None and snapshot.covers("gke"):
+        gke_clusters_to_clean = snapshot.get_raw("gke", "cluster", tags_dict=tags_dict)
+    else:
+        gke_clusters_to_clean = list_clusters_gke(tags_dict=tags_dict)
 
     if not gke_clusters_to_clean:
         LOGGER.info("There are no clusters to remove in GKE")
@@ -1113,9 +1137,12 @@ def clean_orphaned_gke_disks(dry_run: bool = False) -> None:
         LOGGER.error(exc)
 
 
-def clean_clusters_eks(tags_dict: dict, dry_run: bool = False) -> None:
+def clean_clusters_eks(tags_dict: dict, dry_run: bool = False, snapshot: Optional["ResourcesSnapshot"] = None) -> None:
     assert tags_dict, "tags_dict not provided (can't clean all clusters)"
-    eks_clusters_to_clean = list_clusters_eks(tags_dict=tags_dict)
+    if snapshot is not None and snapshot.covers("eks"):
+        eks_clusters_to_clean = snapshot.get_raw("eks", "cluster", tags_dict=tags_dict)
+    else:
+        eks_clusters_to_clean = list_clusters_eks(tags_dict=tags_dict)
 
     if not eks_clusters_to_clean:
         LOGGER.info("There are no clusters to remove in EKS")
@@ -1142,7 +1169,8 @@ def get_scylla_ami_versions(region_name: str, arch: AwsArchType = 'x86_64') -> l
     if _SCYLLA_AMI_CACHE[region_name]:
         return _SCYLLA_AMI_CACHE[region_name]
 
-    ec2_resource: EC2ServiceResource = boto3.resource('ec2', region_name=region_name)
+    # NOTE: use own session because it can be called for few regions concurrently and default session isn't thread-safe
+    ec2_resource: EC2ServiceResource = boto3.session.Session().resource('ec2', region_name=region_name)
     _SCYLLA_AMI_CACHE[region_name] = sorted(
         ec2_resource.images.filter(
             Owners=[SCYLLA_AMI_OWNER_ID, ],
@@ -1476,7 +1504,7 @@ def get_branched_ami(scylla_version: str, region_name: str, arch: AwsArchType =
         filters.append({'Name': 'tag:build-id', 'Values': [build_id, ], })
 
     LOGGER.info("Looking for AMIs match [%s]", scylla_version)
-    ec2_resource: EC2ServiceResource = boto3.resource("ec2", region_name=region_name)
+    ec2_resource: EC2ServiceResource = boto3.session.Session().resource("ec2", region_name=region_name)
     images = sorted(
         ec2_resource.images.filter(Filters=filters),
         key=lambda x: x.creation_date,
@@ -1914,19 +1942,28 @@ def clean_resources_according_post_behavior(params, config, logdir, dry_run=Fals
     kubeconfig_dir = Path(testrun_dir) if testrun_dir else Path(logdir)
     os.environ['KUBECONFIG'] = str(kubeconfig_dir / ".kube/config")
 
+    snapshot = None
+
+    def clean_node_types(node_types):
+        nonlocal snapshot
+        if snapshot is None:
+            # List all clouds only once for all node types.
+            from sdcm.utils.resources_inventory import ResourcesInventory  # pylint: disable=import-outside-toplevel
+            snapshot = ResourcesInventory(tags_dict=params).collect()
+        for node_type in node_types:
+            clean_cloud_resources(params | {"NodeType": node_type}, dry_run=dry_run, snapshot=snapshot)
+
     for cluster_nodes_type, action_type in actions_per_type.items():
         if action_type["action"] == "keep":
             LOGGER.info("Post behavior %s for %s. Keep resources running", action_type["action"], cluster_nodes_type)
         elif action_type["action"] == "destroy":
             LOGGER.info("Post behavior %s for %s. Clean resources", action_type["action"], cluster_nodes_type)
-            for node_type in action_type["node_types"]:
-                clean_cloud_resources(params | {"NodeType": node_type}, dry_run=dry_run)
+            clean_node_types(action_type["node_types"])
             continue
         elif action_type["action"] == "keep-on-failure" and not critical_events:
             LOGGER.info("Post behavior %s for %s. Test run Successful. Clean resources",
                         action_type["action"], cluster_nodes_type)
-            for node_type in action_type["node_types"]:
-                clean_cloud_resources(params | {"NodeType": node_type}, dry_run=dry_run)
+            clean_node_types(action_type["node_types"])
             continue
         else:
             LOGGER.info("Post behavior %s for %s. Test run Failed. Keep resources running",
@@ -0,0 +1,160 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""Cache of Scylla debug information files keyed by build-id.
+
+Only the first DB node with a build-id installs the debuginfo package, other nodes with the same build-id skip it.
+When a backtrace should be decoded, the debug file is downloaded once from a node which has it to the runner
+(and kept there between runs in `DEBUGINFO_CACHE_DIR') and sent to the node which decodes backtraces.
+"""
+
+import os
+import uuid
+import logging
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+DEBUGINFO_CACHE_DIR = os.path.expanduser("~/.cache/sct/debuginfo")
+DEBUGINFO_CACHE_MAX_FILES = 3
+DEBUGINFO_REMOTE_DIR = "/tmp"
+DEBUGINFO_DEFAULT_FILE = "/usr/lib/debug/bin/scylla.debug"
+DEBUGINFO_RELOCATABLE_FILES = "/usr/lib/debug/opt/scylladb/libexec/scylla*.debug"
+
+
+class DebuginfoCacheError(Exception):
+    pass
+
+
+def find_debuginfo_file(remoter, build_id: Optional[str] = None) -> Optional[str]:
+    """Lookup Scylla debug information in various places it can be, None if it's not found."""
+
+    # first try default location
+    if remoter.run(f"[[ -f {DEBUGINFO_DEFAULT_FILE} ]]", ignore_status=True).ok:
+        return DEBUGINFO_DEFAULT_FILE
+
+    # then try the relocatable location
+    if debug_file := remoter.run(f"ls {DEBUGINFO_RELOCATABLE_FILES}", ignore_status=True).stdout.strip():
+        return debug_file
+
+    # then look it up base on the build id
+    if build_id:
+        debug_file = f"/usr/lib/debug/.build-id/{build_id[:2]}/{build_id[2:]}.debug"
+        if remoter.run(f"[[ -f {debug_file} ]]", ignore_status=True).ok:
+            return debug_file
+
+    return None
+
+
+class DebuginfoCache:
+    """Debug files of Scylla builds: nodes which have them and local copies on the runner."""
+
+    def __init__(self, cache_dir: str = DEBUGINFO_CACHE_DIR, max_files: int = DEBUGINFO_CACHE_MAX_FILES):
+        self.cache_dir = cache_dir
+        self.max_files = max_files
+        self.stats = Counter()
+        self._sources: Dict[str, List[Tuple[object, str]]] = {}
+        self._lock = threading.Lock()
+        self._build_id_locks: Dict[str, threading.Lock] = {}
+
+    def _build_id_lock(self, build_id: str) -> threading.Lock:
+        with self._lock:
+            return self._build_id_locks.setdefault(build_id, threading.Lock())
+
+    def local_path(self, build_id: str) -> str:
+        return os.path.join(self.cache_dir, f"{build_id}.debug")
+
+    def add_source(self, build_id: str, node, debug_file: str) -> None:
+        with self._lock:
+            sources = self._sources.setdefault(build_id, [])
+            if (node, debug_file) not in sources:
+                sources.append((node, debug_file))
+
+    def sources(self, build_id: str) -> List[Tuple[object, str]]:
+        with self._lock:
+            return list(self._sources.get(build_id, ()))
+
+    def install(self, node, build_id: str, install_func) -> bool:
+        """Run `install_func' (which installs debuginfo on the node) unless debug file of `build_id' is available.
+
+        Nodes with the same build-id wait for the first one.  Return True if `install_func' was called.
+        """
+        with self._build_id_lock(build_id):
+            if self.sources(build_id) or os.path.exists(self.local_path(build_id)):
+                self.stats["install_hits"] += 1
+                LOGGER.info("%s: debuginfo of build-id %s is available already, skip installation", node, build_id)
+                return False
+            self.stats["install_misses"] += 1
+            install_func()
+            if debug_file := find_debuginfo_file(node.remoter, build_id=build_id):
+                self.add_source(build_id, node, debug_file)
+            else:
+                LOGGER.warning("%s: debuginfo of build-id %s is not found after installation", node, build_id)
+            return True
+
+    def get(self, build_id: str, node=None, debug_file: Optional[str] = None) -> str:
+        """Local path to debug file of `build_id', download it from `node' or another source if it's not cached."""
+        with self._build_id_lock(build_id):
+            local_path = self.local_path(build_id)
+            if os.path.exists(local_path):
+                self.stats["download_hits"] += 1
+                os.utime(local_path)  # used by eviction
+                return local_path
+            self.stats["download_misses"] += 1
+            os.makedirs(self.cache_dir, exist_ok=True)
+            sources = ([(node, debug_file)] if node is not None and debug_file else []) + self.sources(build_id)
+            for source_node, source_file in sources:
+                transit_path = f"{local_path}.{uuid.uuid4().hex[:8]}.tmp"
+                LOGGER.info("Download debuginfo of build-id %s from %s:%s", build_id, source_node, source_file)
+                try:
+                    source_node.remoter.receive_files(source_file, transit_path)
+                    if not os.path.getsize(transit_path):
+                        raise DebuginfoCacheError("empty file received")
+                except Exception as exc:  # pylint: disable=broad-except
+                    LOGGER.warning("Failed to download debuginfo from %s: %s", source_node, exc)
+                    if os.path.exists(transit_path):
+                        os.remove(transit_path)
+                    continue
+                os.replace(transit_path, local_path)
+                self._evict(keep=local_path)
+                return local_path
+        raise DebuginfoCacheError(f"There is no node to download debuginfo of build-id {build_id} from")
+
+    def deliver(self, build_id: str, remoter, node=None, debug_file: Optional[str] = None) -> str:
+        """Path to debug file of `build_id' on the host of `remoter', send it from the local cache if needed."""
+        remote_path = os.path.join(DEBUGINFO_REMOTE_DIR, f"scylla-{build_id}.debug")
+        if remoter.run(f"test -s {remote_path}", ignore_status=True, verbose=False).ok:
+            self.stats["deliver_hits"] += 1
+            return remote_path
+        self.stats["deliver_misses"] += 1
+        remoter.send_files(self.get(build_id, node=node, debug_file=debug_file), remote_path)
+        return remote_path
+
+    def _evict(self, keep: str) -> None:
+        files = sorted((os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                        if name.endswith(".debug")), key=os.path.getmtime, reverse=True)
+        for path in [path for path in files if path != keep][max(self.max_files - 1, 0):]:
+            LOGGER.debug("Remove debuginfo %s from the cache", path)
+            os.remove(path)
+
+    def report(self) -> None:
+        LOGGER.info("Debuginfo cache: installations skipped %d / done %d, downloads from nodes skipped %d / done %d, "
+                    "sends to decoding node skipped %d / done %d",
+                    self.stats["install_hits"], self.stats["install_misses"],
+                    self.stats["download_hits"], self.stats["download_misses"],
+                    self.stats["deliver_hits"], self.stats["deliver_misses"])
+
+
+__all__ = ("DebuginfoCache", "DebuginfoCacheError", "find_debuginfo_file", )
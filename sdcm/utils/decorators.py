@@ -202,6 +202,9 @@ def latency_calculator_decorator(original_function: Optional[Callable] = None, *
 
             result = latency.collect_latency(monitor, start, end, workload, args[0].cluster, all_nodes_list)
             result["screenshots"] = screenshots
+            if args[0].cluster.params.get("collect_hdr_latency"):
+                # used to replace Prometheus c-s latencies with exact ones from HDR histograms at the end of the test
+                result["window"] = [start, end]
 
             if "steady" in func.__name__.lower():
                 if 'Steady State' not in latency_results:
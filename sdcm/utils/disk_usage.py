@@ -0,0 +1,138 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""Disk space used by tables of DB nodes, sampled using Scylla REST API instead of `nodetool cfstats'.
+
+One remote command per node gets `total_disk_space_used' of all tables (same value as `Space used (total)' of
+`nodetool cfstats'.)  Samples are cached for a short TTL, so many waiters don't multiply the load on nodes, and
+kept in a short history which is used to estimate growth rate and time to reach a threshold.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+DISK_USAGE_TTL = 5
+DISK_USAGE_HISTORY_SIZE = 60
+GROWTH_RATE_WINDOW = 300
+
+SCYLLA_API_URL = "http://localhost:10000/column_family"
+DISK_USAGE_CMD = (
+    f"names=$(curl -sS --fail {SCYLLA_API_URL}/name) && "
+    f"for name in $(echo \"$names\" | tr -d '[]\",'); do "
+    f"echo \"$name $(curl -sS --fail {SCYLLA_API_URL}/metrics/total_disk_space_used/$name)\"; done"
+)
+
+
+class DiskUsageError(Exception):
+    pass
+
+
+@dataclass
+class DiskUsageSample:
+    timestamp: float
+    tables: Dict[str, int]  # `keyspace.table' -> bytes
+
+    def space_used(self, keyspaces: Optional[Iterable[str]] = None) -> int:
+        """Total space used by `keyspaces' (keyspace names or full table names, all tables if None.)"""
+        if keyspaces is None:
+            return sum(self.tables.values())
+        keyspaces = set(keyspaces)
+        return sum(size for table, size in self.tables.items()
+                   if table in keyspaces or table.split(".", 1)[0] in keyspaces)
+
+
+def parse_disk_usage(output: str) -> Dict[str, int]:
+    tables = {}
+    for line in output.splitlines():
+        try:
+            name, size = line.split()
+            tables[name.replace(":", ".", 1)] = int(size)
+        except ValueError:
+            LOGGER.debug("Unexpected line in disk usage output: %r", line)
+    return tables
+
+
+class DiskUsageSampler:
+    """Cached per-node samples of disk space used by tables."""
+
+    def __init__(self, ttl: float = DISK_USAGE_TTL, history_size: int = DISK_USAGE_HISTORY_SIZE):
+        self.ttl = ttl
+        self.history_size = history_size
+        self._history: Dict[str, Deque[DiskUsageSample]] = {}
+        self._lock = threading.Lock()
+        self._node_locks: Dict[str, threading.Lock] = {}
+
+    def sample(self, node, max_age: Optional[float] = None) -> DiskUsageSample:
+        """Last sample of the node if it's not older than `max_age' (default is TTL of the sampler) or a new one."""
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            node_lock = self._node_locks.setdefault(node.name, threading.Lock())
+        with node_lock:  # concurrent callers wait for one remote call instead of running their own
+            history = self._history.get(node.name)
+            if history and time.time() - history[-1].timestamp <= max_age:
+                return history[-1]
+            result = node.remoter.run(DISK_USAGE_CMD, ignore_status=True, verbose=False, timeout=60)
+            if not result.ok or not (tables := parse_disk_usage(result.stdout)):
+                raise DiskUsageError(f"Failed to get disk usage from Scylla REST API on {node}: {result.stderr}")
+            sample = DiskUsageSample(timestamp=time.time(), tables=tables)
+            self._history.setdefault(node.name, deque(maxlen=self.history_size)).append(sample)
+            return sample
+
+    def space_used(self, node, keyspaces: Optional[Iterable[str]] = None) -> int:
+        return self.sample(node).space_used(keyspaces)
+
+    def growth_rate(self, node, keyspaces: Optional[Iterable[str]] = None,
+                    window: float = GROWTH_RATE_WINDOW) -> Optional[float]:
+        """Growth rate (bytes/s) of space used by `keyspaces' on the node during last `window' seconds.
+
+        Least squares slope of sampled values, None if there are less than 2 samples in the window.
+        """
+        keyspaces = None if keyspaces is None else list(keyspaces)
+        history = list(self._history.get(node.name, ()))
+        if not history:
+            return None
+        points = [(sample.timestamp, sample.space_used(keyspaces))
+                  for sample in history if sample.timestamp >= history[-1].timestamp - window]
+        if len(points) < 2:
+            return None
+        mean_t = sum(t for t, _ in points) / len(points)
+        mean_v = sum(v for _, v in points) / len(points)
+        variance = sum((t - mean_t) ** 2 for t, _ in points)
+        if not variance:
+            return None
+        return sum((t - mean_t) * (v - mean_v) for t, v in points) / variance
+
+    def time_to_threshold(self, node, threshold: int, keyspaces: Optional[Iterable[str]] = None,
+                          window: float = GROWTH_RATE_WINDOW) -> Optional[float]:
+        """Estimated number of seconds until space used by `keyspaces' reaches `threshold'.
+
+        0 if it's reached already, None if space used doesn't grow or there is not enough samples.
+        """
+        keyspaces = None if keyspaces is None else list(keyspaces)
+        history = self._history.get(node.name)
+        if not history:
+            return None
+        if (space_used := history[-1].space_used(keyspaces)) >= threshold:
+            return 0
+        if not (rate := self.growth_rate(node, keyspaces, window)) or rate <= 0:
+            return None
+        return (threshold - space_used) / rate
+
+
+__all__ = ("DiskUsageSampler", "DiskUsageSample", "DiskUsageError", "parse_disk_usage", )
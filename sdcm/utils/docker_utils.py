@@ -13,12 +13,14 @@
 
 import os
 import re
+import time
 import logging
 import warnings
 from pprint import pformat
 from types import SimpleNamespace
-from typing import List, Optional, Union, Any, Tuple
+from typing import List, Optional, Union, Any, Tuple, Sequence
 from functools import cache
+from concurrent.futures import ThreadPoolExecutor
 
 import docker
 from docker.errors import DockerException, NotFound, ImageNotFound, NullResource, BuildError
@@ -32,6 +34,7 @@ from sdcm.keystore import pub_key_from_private_key_file, KeyStore
 from sdcm.utils.decorators import retrying, Retry
 
 DOCKER_API_CALL_TIMEOUT = 180  # seconds
+CONTAINERS_START_TIMEOUT = 300  # seconds
 
 LOGGER = logging.getLogger(__name__)
 
@@ -222,6 +225,66 @@ class ContainerManager:  # pylint: disable=too-many-public-methods)
     def _run_args(**kwargs) -> dict:
         return kwargs
 
+    @classmethod
+    def run_containers(cls,
+                       instances: Sequence[object],
+                       name: str,
+                       max_workers: Optional[int] = None,
+                       timeout: float = CONTAINERS_START_TIMEOUT,
+                       **extra_run_args) -> List[Container]:
+        """Run container `name' for all `instances' concurrently and wait until all of them are running.
+
+        Instances which use the same Docker client share it.  Docker events stream is used to wait for containers
+        instead of polling status of each of them.
+        """
+        if not instances:
+            return []
+        since = int(time.time()) - 1  # events are replayed from this time, so no `start' event can be missed
+        with ThreadPoolExecutor(max_workers=max_workers or len(instances),
+                                thread_name_prefix=f"run_containers_{name}") as executor:
+            containers = list(executor.map(lambda instance: cls.run_container(instance, name, **extra_run_args),
+                                           instances))
+        cls.wait_for_containers_running(containers, since=since, timeout=timeout)
+        return containers
+
+    @staticmethod
+    def wait_for_containers_running(containers: Sequence[Container],
+                                    since: int,
+                                    timeout: float = CONTAINERS_START_TIMEOUT) -> None:
+        """Wait for `start' events of containers which are not running yet.
+
+        Raise DockerException if a container died or not all containers started during `timeout' seconds.
+        """
+        waiting = {}
+        for container in containers:
+            container.reload()
+            if container.status != "running":
+                waiting.setdefault(container.client, {})[container.id] = container
+        for docker_client, client_containers in waiting.items():
+            events = docker_client.events(since=since,
+                                          until=int(time.time() + timeout),
+                                          filters={"type": "container",
+                                                   "event": ["start", "die", ],
+                                                   "container": list(client_containers), },
+                                          decode=True)
+            try:
+                for event in events:
+                    if (container := client_containers.get(event.get("id"))) is None:
+                        continue
+                    if event.get("Action") == "start":
+                        del client_containers[container.id]
+                        if not client_containers:
+                            break
+                        continue
+                    container.reload()  # `die' event can be replayed for a container which was re-run
+                    if container.status not in ("running", "restarting", ):
+                        raise DockerException(f"Container {container} died with status `{container.status}'")
+            finally:
+                events.close()
+            if client_containers:
+                raise DockerException(f"Containers {', '.join(map(str, client_containers.values()))} "
+                                      f"are not running after {timeout}s")
+
     @classmethod
     def destroy_container(cls, instance: object, name: str, ignore_keepalive: bool = False) -> bool:
         container = cls.get_container(instance, name)
@@ -413,6 +476,18 @@ class ContainerManager:  # pylint: disable=too-many-public-methods)
         docker_client = docker_client or cls.default_docker_client
         return docker_client.containers.get(c_id).name
 
+    @classmethod
+    def commit_container(cls, instance: object, name: str, image_tag: str, **conf) -> Image:
+        """Save the current state of the container as an image tagged `image_tag'.
+
+        `conf' overrides config of the container in the image (e.g., `Labels' or `Cmd'.)  Content of volumes is not
+        saved by Docker.
+        """
+        container = cls.get_container(instance, name)
+        repository, tag = image_tag.split(":", maxsplit=1)
+        LOGGER.info("Commit container %s to image `%s'", container, image_tag)
+        return container.commit(repository=repository, tag=tag, conf=conf)
+
     @classmethod
     def pause_container(cls, instance: object, name: str) -> None:
         cls.get_container(instance, name).pause()
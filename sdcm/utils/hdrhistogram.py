@@ -0,0 +1,311 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+"""
+Reader of HdrHistogram interval logs written by cassandra-stress (`-log hdrfile=...') and
+scylla-bench (`-hdr-latency-file ...') and a store which merges histograms of all loaders.
+
+Percentiles can't be averaged, but histograms can be merged: the store sums bucket counts of all loaders per
+time interval and calculates exact cluster-wide percentiles for any interval or time window (e.g., a nemesis.)
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+import math
+import re
+import struct
+import zlib
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+V2_ENCODING_COOKIE = 0x1c849303
+V2_COMPRESSED_ENCODING_COOKIE = 0x1c849304
+COOKIE_MASK = ~0xf0  # cookie's lower bits hold word size in V1 format and should be ignored
+
+COMPRESSED_HEADER = struct.Struct(">ii")
+PAYLOAD_HEADER = struct.Struct(">iiiiqqd")
+
+# Both cassandra-stress and scylla-bench record latencies in nanoseconds.
+NS_PER_MS = 1_000_000
+
+DEFAULT_PERCENTILES = (50, 95, 99, 99.9)
+
+START_TIME_RE = re.compile(r"^#\[StartTime: (?P<time>[\d.]+)")
+BASE_TIME_RE = re.compile(r"^#\[BaseTime: (?P<time>[\d.]+)")
+
+# cassandra-stress logs both service time (`WRITE-st') and, for fixed rate runs, response time (`WRITE-rt') of
+# the same operations.  Service time is what c-s reports in its summary.
+CS_SERVICE_TIME_TAG_SUFFIX = "-st"
+
+# Timestamps in interval logs are relative to the start time unless they look like absolute ones.
+MAX_RELATIVE_TIMESTAMP = 365 * 24 * 3600
+
+
+class HdrHistogramDecodeError(ValueError):
+    pass
+
+
+def _read_zigzag_varints(payload: bytes) -> Iterator[int]:
+    value = shift = 0
+    for byte in payload:
+        # The 9th byte of a LEB128 encoded 64-bit value holds all 8 bits.
+        if shift == 56:
+            value |= byte << 56
+        else:
+            value |= (byte & 0x7f) << shift
+            if byte & 0x80:
+                shift += 7
+                continue
+        yield (value >> 1) ^ -(value & 1)
+        value = shift = 0
+
+
+def _count_at_percentile(percentile: float, total_count: int) -> int:
+    # Step down to the previous float to not overshoot by one because of rounding errors, same as HdrHistogram does.
+    percentile = min(max(math.nextafter(percentile, -math.inf), 0.0), 100.0)
+    return max(math.ceil(percentile / 100 * total_count), 1)
+
+
+class HdrHistogram:
+    """Mergeable latency histogram: counts of recorded values by the highest equivalent value of HDR buckets.
+
+    Keeping the highest equivalent value instead of bucket indexes allows to merge histograms with different
+    layouts and gives the same percentile values as HdrHistogram's `getValueAtPercentile()'.
+    """
+
+    __slots__ = ("counts", "max_value", )
+
+    def __init__(self, counts: Optional[Dict[int, int]] = None, max_value: int = 0):
+        self.counts: Counter = Counter(counts or {})
+        self.max_value = max_value
+
+    @classmethod
+    def decode(cls, encoded: str | bytes) -> HdrHistogram:
+        """Decode a base64 encoded V2 compressed histogram (the last column of an interval log line.)"""
+        try:
+            data = base64.b64decode(encoded)
+            cookie, length = COMPRESSED_HEADER.unpack_from(data)
+            if cookie & COOKIE_MASK != V2_COMPRESSED_ENCODING_COOKIE & COOKIE_MASK:
+                raise HdrHistogramDecodeError(f"Unsupported compressed histogram cookie: {cookie:#x}")
+            payload = zlib.decompress(data[COMPRESSED_HEADER.size:COMPRESSED_HEADER.size + length])
+            (cookie, payload_length, normalizing_index_offset, significant_digits, lowest_discernible_value, _,
+             _) = PAYLOAD_HEADER.unpack_from(payload)
+        except (ValueError, struct.error, zlib.error) as exc:
+            raise HdrHistogramDecodeError(f"Failed to decode histogram: {exc}") from exc
+        if cookie & COOKIE_MASK != V2_ENCODING_COOKIE & COOKIE_MASK:
+            raise HdrHistogramDecodeError(f"Unsupported histogram encoding cookie: {cookie:#x}")
+        if normalizing_index_offset:
+            raise HdrHistogramDecodeError("Histograms with non-zero normalizing index offset are not supported")
+
+        sub_bucket_count_magnitude = math.ceil(math.log2(2 * 10 ** significant_digits))
+        sub_bucket_half_count_magnitude = max(sub_bucket_count_magnitude, 1) - 1
+        sub_bucket_half_count = 1 << sub_bucket_half_count_magnitude
+        unit_magnitude = int(math.floor(math.log2(lowest_discernible_value)))
+
+        histogram = cls()
+        index = 0
+        counts_payload = payload[PAYLOAD_HEADER.size:PAYLOAD_HEADER.size + payload_length]
+        for count in _read_zigzag_varints(counts_payload):
+            if count < 0:  # a run of zero counts
+                index -= count
+                continue
+            if count:
+                bucket_index = (index >> sub_bucket_half_count_magnitude) - 1
+                sub_bucket_index = (index & (sub_bucket_half_count - 1)) + sub_bucket_half_count
+                if bucket_index < 0:
+                    sub_bucket_index -= sub_bucket_half_count
+                    bucket_index = 0
+                value = sub_bucket_index << (bucket_index + unit_magnitude)
+                highest_equivalent_value = value + (1 << (bucket_index + unit_magnitude)) - 1
+                histogram.counts[highest_equivalent_value] += count
+                histogram.max_value = max(histogram.max_value, highest_equivalent_value)
+            index += 1
+        return histogram
+
+    @property
+    def total_count(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def mean(self) -> float:
+        total_count = self.total_count
+        return sum(value * count for value, count in self.counts.items()) / total_count if total_count else 0.0
+
+    def add(self, other: HdrHistogram) -> HdrHistogram:
+        self.counts.update(other.counts)
+        self.max_value = max(self.max_value, other.max_value)
+        return self
+
+    def get_value_at_percentile(self, percentile: float) -> int:
+        total_count = self.total_count
+        if not total_count:
+            return 0
+        count_at_percentile = _count_at_percentile(percentile, total_count)
+        running_count = 0
+        for value in sorted(self.counts):
+            running_count += self.counts[value]
+            if running_count >= count_at_percentile:
+                return value
+        return self.max_value
+
+    def get_percentiles(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[float, int]:
+        """Calculate several percentiles with one pass over sorted values."""
+        total_count = self.total_count
+        percentiles = sorted(percentiles)
+        result = dict.fromkeys(percentiles, 0)
+        if not total_count:
+            return result
+        values = iter(sorted(self.counts))
+        running_count = 0
+        value = 0
+        for percentile in percentiles:
+            count_at_percentile = _count_at_percentile(percentile, total_count)
+            while running_count < count_at_percentile:
+                value = next(values, None)
+                if value is None:
+                    value = self.max_value
+                    break
+                running_count += self.counts[value]
+            result[percentile] = value
+        return result
+
+    def __bool__(self):
+        return bool(self.counts)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} total_count={self.total_count} max_value={self.max_value}>"
+
+
+def parse_hdr_log(path: str) -> Iterator[Tuple[str, float, float, HdrHistogram]]:
+    """Yield (tag, start, end, histogram) for each interval in an HdrHistogram log with absolute timestamps."""
+    start_time = base_time = None
+    with open(path, encoding="utf-8") as log_file:
+        for line_number, line in enumerate(log_file, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("#"):
+                if match := START_TIME_RE.match(line):
+                    start_time = float(match.group("time"))
+                elif match := BASE_TIME_RE.match(line):
+                    base_time = float(match.group("time"))
+                continue
+            if line.startswith('"'):  # legend
+                continue
+            tag = ""
+            if line.startswith("Tag="):
+                tag, _, line = line[4:].partition(",")
+            try:
+                timestamp, interval, _, encoded = line.split(",", 3)
+                histogram = HdrHistogram.decode(encoded)
+            except (ValueError, HdrHistogramDecodeError) as exc:
+                LOGGER.warning("%s:%d: skip malformed interval: %s", path, line_number, exc)
+                continue
+            start = float(timestamp)
+            if base_time is not None:
+                start += base_time
+            elif start_time is not None and start < MAX_RELATIVE_TIMESTAMP:
+                start += start_time
+            yield tag, start, start + float(interval), histogram
+
+
+class HdrHistogramStore:
+    """Histograms of all loaders merged per tag and per `interval' seconds long time slot.
+
+    Usage::
+
+        store = HdrHistogramStore()
+        for path in stress_thread.hdr_log_files:
+            store.load_log(path)
+        store.get_percentiles(start=nemesis_start, end=nemesis_end, percentiles=(95, 99))
+
+    When `tags' argument is omitted, histograms of `latency_tags' are merged.
+    """
+
+    def __init__(self, interval: float = 1.0, value_unit_ratio: float = NS_PER_MS):
+        self.interval = interval
+        self.value_unit_ratio = value_unit_ratio
+        self._histograms: Dict[str, Dict[int, HdrHistogram]] = defaultdict(dict)
+        self._loaded_logs = set()
+
+    def add(self, tag: str, start: float, histogram: HdrHistogram) -> None:
+        slot = int(start // self.interval)
+        if (merged := self._histograms[tag].get(slot)) is None:
+            self._histograms[tag][slot] = merged = HdrHistogram()
+        merged.add(histogram)
+
+    def load_log(self, path: str) -> None:
+        """Merge all intervals of a log file, the same file is loaded only once."""
+        if path in self._loaded_logs:
+            return
+        self._loaded_logs.add(path)
+        for tag, start, _, histogram in parse_hdr_log(path):
+            self.add(tag=tag, start=start, histogram=histogram)
+
+    @property
+    def tags(self) -> List[str]:
+        return sorted(self._histograms)
+
+    @property
+    def latency_tags(self) -> List[str]:
+        """Tags to merge by default: c-s service time histograms if there are any, all tags otherwise."""
+        return [tag for tag in self.tags if tag.endswith(CS_SERVICE_TIME_TAG_SUFFIX)] or self.tags
+
+    def _select_tags(self, tags: Optional[Iterable[str]]) -> List[str]:
+        return self.latency_tags if tags is None else [tag for tag in tags if tag in self._histograms]
+
+    def _in_window(self, slot: int, start: Optional[float], end: Optional[float]) -> bool:
+        slot_start = slot * self.interval
+        return (start is None or slot_start >= start) and (end is None or slot_start < end)
+
+    def get_histogram(self, start: Optional[float] = None, end: Optional[float] = None,
+                      tags: Optional[Iterable[str]] = None) -> HdrHistogram:
+        """Merge all intervals which start within [start, end) time window."""
+        merged = HdrHistogram()
+        for tag in self._select_tags(tags):
+            for slot, histogram in self._histograms[tag].items():
+                if self._in_window(slot, start, end):
+                    merged.add(histogram)
+        return merged
+
+    def _to_units(self, values: Dict[float, int]) -> Dict[float, float]:
+        return {percentile: round(value / self.value_unit_ratio, 2) for percentile, value in values.items()}
+
+    def get_percentiles(self, start: Optional[float] = None, end: Optional[float] = None,
+                        tags: Optional[Iterable[str]] = None,
+                        percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[float, float]:
+        """Exact cluster-wide percentiles (in ms by default) for a time window."""
+        return self._to_units(self.get_histogram(start=start, end=end, tags=tags).get_percentiles(percentiles))
+
+    def get_mean(self, start: Optional[float] = None, end: Optional[float] = None,
+                 tags: Optional[Iterable[str]] = None) -> float:
+        return round(self.get_histogram(start=start, end=end, tags=tags).mean / self.value_unit_ratio, 2)
+
+    def get_interval_percentiles(self, start: Optional[float] = None, end: Optional[float] = None,
+                                 tags: Optional[Iterable[str]] = None,
+                                 percentiles: Iterable[float] = DEFAULT_PERCENTILES,
+                                 ) -> List[Tuple[float, Dict[float, float]]]:
+        """Exact cluster-wide percentiles for each interval within a time window as list of (start, percentiles)."""
+        slots = defaultdict(HdrHistogram)
+        for tag in self._select_tags(tags):
+            for slot, histogram in self._histograms[tag].items():
+                if self._in_window(slot, start, end):
+                    slots[slot].add(histogram)
+        return [(slot * self.interval, self._to_units(slots[slot].get_percentiles(percentiles)))
+                for slot in sorted(slots)]
+
+    def __bool__(self):
+        return bool(self._histograms)
@@ -13,6 +13,9 @@
 
 # pylint: disable=too-many-arguments
 import abc
+import enum
+import heapq
+import itertools
 import json
 import os
 import time
@@ -68,13 +71,44 @@ K8S_CPU_CONVERSION_MAP = {
 logging.getLogger("kubernetes.client.rest").setLevel(logging.INFO)
 
 
+class ApiCallPriority(enum.IntEnum):
+    """Order in which pending API calls are let through by `ApiCallRateLimiter' (lower goes first.)"""
+    MUTATION = 0
+    READ = 1
+    STREAMING = 2
+
+
+KUBECTL_MUTATION_VERBS = {"annotate", "apply", "cordon", "create", "delete", "drain", "edit", "label", "patch",
+                          "replace", "rollout", "scale", "set", "taint", "uncordon", "install", "upgrade", }
+
+
+def get_api_call_priority(method: str, query_params=None) -> ApiCallPriority:
+    if method.upper() not in ("GET", "HEAD", "OPTIONS"):
+        return ApiCallPriority.MUTATION
+    if any(key in ("watch", "follow") and value for key, value in query_params or ()):
+        return ApiCallPriority.STREAMING
+    return ApiCallPriority.READ
+
+
+def get_kubectl_call_priority(*command: str) -> ApiCallPriority:
+    args = " ".join(command).split()
+    if not args:
+        return ApiCallPriority.READ
+    if args[0] in KUBECTL_MUTATION_VERBS:
+        return ApiCallPriority.MUTATION
+    if args[0] == "logs" or "--watch" in args or "--watch=true" in args or "-w" in args:
+        return ApiCallPriority.STREAMING
+    return ApiCallPriority.READ
+
+
 class ApiLimiterClient(k8s.client.ApiClient):
     _api_rate_limiter: 'ApiCallRateLimiter' = None
 
-    def call_api(self, *args, **kwargs):  # pylint: disable=signature-differs
+    def call_api(self, resource_path, method, path_params=None, query_params=None,  # pylint: disable=arguments-differ
+                 *args, **kwargs):  # pylint: disable=keyword-arg-before-vararg
         if self._api_rate_limiter:
-            self._api_rate_limiter.wait()
-        return super().call_api(*args, **kwargs)
+            self._api_rate_limiter.wait(priority=get_api_call_priority(method, query_params))
+        return super().call_api(resource_path, method, path_params, query_params, *args, **kwargs)
 
     def bind_api_limiter(self, instance: 'ApiCallRateLimiter'):
         self._api_rate_limiter = instance
@@ -98,23 +132,37 @@ class ApiLimiterRetry(Retry):
         self._api_rate_limiter = instance
 
 
-class ApiCallRateLimiter(threading.Thread):
-    """Simple and not very accurate rate limiter.
+class ApiCallRateLimiter(threading.Thread):  # pylint: disable=too-many-instance-attributes
+    """Token bucket rate limiter with priorities.
 
-    Allow 1 call each `1 / rate_limit' seconds interval.
+    Bucket is refilled with `rate_limit' tokens per second up to `burst' tokens, each call takes one token.
+    If there are no tokens, calls wait in order of their priority (see `ApiCallPriority') and then in FIFO order.
     If some call not able to start after `queue_size / rate_limit' seconds then raise `queue.Full' for caller.
+
+    The thread itself only logs wait time metrics periodically.
     """
 
-    def __init__(self, rate_limit: float, queue_size: int, urllib_retry: int, urllib_backoff_factor: float):
+    metrics_log_interval = 300  # seconds
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, rate_limit: float, queue_size: int, urllib_retry: int, urllib_backoff_factor: float,
+                 burst: Optional[int] = None):
         super().__init__(name=type(self).__name__, daemon=True)
-        self._lock = multiprocessing.Semaphore(value=1)
         self._requests_pause_event = multiprocessing.Event()
         self.release_requests_pause()
         self.rate_limit = rate_limit  # ops/s
+        self.burst = burst or max(1, int(rate_limit))
         self.queue_size = queue_size
         self.urllib_retry = urllib_retry
         self.urllib_backoff_factor = urllib_backoff_factor
         self.running = threading.Event()
+        self._condition = threading.Condition()
+        self._tokens = float(self.burst)
+        self._last_refill = time.perf_counter()
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._wait_stats = {priority: {"calls": 0, "waited": 0, "total_wait": 0.0, "max_wait": 0.0, "rejected": 0}
+                            for priority in ApiCallPriority}
 
     def put_requests_on_pause(self):
         self._requests_pause_event.clear()
@@ -129,11 +177,50 @@ class ApiCallRateLimiter(threading.Thread):
         yield None
         self.release_requests_pause()
 
-    def wait(self):
+    def _refill(self) -> None:
+        now = time.perf_counter()
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate_limit)
+        self._last_refill = now
+
+    def wait(self, priority: ApiCallPriority = ApiCallPriority.READ):
         self._requests_pause_event.wait(15 * 60)
-        if not self._lock.acquire(timeout=self.queue_size / self.rate_limit):  # deepcode ignore E1123: deepcode error
-            LOGGER.error("k8s API call rate limiter queue size limit has been reached")
-            raise queue.Full
+        started = time.perf_counter()
+        deadline = started + self.queue_size / self.rate_limit
+        with self._condition:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    self._refill()
+                    if self._waiters[0] == ticket and self._tokens >= 1:
+                        self._tokens -= 1
+                        heapq.heappop(self._waiters)
+                        break
+                    if (remaining := deadline - time.perf_counter()) <= 0:
+                        self._waiters.remove(ticket)
+                        heapq.heapify(self._waiters)
+                        self._wait_stats[priority]["rejected"] += 1
+                        LOGGER.error("k8s API call rate limiter queue size limit has been reached")
+                        raise queue.Full
+                    if self._waiters[0] == ticket:
+                        remaining = min(remaining, (1 - self._tokens) / self.rate_limit)
+                    self._condition.wait(remaining)
+            finally:
+                self._condition.notify_all()
+            waited = time.perf_counter() - started
+            stats = self._wait_stats[priority]
+            stats["calls"] += 1
+            stats["total_wait"] += waited
+            stats["max_wait"] = max(stats["max_wait"], waited)
+            if waited >= 1 / self.rate_limit:
+                stats["waited"] += 1
+
+    @property
+    def metrics(self) -> dict:
+        """Wait time statistics per priority."""
+        with self._condition:
+            return {priority.name: {**stats, "avg_wait": stats["total_wait"] / stats["calls"] if stats["calls"] else 0}
+                    for priority, stats in self._wait_stats.items()}
 
     def _api_test(self, kluster):  # pylint: disable=no-self-use
         logging.getLogger('urllib3.connectionpool').disabled = True
@@ -180,15 +267,18 @@ class ApiCallRateLimiter(threading.Thread):
     def stop(self):
         self.running.clear()
         self.join()
+        LOGGER.info("k8s API call rate limiter stopped, wait times: %s", self.metrics)
 
     def run(self) -> None:
-        LOGGER.info("k8s API call rate limiter started: rate_limit=%s, queue_size=%s",
-                    self.rate_limit, self.queue_size)
+        LOGGER.info("k8s API call rate limiter started: rate_limit=%s, burst=%s, queue_size=%s",
+                    self.rate_limit, self.burst, self.queue_size)
         self.running.set()
+        next_log_time = time.perf_counter() + self.metrics_log_interval
         while self.running.is_set():
-            if self._lock.get_value() == 0:
-                self._lock.release()
-            time.sleep(1 / self.rate_limit)
+            time.sleep(1)
+            if time.perf_counter() >= next_log_time:
+                LOGGER.debug("k8s API call rate limiter wait times: %s", self.metrics)
+                next_log_time += self.metrics_log_interval
 
     def get_k8s_configuration(self, kluster) -> k8s.client.Configuration:
         output = KubernetesOps.create_k8s_configuration(kluster)
@@ -202,6 +292,125 @@ class ApiCallRateLimiter(threading.Thread):
         return output
 
 
+class KubernetesInformer(threading.Thread):  # pylint: disable=too-many-instance-attributes
+    """Local cache of k8s objects of one kind in a namespace, kept up to date by a watch stream.
+
+    Makes one `list' call on start (and each `resync_period' seconds or after the watch got too old resource version)
+    and then gets changes by long `watch' calls, so the cached objects can be read as often as needed without API
+    calls and without touching the API call rate limiter.
+
+    If the cache is not synced yet or the watch is broken for more than `max_staleness' seconds, `get()' falls back
+    to a direct API call.
+    """
+
+    LIST_FUNCS = {
+        "pod": ("list_namespaced_pod", "list_pod_for_all_namespaces"),
+        "service": ("list_namespaced_service", "list_service_for_all_namespaces"),
+        "node": (None, "list_node"),
+    }
+
+    watch_timeout = 60  # seconds, server side timeout of a single watch call
+    resync_period = 600  # seconds
+    max_staleness = 180  # seconds
+    retry_delay = 5  # seconds
+
+    def __init__(self, k8s_core_v1_api: k8s.client.CoreV1Api, kind: str, namespace: Optional[str] = None):
+        namespaced_func, cluster_func = self.LIST_FUNCS[kind]
+        if namespace is not None and namespaced_func:
+            self._list_func = getattr(k8s_core_v1_api, namespaced_func)
+            self._list_kwargs = {"namespace": namespace}
+        else:
+            self._list_func = getattr(k8s_core_v1_api, cluster_func)
+            self._list_kwargs = {}
+        self.kind = kind
+        self.namespace = namespace
+        self._objects = {}
+        self._resource_version = None
+        self._last_resync = 0.0
+        self._last_update = None
+        self._watch = None
+        self._termination_event = threading.Event()
+        self.stats = dict.fromkeys(("resyncs", "events", "watch_restarts", "errors", "hits", "fallbacks"), 0)
+        super().__init__(daemon=True, name=f"{type(self).__name__}-{kind}-{namespace or 'all'}")
+
+    @property
+    def staleness(self) -> Optional[float]:
+        """Seconds since the informer made sure that the cache is up to date, None if it never did."""
+        if self._last_update is None:
+            return None
+        return time.perf_counter() - self._last_update
+
+    @property
+    def is_fresh(self) -> bool:
+        staleness = self.staleness
+        return staleness is not None and staleness < self.max_staleness
+
+    @property
+    def metrics(self) -> dict:
+        return {"objects": len(self._objects), "staleness": self.staleness, **self.stats}
+
+    def get(self, name: str, fallback: Callable[[], object]):
+        """Return cached object with given name (None if there is no such object) or call `fallback' if stale."""
+        if self.is_fresh:
+            self.stats["hits"] += 1
+            return self._objects.get(name)
+        self.stats["fallbacks"] += 1
+        return fallback()
+
+    def _resync(self):
+        response = self._list_func(watch=False, **self._list_kwargs)
+        self._objects = {obj.metadata.name: obj for obj in response.items}
+        self._resource_version = response.metadata.resource_version
+        self._last_resync = self._last_update = time.perf_counter()
+        self.stats["resyncs"] += 1
+
+    def _watch_changes(self):
+        self._watch = k8s.watch.Watch()
+        timeout = min(self.watch_timeout, max(1, int(self._last_resync + self.resync_period - time.perf_counter())))
+        for event in self._watch.stream(self._list_func, resource_version=self._resource_version,
+                                        timeout_seconds=timeout, allow_watch_bookmarks=True, **self._list_kwargs):
+            obj = event["object"]
+            if event["type"] == "DELETED":
+                self._objects.pop(obj.metadata.name, None)
+            elif event["type"] in ("ADDED", "MODIFIED"):
+                self._objects[obj.metadata.name] = obj
+            self._resource_version = obj.metadata.resource_version
+            self._last_update = time.perf_counter()
+            self.stats["events"] += 1
+        self.stats["watch_restarts"] += 1
+        if not self._termination_event.is_set():
+            self._last_update = time.perf_counter()
+
+    def run(self):
+        while not self._termination_event.is_set():
+            try:
+                if self._resource_version is None or \
+                        time.perf_counter() - self._last_resync >= self.resync_period:
+                    self._resync()
+                self._watch_changes()
+            except k8s.client.exceptions.ApiException as exc:
+                if exc.status == 410:  # resource version is too old, need to get the full list again
+                    LOGGER.debug("%s: %s, resync", self.name, exc.reason)
+                    self._resource_version = None
+                    continue
+                self._handle_error(exc)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._handle_error(exc)
+
+    def _handle_error(self, exc: Exception):
+        self.stats["errors"] += 1
+        self._resource_version = None
+        LOGGER.debug("%s: failed to update the cache: %s", self.name, exc)
+        self._termination_event.wait(self.retry_delay)
+
+    def stop(self, timeout=None):
+        self._termination_event.set()
+        if self._watch is not None:
+            self._watch.stop()
+        self.join(timeout)
+        LOGGER.info("%s stopped: %s", self.name, self.metrics)
+
+
 class CordonNodes:
     def __init__(self, kubectl_method, selector):
         self.kubectl = kubectl_method
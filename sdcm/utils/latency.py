@@ -12,6 +12,7 @@
 # Copyright (c) 2020 ScyllaDB
 
 from sdcm.db_stats import PrometheusDBStats
+from sdcm.utils.hdrhistogram import HdrHistogramStore
 
 
 def avg(values):
@@ -80,6 +81,37 @@ def collect_latency(monitor_node, start, end, load_type, cluster, nodes_list):
     return res
 
 
+def collect_hdr_latency(hdr_histograms: HdrHistogramStore, start, end):
+    """Exact c-s percentiles for a time window from merged HDR histograms of all loaders.
+
+    `c-s P99' is the percentile of all operations within the window and `c-s P99 max' is the worst
+    per-interval one, same metrics as `collect_latency()' provides from Prometheus.
+    """
+    res = {}
+    percentiles = (99, 95)
+    window = hdr_histograms.get_percentiles(start=start, end=end, percentiles=percentiles)
+    intervals = [values for _, values in hdr_histograms.get_interval_percentiles(start=start, end=end,
+                                                                                 percentiles=percentiles)]
+    if not intervals:
+        return res
+    for percentile in percentiles:
+        res[f'c-s P{percentile}'] = window[percentile]
+        res[f'c-s P{percentile} max'] = max(values[percentile] for values in intervals)
+    return res
+
+
+def update_latency_from_hdr(latency_results, hdr_histograms: HdrHistogramStore):
+    """Replace c-s latencies averaged from Prometheus gauges with exact ones for each collected time window.
+
+    Time windows are removed from the results, so they don't get to reports.
+    """
+    for value in latency_results.values():
+        for result in value.get('cycles', [value]):
+            if (window := result.pop('window', None)) and hdr_histograms:
+                result.update(collect_hdr_latency(hdr_histograms, *window))
+    return latency_results
+
+
 def calculate_latency(latency_results):
     result_dict = {}
     all_keys = list(latency_results.keys())
@@ -96,7 +128,7 @@ def calculate_latency(latency_results):
         temp_dict = {}
         for cycle in latency_results[key]['cycles']:
             for metric, value in cycle.items():
-                if metric == "screenshots":
+                if metric in ("screenshots", "window"):
                     continue
                 if metric not in temp_dict:
                     temp_dict[metric] = []
@@ -0,0 +1,82 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""Disk-backed cache with TTL for results of slow lookups (e.g., cloud images), shared between SCT processes."""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+LOOKUP_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "sct"
+LOOKUP_CACHE_TTL_ENV = "_SCT_LOOKUP_CACHE_TTL"
+
+
+class LookupCache:
+    """Store JSON-serializable values in files under `LOOKUP_CACHE_DIR / name', one file per key.
+
+    Writes are atomic, so many processes (e.g., `sct.py lint-yamls' workers) can use same cache safely.
+    TTL can be overridden by `_SCT_LOOKUP_CACHE_TTL' environment variable, 0 disables the cache.
+    """
+
+    def __init__(self, name: str, ttl: float = 3600, cache_dir: Optional[Path] = None):
+        self.path = Path(cache_dir or LOOKUP_CACHE_DIR) / name
+        self._ttl = ttl
+
+    @property
+    def ttl(self) -> float:
+        if (ttl := os.environ.get(LOOKUP_CACHE_TTL_ENV)) is not None:
+            return float(ttl)
+        return self._ttl
+
+    def _key_path(self, key: str) -> Path:
+        return self.path / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        if self.ttl <= 0:
+            return None
+        try:
+            with self._key_path(key).open(encoding="utf-8") as cache_file:
+                entry = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        if entry.get("key") != key or time.time() - entry.get("time", 0) > self.ttl:
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=self.path, suffix=".tmp", delete=False,
+                                             encoding="utf-8") as tmp_file:
+                json.dump({"key": key, "time": time.time(), "value": value}, tmp_file)
+            os.replace(tmp_file.name, self._key_path(key))
+        except OSError as exc:
+            LOGGER.debug("Failed to save `%s' to the lookup cache: %s", key, exc)
+
+    def get_or_set(self, key: str, func: Callable[[], Any]) -> Any:
+        """Return cached value for `key' or call `func' and cache its result.  Exceptions are not cached."""
+        if (value := self.get(key)) is not None:
+            LOGGER.debug("Use cached value for `%s'", key)
+            return value
+        value = func()
+        self.set(key, value)
+        return value
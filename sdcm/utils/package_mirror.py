@@ -0,0 +1,191 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""Download a set of packages once per cluster and serve it to all nodes over HTTP.
+
+First node which asks for a package set becomes a mirror for it: it downloads the packages with all missing
+dependencies (`yum --downloadonly' or `apt-get --download-only') and serves them by `python3 -m http.server'.
+Other nodes wait for the mirror, fetch the files from it over the local network and install them locally.
+"""
+
+import time
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+PACKAGE_MIRROR_PORT = 8089
+PACKAGE_MIRROR_DIR = "/var/tmp/sct-package-mirror"
+PACKAGES_DIR = "/var/tmp/sct-packages"
+FETCH_PARALLELISM = 8
+FETCH_CONNECT_TIMEOUT = 5  # seconds; a firewalled mirror port should fail fast to fall back to the repo
+
+
+class PackageMirrorError(Exception):
+    pass
+
+
+@dataclass
+class PackageSet:  # pylint: disable=too-many-instance-attributes
+    key: str
+    packages: str
+    package_format: str
+    mirror_node: Optional[object] = None
+    files: List[str] = field(default_factory=list)
+    download_time: float = 0
+    fetch_times: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def saved_time(self) -> float:
+        """Estimated time saved by fetching packages from the mirror instead of downloading them from repos."""
+        return sum(max(self.download_time - fetch_time, 0) for fetch_time in self.fetch_times.values())
+
+
+class PackageMirror:
+    """Package sets of one cluster, keyed by repo URL, packages (with versions) and package format."""
+
+    def __init__(self, port: int = PACKAGE_MIRROR_PORT, root: str = PACKAGE_MIRROR_DIR):
+        self.port = port
+        self.root = root
+        self.package_sets: Dict[str, PackageSet] = {}
+        self._serving_nodes = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def package_set_key(repo_url: str, packages: str, package_format: str) -> str:
+        return hashlib.sha1(f"{repo_url}|{packages}|{package_format}".encode()).hexdigest()[:16]
+
+    @staticmethod
+    def package_format(node) -> Optional[str]:
+        if node.distro.is_rhel_like:
+            return "rpm"
+        if node.distro.is_debian_like:
+            return "deb"
+        return None
+
+    def url(self, package_set: PackageSet) -> str:
+        return f"http://{package_set.mirror_node.private_ip_address}:{self.port}/{package_set.key}"
+
+    def install(self, node, repo_url: str, packages: str) -> bool:
+        """Install `packages' on the node using the mirror.
+
+        Return False if the mirror can't be used for the node, the caller should install packages in a regular way.
+        """
+        if not (package_format := self.package_format(node)):
+            return False
+        key = self.package_set_key(repo_url=repo_url, packages=packages, package_format=package_format)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:  # all nodes wait here while the first one downloads the packages
+            if (package_set := self.package_sets.get(key)) is None:
+                package_set = self.package_sets[key] = PackageSet(key=key, packages=packages,
+                                                                  package_format=package_format, mirror_node=node)
+                try:
+                    self._download(package_set)
+                    self._serve(node)
+                except Exception as exc:  # pylint: disable=broad-except
+                    package_set.error = str(exc)
+                    LOGGER.warning("Failed to prepare package mirror for `%s' on %s: %s", packages, node, exc)
+        if package_set.error:
+            return False
+        try:
+            if node is package_set.mirror_node:
+                path = f"{self.root}/{key}"
+            else:
+                path = self._fetch(node, package_set)
+            node.remoter.sudo(self._install_cmd(package_set, path))
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.warning("Failed to install `%s' on %s from package mirror: %s", packages, node, exc)
+            return False
+        return True
+
+    def _download(self, package_set: PackageSet) -> None:
+        node = package_set.mirror_node
+        path = f"{self.root}/{package_set.key}"
+        LOGGER.info("Download `%s' to package mirror on %s", package_set.packages, node)
+        started = time.perf_counter()
+        node.remoter.sudo(f"mkdir -p {path}/partial")
+        if package_set.package_format == "rpm":
+            # yum can exit with non-zero status when `--downloadonly' is used, check downloaded files instead.
+            node.remoter.sudo(f"yum install -y --downloadonly --downloaddir={path} {package_set.packages}",
+                              ignore_status=True, retry=3)
+        else:
+            node.remoter.sudo(f"apt-get install -y --download-only -o Dir::Cache::archives={path} "
+                              f"{package_set.packages}", retry=3)
+        files = node.remoter.run(f"ls -1 {path}", ignore_status=True, verbose=False).stdout.split()
+        files = [name for name in files if name.endswith(f".{package_set.package_format}")]
+        if not files:
+            raise PackageMirrorError(f"no packages downloaded to {path}")
+
+        # Debian package file names have an epoch encoded as `%3a', which is inconvenient in URLs.
+        for name in files:
+            if "%" in name:
+                node.remoter.sudo(f"mv -f {path}/'{name}' {path}/{name.replace('%', '_')}")
+        files = [name.replace("%", "_") for name in files]
+        package_set.files = files
+        package_set.download_time = time.perf_counter() - started
+        LOGGER.info("%d packages for `%s' downloaded on %s in %.0f s",
+                    len(files), package_set.packages, node, package_set.download_time)
+
+    def _serve(self, node) -> None:
+        if node.name in self._serving_nodes:
+            return
+        node.remoter.run(f"cd {self.root} && (setsid nohup python3 -m http.server {self.port} "
+                         f"> {self.root}.log 2>&1 < /dev/null &)")
+        for _ in range(30):
+            if node.remoter.run(f"curl -fsS -o /dev/null http://127.0.0.1:{self.port}/",
+                                ignore_status=True, verbose=False).ok:
+                self._serving_nodes[node.name] = node
+                return
+            time.sleep(1)
+        raise PackageMirrorError(f"HTTP server on port {self.port} is not started")
+
+    def _fetch(self, node, package_set: PackageSet) -> str:
+        path = f"{PACKAGES_DIR}/{package_set.key}"
+        started = time.perf_counter()
+        node.remoter.run(f"mkdir -p {path} && cd {path} && printf '%s\\n' {' '.join(package_set.files)} "
+                         f"| xargs -P {FETCH_PARALLELISM} -I PKG "
+                         f"curl -fsS --retry 3 --connect-timeout {FETCH_CONNECT_TIMEOUT} "
+                         f"-o PKG {self.url(package_set)}/PKG")
+        package_set.fetch_times[node.name] = fetch_time = time.perf_counter() - started
+        LOGGER.info("Packages for `%s' fetched from package mirror on %s to %s in %.0f s (download took %.0f s), "
+                    "saved %.0f s in total", package_set.packages, package_set.mirror_node, node, fetch_time,
+                    package_set.download_time, package_set.saved_time)
+        return path
+
+    @staticmethod
+    def _install_cmd(package_set: PackageSet, path: str) -> str:
+        if package_set.package_format == "rpm":
+            return f"yum install -y {path}/*.rpm"
+        return f"env DEBIAN_FRONTEND=noninteractive apt-get install -y {path}/*.deb"
+
+    def stop(self) -> None:
+        """Stop HTTP servers on mirror nodes and forget package sets, next install() prepares a new mirror."""
+        with self._lock:
+            serving_nodes = list(self._serving_nodes.values())
+            self._serving_nodes.clear()
+            self.package_sets.clear()
+            self._key_locks.clear()
+        for node in serving_nodes:
+            try:
+                node.remoter.run(f"pkill -f 'http.server {self.port}'", ignore_status=True)
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.debug("Failed to stop package mirror on %s: %s", node, exc)
+
+
+__all__ = ("PackageMirror", "PackageSet", "PackageMirrorError", )
@@ -20,12 +20,18 @@ from functools import cached_property
 from threading import Thread, Event as ThreadEvent
 from multiprocessing import Process, Event
 from textwrap import dedent
+from typing import List, Optional
+
+from invoke.watchers import StreamWatcher
 
 from sdcm import wait
 from sdcm.remote import RemoteCmdRunnerBase
 from sdcm.sct_events.decorators import raise_event_on_failure
 from sdcm.utils.k8s import KubernetesOps
 
+JOURNAL_CURSOR_MARKER = "-- sct journal cursor: "
+JOURNAL_LOG_BUFFER_SIZE = 1024 * 1024
+
 
 class LoggerBase(metaclass=ABCMeta):
     def __init__(self, target_log_file: str):
@@ -47,9 +53,7 @@ class NodeLoggerBase(LoggerBase, metaclass=ABCMeta):
         super().__init__(target_log_file=target_log_file)
 
 
-class SSHLoggerBase(NodeLoggerBase):
-    _retrieve_message = "Reading Scylla logs from {since}"
-
+class SSHNodeLoggerBase(NodeLoggerBase):
     def __init__(self, node, target_log_file: str):
         super().__init__(node, target_log_file)
         self._termination_event = Event()
@@ -58,6 +62,29 @@ class SSHLoggerBase(NodeLoggerBase):
         self._remoter_params = node.remoter.get_init_arguments()
         self._child_process = Process(target=self._journal_thread, daemon=True)
 
+    @abstractmethod
+    def _journal_thread(self):
+        pass
+
+    def _wait_ssh_up(self, verbose=True, timeout=500):
+        text = None
+        if verbose:
+            text = '%s: Waiting for SSH to be up' % self
+        wait.wait_for(func=self._remoter.is_up, step=10, text=text, timeout=timeout, throw_exc=True)
+
+    def start(self):
+        self._child_process.start()
+
+    def stop(self, timeout=None):
+        self._child_process.terminate()
+        self._child_process.join(timeout)
+        if self._child_process.is_alive():
+            self._child_process.kill()  # pylint: disable=no-member
+
+
+class SSHLoggerBase(SSHNodeLoggerBase):
+    _retrieve_message = "Reading Scylla logs from {since}"
+
     @property
     @abstractmethod
     def _logger_cmd(self) -> str:
@@ -100,55 +127,144 @@ class SSHLoggerBase(NodeLoggerBase):
             self._retrieve_journal(since=read_from_timestamp)
             read_from_timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
 
-    def _wait_ssh_up(self, verbose=True, timeout=500):
-        text = None
-        if verbose:
-            text = '%s: Waiting for SSH to be up' % self
-        wait.wait_for(func=self._remoter.is_up, step=10, text=text, timeout=timeout, throw_exc=True)
 
-    def start(self):
-        self._child_process.start()
+class JournalCursorWatcher(StreamWatcher):
+    """Write journal lines to the log file in big batches, committing a batch when its cursor marker arrives.
 
-    def stop(self, timeout=None):
-        self._child_process.terminate()
-        self._child_process.join(timeout)
-        if self._child_process.is_alive():
-            self._child_process.kill()  # pylint: disable=no-member
+    Lines received after the last marker are dropped if the connection breaks.  The follower resumes after
+    the last committed cursor, so every journal entry is written exactly once.
+    """
+
+    def __init__(self, log_file: str, cursor_file: str, buffer_size: int = JOURNAL_LOG_BUFFER_SIZE):
+        super().__init__()
+        self.cursor_file = cursor_file
+        self.cursor = self.load_cursor(cursor_file)
+        self.len = 0
+        self._partial_line = ""
+        self._pending_lines: List[str] = []
+        # pylint: disable=consider-using-with
+        self.file_object = open(log_file, "a", encoding="utf-8", buffering=buffer_size)
+
+    @staticmethod
+    def load_cursor(cursor_file: str) -> Optional[str]:
+        try:
+            with open(cursor_file, encoding="utf-8") as cursor_file_obj:
+                return cursor_file_obj.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def reset(self) -> None:
+        """Drop everything which wasn't committed, should be called before each new run of the follower."""
+        self.len = 0
+        self._partial_line = ""
+        self._pending_lines.clear()
+
+    def submit(self, stream: str) -> list:
+        lines = (self._partial_line + stream[self.len:]).split("\n")
+        self.len = len(stream)
+        self._partial_line = lines.pop()
+        for line in lines:
+            self.submit_line(line + "\n")
+        return []
+
+    def submit_line(self, line: str):
+        if line.startswith(JOURNAL_CURSOR_MARKER):
+            self._commit(cursor=line[len(JOURNAL_CURSOR_MARKER):].strip())
+        else:
+            self._pending_lines.append(line)
+
+    def _commit(self, cursor: str) -> None:
+        self.file_object.write("".join(self._pending_lines))
+        self.file_object.flush()
+        self._pending_lines.clear()
+        self.cursor = cursor
+        with open(self.cursor_file, "w", encoding="utf-8") as cursor_file_obj:
+            cursor_file_obj.write(cursor)
+
+    def close(self) -> None:
+        self.file_object.close()
+
+
+class SSHJournalCursorLoggerBase(SSHNodeLoggerBase):
+    """Follow the journal by one long-lived `journalctl -f' and resume after the last written entry by its cursor.
 
+    The remote side converts JSON output of journalctl to text lines and after each chunk of entries it prints
+    a marker line with the cursor of the last entry.
+    """
+    @property
+    @abstractmethod
+    def _journalctl_cmd(self) -> str:
+        pass
+
+    @property
+    def _cursor_file(self) -> str:
+        return f"{self._target_log_file}.cursor"
 
-class SSHScyllaSystemdLogger(SSHLoggerBase):
     @staticmethod
-    def reformat_output_command(cmd):
+    def reformat_output_command(cmd: str) -> str:
         """
         Wrapping journalctl -f command with a python program
         that read a s json stream, and add the level/priority that
-        is missing from regular output
+        is missing from regular output.  Output is flushed by chunks, each chunk is followed by a cursor marker.
         """
         return dedent("""
             PYTHON_PROG="
-            import json,sys, datetime
+            import datetime, json, os, sys
 
             priorities = \\"emerg,alert,critical,error,warning,notice,info,debug\\"
-            prio_map = {{str(i) : str(prio).upper() for i, prio in enumerate(priorities.split(','))}}
-
-            for line in iter(sys.stdin.readline, b''):
-                d = json.loads(line)
-                o = str(datetime.datetime.fromtimestamp(int(d.get('__REALTIME_TIMESTAMP', '1000')) / 1000**2).isoformat(timespec='milliseconds'))
-                o += f\\" {{d.get('_HOSTNAME', 'unknown')}}\\"
-                o += f\\" !{{prio_map.get(d.get('PRIORITY', '7'), '???')}} |\\"
-                o += f\\" {{d.get('SYSLOG_IDENTIFIER', 'unknown')}}[{{d.get('_PID', '0')}}]:\\"
-                o += f\\" {{d.get('MESSAGE', '')}}\\"
-                print(o)
+            prio_map = {str(i) : str(prio).upper() for i, prio in enumerate(priorities.split(','))}
+
+            buf = b''
+            while True:
+                chunk = os.read(0, %(chunk_size)d)
+                if not chunk:
+                    break
+                *lines, buf = (buf + chunk).split(b'\\n')
+                out = []
+                for line in lines:
+                    d = json.loads(line)
+                    o = str(datetime.datetime.fromtimestamp(int(d.get('__REALTIME_TIMESTAMP', '1000')) / 1000**2).isoformat(timespec='milliseconds'))
+                    o += f\\" {d.get('_HOSTNAME', 'unknown')}\\"
+                    o += f\\" !{prio_map.get(d.get('PRIORITY', '7'), '???')} |\\"
+                    o += f\\" {d.get('SYSLOG_IDENTIFIER', 'unknown')}[{d.get('_PID', '0')}]:\\"
+                    o += f\\" {d.get('MESSAGE', '')}\\"
+                    out.append(o)
+                if out:
+                    out.append('%(marker)s' + d['__CURSOR'])
+                    sys.stdout.write('\\n'.join(out) + '\\n')
+                    sys.stdout.flush()
             "
-                      """
-                      f'{cmd} -o json | python3 -c "$PYTHON_PROG"'
-                      )
+                      """ % dict(chunk_size=JOURNAL_LOG_BUFFER_SIZE, marker=JOURNAL_CURSOR_MARKER)
+                      ) + f'{cmd} -o json | python3 -c "$PYTHON_PROG"'
+
+    def _follow_cmd(self, cursor: Optional[str]) -> str:
+        position = f"--after-cursor='{cursor}' " if cursor else ""
+        return self.reformat_output_command(f"{self._journalctl_cmd} -f --no-tail --no-pager --utc {position}")
+
+    @raise_event_on_failure
+    def _journal_thread(self):
+        self._remoter = RemoteCmdRunnerBase.create_remoter(**self._remoter_params)
+        watcher = JournalCursorWatcher(log_file=self._target_log_file, cursor_file=self._cursor_file)
+        try:
+            while not self._termination_event.is_set():
+                self._wait_ssh_up(verbose=False)
+                watcher.reset()
+                try:
+                    self._log.debug("Following the journal %s",
+                                    f"after cursor {watcher.cursor}" if watcher.cursor else "from the beginning")
+                    self._remoter.run(self._follow_cmd(cursor=watcher.cursor),
+                                      verbose=False, ignore_status=True, watchers=[watcher])
+                except Exception as details:  # pylint: disable=broad-except
+                    self._log.error('Error retrieving remote node journal: %s', details)
+        finally:
+            watcher.close()
+
 
+class SSHScyllaSystemdLogger(SSHJournalCursorLoggerBase):
     @property
-    def _logger_cmd(self) -> str:
-        return self.reformat_output_command(
-            f'{self.node.journalctl} -f --no-tail --no-pager '
-            '--utc {since} '
+    def _journalctl_cmd(self) -> str:
+        return (
+            f'{self.node.journalctl} '
             '-u scylla-ami-setup.service '
             '-u scylla-image-setup.service '
             '-u scylla-io-setup.service '
@@ -170,10 +286,10 @@ class SSHNonRootScyllaSystemdLogger(SSHLoggerBase):
         return f'mkdir -p ~/scylladb && touch {scylla_log_file} && tail -F {scylla_log_file}'
 
 
-class SSHGeneralSystemdLogger(SSHLoggerBase):
+class SSHGeneralSystemdLogger(SSHJournalCursorLoggerBase):
     @property
-    def _logger_cmd(self) -> str:
-        return 'sudo journalctl -f --no-tail --no-pager --utc {since} '
+    def _journalctl_cmd(self) -> str:
+        return 'sudo journalctl'
 
 
 class SSHScyllaFileLogger(SSHLoggerBase):
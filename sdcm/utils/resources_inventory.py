@@ -0,0 +1,308 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""Inventory of SCT resources in all clouds, collected concurrently into one tag-indexed snapshot."""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from collections import defaultdict
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
+
+import boto3
+from botocore.config import Config
+
+from sdcm.utils.common import (
+    ParallelObject,
+    all_aws_regions,
+    aws_tags_to_dict,
+    gce_meta_to_dict,
+    list_clusters_gke,
+    list_instances_gce,
+    list_resources_docker,
+    EksCluster,
+)
+from sdcm.utils.lookup_cache import LOOKUP_CACHE_DIR
+
+LOGGER = logging.getLogger(__name__)
+
+PROVIDERS = ("aws", "eks", "gce", "gke", "docker", )
+RESOURCES_SNAPSHOT_FILE = LOOKUP_CACHE_DIR / "resources-snapshot.json"
+
+# Client-side rate limiting and retries on throttling errors (token bucket inside of botocore.)
+AWS_CLIENT_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": 10})
+
+
+@dataclass
+class InventoryItem:  # pylint: disable=too-many-instance-attributes
+    """Normalized resource.  `raw' is an SDK object, it's available for freshly collected snapshots only."""
+    provider: str
+    kind: str
+    id: str  # pylint: disable=invalid-name
+    name: str = "N/A"
+    region: str = "N/A"
+    state: str = "N/A"
+    public_ip: str = "N/A"
+    created: str = "N/A"
+    tags: dict[str, str] = field(default_factory=dict)
+    extra: dict[str, str] = field(default_factory=dict)
+    raw: Any = field(default=None, repr=False, compare=False)
+
+    @property
+    def index_keys(self) -> set[tuple[str, str]]:
+        if self.kind == "cluster":
+            # K8S clusters match any filter by NodeType=k8s (see `filter_k8s_clusters_by_tags()'.)
+            return {(key, value) for key, value in self.tags.items() if key != "NodeType"} | {("NodeType", "k8s")}
+        return set(self.tags.items())
+
+    def to_dict(self) -> dict:
+        return {key: value for key, value in asdict(self).items() if key != "raw"}
+
+
+class ResourcesSnapshot:
+    """Resources of all providers indexed by tags.
+
+    `errors' contains providers (and regions) failed to be listed, i.e., resources of such providers can be missing.
+    """
+
+    def __init__(self, items: Iterable[InventoryItem], created_at: Optional[float] = None,
+                 errors: Optional[dict[str, str]] = None):
+        self.items = list(items)
+        self.created_at = time.time() if created_at is None else created_at
+        self.errors = errors or {}
+        self._index = defaultdict(set)
+        for idx, item in enumerate(self.items):
+            for key in item.index_keys:
+                self._index[key].add(idx)
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.created_at
+
+    def covers(self, provider: str) -> bool:
+        """Check if all resources of the provider were collected."""
+        return not any(key == provider or key.startswith(f"{provider}:") for key in self.errors)
+
+    # pylint: disable=too-many-arguments
+    def filter(self, tags_dict: Optional[dict] = None, provider: Optional[str] = None, kind: Optional[str] = None,
+               running: bool = False) -> list[InventoryItem]:
+        if tags_dict:
+            candidates = set.intersection(*(self._index.get((str(key), str(value)), set())
+                                            for key, value in tags_dict.items()))
+            items = [self.items[idx] for idx in sorted(candidates)]
+        else:
+            items = self.items
+        return [item for item in items
+                if (provider is None or item.provider == provider)
+                and (kind is None or item.kind == kind)
+                and (not running or item.kind not in ("instance", "container", ) or item.state == "running")]
+
+    def get_raw(self, provider: str, kind: str, tags_dict: Optional[dict] = None,
+                group_by_region: bool = False) -> list | dict[str, list]:
+        """Return SDK objects in the same form as `sdcm.utils.common.list_*()' functions do."""
+        raw = {}
+        for item in self.filter(tags_dict=tags_dict, provider=provider, kind=kind):
+            if item.raw is None:
+                raise ValueError("The snapshot has no SDK objects, it was loaded from a file")
+            raw.setdefault(item.region, {})[id(item.raw)] = item.raw  # same Docker image can be there many times
+        if group_by_region:
+            return {region: list(objects.values()) for region, objects in raw.items()}
+        return [obj for objects in raw.values() for obj in objects.values()]
+
+    def save(self, path: Path = RESOURCES_SNAPSHOT_FILE) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False,
+                                         encoding="utf-8") as tmp_file:
+            json.dump({"created_at": self.created_at,
+                       "errors": self.errors,
+                       "items": [item.to_dict() for item in self.items]}, tmp_file)
+        os.replace(tmp_file.name, path)
+        LOGGER.debug("Resources snapshot with %d items saved to %s", len(self.items), path)
+
+    @classmethod
+    def load(cls, path: Path = RESOURCES_SNAPSHOT_FILE, max_age: Optional[float] = None) -> Optional[ResourcesSnapshot]:
+        """Load a snapshot from the file.  Return None if there is no file or the snapshot is older than `max_age'."""
+        try:
+            with Path(path).open(encoding="utf-8") as snapshot_file:
+                data = json.load(snapshot_file)
+            snapshot = cls(items=[InventoryItem(**item) for item in data["items"]],
+                           created_at=data["created_at"], errors=data["errors"])
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            LOGGER.debug("Unable to load resources snapshot from %s: %s", path, exc)
+            return None
+        if max_age is not None and snapshot.age > max_age:
+            LOGGER.debug("Resources snapshot in %s is too old (%.0f seconds)", path, snapshot.age)
+            return None
+        return snapshot
+
+
+def aws_client(service: str, region: str):
+    # The default boto3 session is not thread-safe, so each listing creates its client from a new session.
+    return boto3.session.Session().client(service, region_name=region, config=AWS_CLIENT_CONFIG)
+
+
+class ResourcesInventory:
+    """Collect resources of all providers and all AWS regions concurrently.
+
+    Each provider has own limit of concurrent API calls (`max_concurrency'), so slow one doesn't starve others.
+    If `tags_dict' is provided, it's used to filter resources on server side where it's possible.
+
+    Usage::
+
+        snapshot = ResourcesInventory(tags_dict={"RunByUser": "vasya.pupkin"}).collect()
+        for item in snapshot.filter(tags_dict={"TestId": test_id}, provider="aws", kind="instance"):
+            print(item.name, item.region, item.state)
+    """
+
+    max_concurrency: dict[str, int] = {"aws": 8, "eks": 4, "gce": 1, "gke": 1, "docker": 1, }
+
+    def __init__(self, providers: Iterable[str] = PROVIDERS, tags_dict: Optional[dict] = None, verbose: bool = False):
+        self.providers = tuple(providers)
+        self.tags_dict = tags_dict
+        self.log = LOGGER.info if verbose else LOGGER.debug
+        self._limits = {provider: threading.BoundedSemaphore(limit) for provider, limit in self.max_concurrency.items()}
+        self._items: list[InventoryItem] = []
+        self._errors: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def _aws_filters(self) -> list[dict]:
+        return [{"Name": f"tag:{key}", "Values": [str(value)]} for key, value in (self.tags_dict or {}).items()]
+
+    def _run(self, provider: str, scope: str, func: Callable[[], list[InventoryItem]]) -> None:
+        key = f"{provider}:{scope}" if scope else provider
+        started = time.perf_counter()
+        try:
+            with self._limits[provider]:
+                items = func()
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.error("Failed to list resources of `%s': %s", key, exc)
+            with self._lock:
+                self._errors[key] = str(exc)
+            return
+        with self._lock:
+            self._items.extend(items)
+        self.log("%s: found %d resources in %.1fs", key, len(items), time.perf_counter() - started)
+
+    def _list_aws_instances(self, region: str) -> list[InventoryItem]:
+        client = aws_client("ec2", region)
+        items = []
+        for page in client.get_paginator("describe_instances").paginate(Filters=self._aws_filters):
+            for reservation in page["Reservations"]:
+                for instance in reservation["Instances"]:
+                    if instance["State"]["Name"] == "terminated":
+                        continue
+                    tags = aws_tags_to_dict(instance.get("Tags"))
+                    items.append(InventoryItem(
+                        provider="aws", kind="instance", id=instance["InstanceId"], name=tags.get("Name", "N/A"),
+                        region=region, state=instance["State"]["Name"],
+                        public_ip=instance.get("PublicIpAddress", "N/A"), created=instance["LaunchTime"].isoformat(),
+                        tags=tags, extra={"availability_zone": instance["Placement"]["AvailabilityZone"],
+                                          "instance_type": instance.get("InstanceType", "N/A")},
+                        raw=instance))
+        return items
+
+    def _list_aws_elastic_ips(self, region: str) -> list[InventoryItem]:
+        client = aws_client("ec2", region)
+        return [InventoryItem(provider="aws", kind="elastic_ip", id=eip["AllocationId"], region=region,
+                              state="associated" if eip.get("AssociationId") else "available",
+                              public_ip=eip["PublicIp"], tags=aws_tags_to_dict(eip.get("Tags")),
+                              extra={"instance_id": eip.get("InstanceId", "N/A")}, raw=eip)
+                for eip in client.describe_addresses(Filters=self._aws_filters)["Addresses"]]
+
+    @staticmethod
+    def _list_eks_clusters(region: str) -> list[InventoryItem]:
+        client = aws_client("eks", region)
+        items = []
+        for page in client.get_paginator("list_clusters").paginate():
+            for cluster_name in page["clusters"]:
+                cluster = EksCluster(cluster_name, region)
+                items.append(InventoryItem(
+                    provider="eks", kind="cluster", id=cluster.body.get("arn", cluster_name), name=cluster_name,
+                    region=region, state=cluster.body.get("status", "N/A"), created=cluster.create_time.isoformat(),
+                    tags=gce_meta_to_dict(cluster.extra["metadata"]), raw=cluster))
+        return items
+
+    def _list_gce_instances(self) -> list[InventoryItem]:
+        return [InventoryItem(provider="gce", kind="instance", id=str(instance.id), name=instance.name,
+                              region=instance.extra["zone"].name, state=str(instance.state),
+                              public_ip=", ".join(instance.public_ips) if None not in instance.public_ips else "N/A",
+                              created=instance.extra["creationTimestamp"],
+                              tags=gce_meta_to_dict(instance.extra["metadata"]), raw=instance)
+                for instance in list_instances_gce(tags_dict=self.tags_dict)]
+
+    def _list_gke_clusters(self) -> list[InventoryItem]:
+        return [InventoryItem(provider="gke", kind="cluster", id=cluster.name, name=cluster.name, region=cluster.zone,
+                              state=cluster.cluster_info.get("status", "N/A"),
+                              created=cluster.cluster_info.get("createTime", "N/A"),
+                              tags=gce_meta_to_dict(cluster.extra["metadata"]), raw=cluster)
+                for cluster in list_clusters_gke(tags_dict=self.tags_dict)]
+
+    def _list_docker_resources(self) -> list[InventoryItem]:
+        resources = list_resources_docker(tags_dict=self.tags_dict, group_as_builder=True)
+        containers = [(builder, container)
+                      for builder, builder_containers in resources["containers"].items()
+                      for container in builder_containers]
+        # Containers are listed in sparse mode, get all attributes for all of them at once.
+        ParallelObject([container for _, container in containers], timeout=60, num_workers=16,
+                       disable_logging=True).run(lambda container: container.reload(), ignore_exceptions=True)
+        items = [InventoryItem(provider="docker", kind="container", id=container.id, name=container.name,
+                               region=builder, state=container.status,
+                               public_ip=container.attrs.get("NetworkSettings", {}).get("IPAddress") or "N/A",
+                               created=container.attrs.get("Created", "N/A"), tags=dict(container.labels or {}),
+                               raw=container)
+                 for builder, container in containers]
+        for builder, images in resources["images"].items():
+            for image in images:
+                items.extend(InventoryItem(provider="docker", kind="image", id=image.id, name=tag, region=builder,
+                                           created=image.attrs.get("Created", "N/A"), tags=dict(image.labels or {}),
+                                           raw=image)
+                             for tag in image.tags or ["<none>"])
+        return items
+
+    def collect(self) -> ResourcesSnapshot:
+        started = time.perf_counter()
+        workers = sum(self.max_concurrency[provider] for provider in self.providers)
+        with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="ResourcesInventory") as executor:
+            for provider, func in (("gce", self._list_gce_instances),
+                                   ("gke", self._list_gke_clusters),
+                                   ("docker", self._list_docker_resources), ):
+                if provider in self.providers:
+                    executor.submit(self._run, provider, "", func)
+            if "aws" in self.providers or "eks" in self.providers:
+                try:
+                    aws_regions = all_aws_regions()
+                except Exception as exc:  # pylint: disable=broad-except
+                    LOGGER.error("Failed to get list of AWS regions: %s", exc)
+                    aws_regions = []
+                    with self._lock:
+                        self._errors.update(dict.fromkeys(set(self.providers) & {"aws", "eks"}, str(exc)))
+                for region in aws_regions:
+                    if "aws" in self.providers:
+                        executor.submit(self._run, "aws", f"instances:{region}",
+                                        lambda region=region: self._list_aws_instances(region))
+                        executor.submit(self._run, "aws", f"elastic_ips:{region}",
+                                        lambda region=region: self._list_aws_elastic_ips(region))
+                    if "eks" in self.providers:
+                        executor.submit(self._run, "eks", region, lambda region=region: self._list_eks_clusters(region))
+        self.log("Found %d resources in %.1fs", len(self._items), time.perf_counter() - started)
+        return ResourcesSnapshot(items=self._items, errors=self._errors)
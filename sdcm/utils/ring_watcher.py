@@ -0,0 +1,208 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""Watch ring state of a cluster using one long-lived CQL session instead of polling `nodetool status'.
+
+The watcher is registered as a host state listener of the driver, so topology and status change pushes wake it up
+immediately.  The ring itself is read from `system.cluster_status' (or `system.peers' and `system.local' with
+up/down state from the driver metadata for Scylla versions without this table) on each push and periodically.
+
+State of a node is in `nodetool status' format: `UN', `DN', `UJ', etc., keyed by broadcast address of the node.
+"""
+
+import time
+import logging
+import threading
+from typing import Callable, Dict, Iterable, Optional
+
+from cassandra import InvalidRequest
+from cassandra.policies import HostStateListener
+
+LOGGER = logging.getLogger(__name__)
+
+RING_REFRESH_INTERVAL = 5
+RING_STALE_TIMEOUT = 60
+RING_CONNECT_RETRY_DELAY = 60
+
+STATUS_CODES = {
+    "NORMAL": "N",
+    "JOINING": "J",
+    "LEAVING": "L",
+    "MOVING": "M",
+}
+
+
+class RingStateWatcherError(Exception):
+    pass
+
+
+class RingStateTimeout(RingStateWatcherError):
+    pass
+
+
+def node_state(up: bool, status: Optional[str]) -> str:
+    return ("U" if up else "D") + STATUS_CODES.get((status or "").upper(), "?")
+
+
+class RingStateWatcher(HostStateListener):
+    """Ring state of a cluster as seen by the coordinator of a CQL session.
+
+    `connect' is a callable which returns `ScyllaCQLSession'.  The session is opened by `start()' and closed
+    by `close()'.
+    """
+
+    def __init__(self, connect: Callable, refresh_interval: float = RING_REFRESH_INTERVAL,
+                 stale_timeout: float = RING_STALE_TIMEOUT):
+        self._connect = connect
+        self.refresh_interval = refresh_interval
+        self.stale_timeout = stale_timeout
+        self.ring: Dict[str, str] = {}
+        self.last_refresh: Optional[float] = None
+        self.last_error: Optional[Exception] = None
+        self._scylla_session = None
+        self._session = None
+        self._cluster_status_supported = True
+        self._rpc_addresses: Dict[str, str] = {}
+        self._condition = threading.Condition()
+        self._changed = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def is_stale(self) -> bool:
+        return self.last_refresh is None or time.monotonic() - self.last_refresh > self.stale_timeout
+
+    def start(self) -> "RingStateWatcher":
+        self._scylla_session = self._connect()
+        self._session = self._scylla_session.session
+        self._scylla_session.cluster.register_listener(self)
+        self.refresh()
+        self._thread = threading.Thread(target=self._run, name="RingStateWatcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._changed.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.refresh_interval * 2)
+            self._thread = None
+        if self._scylla_session is not None:
+            self._scylla_session.cluster.unregister_listener(self)
+            self._scylla_session.cluster.shutdown()
+            self._scylla_session = self._session = None
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._changed.wait(timeout=self.refresh_interval)
+            self._changed.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self.refresh()
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.debug("Failed to refresh ring state: %s", exc)
+                with self._condition:
+                    self.last_error = exc
+                    self._condition.notify_all()
+
+    def refresh(self) -> Dict[str, str]:
+        """Read the ring from system tables and wake up all waiters."""
+        ring = None
+        if self._cluster_status_supported:
+            try:
+                ring = self._read_cluster_status()
+            except InvalidRequest:
+                LOGGER.debug("`system.cluster_status' is not supported, use `system.peers' to get ring state")
+                self._cluster_status_supported = False
+        if ring is None:
+            ring = self._read_peers()
+        with self._condition:
+            self.ring = ring
+            self.last_refresh = time.monotonic()
+            self.last_error = None
+            self._condition.notify_all()
+        return ring
+
+    def _read_cluster_status(self) -> Dict[str, str]:
+        rows = self._session.execute("SELECT peer, up, status FROM system.cluster_status")
+        return {str(row.peer): node_state(up=row.up, status=row.status) for row in rows}
+
+    def _read_peers(self) -> Dict[str, str]:
+        hosts_up = {str(host.address): host.is_up for host in self._scylla_session.cluster.metadata.all_hosts()}
+        rows = [(row.broadcast_address, row.rpc_address, row.tokens) for row in self._session.execute(
+            "SELECT broadcast_address, rpc_address, tokens FROM system.local")]
+        rows.extend((row.peer, row.rpc_address, row.tokens) for row in self._session.execute(
+            "SELECT peer, rpc_address, tokens FROM system.peers"))
+        ring = {}
+        for peer, rpc_address, tokens in rows:
+            self._rpc_addresses[str(rpc_address)] = str(peer)
+            ring[str(peer)] = node_state(up=bool(hosts_up.get(str(rpc_address))),
+                                         status="NORMAL" if tokens else "JOINING")
+        return ring
+
+    def get_state(self, address: str) -> Optional[str]:
+        with self._condition:
+            return self.ring.get(address)
+
+    def await_state(self, addresses: Iterable[str], state: Optional[str] = "UN", timeout: float = 300) -> None:
+        """Wait until all `addresses' are in the `state' (or not in the ring at all if `state' is None.)
+
+        Raise `RingStateTimeout' if it's not reached in `timeout' seconds and `RingStateWatcherError' if the ring
+        state wasn't refreshed for `stale_timeout' seconds, i.e., the watcher is not reliable anymore.
+        """
+        addresses = list(addresses)
+        deadline = time.monotonic() + timeout
+
+        def not_ready():
+            return [address for address in addresses if self.ring.get(address) != state]
+
+        self._changed.set()  # ask for a fresh ring state, pushes could be lost
+        with self._condition:
+            while pending := not_ready():
+                if not self.is_running:
+                    raise RingStateWatcherError("ring state watcher is not running")
+                if self.is_stale:
+                    raise RingStateWatcherError(f"ring state is stale, last error: {self.last_error}")
+                if (time_left := deadline - time.monotonic()) <= 0:
+                    raise RingStateTimeout(
+                        f"{', '.join(f'{address} ({self.ring.get(address)})' for address in pending)} "
+                        f"didn't reach {state} state in {timeout} s")
+                self._condition.wait(timeout=min(time_left, self.refresh_interval))
+
+    def _on_host_change(self, host, up: Optional[bool] = None) -> None:
+        if up is not None and (peer := self._rpc_addresses.get(str(host.address))):
+            with self._condition:
+                if (state := self.ring.get(peer)) is not None:
+                    self.ring[peer] = ("U" if up else "D") + state[1:]
+                    self._condition.notify_all()
+        self._changed.set()
+
+    def on_up(self, host):
+        self._on_host_change(host, up=True)
+
+    def on_down(self, host):
+        self._on_host_change(host, up=False)
+
+    def on_add(self, host):
+        self._on_host_change(host)
+
+    def on_remove(self, host):
+        self._on_host_change(host)
+
+
+__all__ = ("RingStateWatcher", "RingStateWatcherError", "RingStateTimeout", "RING_CONNECT_RETRY_DELAY", )
@@ -0,0 +1,202 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""Node setup as a graph of steps with checkpoints stored on the node.
+
+Each step declares steps it requires, inputs its result depends on and, optionally, a probe which checks that the
+result is in place.  Finished steps are recorded in `STEPS_CHECKPOINT_PATH' on the node, so a rerun of the setup
+(after a failure or for a reused cluster) skips them.  Steps which don't depend on each other run concurrently,
+unless they use the same resource (e.g., a package manager.)
+"""
+
+import json
+import time
+import base64
+import hashlib
+import logging
+import os.path
+import threading
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait as wait_for_futures
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+STEPS_CHECKPOINT_PATH = "/var/lib/sct/steps.json"
+STEPS_PARALLELISM = 4
+PACKAGE_MANAGER = "package_manager"
+SCYLLA_CONFIG = "scylla_config"  # scylla.yaml and other Scylla config files
+
+
+class SetupStepError(Exception):
+    def __init__(self, node, step: "SetupStep", error: Exception):
+        super().__init__(f"{node}: setup step `{step.name}' failed: {error}")
+        self.step = step
+
+
+@dataclass
+class SetupStep:
+    """A step of a node setup.
+
+    `requires' are names of steps which should be finished before this one, `inputs' are values its result depends
+    on (a finished step runs again if they are changed), `probe' returns False if the result of the step is not in
+    place anymore.  Steps with the same `resources' never run concurrently.  Steps with `checkpoint=False' run always.
+    """
+    name: str
+    func: Callable[[], Any]
+    requires: Tuple[str, ...] = ()
+    inputs: Dict[str, Any] = field(default_factory=dict)
+    probe: Optional[Callable[[], bool]] = None
+    resources: Tuple[str, ...] = ()
+    checkpoint: bool = True
+
+    @property
+    def inputs_hash(self) -> str:
+        return hashlib.sha1(json.dumps(self.inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class SetupStepsRunner:
+    """Run setup steps of a node which are not finished according to the checkpoint."""
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 node,
+                 steps: Iterable[SetupStep],
+                 checkpoint_path: str = STEPS_CHECKPOINT_PATH,
+                 parallelism: int = STEPS_PARALLELISM,
+                 check_inputs: bool = True):
+        self.node = node
+        self.steps = list(steps)
+        self.checkpoint_path = checkpoint_path
+        self.parallelism = parallelism
+        self.check_inputs = check_inputs
+        self.durations: Dict[str, float] = {}
+        self.skipped: List[str] = []
+        self._checkpoint: Optional[Dict[str, dict]] = None
+        self._lock = threading.Lock()
+        self._validate()
+
+    def _validate(self) -> None:
+        names = [step.name for step in self.steps]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate setup steps: {names}")
+        ordered = set()
+        for step in self.steps:  # steps should be listed after steps they require, so there can't be a cycle
+            if missing := set(step.requires) - ordered:
+                raise ValueError(f"Setup step `{step.name}' requires unknown or following steps: {sorted(missing)}")
+            ordered.add(step.name)
+
+    @property
+    def checkpoint(self) -> Dict[str, dict]:
+        """Finished steps (name -> record) loaded from the node."""
+        if self._checkpoint is None:
+            data = {}
+            result = self.node.remoter.sudo(f"cat {self.checkpoint_path}", ignore_status=True, verbose=False)
+            if result.ok:
+                try:
+                    data = json.loads(result.stdout)
+                except ValueError:
+                    LOGGER.warning("%s: broken setup steps checkpoint, ignore it", self.node)
+            if data and data.get("node") != self.node.name:
+                LOGGER.warning("%s: setup steps checkpoint is for node %s, ignore it", self.node, data.get("node"))
+                data = {}
+            self._checkpoint = data.get("steps", {})
+        return self._checkpoint
+
+    def _save_checkpoint(self) -> None:
+        content = json.dumps({"node": self.node.name, "steps": self.checkpoint}, indent=2, sort_keys=True)
+        encoded = base64.b64encode(content.encode()).decode()
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        self.node.remoter.sudo(f"bash -c 'mkdir -p {os.path.dirname(self.checkpoint_path)} && "
+                               f"echo {encoded} | base64 -d > {tmp_path} && mv -f {tmp_path} {self.checkpoint_path}'",
+                               verbose=False)
+
+    def is_finished(self, step: SetupStep) -> bool:
+        if not step.checkpoint or (record := self.checkpoint.get(step.name)) is None:
+            return False
+        if self.check_inputs and record.get("inputs") != step.inputs_hash:
+            LOGGER.info("%s: inputs of setup step `%s' are changed", self.node, step.name)
+            return False
+        if step.probe is not None:
+            try:
+                if not step.probe():
+                    LOGGER.info("%s: result of setup step `%s' is not in place", self.node, step.name)
+                    return False
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("%s: probe of setup step `%s' failed: %s", self.node, step.name, exc)
+                return False
+        return True
+
+    def _run_step(self, step: SetupStep) -> None:
+        if step.checkpoint and step.name in self.checkpoint:
+            with self._lock:
+                del self.checkpoint[step.name]
+                self._save_checkpoint()
+        LOGGER.info("%s: run setup step `%s'", self.node, step.name)
+        started = time.perf_counter()
+        step.func()
+        duration = self.durations[step.name] = time.perf_counter() - started
+        LOGGER.info("%s: setup step `%s' finished in %.1f s", self.node, step.name, duration)
+        if step.checkpoint:
+            with self._lock:
+                self.checkpoint[step.name] = {"inputs": step.inputs_hash, "duration": round(duration, 1),
+                                              "finished_at": time.time()}
+                self._save_checkpoint()
+
+    def run(self) -> Dict[str, float]:  # pylint: disable=too-many-branches
+        """Run steps which are not finished yet, independent ones concurrently.  Return durations of steps run.
+
+        A finished step is skipped if none of its required steps ran again.  After a failure no new steps are
+        started and SetupStepError is raised when running steps are done.
+        """
+        pending = {step.name: step for step in self.steps}
+        finished = set()
+        rerun = set()
+        running = {}
+        busy_resources = set()
+        error = None
+        with ThreadPoolExecutor(max_workers=self.parallelism,
+                                thread_name_prefix=f"SetupSteps-{self.node.name}") as executor:
+            while pending or running:
+                for step in list(pending.values()) if error is None else ():
+                    if not finished.issuperset(step.requires) or busy_resources.intersection(step.resources):
+                        continue
+                    del pending[step.name]
+                    if not rerun.intersection(step.requires) and self.is_finished(step):
+                        LOGGER.info("%s: skip finished setup step `%s'", self.node, step.name)
+                        self.skipped.append(step.name)
+                        finished.add(step.name)
+                        continue
+                    busy_resources.update(step.resources)
+                    running[executor.submit(self._run_step, step)] = step
+                if not running:
+                    if error is not None or not pending:
+                        break
+                    continue  # some steps were skipped, steps which require them can be ready now
+                done, _ = wait_for_futures(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    busy_resources.difference_update(step.resources)
+                    if exc := future.exception():
+                        error = error or SetupStepError(self.node, step, exc)
+                        error.__cause__ = error.__cause__ or exc
+                        continue
+                    finished.add(step.name)
+                    if step.checkpoint:
+                        rerun.add(step.name)
+        if error is not None:
+            raise error
+        return self.durations
+
+
+__all__ = ("SetupStep", "SetupStepsRunner", "SetupStepError", "STEPS_CHECKPOINT_PATH", "PACKAGE_MANAGER",
+           "SCYLLA_CONFIG", )
@@ -0,0 +1,196 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+"""
+Per-node inventory of SSTables stored in Scylla data directories.
+
+The inventory lists all table directories with one remote call and rescans only directories which mtime
+was changed since the previous refresh, so picking a random SSTable is cheap even on nodes with a lot of them.
+"""
+
+import logging
+import random
+import re
+import shlex
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+SCYLLA_DATA_DIR = "/var/lib/scylla/data"
+
+# Data file names look like:
+#   mc-220-big-Data.db                       (mc/md/me formats, numeric generation)
+#   me-3g7a_0s8o_2lx0g2dn4ei3n2t3hk-big-Data.db  (UUID generation)
+#   system-truncated-ka-7-Data.db            (old ka format, with keyspace and table name in the file name)
+SSTABLE_DATA_FILE_RE = re.compile(
+    r"^(?P<prefix>(?:[^-]+-[^-]+-)?(?P<version>[a-z]{2})-(?P<generation>[^-]+))-(?:(?P<format>[a-z]+)-)?Data\.db$")
+
+
+class Sstable(NamedTuple):
+    table: str  # as `keyspace.table'
+    directory: str
+    version: str
+    generation: str
+    sstable_format: str
+    prefix: str  # file name without component and format, i.e., `mc-220' or `system-truncated-ka-7'
+
+    @property
+    def data_file(self) -> str:
+        return f"{self.directory}/{self.prefix}-{self.sstable_format + '-' if self.sstable_format else ''}Data.db"
+
+    @property
+    def files_pattern(self) -> str:
+        """Shell pattern which matches all components of the SSTable."""
+        return f"{self.directory}/{self.prefix}-*"
+
+
+def parse_sstable_data_file_name(file_name: str) -> Optional[Tuple[str, str, str, str]]:
+    """Return (prefix, version, generation, format) for an SSTable Data file name or None if it doesn't match."""
+    if match := SSTABLE_DATA_FILE_RE.match(file_name):
+        return match.group("prefix"), match.group("version"), match.group("generation"), match.group("format") or ""
+    return None
+
+
+def table_name_from_directory(directory: str) -> str:
+    """Convert `/var/lib/scylla/data/keyspace1/standard1-<uuid>' to `keyspace1.standard1'."""
+    keyspace, table_dir = directory.rstrip("/").rsplit("/", 2)[-2:]
+    return f"{keyspace}.{table_dir.rsplit('-', 1)[0]}"
+
+
+class _TableDirectory:
+    __slots__ = ("directory", "table", "mtime", "sstables", )
+
+    def __init__(self, directory: str, mtime: str):
+        self.directory = directory
+        self.table = table_name_from_directory(directory)
+        self.mtime = mtime
+        # prefix -> (version, generation, format)
+        self.sstables: Dict[str, Tuple[str, str, str]] = {}
+
+
+class SstableInventory:
+    """Cached index of SSTables on a node, refreshed incrementally by table directory mtime.
+
+    Usage::
+
+        inventory = node.sstable_inventory
+        inventory.refresh()
+        sstable = inventory.choose_random_sstable(tables=["keyspace1.standard1"])
+        node.remoter.sudo(f"rm -f {sstable.files_pattern}")
+    """
+
+    # When more directories than this changed, list the whole data directory instead of passing paths in command line.
+    FULL_RESCAN_THRESHOLD = 200
+
+    def __init__(self, node, data_dir: str = SCYLLA_DATA_DIR):
+        self.node = node
+        self.data_dir = data_dir.rstrip("/")
+        self._directories: Dict[str, _TableDirectory] = {}
+        self._lock = threading.RLock()
+        self.log = LOGGER
+
+    def _list_directories(self) -> Dict[str, str]:
+        result = self.node.remoter.sudo(
+            f"find {shlex.quote(self.data_dir)} -mindepth 2 -maxdepth 2 -type d -printf '%T@ %p\\n'",
+            ignore_status=True, verbose=False)
+        directories = {}
+        for line in result.stdout.splitlines():
+            mtime, _, directory = line.strip().partition(" ")
+            if directory:
+                directories[directory] = mtime
+        return directories
+
+    def _list_data_files(self, directories: Optional[List[str]] = None) -> List[Tuple[str, str]]:
+        if directories is None:
+            cmd = (f"find {shlex.quote(self.data_dir)} -mindepth 3 -maxdepth 3 -type f -name '*-Data.db' "
+                   "-printf '%h %f\\n'")
+        else:
+            paths = " ".join(shlex.quote(directory) for directory in directories)
+            cmd = f"find {paths} -maxdepth 1 -type f -name '*-Data.db' -printf '%h %f\\n'"
+        result = self.node.remoter.sudo(cmd, ignore_status=True, verbose=False)
+        files = []
+        for line in result.stdout.splitlines():
+            directory, _, file_name = line.strip().rpartition(" ")
+            if directory:
+                files.append((directory, file_name))
+        return files
+
+    def refresh(self) -> None:
+        """Update the index by rescanning only new or changed table directories."""
+        with self._lock:
+            current = self._list_directories()
+            for directory in set(self._directories) - set(current):
+                del self._directories[directory]
+
+            changed = [directory for directory, mtime in current.items()
+                       if directory not in self._directories or self._directories[directory].mtime != mtime]
+            if not changed:
+                return
+
+            for directory in changed:
+                self._directories[directory] = _TableDirectory(directory=directory, mtime=current[directory])
+            if len(changed) > self.FULL_RESCAN_THRESHOLD:
+                changed_set = set(changed)
+                files = [(directory, file_name) for directory, file_name in self._list_data_files()
+                         if directory in changed_set]
+            else:
+                files = self._list_data_files(directories=changed)
+
+            for directory, file_name in files:
+                parsed = parse_sstable_data_file_name(file_name)
+                if parsed is None:
+                    self.log.debug("File name `%s' is not as expected for Scylla data files", file_name)
+                    continue
+                prefix, version, generation, sstable_format = parsed
+                self._directories[directory].sstables[prefix] = (version, generation, sstable_format)
+            self.log.debug("SSTable inventory of %s: rescanned %d of %d table directories",
+                           self.node, len(changed), len(current))
+
+    def invalidate(self, directory: Optional[str] = None) -> None:
+        """Force rescan of a directory (or of all directories) on the next refresh."""
+        with self._lock:
+            if directory is None:
+                self._directories.clear()
+            else:
+                self._directories.pop(directory.rstrip("/"), None)
+
+    @property
+    def tables(self) -> List[str]:
+        """Tables which have at least one SSTable."""
+        with self._lock:
+            return sorted({entry.table for entry in self._directories.values() if entry.sstables})
+
+    def get_sstables(self, table: Optional[str] = None) -> List[Sstable]:
+        with self._lock:
+            return [Sstable(table=entry.table, directory=directory, version=version, generation=generation,
+                            sstable_format=sstable_format, prefix=prefix)
+                    for directory, entry in self._directories.items() if table is None or entry.table == table
+                    for prefix, (version, generation, sstable_format) in entry.sstables.items()]
+
+    def count(self, table: Optional[str] = None) -> int:
+        with self._lock:
+            return sum(len(entry.sstables) for entry in self._directories.values()
+                       if table is None or entry.table == table)
+
+    def choose_random_sstable(self, tables: Optional[List[str]] = None) -> Optional[Sstable]:
+        """Pick a random SSTable of one of the given tables (or of any table) without running remote commands."""
+        with self._lock:
+            candidates = [entry for entry in self._directories.values()
+                          if entry.sstables and (tables is None or entry.table in tables)]
+            if not candidates:
+                return None
+            entry = random.choice(candidates)
+            prefix = random.choice(list(entry.sstables))
+            version, generation, sstable_format = entry.sstables[prefix]
+            return Sstable(table=entry.table, directory=entry.directory, version=version,
+                           generation=generation, sstable_format=sstable_format, prefix=prefix)
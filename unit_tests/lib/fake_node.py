@@ -0,0 +1,51 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+from types import SimpleNamespace
+from typing import List
+
+
+def fake_result(stdout: str = "", ok: bool = True, stderr: str = "") -> SimpleNamespace:
+    return SimpleNamespace(stdout=stdout, stderr=stderr, ok=ok, exited=0 if ok else 1)
+
+
+class FakeRemoter:
+    """Remoter which records all commands and answers them by `respond()'.
+
+    `sudo()' is the same as `run()', override `respond()' to emulate commands used by the code under test.
+    """
+
+    def __init__(self):
+        self.commands: List[str] = []
+
+    def respond(self, cmd: str) -> SimpleNamespace:  # pylint: disable=unused-argument,no-self-use
+        return fake_result()
+
+    def run(self, cmd: str, **_) -> SimpleNamespace:
+        self.commands.append(cmd)
+        return self.respond(cmd)
+
+    def sudo(self, cmd: str, **kwargs) -> SimpleNamespace:
+        return self.run(cmd, **kwargs)
+
+
+class FakeNode:  # pylint: disable=too-few-public-methods
+    """Node with a name and a remoter only, other attributes required by a test can be passed as kwargs."""
+
+    def __init__(self, name: str = "node-1", remoter=None, **attributes):
+        self.name = name
+        self.remoter = FakeRemoter() if remoter is None else remoter
+        self.__dict__.update(attributes)
+
+    def __str__(self):
+        return self.name
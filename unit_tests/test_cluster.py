@@ -48,7 +48,10 @@ class DummyDbCluster(BaseCluster):  # pylint: disable=abstract-method
 
 
 class DummyDbLogReader(DbLogReader):
-    def get_scylla_debuginfo_file(self):
+    def get_scylla_build_id(self):
+        return None
+
+    def get_scylla_debuginfo_file(self, build_id=None):
         return "scylla_debug_info_file"
 
 
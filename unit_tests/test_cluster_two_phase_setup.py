@@ -0,0 +1,95 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import time
+import logging
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sdcm.cluster import NodeSetupFailed, NodeSetupTimeout, setup_nodes_in_two_phases
+from unit_tests.lib.fake_node import FakeNode
+
+
+def db_node(name):
+    return FakeNode(name, argus_resource_set_shards=lambda: None)
+
+
+class FakeCluster:
+    def __init__(self, parallelism=0, prepare_time=0.2, fail_on=None):
+        self.params = {"cluster_init_parallelism": parallelism}
+        self.log = logging.getLogger(__name__)
+        self.prepare_time = prepare_time
+        self.fail_on = fail_on
+        self.lock = threading.Lock()
+        self.preparing = 0
+        self.max_preparing = 0
+        self.calls = []
+
+    def node_prepare(self, node, **_):
+        with self.lock:
+            self.preparing += 1
+            self.max_preparing = max(self.max_preparing, self.preparing)
+        time.sleep(self.prepare_time)
+        with self.lock:
+            self.preparing -= 1
+            self.calls.append(("prepare", node.name))
+        if node.name == self.fail_on:
+            raise ValueError("no space left on device")
+
+    def node_startup(self, node, **_):
+        assert not self.preparing, "all nodes should be prepared before the first startup"
+        self.calls.append(("startup", node.name))
+
+    def wait_for_nodes_up_and_normal(self, nodes, verification_node, timeout):
+        self.calls.append(("ring", verification_node.name, tuple(node.name for node in nodes)))
+
+
+@pytest.fixture(autouse=True)
+def argus():
+    with patch("sdcm.cluster.ArgusTestRun", MagicMock()):
+        yield
+
+
+def test_two_phase_setup():
+    cluster = FakeCluster(parallelism=3)
+    nodes = [db_node(f"node-{i}") for i in range(6)]
+
+    timings = setup_nodes_in_two_phases(cluster, nodes, timeout=5)
+
+    assert cluster.max_preparing == 3
+    assert [call for call in cluster.calls if call[0] != "prepare"] == [
+        ("startup", "node-0"), ("ring", "node-0", ("node-0", )),
+        ("startup", "node-1"), ("ring", "node-0", ("node-0", "node-1")),
+        ("startup", "node-2"), ("ring", "node-0", ("node-0", "node-1", "node-2")),
+        ("startup", "node-3"), ("ring", "node-0", ("node-0", "node-1", "node-2", "node-3")),
+        ("startup", "node-4"), ("ring", "node-0", ("node-0", "node-1", "node-2", "node-3", "node-4")),
+        ("startup", "node-5"), ("ring", "node-0", ("node-0", "node-1", "node-2", "node-3", "node-4", "node-5")),
+    ]
+    assert set(timings) == {node.name for node in nodes}
+    assert all(phases["prepare"] >= 0.2 and "startup" in phases for phases in timings.values())
+
+
+def test_two_phase_setup_prepare_failed():
+    cluster = FakeCluster(fail_on="node-1")
+    with pytest.raises(NodeSetupFailed, match=r"\[node-1\] NodeSetupFailed: no space left on device"):
+        setup_nodes_in_two_phases(cluster, [db_node("node-0"), db_node("node-1")])
+    assert not [call for call in cluster.calls if call[0] == "startup"]
+
+
+def test_two_phase_setup_timeout():
+    cluster = FakeCluster(prepare_time=2)
+    with pytest.raises(NodeSetupTimeout):
+        setup_nodes_in_two_phases(cluster, [db_node("node-0")], timeout=0.01)
@@ -51,6 +51,8 @@ class ConfigurationTests(unittest.TestCase):  # pylint: disable=too-many-public-
     @classmethod
     def setup_default_env(cls):
         os.environ['SCT_CONFIG_FILES'] = 'internal_test_data/minimal_test_case.yaml'
+        # don't use image lookups cached by previous runs
+        os.environ['_SCT_LOOKUP_CACHE_TTL'] = '0'
 
     @classmethod
     def clear_sct_env_variables(cls):
@@ -4,6 +4,8 @@ import time
 import tempfile
 from abc import abstractmethod
 
+from invoke import Result
+
 from sdcm.cluster import BaseNode
 from sdcm.coredump import CoredumpExportSystemdThread, CoreDumpInfo, CoredumpExportFileThread, CoredumpThreadBase
 from unit_tests.lib.data_pickle import Pickler
@@ -195,3 +197,73 @@ class CoredumpExportFileTest(CoredumpExportTestBase):
 
     def test_fail_get_list_test(self):
         self._run_coredump_with_fake_remoter('fail_get_list_test')
+
+
+class RecordingRemoter:  # pylint: disable=too-few-public-methods
+    def __init__(self, responses: dict):
+        self.responses = responses
+        self.commands = []
+
+    def run(self, cmd, **_):
+        self.commands.append(cmd)
+        for pattern, stdout in self.responses.items():
+            if pattern in cmd:
+                return Result(stdout=stdout, exited=0)
+        return Result(stdout="", exited=0)
+
+
+class CoredumpStreamingUploadTest(unittest.TestCase):
+    corefile = "/var/lib/systemd/coredump/core.scylla.996.0dc7f4137d5f47a3bda07dd046937fc2.37349.1578998425000000"
+
+    def _get_thread(self, responses: dict) -> CoredumpExportSystemdTestThread:
+        remoter = RecordingRemoter(responses=responses)
+        thread = CoredumpExportSystemdTestThread(FakeNode(remoter, tempfile.mkdtemp()), 5)
+        thread.streaming_upload = True
+        thread.__dict__["_is_pigz_installed"] = True
+        return thread
+
+    def test_upload_is_resumed_from_not_uploaded_part(self):
+        file_name = os.path.basename(self.corefile) + ".gz"
+        thread = self._get_thread(responses={
+            "stat -c %s": str(int(2.5 * CoredumpThreadBase.streaming_upload_part_size)),
+            "cat /var/tmp/": f"{file_name}.part0000\n",
+        })
+        core_info = CoreDumpInfo(pid="37349", corefile=self.corefile)
+
+        self.assertTrue(thread.upload_coredump(core_info))
+
+        upload_commands = [cmd for cmd in thread.node.remoter.commands if "curl" in cmd]
+        self.assertEqual(len(upload_commands), 2)
+        self.assertIn(f"{file_name}.part0001'", upload_commands[0])
+        self.assertIn(f"skip={CoredumpThreadBase.streaming_upload_part_size} ", upload_commands[0])
+        self.assertIn("pigz --fast --stdout", upload_commands[0])
+        self.assertIn(f"{file_name}.part0002'", upload_commands[1])
+        self.assertFalse(any("pigz --fast --keep" in cmd for cmd in thread.node.remoter.commands))
+        self.assertIn(f"cat {file_name}.part* > {file_name}\ngunzip {file_name}", core_info.download_instructions)
+
+    def test_compressed_core_is_not_compressed_again(self):
+        thread = self._get_thread(responses={"stat -c %s": "1024"})
+        core_info = CoreDumpInfo(pid="37349", corefile=self.corefile + ".zst")
+
+        self.assertTrue(thread.upload_coredump(core_info))
+
+        upload_commands = [cmd for cmd in thread.node.remoter.commands if "curl" in cmd]
+        self.assertEqual(len(upload_commands), 1)
+        self.assertNotIn("pigz", upload_commands[0])
+        self.assertIn(f"upload.scylladb.com/{os.path.basename(self.corefile)}/", upload_commands[0])
+        self.assertNotIn("gunzip", core_info.download_instructions)
+        self.assertIn(f"zstd -d {os.path.basename(self.corefile)}.zst", core_info.download_instructions)
+
+    def test_compressed_core_upload_without_streaming(self):
+        thread = self._get_thread(responses={})
+        thread.streaming_upload = False
+        core_info = CoreDumpInfo(pid="37349", corefile=self.corefile + ".zst")
+
+        self.assertTrue(thread.upload_coredump(core_info))
+
+        file_name = os.path.basename(self.corefile) + ".zst"
+        [upload_command] = [cmd for cmd in thread.node.remoter.commands if "curl" in cmd]
+        self.assertIn(f"upload.scylladb.com/{os.path.basename(self.corefile)}/{file_name}'", upload_command)
+        self.assertEqual(core_info.download_instructions,
+                         f"gsutil cp gs://upload.scylladb.com/{os.path.basename(self.corefile)}/{file_name} .\n"
+                         f"zstd -d {file_name}")
@@ -0,0 +1,122 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import re
+import shutil
+import threading
+
+import pytest
+
+from sdcm.utils.debuginfo_cache import DebuginfoCache, DebuginfoCacheError, find_debuginfo_file
+from unit_tests.lib.fake_node import FakeNode, FakeRemoter, fake_result
+
+BUILD_ID = "0a1b2c3d4e5f"
+BUILD_ID_DEBUG_FILE = "/usr/lib/debug/.build-id/0a/1b2c3d4e5f.debug"
+
+
+class DebuginfoRemoter(FakeRemoter):
+    def __init__(self, files=None, broken=False):
+        super().__init__()
+        self.files = dict(files or {})  # remote path -> local path with content
+        self.broken = broken
+        self.received = []
+        self.sent = []
+
+    def respond(self, cmd):
+        if match := re.fullmatch(r"(?:\[\[ -f|test -s) (\S+)(?: \]\])?", cmd):
+            return fake_result(ok=match.group(1) in self.files)
+        if cmd.startswith("ls "):
+            pattern = re.compile(cmd[3:].replace("*", ".*"))
+            return fake_result(stdout="\n".join(path for path in self.files if pattern.fullmatch(path)))
+        raise AssertionError(f"unexpected command: {cmd}")
+
+    def receive_files(self, src, dst):
+        if self.broken:
+            raise ConnectionError("node is gone")
+        self.received.append(src)
+        shutil.copy(self.files[src], dst)
+        return True
+
+    def send_files(self, src, dst):
+        self.sent.append(dst)
+        self.files[dst] = src
+        return True
+
+
+@pytest.fixture
+def debug_file(tmp_path):
+    path = tmp_path / "scylla.debug"
+    path.write_bytes(b"\x7fELF debuginfo")
+    return str(path)
+
+
+def test_find_debuginfo_file(debug_file):
+    assert find_debuginfo_file(DebuginfoRemoter({"/usr/lib/debug/bin/scylla.debug": debug_file})) == \
+        "/usr/lib/debug/bin/scylla.debug"
+    assert find_debuginfo_file(DebuginfoRemoter({BUILD_ID_DEBUG_FILE: debug_file}), build_id=BUILD_ID) == \
+        BUILD_ID_DEBUG_FILE
+    assert find_debuginfo_file(DebuginfoRemoter({BUILD_ID_DEBUG_FILE: debug_file})) is None
+
+
+def test_debuginfo_cache_install(tmp_path, debug_file):
+    cache = DebuginfoCache(cache_dir=str(tmp_path / "cache"))
+    nodes = [FakeNode(f"db-node-{index}", DebuginfoRemoter()) for index in range(5)]
+    installed = []
+
+    def install(node):
+        def install_func():
+            installed.append(node)
+            node.remoter.files[BUILD_ID_DEBUG_FILE] = debug_file
+        return install_func
+
+    threads = [threading.Thread(target=cache.install, args=(node, BUILD_ID, install(node))) for node in nodes]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(installed) == 1, "only one node should install debuginfo"
+    assert cache.sources(BUILD_ID) == [(installed[0], BUILD_ID_DEBUG_FILE)]
+    assert cache.stats["install_misses"] == 1
+    assert cache.stats["install_hits"] == 4
+
+
+def test_debuginfo_cache_deliver(tmp_path, debug_file):
+    cache = DebuginfoCache(cache_dir=str(tmp_path / "cache"))
+    gone_node = FakeNode("db-node-1", DebuginfoRemoter({BUILD_ID_DEBUG_FILE: debug_file}, broken=True))
+    source_node = FakeNode("db-node-2", DebuginfoRemoter({BUILD_ID_DEBUG_FILE: debug_file}))
+    cache.add_source(BUILD_ID, gone_node, BUILD_ID_DEBUG_FILE)
+    cache.add_source(BUILD_ID, source_node, BUILD_ID_DEBUG_FILE)
+    monitor = DebuginfoRemoter()
+
+    assert cache.deliver(BUILD_ID, monitor) == f"/tmp/scylla-{BUILD_ID}.debug"
+    assert cache.deliver(BUILD_ID, monitor) == f"/tmp/scylla-{BUILD_ID}.debug"
+    assert cache.deliver(BUILD_ID, DebuginfoRemoter()) == f"/tmp/scylla-{BUILD_ID}.debug"
+    assert source_node.remoter.received == [BUILD_ID_DEBUG_FILE], "the file should be downloaded once"
+    assert monitor.sent == [f"/tmp/scylla-{BUILD_ID}.debug"]
+    assert open(cache.local_path(BUILD_ID), "rb").read() == b"\x7fELF debuginfo"
+    assert cache.stats["download_misses"] == 1
+    assert cache.stats["download_hits"] == 1
+    assert cache.stats["deliver_hits"] == 1
+
+    with pytest.raises(DebuginfoCacheError, match="no node to download"):
+        cache.get("ffffffff")
+
+
+def test_debuginfo_cache_eviction(tmp_path, debug_file):
+    cache = DebuginfoCache(cache_dir=str(tmp_path / "cache"), max_files=2)
+    node = FakeNode("db-node-1", DebuginfoRemoter({BUILD_ID_DEBUG_FILE: debug_file}))
+    for build_id in ("aa01", "aa02", "aa03"):
+        cache.get(build_id, node=node, debug_file=BUILD_ID_DEBUG_FILE)
+    assert sorted(path.name for path in (tmp_path / "cache").iterdir()) == ["aa02.debug", "aa03.debug"]
@@ -28,12 +28,15 @@ from unit_tests.lib.events_utils import EventsUtilsMixin
 
 class DecodeDummyNode(DummyNode):  # pylint: disable=abstract-method
 
-    def copy_scylla_debug_info(self, node_name, debug_file):
+    def copy_scylla_debug_info(self, node_name, debug_file, build_id=None):
         return "scylla_debug_info_file"
 
 
 class DummyDbLogReader(DbLogReader):
-    def get_scylla_debuginfo_file(self):
+    def get_scylla_build_id(self):
+        return None
+
+    def get_scylla_debuginfo_file(self, build_id=None):
         return "scylla_debug_info_file"
 
 
@@ -0,0 +1,73 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+from types import SimpleNamespace
+
+import pytest
+
+from sdcm.utils import disk_usage
+from sdcm.utils.disk_usage import DiskUsageError, DiskUsageSampler, parse_disk_usage
+from unit_tests.lib.fake_node import FakeNode, FakeRemoter, fake_result
+
+
+class DiskUsageRemoter(FakeRemoter):
+    def __init__(self):
+        super().__init__()
+        self.keyspace1_size = 1000
+
+    def respond(self, cmd):
+        assert "column_family/metrics/total_disk_space_used" in cmd
+        self.keyspace1_size += 1000
+        return fake_result(stdout=f"keyspace1:standard1 {self.keyspace1_size}\n"
+                                  f"keyspace1:counter1 0\n"
+                                  f"system:local 50\n")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(disk_usage.time, "time", lambda: clock.now)
+    return clock
+
+
+def test_parse_disk_usage():
+    assert parse_disk_usage("keyspace1:standard1 2048\nks:cf \nsystem:local 12\n") == \
+        {"keyspace1.standard1": 2048, "system.local": 12}
+
+
+def test_disk_usage_sampler(clock):
+    node = FakeNode(remoter=DiskUsageRemoter())
+    sampler = DiskUsageSampler(ttl=5)
+    assert sampler.space_used(node, keyspaces=["keyspace1"]) == 2000
+    assert sampler.space_used(node, keyspaces=["keyspace1.standard1", "system"]) == 2050
+    assert sampler.space_used(node) == 2050
+    assert len(node.remoter.commands) == 1, "sample should be cached for TTL"
+    assert sampler.growth_rate(node) is None
+    assert sampler.time_to_threshold(node, threshold=10000) is None
+
+    for _ in range(3):
+        clock.now += 10
+        sampler.sample(node)
+    assert len(node.remoter.commands) == 4
+    assert sampler.growth_rate(node, keyspaces=["keyspace1"]) == pytest.approx(100)
+    assert sampler.time_to_threshold(node, threshold=10000, keyspaces=["keyspace1"]) == pytest.approx(50)
+    assert sampler.time_to_threshold(node, threshold=5000, keyspaces=["keyspace1"]) == 0
+    assert sampler.time_to_threshold(node, threshold=10000, keyspaces=["keyspace2"]) is None
+
+
+def test_disk_usage_sampler_error():
+    node = FakeNode(remoter=DiskUsageRemoter())
+    node.remoter.respond = lambda cmd: fake_result(ok=False, stderr="Connection refused")
+    with pytest.raises(DiskUsageError, match="Connection refused"):
+        DiskUsageSampler().sample(node)
@@ -0,0 +1,94 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+from pathlib import Path
+
+import pytest
+
+from sdcm.utils.hdrhistogram import HdrHistogram, HdrHistogramDecodeError, HdrHistogramStore, parse_hdr_log
+from sdcm.utils.latency import calculate_latency, update_latency_from_hdr
+
+TEST_DATA = Path(__file__).parent / "test_data" / "test_hdrhistogram"
+START_TIME = 1660000000.0
+
+# Loader 0: 990 ops of 1ms in the 1st second and 100 ops of 2ms in the 2nd one.
+# Loader 1: 10 ops of 50ms in the 1st second and 100 ops of 4ms in the 2nd one (and response time of 900ms.)
+
+
+@pytest.fixture
+def store():
+    hdr_store = HdrHistogramStore()
+    for path in sorted(TEST_DATA.glob("*.hdr")):
+        hdr_store.load_log(str(path))
+    return hdr_store
+
+
+def test_parse_hdr_log():
+    intervals = list(parse_hdr_log(str(TEST_DATA / "cassandra-stress-l1.hdr")))
+
+    assert [(tag, start, end) for tag, start, end, _ in intervals] == [
+        ("WRITE-st", START_TIME, START_TIME + 1),
+        ("WRITE-rt", START_TIME, START_TIME + 1),
+        ("WRITE-st", START_TIME + 1, START_TIME + 2),
+    ]
+    histogram = intervals[0][3]
+    assert histogram.total_count == 10
+    assert histogram.get_value_at_percentile(99) == pytest.approx(50_000_000, rel=1e-3)
+
+
+def test_decode_garbage():
+    with pytest.raises(HdrHistogramDecodeError):
+        HdrHistogram.decode("HISTFAAAACV4nJNpmSzMwMDAwgABzFCaEch0")
+
+
+def test_merged_percentiles(store):
+    assert store.tags == ["WRITE-rt", "WRITE-st"]
+    assert store.latency_tags == ["WRITE-st"]
+
+    # Average of per-loader P99 for the 1st second would be (1 + 50) / 2 = 25.5ms, but it's 1ms actually.
+    assert store.get_percentiles(start=START_TIME, end=START_TIME + 1, percentiles=(99, 99.9)) == {99: 1.0, 99.9: 50.0}
+    assert store.get_percentiles(percentiles=(50, 95, 99)) == {50: 1.0, 95: 4.0, 99: 4.0}
+    assert store.get_percentiles(tags=store.tags, percentiles=(99.9, )) == {99.9: 900.2}
+    assert store.get_mean() == 1.74
+
+
+def test_interval_percentiles(store):
+    assert store.get_interval_percentiles(percentiles=(50, 99)) == [
+        (START_TIME, {50: 1.0, 99: 1.0}),
+        (START_TIME + 1, {50: 2.0, 99: 4.0}),
+    ]
+    assert store.get_interval_percentiles(start=START_TIME + 1, percentiles=(50, )) == [(START_TIME + 1, {50: 2.0})]
+
+
+def test_load_same_log_once(store):
+    store.load_log(str(TEST_DATA / "cassandra-stress-l0.hdr"))
+    assert store.get_histogram().total_count == 1200
+
+
+def test_update_latency_from_hdr(store):
+    latency_results = {
+        "Steady State": {"c-s P99": 30.0, "c-s P95": 20.0, "window": [START_TIME, START_TIME + 1]},
+        "_decommission": {"legend": "Decommission", "cycles": [
+            {"c-s P99": 40.0, "c-s P95": 30.0, "screenshots": [], "window": [START_TIME + 1, START_TIME + 2]},
+        ]},
+    }
+    latency_results = calculate_latency(update_latency_from_hdr(latency_results, store))
+
+    assert latency_results["Steady State"]["c-s P99"] == 1.0
+    assert latency_results["Steady State"]["c-s P99 max"] == 1.0
+    assert latency_results["_decommission"]["Cycles Average"] == {
+        "c-s P99": 4.0, "c-s P99 max": 4.0, "c-s P95": 4.0, "c-s P95 max": 4.0}
+    assert latency_results["_decommission"]["Relative to Steady"]["c-s P99"] == 3.0
+    assert "window" not in latency_results["Steady State"]
+    assert "window" not in latency_results["_decommission"]["cycles"][0]
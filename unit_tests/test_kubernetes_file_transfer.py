@@ -0,0 +1,132 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import io
+import base64
+import subprocess
+import threading
+
+import pytest
+
+from sdcm.remote.kubernetes_cmd_runner import Base64StreamDecoder, KubernetesCmdRunner
+
+
+class LocalExecProcess:
+    """Run the command locally and mimic `kubernetes.stream.ws_client.WSClient' interface."""
+
+    def __init__(self, command):
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                         stderr=subprocess.PIPE)
+        self._stdout, self._stderr = [], []
+        self._readers = [threading.Thread(target=self._read, args=(self._process.stdout, self._stdout)),
+                         threading.Thread(target=self._read, args=(self._process.stderr, self._stderr))]
+        for reader in self._readers:
+            reader.start()
+
+    @staticmethod
+    def _read(stream, buffer):
+        while data := stream.read1(4096):
+            buffer.append(data.decode())
+
+    def is_open(self):
+        return self._process.poll() is None or any(reader.is_alive() for reader in self._readers)
+
+    def update(self, timeout=0):
+        self._readers[0].join(min(timeout, 0.01))
+
+    @staticmethod
+    def _pop(buffer):
+        data = "".join(buffer)
+        buffer.clear()
+        return data
+
+    def read_stdout(self, timeout=None):
+        return self._pop(self._stdout)
+
+    def read_stderr(self, timeout=None):
+        return self._pop(self._stderr)
+
+    def write_stdin(self, data):
+        self._process.stdin.write(data)
+        self._process.stdin.flush()
+
+    @property
+    def returncode(self):
+        return self._process.poll()
+
+    def close(self):
+        self._process.stdin.close()
+        self._process.wait()
+
+
+@pytest.fixture
+def remoter(monkeypatch):
+    runner = KubernetesCmdRunner(kluster=None, pod="scylla-0", container="scylla", namespace="scylla")
+    monkeypatch.setattr(runner, "_exec_stream", lambda command: LocalExecProcess(["/bin/bash", "-c", command]))
+    return runner
+
+
+def test_base64_stream_decoder():
+    data = bytes(range(256)) * 10
+    encoded = base64.encodebytes(data).decode()
+    output = io.BytesIO()
+    decoder = Base64StreamDecoder(output)
+    for i in range(0, len(encoded), 7):
+        decoder.write(encoded[i:i + 7])
+    decoder.close()
+    assert output.getvalue() == data
+
+
+@pytest.mark.parametrize("compress", (False, True))
+def test_send_and_receive_files_batch(remoter, tmp_path, compress):
+    src_dir = tmp_path / "src"
+    (src_dir / "conf.d").mkdir(parents=True)
+    (src_dir / "conf.d" / "a.yaml").write_bytes(b"a: 1\n")
+    (src_dir / "data.bin").write_bytes(bytes(range(256)) * 1000)
+    pod_dir = tmp_path / "pod"
+
+    assert remoter.send_files_batch({str(src_dir / "conf.d"): str(pod_dir / "etc" / "conf.d"),
+                                     str(src_dir / "data.bin"): str(pod_dir / "var" / "data.bin")},
+                                    compress=compress)
+    assert (pod_dir / "etc" / "conf.d" / "a.yaml").read_bytes() == b"a: 1\n"
+    assert (pod_dir / "var" / "data.bin").read_bytes() == (src_dir / "data.bin").read_bytes()
+
+    local_dir = tmp_path / "local"
+    assert remoter.receive_files_batch({f"{pod_dir}/etc/conf.d/": str(local_dir / "conf"),
+                                        str(pod_dir / "var" / "data.bin"): str(local_dir / "data.bin")},
+                                       compress=compress)
+    assert (local_dir / "conf" / "a.yaml").read_bytes() == b"a: 1\n"
+    assert (local_dir / "data.bin").read_bytes() == (src_dir / "data.bin").read_bytes()
+
+
+def test_receive_files_batch_missing_file(remoter, tmp_path):
+    (tmp_path / "exists").write_text("yes")
+    files = {str(tmp_path / "exists"): str(tmp_path / "copy"), str(tmp_path / "missing"): str(tmp_path / "nope")}
+
+    with pytest.raises(RuntimeError, match="failed to receive files"):
+        remoter.receive_files_batch(files)
+    assert not remoter.receive_files_batch(files, ignore_status=True)
+    assert (tmp_path / "copy").read_text() == "yes"
+
+
+def test_receive_files_batch_skips_links(remoter, tmp_path):
+    pod_dir = tmp_path / "pod"
+    pod_dir.mkdir()
+    (pod_dir / "a.yaml").write_text("a: 1\n")
+    (pod_dir / "passwd").symlink_to("/etc/passwd")
+
+    local_dir = tmp_path / "local"
+    assert remoter.receive_files_batch({str(pod_dir): str(local_dir)})
+    assert (local_dir / "a.yaml").read_text() == "a: 1\n"
+    assert not (local_dir / "passwd").exists() and not (local_dir / "passwd").is_symlink()
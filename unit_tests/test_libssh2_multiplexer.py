@@ -0,0 +1,165 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import socket
+import threading
+
+from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN, LIBSSH2_ERROR_CHANNEL_CLOSED  # pylint: disable=no-name-in-module
+
+from sdcm.remote.libssh2_client.exceptions import (
+    CommandTimedOut, FailedToReadCommandOutput, FailedToRunCommand, UnexpectedExit)
+from sdcm.remote.libssh2_client.multiplexer import MultiplexedExecutor
+
+EAGAIN = (LIBSSH2_ERROR_EAGAIN, b"")
+CHANNEL_CLOSED = (LIBSSH2_ERROR_CHANNEL_CLOSED, b"")
+
+
+class FakeChannel:
+    """Returns scripted chunks on read(), EAGAIN between them, EOF (0) when the script is over."""
+
+    def __init__(self, stdout, stderr=(), exit_status=0, endless=False, broken=False):
+        self.stdout = list(stdout)
+        self.stderr = list(stderr)
+        self.exit_status = exit_status
+        self.endless = endless
+        self.broken = broken
+        self.command = None
+
+    @staticmethod
+    def _read(chunks):
+        if not chunks:
+            return 0, b""
+        chunk = chunks.pop(0)
+        return EAGAIN if chunk is None else (len(chunk), chunk)
+
+    def execute(self, command):
+        self.command = command
+        return 0
+
+    def read(self):
+        if self.broken:
+            return CHANNEL_CLOSED
+        return EAGAIN if self.endless else self._read(self.stdout)
+
+    def read_stderr(self):
+        return EAGAIN if self.endless else self._read(self.stderr)
+
+    def eof(self):
+        return not self.endless and not self.stdout and not self.stderr
+
+    def close(self):
+        return 0
+
+    def wait_closed(self):
+        return 0
+
+    def get_exit_status(self):
+        return self.exit_status
+
+
+class FakeSession:
+    def __init__(self, channel):
+        self.lock = threading.Lock()
+        self.channels = []
+        self._channel = channel
+        self._open_attempts = 0
+
+    def open_session(self):
+        self._open_attempts += 1
+        if self._open_attempts == 1:
+            return LIBSSH2_ERROR_EAGAIN
+        self.channels.append(self._channel)
+        return self._channel
+
+    @staticmethod
+    def block_directions():
+        return 0
+
+    def drop_channel(self, channel):
+        self.channels.remove(channel)
+
+
+class FakeClient:
+    def __init__(self, host, channel, connect_error=None):
+        self.host = host
+        self.channel = channel
+        self.connect_error = connect_error
+        self.session = None
+        # Socket which is always readable, so the loop never blocks.
+        self.sock, self._peer = socket.socketpair()
+        self._peer.send(b"x")
+
+    def connect(self):
+        if self.connect_error:
+            raise self.connect_error
+        self.session = FakeSession(self.channel)
+
+    def disconnect(self):
+        self.session = None
+
+
+def test_run_on_many_clients():
+    clients = {
+        "node-1": FakeClient("10.0.0.1", FakeChannel(stdout=[b"hel", None, b"lo\nwor", b"ld\n"])),
+        "node-2": FakeClient("10.0.0.2", FakeChannel(stdout=[b"one\n", None, None, b"two"], stderr=[b"warn\n"])),
+        "node-3": FakeClient("10.0.0.3", FakeChannel(stdout=[], stderr=[b"not found\n"], exit_status=127)),
+    }
+    lines = []
+    results = MultiplexedExecutor().run("echo hello", clients=clients,
+                                        on_output=lambda key, stream, line: lines.append((key, stream, line)))
+
+    assert list(results) == ["node-1", "node-2", "node-3"]
+    assert results["node-1"].ok
+    assert results["node-1"].result.stdout == "hello\nworld\n"
+    assert results["node-2"].result.stdout == "one\ntwo\n"
+    assert results["node-2"].result.stderr == "warn\n"
+    assert results["node-3"].failed
+    assert results["node-3"].result.exited == 127
+    assert isinstance(results["node-3"].exception, UnexpectedExit)
+    assert [line for key, stream, line in lines if key == "node-1"] == ["hello\n", "world\n"]
+    assert ("node-2", "stderr", "warn\n") in lines
+    assert all(client.channel.command == "echo hello" for client in clients.values())
+    assert all(not client.session.channels for client in clients.values()), "channels should be dropped"
+
+
+def test_ignore_status():
+    clients = {"node-1": FakeClient("10.0.0.1", FakeChannel(stdout=[], exit_status=1))}
+    result = MultiplexedExecutor().run("false", clients=clients, ignore_status=True)["node-1"]
+
+    assert result.exception is None
+    assert result.result.exited == 1
+
+
+def test_timeout_and_connect_error():
+    clients = {
+        "stuck": FakeClient("10.0.0.1", FakeChannel(stdout=[], endless=True)),
+        "down": FakeClient("10.0.0.2", FakeChannel(stdout=[]), connect_error=ConnectionRefusedError()),
+        "fine": FakeClient("10.0.0.3", FakeChannel(stdout=[b"ok\n"])),
+    }
+    results = MultiplexedExecutor(poll_interval=0.05).run("sleep 1000", clients=clients, timeout=0.3)
+
+    assert isinstance(results["stuck"].exception, CommandTimedOut)
+    assert clients["stuck"].session is None, "session should be reset after a failure"
+    assert isinstance(results["down"].exception, FailedToRunCommand)
+    assert results["fine"].ok
+    assert results["fine"].result.stdout == "ok\n"
+
+
+def test_read_error():
+    clients = {"broken": FakeClient("10.0.0.1", FakeChannel(stdout=[], broken=True))}
+    result = MultiplexedExecutor(poll_interval=0.05).run("uptime", clients=clients)["broken"]
+
+    assert isinstance(result.exception, FailedToReadCommandOutput)
+    assert "libssh2 error code" in str(result.exception)
+    assert clients["broken"].session is None, "session should be reset after a failure"
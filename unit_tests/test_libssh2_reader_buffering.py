@@ -0,0 +1,126 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import threading
+from io import StringIO
+
+from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN  # pylint: disable=no-name-in-module
+
+from sdcm.remote.libssh2_client import Client, SSHReaderThread
+
+CHUNK_SIZE = 32 * 1024
+
+
+class FakeChannel:
+    """Returns `stdout' in chunks of `CHUNK_SIZE' bytes, same as libssh2 does for a fast producer."""
+
+    def __init__(self, stdout: bytes, stderr: bytes = b""):
+        self._stdout = [stdout[i:i + CHUNK_SIZE] for i in range(0, len(stdout), CHUNK_SIZE)]
+        self._stderr = [stderr[i:i + CHUNK_SIZE] for i in range(0, len(stderr), CHUNK_SIZE)]
+
+    @staticmethod
+    def _read(chunks):
+        if not chunks:
+            return 0, b""
+        chunk = chunks.pop(0)
+        return len(chunk), chunk
+
+    def read(self):
+        return self._read(self._stdout)
+
+    def read_stderr(self):
+        return self._read(self._stderr)
+
+    def eof(self):
+        return LIBSSH2_ERROR_EAGAIN if self._stdout or self._stderr else 1
+
+
+class FakeSession:
+    def __init__(self):
+        self.lock = threading.Lock()
+
+    def simple_select(self, timeout=None):
+        pass
+
+
+class LineWatcher:
+    def __init__(self):
+        self.lines = []
+
+    def submit_line(self, line):
+        self.lines.append(line)
+
+
+class ChunkWatcher:
+    def __init__(self):
+        self.data = StringIO()
+
+    def submit_line(self, line):
+        raise AssertionError("should get chunks only")
+
+    def submit_chunk(self, data):
+        self.data.write(data)
+
+
+class CountingStream:
+    def __init__(self, stream, puts):
+        self._stream = stream
+        self._puts = puts
+
+    def put(self, item):
+        self._puts.append(item)
+        self._stream.put(item)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def run_reader(channel, watchers, buffered):
+    """Return stdout and stderr the consumer got and number of puts done by the reader."""
+    stdout, stderr = StringIO(), StringIO()
+    reader = SSHReaderThread(FakeSession(), channel, timeout=60, timeout_read_data=0.5, buffered=buffered)
+    puts = []
+    reader.stdout, reader.stderr = CountingStream(reader.stdout, puts), CountingStream(reader.stderr, puts)
+    process_output = Client._process_output_buffered if buffered else Client._process_output
+    assert process_output(watchers, "utf-8", stdout, stderr, reader, timeout=60, timeout_read_data_chunk=0.5)
+    return stdout.getvalue(), stderr.getvalue(), len(puts)
+
+
+def test_buffered_mode_output():
+    # Multibyte characters and lines are split between chunks.
+    stdout = "".join(f"line {i} ✔\n" for i in range(20_000)).encode() + b"no newline at the end"
+    line_watcher, chunk_watcher = LineWatcher(), ChunkWatcher()
+
+    out, err, _ = run_reader(FakeChannel(stdout, stderr=b"error\n"), [line_watcher, chunk_watcher], buffered=True)
+
+    assert out == stdout.decode()
+    assert err == "error\n"
+    assert chunk_watcher.data.getvalue() == out + err
+    assert len(line_watcher.lines) == 20_002
+    assert line_watcher.lines[-2:] in (["no newline at the end\n", "error\n"], ["error\n", "no newline at the end\n"])
+    assert "".join(line for line in line_watcher.lines if line != "error\n") == out + "\n"
+
+
+def test_buffered_mode_puts_chunks():
+    lines_num = 100_000
+    stdout = b"".join(b"total, %8d, 12345, 12345, 12345, 1.2, 1.0, 2.1, 3.5, 4.8, 5.0, 9.1\n" % i
+                      for i in range(lines_num))
+    chunks_num = len(FakeChannel(stdout)._stdout)
+    puts = {}
+    for buffered in (False, True):
+        out, _, puts[buffered] = run_reader(FakeChannel(stdout), [ChunkWatcher() if buffered else LineWatcher()],
+                                            buffered=buffered)
+        assert len(out) == len(stdout)
+    assert puts[False] == lines_num, "line mode should put each line"
+    assert puts[True] == chunks_num, "buffered mode should put each chunk as is"
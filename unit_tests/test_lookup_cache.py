@@ -0,0 +1,58 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import time
+
+import pytest
+
+from sdcm.utils.lookup_cache import LookupCache, LOOKUP_CACHE_TTL_ENV
+
+
+@pytest.fixture(autouse=True)
+def no_ttl_override(monkeypatch):
+    monkeypatch.delenv(LOOKUP_CACHE_TTL_ENV, raising=False)
+
+
+def test_lookup_cache_ttl(tmp_path):
+    cache = LookupCache(name="images", ttl=0.2, cache_dir=tmp_path)
+    calls = []
+
+    assert cache.get_or_set("ami/4.6.3/eu-west-1", lambda: calls.append(1) or "ami-1") == "ami-1"
+    assert LookupCache(name="images", ttl=0.2, cache_dir=tmp_path).get("ami/4.6.3/eu-west-1") == "ami-1"
+    assert cache.get_or_set("ami/4.6.3/eu-west-1", lambda: calls.append(1) or "ami-2") == "ami-1"
+    assert len(calls) == 1
+
+    time.sleep(0.3)
+    assert cache.get("ami/4.6.3/eu-west-1") is None
+    assert cache.get_or_set("ami/4.6.3/eu-west-1", lambda: "ami-3") == "ami-3"
+
+
+def test_lookup_cache_errors_not_cached(tmp_path):
+    cache = LookupCache(name="images", cache_dir=tmp_path)
+
+    def fail():
+        raise ValueError("not found")
+
+    with pytest.raises(ValueError):
+        cache.get_or_set("gce/99.0.3", fail)
+    assert cache.get("gce/99.0.3") is None
+
+
+def test_lookup_cache_disabled_by_env(tmp_path, monkeypatch):
+    monkeypatch.setenv(LOOKUP_CACHE_TTL_ENV, "0")
+    cache = LookupCache(name="images", cache_dir=tmp_path)
+
+    cache.set("ami/4.6.3/eu-west-1", "ami-1")
+    assert cache.get("ami/4.6.3/eu-west-1") is None
+    assert not cache.path.exists()
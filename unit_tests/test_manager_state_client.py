@@ -0,0 +1,142 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import json
+import time
+import datetime
+import threading
+
+import pytest
+
+from sdcm.mgmt.common import TaskStatus
+from sdcm.mgmt.state_client import ManagerStateClient, ManagerStateClientError, ManagerTasksPoller, parse_time
+from unit_tests.lib.fake_node import FakeNode, FakeRemoter, fake_result
+
+CLUSTER_ID = "1de39a6b-ce64-41be-a671-a7c621035c0f"
+REPAIR_ID = "2a4125d6-5d5a-45b9-9d8d-dec038b3732d"
+BACKUP_ID = "dd98f6ae-bcf4-4c98-8949-573d533bb789"
+
+
+def task(task_type, task_id, status, **kwargs):
+    return dict(type=task_type, id=task_id, name="", enabled=True, status=status, retry=3,
+                start_time="2022-02-28T09:36:20.123456789Z", end_time="0001-01-01T00:00:00Z", **kwargs)
+
+
+class ManagerApiRemoter(FakeRemoter):
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = responses
+
+    @property
+    def urls(self):
+        return [cmd.split("'")[1] for cmd in self.commands]
+
+    def respond(self, cmd):
+        response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if response is None:
+            return fake_result(ok=False, stderr="curl: (7) Failed to connect to 127.0.0.1 port 5080")
+        return fake_result(stdout=json.dumps(response))
+
+
+def manager_node(responses):
+    return FakeNode("monitor-node-1", remoter=ManagerApiRemoter(responses))
+
+
+def test_parse_time():
+    assert parse_time("0001-01-01T00:00:00Z") is None
+    assert parse_time(None) is None
+    assert parse_time("2022-02-28T09:36:20.123456789Z") == \
+        datetime.datetime(2022, 2, 28, 9, 36, 20, 123456, tzinfo=datetime.timezone.utc)
+    assert parse_time("2022-02-28T09:36:20Z").second == 20
+
+
+def test_manager_state_client_tasks():
+    node = manager_node([[task("repair", REPAIR_ID, "RUNNING"),
+                          task("backup", BACKUP_ID, "ERROR", error_count=4)],
+                         [dict(id="e2f6e5ea-9879-11ec-af1b-02cd01a36b8f", status="DONE",
+                               start_time="2022-02-28T09:36:20Z", end_time="2022-02-28T09:36:31Z")]])
+    client = ManagerStateClient.get(node)
+    assert ManagerStateClient.get(node) is client
+
+    tasks = client.tasks(CLUSTER_ID)
+    assert node.remoter.urls == [f"http://127.0.0.1:5080/api/v1/cluster/{CLUSTER_ID}/tasks?all=true"]
+    assert tasks[f"repair/{REPAIR_ID}"].status == TaskStatus.RUNNING
+    assert tasks[f"repair/{REPAIR_ID}"].end_time is None
+    assert tasks[f"backup/{BACKUP_ID}"].status == TaskStatus.ERROR_FINAL
+
+    [run] = client.task_history(CLUSTER_ID, f"repair/{REPAIR_ID}", limit=1)
+    assert node.remoter.urls[-1].endswith(f"/task/repair/{REPAIR_ID}/history?limit=1")
+    assert run.status == TaskStatus.DONE
+    assert run.duration == datetime.timedelta(seconds=11)
+
+
+class GatedApiRemoter(ManagerApiRemoter):
+    """Each API call is blocked until the test lets it through, so the poller can be driven step by step."""
+
+    def __init__(self, responses):
+        super().__init__(responses)
+        self.gate = threading.Semaphore(0)
+
+    def respond(self, cmd):
+        self.gate.acquire()
+        return super().respond(cmd)
+
+
+def wait_until(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition is not reached"
+        time.sleep(0.001)
+
+
+def test_manager_tasks_poller():
+    remoter = GatedApiRemoter([[task("repair", REPAIR_ID, "NEW")], [task("repair", REPAIR_ID, "RUNNING")],
+                               [task("repair", REPAIR_ID, "DONE")]])
+    poller = ManagerTasksPoller(client=ManagerStateClient(FakeNode("monitor-node-1", remoter=remoter)),
+                                cluster_id=CLUSTER_ID, interval=0)
+    results = []
+
+    def wait(statuses):
+        results.append(poller.wait_for_status(f"repair/{REPAIR_ID}", statuses=statuses, timeout=5).status)
+
+    def poll_once():
+        polls = poller.polls
+        remoter.gate.release()
+        wait_until(lambda: poller.polls > polls)
+
+    running_waiter, done_waiter = [threading.Thread(target=wait, args=(statuses, ))
+                                   for statuses in ([TaskStatus.RUNNING], [TaskStatus.DONE, TaskStatus.ERROR])]
+    running_waiter.start()
+    done_waiter.start()
+    wait_until(lambda: poller._waiters == 2)
+
+    poll_once()  # NEW
+    assert not results
+    poll_once()  # RUNNING
+    running_waiter.join(timeout=5)
+    assert results == [TaskStatus.RUNNING]
+    assert done_waiter.is_alive()
+    poll_once()  # DONE
+    done_waiter.join(timeout=5)
+    assert results == [TaskStatus.RUNNING, TaskStatus.DONE]
+
+    remoter.gate.release(10)
+    assert poller.wait_for_status(f"repair/{REPAIR_ID}", statuses=[TaskStatus.NEW], timeout=0.1) is None
+
+
+def test_manager_tasks_poller_errors():
+    poller = ManagerTasksPoller(client=ManagerStateClient(manager_node([None])), cluster_id=CLUSTER_ID,
+                                interval=0.01)
+    with pytest.raises(ManagerStateClientError, match="failed 3 times in a row.*Failed to connect"):
+        poller.wait_for_status(f"repair/{REPAIR_ID}", statuses=[TaskStatus.DONE], timeout=5)
@@ -0,0 +1,110 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import socket
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from sdcm.remote import LocalCmdRunner
+from sdcm.utils import package_mirror
+from sdcm.utils.package_mirror import PackageMirror
+from unit_tests.lib.fake_node import FakeNode
+
+
+def local_node(name, is_rhel_like=True):
+    return FakeNode(name, remoter=LocalCmdRunner(), private_ip_address="127.0.0.1",
+                    distro=SimpleNamespace(is_rhel_like=is_rhel_like, is_debian_like=False))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def mirror(tmp_path, monkeypatch):
+    monkeypatch.setattr(package_mirror, "PACKAGES_DIR", str(tmp_path / "packages"))
+    mirror = PackageMirror(port=free_port(), root=str(tmp_path / "mirror"))
+    downloads = []
+
+    def download(package_set):
+        # Simulate `yum install --downloadonly' from a local directory repo.
+        downloads.append(package_set.mirror_node.name)
+        path = tmp_path / "mirror" / package_set.key
+        path.mkdir(parents=True, exist_ok=True)
+        for name in package_set.packages.split():
+            (path / f"{name}-5.0.1-1.x86_64.rpm").write_text(name)
+        package_set.files = sorted(file.name for file in path.iterdir())
+        package_set.download_time = 10
+
+    monkeypatch.setattr(mirror, "_download", download)
+    monkeypatch.setattr(mirror, "_install_cmd", lambda package_set, path: f"cp {path}/*.rpm {tmp_path}/installed/")
+    mirror.downloads = downloads
+    yield mirror
+    mirror.stop()
+
+
+def test_package_mirror_install(mirror, tmp_path):
+    (tmp_path / "installed").mkdir()
+    nodes = [local_node(f"node-{i}") for i in range(4)]
+    results = {}
+
+    def install(node):
+        results[node.name] = mirror.install(node, repo_url="file:///repo/scylla.repo", packages="scylla scylla-jmx")
+
+    threads = [threading.Thread(target=install, args=(node, )) for node in nodes]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {node.name: True for node in nodes}
+    assert len(mirror.downloads) == 1, "packages should be downloaded once"
+    [package_set] = mirror.package_sets.values()
+    assert len(package_set.fetch_times) == 3
+    assert package_set.saved_time > 0
+    for name in package_set.files:
+        assert (tmp_path / "packages" / package_set.key / name).exists()
+    assert sorted(file.name for file in (tmp_path / "installed").iterdir()) == \
+        ["scylla-5.0.1-1.x86_64.rpm", "scylla-jmx-5.0.1-1.x86_64.rpm"]
+
+    # Another version is a new package set.
+    assert mirror.install(nodes[1], repo_url="file:///repo/scylla.repo", packages="scylla-5.1.0")
+    assert mirror.downloads == [mirror.downloads[0], "node-1"]
+
+
+def test_package_mirror_fallback(mirror):
+    assert not mirror.install(local_node("node-1", is_rhel_like=False), repo_url="url", packages="scylla")
+
+    def failed_download(package_set):
+        raise package_mirror.PackageMirrorError("no packages downloaded")
+
+    mirror._download = failed_download
+    assert not mirror.install(local_node("node-1"), repo_url="url", packages="scylla")
+    assert not mirror.install(local_node("node-2"), repo_url="url", packages="scylla")
+
+
+def test_package_mirror_stop(mirror, tmp_path):
+    (tmp_path / "installed").mkdir()
+    node = local_node("node-1")
+    assert mirror.install(node, repo_url="url", packages="scylla")
+    mirror.stop()
+    assert not mirror.package_sets
+
+    # The mirror is prepared again for nodes added later.
+    assert mirror.install(node, repo_url="url", packages="scylla")
+    assert mirror.downloads == ["node-1", "node-1"]
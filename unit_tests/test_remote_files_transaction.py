@@ -0,0 +1,101 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import os
+
+import pytest
+
+from sdcm.remote import LocalCmdRunner
+from sdcm.remote.remote_file import (
+    RemoteFilesTransaction,
+    RemoteFilesTransactionError,
+    dict_to_yaml_file,
+    yaml_file_to_dict,
+)
+from sdcm.utils import properties
+
+
+class CountingRunner(LocalCmdRunner):
+    def __init__(self):
+        super().__init__()
+        self.commands = 0
+
+    def run(self, cmd, *args, **kwargs):
+        self.commands += 1
+        return super().run(cmd, *args, **kwargs)
+
+
+@pytest.fixture
+def config_files(tmp_path):
+    scylla_yaml = tmp_path / "scylla.yaml"
+    scylla_yaml.write_text("cluster_name: test\nnum_tokens: 256\n")
+    os.chmod(scylla_yaml, 0o640)
+    rackdc = tmp_path / "cassandra-rackdc.properties"
+    rackdc.write_text("# comment\ndc=dc1\nrack=rack1\n")
+    return scylla_yaml, rackdc
+
+
+def test_remote_files_transaction(config_files, tmp_path):
+    scylla_yaml, rackdc = config_files
+    remoter = CountingRunner()
+    with RemoteFilesTransaction(remoter=remoter, sudo=False) as transaction:
+        transaction.fetch(str(scylla_yaml), str(rackdc), str(tmp_path / "missing"))
+        with transaction.edit(str(scylla_yaml), serializer=dict_to_yaml_file, deserializer=yaml_file_to_dict) as data:
+            data["num_tokens"] = 16
+        with transaction.edit(str(scylla_yaml), serializer=dict_to_yaml_file, deserializer=yaml_file_to_dict) as data:
+            assert data["num_tokens"] == 16
+            data["endpoint_snitch"] = "GossipingPropertyFileSnitch"
+        with transaction.edit(str(rackdc), serializer=properties.serialize,
+                              deserializer=properties.deserialize) as data:
+            data["prefer_local"] = "true"
+        with transaction.edit(str(tmp_path / "new.yaml"), serializer=dict_to_yaml_file,
+                              deserializer=yaml_file_to_dict, create=True) as data:
+            data["auth_token"] = "token"
+        with pytest.raises(RemoteFilesTransactionError, match="doesn't exist"):
+            with transaction.edit(str(tmp_path / "missing")):
+                pass
+        assert scylla_yaml.read_text() == "cluster_name: test\nnum_tokens: 256\n"
+
+    assert remoter.commands == 3, "one command to read prefetched files, one for new.yaml and one to write all"
+    assert yaml_file_to_dict(scylla_yaml.open()) == {
+        "cluster_name": "test", "num_tokens": 16, "endpoint_snitch": "GossipingPropertyFileSnitch"}
+    assert oct(scylla_yaml.stat().st_mode & 0o777) == "0o640"
+    assert properties.deserialize(rackdc.read_text()) == {"# comment": None, "dc": "dc1", "rack": "rack1",
+                                                          "prefer_local": "true"}
+    assert (tmp_path / "new.yaml").read_text() == "auth_token: token\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cassandra-rackdc.properties", "new.yaml",
+                                                                "scylla.yaml"]
+
+    # Nothing to write if content is not changed.
+    with RemoteFilesTransaction(remoter=remoter, sudo=False) as transaction:
+        with transaction.edit(str(scylla_yaml), serializer=dict_to_yaml_file, deserializer=yaml_file_to_dict) as data:
+            data["num_tokens"] = 16
+    assert remoter.commands == 4
+
+
+def test_remote_files_transaction_concurrent_change(config_files):
+    scylla_yaml, rackdc = config_files
+    transaction = RemoteFilesTransaction(remoter=LocalCmdRunner(), sudo=False)
+    transaction.fetch(str(scylla_yaml), str(rackdc))
+    with transaction.edit(str(rackdc), serializer=properties.serialize, deserializer=properties.deserialize) as data:
+        data["dc"] = "dc2"
+    with transaction.edit(str(scylla_yaml), serializer=dict_to_yaml_file, deserializer=yaml_file_to_dict) as data:
+        data["num_tokens"] = 16
+    scylla_yaml.write_text("cluster_name: other\n")
+
+    with pytest.raises(Exception, match="has been changed concurrently"):
+        transaction.commit()
+    assert scylla_yaml.read_text() == "cluster_name: other\n"
+    assert rackdc.read_text() == "# comment\ndc=dc1\nrack=rack1\n", "all files should be left untouched"
+    assert len(list(scylla_yaml.parent.iterdir())) == 2
@@ -0,0 +1,34 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+from sdcm.utils.remote_logger import JournalCursorWatcher, JOURNAL_CURSOR_MARKER
+
+
+def test_journal_cursor_watcher_commits_lines_by_cursor(tmp_path):
+    log_file = tmp_path / "system.log"
+    cursor_file = tmp_path / "system.log.cursor"
+
+    watcher = JournalCursorWatcher(log_file=str(log_file), cursor_file=str(cursor_file))
+    assert watcher.cursor is None
+    for line in ("line1\n", "line2\n", f"{JOURNAL_CURSOR_MARKER}s=1;i=2\n", "line3\n"):
+        watcher.submit_line(line)
+    assert log_file.read_text() == "line1\nline2\n"
+    assert cursor_file.read_text() == "s=1;i=2"
+
+    # The connection is broken before the next marker: `line3' will be sent again after the cursor.
+    watcher.reset()
+    watcher.submit(f"line3\nline4\n{JOURNAL_CURSOR_MARKER}s=1;i=4\npartial")
+    watcher.close()
+    assert log_file.read_text() == "line1\nline2\nline3\nline4\n"
+
+    assert JournalCursorWatcher(log_file=str(log_file), cursor_file=str(cursor_file)).cursor == "s=1;i=4"
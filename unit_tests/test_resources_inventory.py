@@ -0,0 +1,118 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import datetime
+import threading
+from unittest.mock import MagicMock, patch
+
+from sdcm.utils.common import clean_elastic_ips_aws
+from sdcm.utils.resources_inventory import InventoryItem, ResourcesInventory, ResourcesSnapshot
+
+LAUNCH_TIME = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def aws_instance(instance_id, state="running", **tags):
+    return {"InstanceId": instance_id, "State": {"Name": state}, "LaunchTime": LAUNCH_TIME,
+            "Placement": {"AvailabilityZone": "eu-west-1a"}, "InstanceType": "i3.large",
+            "Tags": [{"Key": key, "Value": value} for key, value in tags.items()]}
+
+
+def make_snapshot():
+    return ResourcesSnapshot(items=[
+        InventoryItem(provider="aws", kind="instance", id="i-1", region="eu-west-1", state="running",
+                      tags={"TestId": "t1", "NodeType": "scylla-db"}, raw={"InstanceId": "i-1"}),
+        InventoryItem(provider="aws", kind="instance", id="i-2", region="us-east-1", state="stopped",
+                      tags={"TestId": "t1", "NodeType": "loader"}, raw={"InstanceId": "i-2"}),
+        InventoryItem(provider="aws", kind="instance", id="i-3", region="eu-west-1", state="running",
+                      tags={"TestId": "t2", "NodeType": "scylla-db"}, raw={"InstanceId": "i-3"}),
+        InventoryItem(provider="aws", kind="elastic_ip", id="eipalloc-1", region="eu-west-1", public_ip="10.0.0.1",
+                      tags={"TestId": "t2"}, raw={"AllocationId": "eipalloc-1", "PublicIp": "10.0.0.1"}),
+        InventoryItem(provider="eks", kind="cluster", id="eks-1", region="eu-north-1",
+                      tags={"TestId": "t1"}, raw="eks-1"),
+    ])
+
+
+def test_snapshot_filter():
+    snapshot = make_snapshot()
+
+    assert [item.id for item in snapshot.filter(tags_dict={"TestId": "t1"})] == ["i-1", "i-2", "eks-1"]
+    assert [item.id for item in snapshot.filter(tags_dict={"TestId": "t1"}, running=True)] == ["i-1", "eks-1"]
+    assert [item.id for item in snapshot.filter(tags_dict={"NodeType": "scylla-db"}, provider="aws")] == ["i-1", "i-3"]
+    # K8S clusters are matched by NodeType=k8s only.
+    assert [item.id for item in snapshot.filter(tags_dict={"TestId": "t1", "NodeType": "k8s"})] == ["eks-1"]
+    assert not snapshot.filter(tags_dict={"TestId": "t3"})
+    assert snapshot.get_raw("aws", "instance", tags_dict={"TestId": "t1"}, group_by_region=True) == \
+        {"eu-west-1": [{"InstanceId": "i-1"}], "us-east-1": [{"InstanceId": "i-2"}]}
+
+
+def test_snapshot_save_and_load(tmp_path):
+    path = tmp_path / "snapshot.json"
+    snapshot = make_snapshot()
+    snapshot.errors["gce"] = "no credentials"
+    snapshot.save(path)
+
+    loaded = ResourcesSnapshot.load(path)
+    assert [item.to_dict() for item in loaded.items] == [item.to_dict() for item in snapshot.items]
+    assert not loaded.covers("gce")
+    assert loaded.covers("aws")
+    assert [item.id for item in loaded.filter(tags_dict={"TestId": "t2"})] == ["i-3", "eipalloc-1"]
+    assert ResourcesSnapshot.load(path, max_age=0) is None
+    assert ResourcesSnapshot.load(tmp_path / "missing.json") is None
+
+
+@patch("sdcm.utils.resources_inventory.all_aws_regions", return_value=["eu-west-1", "us-east-1", "eu-north-1"])
+@patch("sdcm.utils.resources_inventory.boto3.session.Session")
+def test_inventory_collect(boto3_session, _):
+    ec2 = MagicMock()
+    # Two pages of instances, the terminated one should be skipped.
+    ec2.get_paginator.return_value.paginate.return_value = [
+        {"Reservations": [{"Instances": [aws_instance("i-1", TestId="t1", Name="db-1")]}]},
+        {"Reservations": [{"Instances": [aws_instance("i-2", state="terminated", TestId="t1")]}]},
+    ]
+    ec2.describe_addresses.return_value = {"Addresses": []}
+    boto3_session.return_value.client.return_value = ec2
+
+    # Both listings pass the barrier only if they run concurrently.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def list_gce_instances(self):
+        barrier.wait()
+        return [InventoryItem(provider="gce", kind="instance", id="gce-1", tags={"TestId": "t1"})]
+
+    def list_gke_clusters(self):
+        barrier.wait()
+        raise RuntimeError("gcloud failed")
+
+    with patch.object(ResourcesInventory, "_list_gce_instances", list_gce_instances), \
+            patch.object(ResourcesInventory, "_list_gke_clusters", list_gke_clusters):
+        snapshot = ResourcesInventory(providers=("aws", "gce", "gke"), tags_dict={"TestId": "t1"}).collect()
+
+    assert not barrier.broken, "providers should be listed concurrently"
+    assert boto3_session.call_count == 6, "each AWS listing should use its own session"
+    assert ec2.get_paginator.call_args.args == ("describe_instances", )
+    ec2.get_paginator.return_value.paginate.assert_called_with(Filters=[{"Name": "tag:TestId", "Values": ["t1"]}])
+    assert sorted(item.id for item in snapshot.filter(provider="aws")) == ["i-1", "i-1", "i-1"]  # one per region
+    assert {item.name for item in snapshot.filter(provider="aws")} == {"db-1"}
+    assert [item.id for item in snapshot.filter(provider="gce")] == ["gce-1"]
+    assert snapshot.covers("aws")
+    assert not snapshot.covers("gke")
+    assert "gcloud failed" in snapshot.errors["gke"]
+
+
+@patch("boto3.client")
+def test_clean_elastic_ips_aws_uses_snapshot(ec2_client):
+    with patch("sdcm.utils.common.list_elastic_ips_aws") as list_elastic_ips_aws:
+        clean_elastic_ips_aws({"TestId": "t2"}, snapshot=make_snapshot())
+    list_elastic_ips_aws.assert_not_called()
+    ec2_client().release_address.assert_called_once_with(AllocationId="eipalloc-1")
@@ -0,0 +1,123 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import time
+import threading
+from types import SimpleNamespace
+
+import pytest
+from cassandra import InvalidRequest
+
+from sdcm.utils.ring_watcher import RingStateWatcher, RingStateTimeout, RingStateWatcherError
+
+
+class FakeSession:
+    def __init__(self, cluster_status=None, local=None, peers=None):
+        self.cluster_status = cluster_status
+        self.local = local or []
+        self.peers = peers or []
+        self.queries = []
+
+    def execute(self, query):
+        self.queries.append(query)
+        if "system.cluster_status" in query:
+            if self.cluster_status is None:
+                raise InvalidRequest("unconfigured table cluster_status")
+            return [SimpleNamespace(peer=peer, up=up, status=status) for peer, up, status in self.cluster_status]
+        if "system.local" in query:
+            return [SimpleNamespace(broadcast_address=peer, rpc_address=rpc, tokens=tokens)
+                    for peer, rpc, tokens in self.local]
+        return [SimpleNamespace(peer=peer, rpc_address=rpc, tokens=tokens) for peer, rpc, tokens in self.peers]
+
+
+class FakeCluster:
+    def __init__(self, hosts=None):
+        self.listeners = []
+        self.hosts = hosts or []
+        self.metadata = SimpleNamespace(all_hosts=lambda: self.hosts)
+        self.is_shutdown = False
+
+    def register_listener(self, listener):
+        self.listeners.append(listener)
+
+    def unregister_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def shutdown(self):
+        self.is_shutdown = True
+
+
+@pytest.fixture
+def watcher_factory():
+    watchers = []
+
+    def factory(session, cluster=None):
+        cluster = cluster or FakeCluster()
+        watcher = RingStateWatcher(connect=lambda: SimpleNamespace(session=session, cluster=cluster),
+                                   refresh_interval=0.05, stale_timeout=1)
+        watchers.append(watcher)
+        return watcher.start(), cluster
+
+    yield factory
+    for watcher in watchers:
+        watcher.close()
+
+
+def test_ring_state_watcher_cluster_status(watcher_factory):
+    session = FakeSession(cluster_status=[("10.0.0.1", True, "NORMAL"), ("10.0.0.2", False, "JOINING")])
+    watcher, cluster = watcher_factory(session)
+    assert cluster.listeners == [watcher]
+    assert watcher.ring == {"10.0.0.1": "UN", "10.0.0.2": "DJ"}
+
+    joined = threading.Event()
+
+    def node_joined():
+        time.sleep(0.1)
+        session.cluster_status = [("10.0.0.1", True, "NORMAL"), ("10.0.0.2", True, "NORMAL")]
+        joined.set()
+        watcher.on_up(SimpleNamespace(address="10.0.0.2"))
+
+    threading.Thread(target=node_joined).start()
+    watcher.await_state(["10.0.0.1", "10.0.0.2"], state="UN", timeout=5)
+    assert joined.is_set(), "should wait for the node to join"
+
+    with pytest.raises(RingStateTimeout, match=r"10.0.0.2 \(UN\) didn't reach None state"):
+        watcher.await_state(["10.0.0.2"], state=None, timeout=0.2)
+
+    watcher.close()
+    assert not cluster.listeners and cluster.is_shutdown
+    with pytest.raises(RingStateWatcherError, match="not running"):
+        watcher.await_state(["10.0.0.3"], timeout=1)
+
+
+def test_ring_state_watcher_peers(watcher_factory):
+    session = FakeSession(local=[("10.0.0.1", "1.1.1.1", ["1"])],
+                          peers=[("10.0.0.2", "1.1.1.2", ["2"]), ("10.0.0.3", "1.1.1.3", None)])
+    hosts = [SimpleNamespace(address=f"1.1.1.{i}", is_up=True) for i in (1, 2, 3)]
+    watcher, _ = watcher_factory(session, cluster=FakeCluster(hosts=hosts))
+    assert watcher.ring == {"10.0.0.1": "UN", "10.0.0.2": "UN", "10.0.0.3": "UJ"}
+    assert sum("system.cluster_status" in query for query in session.queries) == 1
+
+    # Down push is applied immediately, without waiting for the refresh.
+    hosts[1].is_up = False
+    watcher.on_down(hosts[1])
+    assert watcher.get_state("10.0.0.2") == "DN"
+
+
+def test_ring_state_watcher_stale(watcher_factory):
+    session = FakeSession(cluster_status=[("10.0.0.1", True, "NORMAL")])
+    watcher, _ = watcher_factory(session)
+    session.execute = lambda query: (_ for _ in ()).throw(ConnectionError("connection reset"))
+    with pytest.raises(RingStateWatcherError, match="ring state is stale, last error: connection reset"):
+        watcher.await_state(["10.0.0.2"], timeout=5)
@@ -0,0 +1,76 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+from sdcm.sct_events.events_digest import EventsDigest, MAX_EXEMPLAR_LENGTH, normalize_message
+
+
+def add_stall(digest, node, ms, timestamp):
+    message = f"(DatabaseLogEvent Severity.DEBUG) period_type=one-time " \
+              f"event_id=6d2b4b2c-5c4e-4b55-a0b5-2f0b1fe5b00{ms % 10}: type=REACTOR_STALLED " \
+              f"line_number={ms * 7} node={node}\nReactor stalled for {ms} ms on shard {ms % 4}. at 0x3f2a1b"
+    return digest.add(event_type="DatabaseLogEvent.REACTOR_STALLED", severity="DEBUG", node=node,
+                      message=message, exemplar=f"{timestamp}: {message}", timestamp=timestamp)
+
+
+def test_normalize_message():
+    assert normalize_message("node 10.0.1.2:9042 stalled for 25 ms at 0x1f, id=1b4e28ba-2fa1-11d2-883f-0016d3cca427") \
+        == "node <ip> stalled for <n> ms at <hex>, id=<uuid>"
+
+
+def test_events_digest(tmp_path):
+    digest = EventsDigest()
+    for i in range(1000):
+        assert add_stall(digest, node="node-1", ms=20 + i, timestamp=1000.0 + i) == (i == 0)
+    assert add_stall(digest, node="node-2", ms=30, timestamp=5000.0)
+    assert digest.add(event_type="CassandraStressLogEvent", severity="CRITICAL", node="loader-1",
+                      message="java.io.IOException: Operation x10 on key(s) [4b4f]", timestamp=900.0)
+    assert len(digest.entries) == 3
+
+    digest.save(tmp_path / "digest.json")
+    loaded = EventsDigest.load(tmp_path / "digest.json")
+    events = loaded.get_events_by_category(limit=1)
+    assert events["CRITICAL"] == ["java.io.IOException: Operation x10 on key(s) [4b4f]"]
+    assert not events["ERROR"]
+    assert len(events["DEBUG"]) == 1 and events["DEBUG"][0].startswith("5000.0: ")
+
+    [node_1_stalls, _] = loaded.get_events_by_category()["DEBUG"]
+    assert node_1_stalls.startswith("1000.0: ")
+    assert "Reactor stalled for 1019 ms" in node_1_stalls
+    assert node_1_stalls.endswith("[1000 similar events on node-1: "
+                                  "first at 1970-01-01 00:16:40.000, last at 1970-01-01 00:33:19.000]")
+
+
+def test_events_digest_max_groups():
+    digest = EventsDigest(max_groups=2)
+    assert digest.add(event_type="InfoEvent", severity="NORMAL", node=None, message="a")
+    assert digest.add(event_type="InfoEvent", severity="NORMAL", node=None, message="b")
+    assert digest.add(event_type="InfoEvent", severity="NORMAL", node=None, message="c")
+    assert not digest.add(event_type="InfoEvent", severity="NORMAL", node=None, message="d")
+    assert digest.add(event_type="InfoEvent", severity="NORMAL", node=None, message="a") is False
+    assert [entry.count for entry in digest.entries.values()] == [2, 1, 2]
+    assert digest.get_events_by_category()["NORMAL"][-1].startswith("c\n...\nd\n[2 other events on no node")
+
+
+def test_events_digest_snapshot_and_long_exemplars(tmp_path):
+    digest = EventsDigest()
+    backtrace = "Backtrace:\n" + "  0x3f2a1b\n" * 10_000
+    digest.add(event_type="DatabaseLogEvent.BACKTRACE", severity="ERROR", node="node-1", message=backtrace)
+    [entry] = digest.entries.values()
+    assert len(entry.exemplar) < MAX_EXEMPLAR_LENGTH + 100
+    assert entry.exemplar.endswith(f"... [{len(backtrace) - MAX_EXEMPLAR_LENGTH} more characters]")
+
+    snapshot = digest.snapshot()
+    digest.add(event_type="DatabaseLogEvent.BACKTRACE", severity="ERROR", node="node-1", message=backtrace)
+    EventsDigest.save_snapshot(snapshot, tmp_path / "digest.json")
+    assert [entry.count for entry in EventsDigest.load(tmp_path / "digest.json").entries.values()] == [1]
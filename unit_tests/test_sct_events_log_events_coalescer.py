@@ -0,0 +1,69 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=protected-access
+
+import unittest
+from unittest.mock import patch
+
+from sdcm.sct_events.base import SctEvent
+from sdcm.sct_events.loaders import CassandraStressLogEvent
+from sdcm.sct_events.log_events_coalescer import LogEventsCoalescer, normalize_message
+
+CS_TIMEOUT_LINE = "java.io.IOException: Operation x10 on key(s) [{key}]: Error executing: (WriteTimeoutException)"
+
+
+class TestLogEventsCoalescer(unittest.TestCase):
+    def setUp(self):
+        self.published = []
+
+        def fake_publish(event, warn_not_ready=True):  # pylint: disable=unused-argument
+            if event._ready_to_publish:
+                self.published.append(event.clone())
+                event._ready_to_publish = False
+
+        patcher = patch.object(SctEvent, "publish", fake_publish)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_normalize_message(self):
+        self.assertEqual(normalize_message(CS_TIMEOUT_LINE.format(key="4c4b3834") + "\n"),
+                         normalize_message(CS_TIMEOUT_LINE.format(key="3036303231")))
+
+    def test_repeats_are_published_as_one_event(self):
+        event = CassandraStressLogEvent.IOException()
+        coalescer = LogEventsCoalescer(flush_interval=3600)
+        with coalescer:
+            for line_number in range(100):
+                coalescer.publish(event.add_info(node="loader-1", line=CS_TIMEOUT_LINE.format(key=line_number),
+                                                 line_number=line_number))
+            coalescer.publish(event.add_info(node="loader-2", line=CS_TIMEOUT_LINE.format(key=0), line_number=0))
+            self.assertEqual(len(self.published), 2, "first occurrence per node should be published immediately")
+
+        self.assertEqual(len(self.published), 3)
+        summary = self.published[-1]
+        self.assertEqual(summary.node, "loader-1")
+        self.assertEqual(summary.coalesced_count, 99)
+        self.assertEqual(summary.line_number, 99)
+        self.assertLessEqual(summary.first_timestamp, summary.last_timestamp)
+        self.assertIn("coalesced_count=99", str(summary))
+        self.assertNotIn("coalesced_count", str(self.published[0]))
+
+    def test_disabled_coalescing(self):
+        event = CassandraStressLogEvent.IOException()
+        coalescer = LogEventsCoalescer(flush_interval=0)
+        with coalescer:
+            for line_number in range(10):
+                coalescer.publish(event.add_info(node="loader-1", line=CS_TIMEOUT_LINE.format(key=1),
+                                                 line_number=line_number))
+        self.assertEqual(len(self.published), 10)
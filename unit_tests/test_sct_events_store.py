@@ -0,0 +1,113 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import json
+
+from sdcm.sct_events import Severity
+from sdcm.sct_events.events_store import RawEventsStore
+from sdcm.sct_events.file_logger import EventsLogReader
+
+
+def raw_event(n, base="InfoEvent", severity="NORMAL", node=None, event_type=None, timestamp=None):
+    return json.dumps({"base": base, "type": event_type, "severity": severity, "node": node, "event_id": str(n),
+                       "event_timestamp": 1000.0 + n * 30 if timestamp is None else timestamp}) + "\n"
+
+
+def write_events(path, *events, mode="a"):
+    with path.open(mode, encoding="utf-8") as log_file:
+        log_file.write("".join(events))
+
+
+def event_ids(events):
+    return [event["event_id"] for event in events]
+
+
+def test_events_store_filters(tmp_path):
+    raw_events_log = tmp_path / "raw_events.log"
+    write_events(raw_events_log,
+                 raw_event(0),
+                 raw_event(1, base="DatabaseLogEvent", event_type="BACKTRACE", severity="ERROR", node="node-1"),
+                 raw_event(2, base="DatabaseLogEvent", event_type="REACTOR_STALLED", severity="DEBUG", node="node-2"),
+                 raw_event(3, base="DatabaseLogEvent", event_type="BACKTRACE", severity="ERROR", node="node-2"),
+                 raw_event(4, severity="CRITICAL"))
+    store = RawEventsStore(raw_events_log)
+
+    assert event_ids(store.iter_events()) == ["0", "1", "2", "3", "4"]
+    assert store.count == 5
+    assert store.max_timestamp == 1120.0
+    assert event_ids(store.iter_events(severity=Severity.ERROR)) == ["1", "3"]
+    assert event_ids(store.iter_events(severity=["ERROR", "CRITICAL"], limit=2, last=True)) == ["3", "4"]
+    assert event_ids(store.iter_events(event_type="DatabaseLogEvent", node="node-2")) == ["2", "3"]
+    assert event_ids(store.iter_events(event_type="DatabaseLogEvent.BACKTRACE")) == ["1", "3"]
+    assert event_ids(store.iter_events(start=1030, end=1060)) == ["1", "2"]
+    assert event_ids(store.iter_events(event_type="DatabaseLogEvent", start=1050)) == ["2", "3"]
+    assert not list(store.iter_events(node="node-3"))
+
+
+def test_events_store_incremental_index(tmp_path):
+    raw_events_log = tmp_path / "raw_events.log"
+    write_events(raw_events_log, raw_event(0), raw_event(1, severity="ERROR"))
+    store = RawEventsStore(raw_events_log)
+    assert store.refresh() == 2
+    assert store.index_path.exists()
+
+    # A partially written line is indexed only after it's completed.
+    partial_event = raw_event(2, severity="ERROR")
+    write_events(raw_events_log, partial_event[:10])
+    assert store.refresh() == 0
+    assert event_ids(store.iter_events(severity="ERROR")) == ["1"]
+    write_events(raw_events_log, partial_event[10:])
+
+    # A new store picks up the saved index and parses only the appended lines.
+    store = RawEventsStore(raw_events_log)
+    assert store.count == 2
+    index = store.index_path.read_text()
+    assert store.refresh() == 1
+    assert event_ids(store.iter_events(severity="ERROR")) == ["1", "2"]
+    assert store.index_path.read_text().startswith(index), "new entries should be appended to the index"
+    assert len(store.index_path.read_text().splitlines()) == 3
+
+    # A partially written index record is dropped and the events it covered are indexed again.
+    with store.index_path.open("a", encoding="utf-8") as index_file:
+        index_file.write('{"offset": ')
+    store = RawEventsStore(raw_events_log)
+    assert store.count == 3
+    write_events(raw_events_log, raw_event(3, severity="ERROR"))
+    assert store.refresh() == 1
+    assert RawEventsStore(raw_events_log).count == 4
+
+    # The index is rebuilt if the log was replaced.
+    write_events(raw_events_log, raw_event(5, severity="ERROR"), mode="w")
+    assert event_ids(store.iter_events(severity="ERROR")) == ["5"]
+    assert store.count == 1
+
+
+def test_events_log_reader(tmp_path):
+    log_file = tmp_path / "error.log"
+    log_file.write_text("2022-01-01 00:00:00.000: event 1\n"
+                        "2022-01-01 00:00:01.000: event 2\n  traceback line\n")
+    first = EventsLogReader(log_file=log_file, from_head=True, limit=2)
+    last = EventsLogReader(log_file=log_file, limit=2)
+    assert first.read() == last.read() == ["2022-01-01 00:00:00.000: event 1",
+                                           "2022-01-01 00:00:01.000: event 2\ntraceback line"]
+
+    with log_file.open("a") as fobj:
+        fobj.write("2022-01-01 00:00:02.000: event 3\n2022-01-01 00:00:03.000: eve")
+    assert first.read() == ["2022-01-01 00:00:00.000: event 1", "2022-01-01 00:00:01.000: event 2\ntraceback line"]
+    assert last.read() == ["2022-01-01 00:00:01.000: event 2\ntraceback line", "2022-01-01 00:00:02.000: event 3"]
+
+    with log_file.open("a") as fobj:
+        fobj.write("nt 4\n")
+    assert last.read() == ["2022-01-01 00:00:02.000: event 3", "2022-01-01 00:00:03.000: event 4"]
+    assert EventsLogReader(log_file=log_file, limit=0).read() == []
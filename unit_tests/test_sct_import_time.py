@@ -0,0 +1,80 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import re
+import sys
+import logging
+import subprocess
+from typing import Iterable
+
+import pytest
+
+from sdcm import SCT_ROOT
+
+LOGGER = logging.getLogger(__name__)
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$")
+
+# Modules which are required only by a few commands and should never be imported just to start `sct.py'.
+HEAVY_MODULES = {
+    "pytest", "kubernetes", "sdcm.cluster", "sdcm.results_analyze", "sdcm.sct_runner", "sdcm.monitorstack",
+    "sdcm.send_email", "sdcm.logcollector", "sdcm.sct_provision", "sdcm.parallel_timeline_report",
+}
+# Cloud SDKs and SCT configuration are fine for commands which need them, but not for `--help'.
+CLOUD_MODULES = {"boto3", "docker", "azure", "libcloud", "sdcm.utils.common", "sdcm.sct_config"}
+
+
+def importtime(*args: str) -> dict[str, float]:
+    """Run `python -X importtime' with `args' and return cumulative import time of each module (sec.)"""
+    result = subprocess.run([sys.executable, "-X", "importtime", *args],
+                            cwd=SCT_ROOT, capture_output=True, text=True, timeout=300, check=False)
+    assert result.returncode == 0, result.stderr[-3000:]
+    modules = {match.group(4): int(match.group(2)) / 1_000_000
+               for line in result.stderr.splitlines() if (match := IMPORTTIME_RE.match(line))}
+    assert modules, f"no import time stats:\n{result.stderr}"
+    top = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:10]
+    LOGGER.info("%s: top modules by import time: %s", " ".join(args),
+                ", ".join(f"{name}={cumulative:.3f}s" for name, cumulative in top))
+    return modules
+
+
+def loaded_modules(code: str) -> set[str]:
+    """Run `code' in a new interpreter and return names of all modules in `sys.modules' after it."""
+    result = subprocess.run([sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+                            cwd=SCT_ROOT, capture_output=True, text=True, timeout=300, check=False)
+    assert result.returncode == 0, result.stderr[-3000:]
+    return set(result.stdout.split())
+
+
+def imported(modules: Iterable[str], packages: set[str]) -> set[str]:
+    return {name for name in modules if name in packages or name.split(".", 1)[0] in packages}
+
+
+def test_import_sct_is_light():
+    modules = loaded_modules("import sct")
+    assert "sct" in modules
+    assert not imported(modules, HEAVY_MODULES | CLOUD_MODULES)
+
+
+def test_sct_help_is_light():
+    assert not imported(importtime("sct.py", "--help"), HEAVY_MODULES | CLOUD_MODULES)
+
+
+@pytest.mark.parametrize("args", (
+    ("sct.py", "investigate", "show-events", "--help"),
+    ("sct.py", "conf", "--help"),
+    ("sct.py", "list-resources", "--help"),
+))
+def test_common_commands_import_light(args):
+    assert not imported(importtime(*args), HEAVY_MODULES)
@@ -556,6 +556,7 @@ class IntegrationTests(unittest.TestCase):
                 os.environ['SCT_REGION_NAME'] = '["eu-west-1", "us-east-1"]'
                 os.environ['SCT_CONFIG_FILES'] = config_path
                 os.environ['SCT_PREPARE_SASLAUTHD'] = "true"
+                os.environ['_SCT_LOOKUP_CACHE_TTL'] = "0"
 
                 conf = SCTConfiguration()
                 test_config = TestConfig()
@@ -0,0 +1,161 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import re
+import time
+import base64
+import threading
+
+import pytest
+
+from sdcm.utils.setup_steps import SetupStep, SetupStepsRunner, SetupStepError, STEPS_CHECKPOINT_PATH
+from unit_tests.lib.fake_node import FakeNode, FakeRemoter, fake_result
+
+
+class CheckpointRemoter(FakeRemoter):
+    def __init__(self):
+        super().__init__()
+        self.files = {}
+
+    def respond(self, cmd):
+        if cmd.startswith("cat "):
+            path = cmd[4:]
+            return fake_result(ok=path in self.files, stdout=self.files.get(path, ""))
+        if match := re.search(r"echo (\S+) \| base64 -d > \S+ && mv -f \S+ (\S+)'$", cmd):
+            self.files[match.group(2)] = base64.b64decode(match.group(1)).decode()
+            return fake_result()
+        raise AssertionError(f"unexpected command: {cmd}")
+
+
+def db_node(name="db-node-1"):
+    return FakeNode(name, remoter=CheckpointRemoter())
+
+
+class Recorder:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.active = set()
+        self.max_active = 0
+        self.overlaps = []
+        self._lock = threading.Lock()
+
+    def __call__(self, name, fail=False):
+        def func():
+            with self._lock:
+                self.calls.append(name)
+                if self.active:
+                    self.overlaps.append((name, frozenset(self.active)))
+                self.active.add(name)
+                self.max_active = max(self.max_active, len(self.active))
+            time.sleep(self.delay)
+            with self._lock:
+                self.active.discard(name)
+            if fail:
+                raise RuntimeError(f"{name} failed")
+        return func
+
+
+def test_setup_steps_concurrency_and_resources():
+    recorder = Recorder(delay=0.2)
+    steps = [
+        SetupStep("a", recorder("a")),
+        SetupStep("b", recorder("b")),
+        SetupStep("c", recorder("c"), resources=("package_manager", )),
+        SetupStep("d", recorder("d"), resources=("package_manager", )),
+        SetupStep("e", recorder("e"), requires=("a", "b", "c", "d")),
+    ]
+    durations = SetupStepsRunner(db_node(), steps).run()
+
+    assert set(durations) == {"a", "b", "c", "d", "e"}
+    assert recorder.max_active >= 3, "independent steps should run concurrently"
+    assert not any({"c", "d"} <= {name} | active for name, active in recorder.overlaps), \
+        "steps which use the same resource shouldn't overlap"
+    assert recorder.calls[-1] == "e"
+
+
+def test_setup_steps_checkpoint():
+    node = db_node()
+    recorder = Recorder()
+    inputs = {"scylla_version": "5.0"}
+    probe_result = {"started": True}
+
+    def steps():
+        return [
+            SetupStep("install", recorder("install"), inputs=dict(inputs)),
+            SetupStep("config", recorder("config"), requires=("install", )),
+            SetupStep("start", recorder("start"), requires=("config", ), probe=lambda: probe_result["started"]),
+            SetupStep("refresh", recorder("refresh"), checkpoint=False),
+        ]
+
+    SetupStepsRunner(node, steps()).run()
+    assert STEPS_CHECKPOINT_PATH in node.remoter.files
+    assert sorted(recorder.calls) == ["config", "install", "refresh", "start"]
+
+    recorder.calls.clear()
+    runner = SetupStepsRunner(node, steps())
+    runner.run()
+    assert recorder.calls == ["refresh"], "finished steps should be skipped"
+    assert sorted(runner.skipped) == ["config", "install", "start"]
+
+    recorder.calls.clear()
+    probe_result["started"] = False
+    SetupStepsRunner(node, steps()).run()
+    assert sorted(recorder.calls) == ["refresh", "start"], "the step should run again if its probe fails"
+
+    recorder.calls.clear()
+    probe_result["started"] = True
+    inputs["scylla_version"] = "5.1"
+    SetupStepsRunner(node, steps(), check_inputs=False).run()
+    assert sorted(recorder.calls) == ["refresh"], "inputs shouldn't be checked"
+    SetupStepsRunner(node, steps()).run()
+    assert sorted(recorder.calls) == ["config", "install", "refresh", "refresh", "start"], \
+        "the step should run again with steps which require it if inputs are changed"
+
+    recorder.calls.clear()
+    SetupStepsRunner(db_node(name="db-node-2"), steps()).run()
+    other_node = db_node(name="db-node-2")
+    other_node.remoter.files = dict(node.remoter.files)
+    SetupStepsRunner(other_node, steps()).run()
+    assert recorder.calls.count("install") == 2, "checkpoint of another node should be ignored"
+
+
+def test_setup_steps_failure():
+    node = db_node()
+    recorder = Recorder(delay=0.1)
+    fail = {"install": True}
+
+    def steps():
+        return [
+            SetupStep("install", recorder("install", fail=fail["install"])),
+            SetupStep("tune", recorder("tune")),
+            SetupStep("config", recorder("config"), requires=("install", )),
+        ]
+
+    with pytest.raises(SetupStepError, match="`install' failed") as excinfo:
+        SetupStepsRunner(node, steps()).run()
+    assert excinfo.value.step.name == "install"
+    assert sorted(recorder.calls) == ["install", "tune"], "steps which require the failed one shouldn't run"
+
+    recorder.calls.clear()
+    fail["install"] = False
+    SetupStepsRunner(node, steps()).run()
+    assert sorted(recorder.calls) == ["config", "install"], "the rerun should resume from the failed step"
+
+
+def test_setup_steps_validation():
+    with pytest.raises(ValueError, match="Duplicate"):
+        SetupStepsRunner(db_node(), [SetupStep("a", print), SetupStep("a", print)])
+    with pytest.raises(ValueError, match="requires unknown"):
+        SetupStepsRunner(db_node(), [SetupStep("a", print, requires=("b", )), SetupStep("b", print)])
@@ -0,0 +1,94 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+# pylint: disable=W,C,R
+import pytest
+
+from sdcm.utils.sstable.sstable_inventory import SstableInventory, parse_sstable_data_file_name
+from unit_tests.lib.fake_node import FakeNode, FakeRemoter, fake_result
+
+DATA_DIR = "/var/lib/scylla/data"
+STANDARD1_DIR = f"{DATA_DIR}/keyspace1/standard1-f60e4f30c98f11e98d46000000000002"
+TEST_DIR = f"{DATA_DIR}/scylla_bench/test-a60e4f30c98f11e98d46000000000002"
+
+
+class SstablesRemoter(FakeRemoter):
+    def __init__(self):
+        super().__init__()
+        self.directories = {}
+        self.files = {}
+
+    def respond(self, cmd):
+        if "-type d" in cmd:
+            return fake_result(stdout="".join(f"{mtime} {path}\n" for path, mtime in self.directories.items()))
+        return fake_result(stdout="".join(f"{path} {name}\n"
+                                          for path, names in self.files.items() if path in cmd or "-mindepth 3" in cmd
+                                          for name in names))
+
+
+@pytest.fixture
+def node():
+    fake_node = FakeNode(remoter=SstablesRemoter())
+    fake_node.remoter.directories = {STANDARD1_DIR: "1660000000.1", TEST_DIR: "1660000000.2"}
+    fake_node.remoter.files = {
+        STANDARD1_DIR: ["mc-220-big-Data.db", "me-3g7a_0s8o_2lx0g2dn4ei3n2t3hk-big-Data.db"],
+        TEST_DIR: ["md-1-big-Data.db"],
+    }
+    return fake_node
+
+
+@pytest.mark.parametrize("file_name, expected", (
+    ("mc-220-big-Data.db", ("mc-220", "mc", "220", "big")),
+    ("me-3g7a_0s8o_2lx0g2dn4ei3n2t3hk-big-Data.db",
+     ("me-3g7a_0s8o_2lx0g2dn4ei3n2t3hk", "me", "3g7a_0s8o_2lx0g2dn4ei3n2t3hk", "big")),
+    ("system-truncated-ka-7-Data.db", ("system-truncated-ka-7", "ka", "7", "")),
+    ("mc-220-big-Index.db", None),
+    ("manifest.json", None),
+))
+def test_parse_sstable_data_file_name(file_name, expected):
+    assert parse_sstable_data_file_name(file_name) == expected
+
+
+def test_sstable_inventory_refresh(node):
+    inventory = SstableInventory(node=node)
+    inventory.refresh()
+
+    assert inventory.tables == ["keyspace1.standard1", "scylla_bench.test"]
+    assert inventory.count() == 3
+    sstable = inventory.choose_random_sstable(tables=["scylla_bench.test"])
+    assert sstable.files_pattern == f"{TEST_DIR}/md-1-*"
+    assert sstable.data_file == f"{TEST_DIR}/md-1-big-Data.db"
+    assert inventory.choose_random_sstable(tables=["keyspace1.no_such_table"]) is None
+
+
+def test_sstable_inventory_rescans_only_changed_directories(node):
+    inventory = SstableInventory(node=node)
+    inventory.refresh()
+
+    node.remoter.commands.clear()
+    inventory.refresh()
+    assert len(node.remoter.commands) == 1, "unchanged directories shouldn't be rescanned"
+
+    node.remoter.files[TEST_DIR] = ["md-2-big-Data.db"]
+    node.remoter.directories[TEST_DIR] = "1660000001.0"
+    node.remoter.commands.clear()
+    inventory.refresh()
+    assert len(node.remoter.commands) == 2
+    assert TEST_DIR in node.remoter.commands[1]
+    assert STANDARD1_DIR not in node.remoter.commands[1]
+    assert [sstable.generation for sstable in inventory.get_sstables("scylla_bench.test")] == ["2"]
+    assert inventory.count("keyspace1.standard1") == 2
+
+    del node.remoter.directories[STANDARD1_DIR]
+    inventory.refresh()
+    assert inventory.tables == ["scylla_bench.test"]
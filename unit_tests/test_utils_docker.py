@@ -366,6 +366,50 @@ class TestContainerManager(unittest.TestCase):
             ContainerManager.run_container(self.node, "c1")
             self.container.start.assert_called_once_with()
 
+    def test_run_containers(self):
+        class Events(list):
+            close = Mock()
+
+        docker_client = Mock()
+        docker_client.containers.get.side_effect = NotFound("No such container")
+        docker_client.containers.run.side_effect = lambda **kwargs: Mock(id=kwargs["name"], client=docker_client,
+                                                                        status="created")
+        docker_client.events.return_value = Events([{"id": "other", "Action": "start"},
+                                                    {"id": "n1", "Action": "start"},
+                                                    {"id": "n2", "Action": "start"}])
+        nodes = []
+        for node_name in ("n1", "n2"):
+            node = DummyNode()
+            node.docker_client = Mock(return_value=docker_client)
+            node.c3_container_run_args = lambda node_name=node_name: {"name": node_name}
+            nodes.append(node)
+
+        with self.subTest("Run containers and wait for start events"):
+            containers = ContainerManager.run_containers(nodes, "c3")
+            self.assertEqual([container.id for container in containers], ["n1", "n2"])
+            self.assertEqual([ContainerManager.get_container(node, "c3") for node in nodes], containers)
+            self.assertEqual(docker_client.events.call_args.kwargs["filters"]["container"], ["n1", "n2"])
+            Events.close.assert_called_once_with()
+
+        with self.subTest("All containers are running already"):
+            docker_client.events.reset_mock()
+            for container in containers:
+                container.status = "running"
+            ContainerManager.wait_for_containers_running(containers, since=0, timeout=10)
+            docker_client.events.assert_not_called()
+            for container in containers:
+                container.status = "created"
+
+        with self.subTest("Container died"):
+            docker_client.events.return_value = Events([{"id": "n1", "Action": "die"}])
+            self.assertRaisesRegex(DockerException, "died", ContainerManager.wait_for_containers_running,
+                                   containers, since=0, timeout=10)
+
+        with self.subTest("No start event"):
+            docker_client.events.return_value = Events([{"id": "n1", "Action": "start"}])
+            self.assertRaisesRegex(DockerException, "not running after 10s",
+                                   ContainerManager.wait_for_containers_running, containers, since=0, timeout=10)
+
     def test_set_container_keep_alive(self):
         with self.subTest("Set keep alive to non-existent container"):
             self.assertRaises(NotFound, ContainerManager.set_container_keep_alive, self.node, "c2")
@@ -382,6 +426,17 @@ class TestContainerManager(unittest.TestCase):
         ContainerManager.set_all_containers_keep_alive(self.node)
         self.assertEqual(self.container.name, "dummy---KEEPALIVE")
 
+    def test_commit_container(self):
+        with self.subTest("Commit non-existent container"):
+            self.assertRaises(NotFound, ContainerManager.commit_container, self.node, "c2", "repo:tag")
+
+        with self.subTest("Commit container"):
+            self.container.commit = Mock(return_value=sentinel.image)
+            self.assertEqual(ContainerManager.commit_container(self.node, "c1", "scylla-sct-snapshot:abc:def",
+                                                              Labels={"key": "value"}), sentinel.image)
+            self.container.commit.assert_called_once_with(
+                repository="scylla-sct-snapshot", tag="abc:def", conf={"Labels": {"key": "value"}})
+
     def test_ssh_copy_id(self):
         with self.subTest("Copy SSH pub key to non-existent container"):
             self.assertRaises(NotFound,
@@ -1,6 +1,20 @@
+import queue
+import threading
+import time
 from copy import deepcopy
+from types import SimpleNamespace
 
-from sdcm.utils.k8s import HelmValues
+import kubernetes as k8s
+
+from sdcm.utils import k8s as k8s_utils
+from sdcm.utils.k8s import (
+    HelmValues,
+    KubernetesInformer,
+    ApiCallPriority,
+    ApiCallRateLimiter,
+    get_api_call_priority,
+    get_kubectl_call_priority,
+)
 
 
 BASE_HELM_VALUES = {
@@ -102,3 +116,126 @@ def test_helm_values_try_set_by_list_index():
     except ValueError:
         return
     assert False, "expected 'ValueError' exception was not raised"
+
+
+def k8s_object(name, resource_version, **kwargs):
+    return SimpleNamespace(metadata=SimpleNamespace(name=name, resource_version=resource_version), **kwargs)
+
+
+class FakeCoreV1Api:
+    def __init__(self):
+        self.list_calls = 0
+        self.pods = {"pod-a": k8s_object("pod-a", "1", phase="Pending")}
+
+    def list_namespaced_pod(self, namespace, watch):
+        assert namespace == "scylla" and not watch
+        self.list_calls += 1
+        return SimpleNamespace(items=list(self.pods.values()), metadata=SimpleNamespace(resource_version="1"))
+
+
+class FakeWatch:
+    streams = []
+    stopped = threading.Event()
+
+    def stream(self, func, resource_version, **kwargs):
+        if self.streams:
+            yield from self.streams.pop(0)(resource_version)
+        else:
+            self.stopped.wait(10)
+
+    def stop(self):
+        self.stopped.set()
+
+
+def test_kubernetes_informer(monkeypatch):
+    def first_watch(resource_version):
+        assert resource_version == "1"
+        yield {"type": "ADDED", "object": k8s_object("pod-b", "2")}
+        yield {"type": "MODIFIED", "object": k8s_object("pod-a", "3", phase="Running")}
+        yield {"type": "DELETED", "object": k8s_object("pod-b", "4")}
+
+    def expired_watch(resource_version):
+        assert resource_version == "4"
+        raise k8s.client.exceptions.ApiException(status=410, reason="Expired")
+        yield  # pylint: disable=unreachable
+
+    monkeypatch.setattr(k8s.watch, "Watch", FakeWatch)
+    FakeWatch.streams = [first_watch, expired_watch]
+    api = FakeCoreV1Api()
+    informer = KubernetesInformer(api, kind="pod", namespace="scylla")
+
+    assert informer.get("pod-a", fallback=lambda: "from API") == "from API"
+
+    informer.start()
+    try:
+        end_time = time.perf_counter() + 10
+        while api.list_calls < 2 or FakeWatch.streams:
+            assert time.perf_counter() < end_time, "informer didn't resync after expired watch"
+            time.sleep(0.01)
+        assert informer.get("pod-a", fallback=lambda: "from API").phase == "Pending"
+        assert informer.get("pod-b", fallback=lambda: "from API") is None
+        assert informer.metrics["hits"] == 2
+        assert informer.metrics["fallbacks"] == 1
+        assert informer.metrics["events"] == 3
+        assert informer.metrics["resyncs"] == 2
+        assert informer.metrics["staleness"] < informer.max_staleness
+    finally:
+        informer.stop(timeout=10)
+    assert not informer.is_alive()
+
+
+def test_api_call_rate_limiter_burst_and_priorities(monkeypatch):
+    with monkeypatch.context() as frozen:
+        # With the clock stopped the bucket is not refilled, so burst calls can pass only by taking its tokens.
+        now = time.perf_counter()
+        frozen.setattr(k8s_utils, "time", SimpleNamespace(perf_counter=lambda: now))
+        limiter = ApiCallRateLimiter(rate_limit=5, queue_size=100, urllib_retry=1, urllib_backoff_factor=0.1,
+                                     burst=3)
+        for _ in range(3):
+            limiter.wait()
+        assert limiter._tokens == 0  # pylint: disable=protected-access
+        assert limiter.metrics["READ"]["total_wait"] == 0, "burst calls should not wait"
+
+    # The bucket is empty now, so calls are queued and let through by priority, not by arrival order.
+    order = []
+    threads = [threading.Thread(target=lambda p=priority: (limiter.wait(priority=p), order.append(p)))
+               for priority in (ApiCallPriority.STREAMING, ApiCallPriority.READ, ApiCallPriority.MUTATION)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.02)
+    for thread in threads:
+        thread.join(5)
+    assert order == [ApiCallPriority.MUTATION, ApiCallPriority.READ, ApiCallPriority.STREAMING]
+    metrics = limiter.metrics
+    assert metrics["READ"]["calls"] == 4
+    assert metrics["STREAMING"]["max_wait"] >= 0.4
+
+    with limiter.pause:
+        thread = threading.Thread(target=limiter.wait)
+        thread.start()
+        thread.join(0.3)
+        assert thread.is_alive(), "calls should wait while paused"
+    thread.join(5)
+    assert limiter.metrics["READ"]["calls"] == 5
+
+
+def test_api_call_rate_limiter_queue_full():
+    limiter = ApiCallRateLimiter(rate_limit=10, queue_size=1, urllib_retry=1, urllib_backoff_factor=0.1, burst=1)
+    limiter.wait()
+    limiter._tokens = -10  # pylint: disable=protected-access
+    try:
+        limiter.wait()
+    except queue.Full:
+        pass
+    else:
+        assert False, "expected 'queue.Full' exception was not raised"
+    assert limiter.metrics["READ"]["rejected"] == 1
+
+
+def test_api_call_priority():
+    assert get_api_call_priority("POST") == ApiCallPriority.MUTATION
+    assert get_api_call_priority("GET", [("watch", True)]) == ApiCallPriority.STREAMING
+    assert get_api_call_priority("GET", [("labelSelector", "app=scylla")]) == ApiCallPriority.READ
+    assert get_kubectl_call_priority("delete pod scylla-0") == ApiCallPriority.MUTATION
+    assert get_kubectl_call_priority("logs", "-f scylla-0") == ApiCallPriority.STREAMING
+    assert get_kubectl_call_priority("get pods -o wide") == ApiCallPriority.READ
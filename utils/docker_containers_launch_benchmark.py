@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Benchmark of sequential and batch creation of node containers, requires a local Docker daemon.
+Run it from the SCT root directory:
+    $ python -m utils.docker_containers_launch_benchmark 3 10 30
+"""
+
+import sys
+import time
+import uuid
+import logging
+
+from sdcm.utils.docker_utils import ContainerManager
+
+LOGGER = logging.getLogger(__name__)
+IMAGE = "alpine:3"
+
+
+class BenchmarkNode:
+    def __init__(self, prefix, index):
+        self.name = f"{prefix}-{index}"
+        self.tags = {"NodeIndex": str(index), }
+        self._containers = {}
+
+    def node_container_run_args(self):
+        return dict(name=self.name, image=IMAGE, command="sleep infinity")
+
+
+def create_nodes(count):
+    prefix = f"sct-launch-benchmark-{uuid.uuid4().hex[:8]}"
+    return [BenchmarkNode(prefix, index) for index in range(count)]
+
+
+def destroy_containers(nodes):
+    for node in nodes:
+        if ContainerManager.get_container(node, "node", raise_not_found_exc=False) is not None:
+            ContainerManager.destroy_container(node, "node", ignore_keepalive=True)
+
+
+def benchmark_containers_launch(count):
+    nodes = create_nodes(count)
+    try:
+        start = time.perf_counter()
+        for node in nodes:
+            ContainerManager.run_container(node, "node")
+            ContainerManager.wait_for_status(node, "node", status="running")
+            ContainerManager.get_ip_address(node, "node")
+        sequential = time.perf_counter() - start
+    finally:
+        destroy_containers(nodes)
+
+    nodes = create_nodes(count)
+    try:
+        start = time.perf_counter()
+        ContainerManager.run_containers(nodes, "node")
+        for node in nodes:
+            ContainerManager.get_ip_address(node, "node")
+        batch = time.perf_counter() - start
+    finally:
+        destroy_containers(nodes)
+
+    LOGGER.info("%d containers: sequential %.1fs, batch %.1fs", count, sequential, batch)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    ContainerManager.default_docker_client.images.pull(IMAGE)
+    for containers_count in [int(arg) for arg in sys.argv[1:]] or [3, 10, 30]:
+        benchmark_containers_launch(containers_count)